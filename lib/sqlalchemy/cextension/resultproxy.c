@@ -160,6 +160,21 @@ BaseRowProxy_dealloc(BaseRowProxy *self)
 #endif
 }
 
+/* Call a result processor with a single value.  The functions of the
+ * cprocessors module, as well as the process() methods of its processor
+ * types, are METH_O builtins; these are called directly rather than
+ * through the generic calling machinery.
+ */
+static PyObject *
+call_processor(PyObject *func, PyObject *value)
+{
+    if (PyCFunction_Check(func) && PyCFunction_GET_FLAGS(func) == METH_O) {
+        return PyCFunction_GET_FUNCTION(func)(PyCFunction_GET_SELF(func),
+                                              value);
+    }
+    return PyObject_CallFunctionObjArgs(func, value, NULL);
+}
+
 static PyObject *
 BaseRowProxy_processvalues(PyObject *values, PyObject *processors, int astuple)
 {
@@ -195,8 +210,7 @@ BaseRowProxy_processvalues(PyObject *values, PyObject *processors, int astuple)
     while (--num_values >= 0) {
         func = *funcptr;
         if (func != Py_None) {
-            processed_value = PyObject_CallFunctionObjArgs(func, *valueptr,
-                                                           NULL);
+            processed_value = call_processor(func, *valueptr);
             if (processed_value == NULL) {
                 Py_DECREF(values_fastseq);
                 Py_DECREF(result);
@@ -382,7 +396,7 @@ BaseRowProxy_subscript(BaseRowProxy *self, PyObject *key)
         return NULL;
 
     if (processor != Py_None) {
-        processed_value = PyObject_CallFunctionObjArgs(processor, value, NULL);
+        processed_value = call_processor(processor, value);
         if (!tuple_check) {
             Py_DECREF(value);
         }
@@ -668,9 +682,163 @@ static PyTypeObject BaseRowProxyType = {
     0                                   /* tp_new */
 };
 
+/*************
+ * make_rows *
+ *************/
+
+/* Return a new tuple containing the values of the given row, with each
+ * non-None processor applied to the value at its position.
+ */
+static PyObject *
+process_row(PyObject *row, PyObject *processors)
+{
+    Py_ssize_t num_values, num_processors, i;
+    PyObject *values_fastseq, *result, *value, *func;
+
+    values_fastseq = PySequence_Fast(row, "row must be a sequence");
+    if (values_fastseq == NULL)
+        return NULL;
+
+    num_values = PySequence_Fast_GET_SIZE(values_fastseq);
+    num_processors = PyList_GET_SIZE(processors);
+    if (num_values != num_processors) {
+        PyErr_Format(PyExc_RuntimeError,
+            "number of values in row (%d) differ from number of column "
+            "processors (%d)",
+            (int)num_values, (int)num_processors);
+        Py_DECREF(values_fastseq);
+        return NULL;
+    }
+
+    result = PyTuple_New(num_values);
+    if (result == NULL) {
+        Py_DECREF(values_fastseq);
+        return NULL;
+    }
+
+    for (i = 0; i < num_values; i++) {
+        value = PySequence_Fast_GET_ITEM(values_fastseq, i);
+        func = PyList_GET_ITEM(processors, i);
+        if (func != Py_None) {
+            value = call_processor(func, value);
+            if (value == NULL) {
+                Py_DECREF(values_fastseq);
+                Py_DECREF(result);
+                return NULL;
+            }
+        } else {
+            Py_INCREF(value);
+        }
+        PyTuple_SET_ITEM(result, i, value);
+    }
+    Py_DECREF(values_fastseq);
+    return result;
+}
+
+static PyObject *
+make_rows(PyObject *self, PyObject *args)
+{
+    PyObject *row_cls, *parent, *rows, *processors, *row_processors, *keymap;
+    PyObject *rows_fastseq, *result, *row, *obj;
+    PyTypeObject *row_type;
+    BaseRowProxy *proxy;
+    Py_ssize_t num_rows, num_processors, i;
+    int has_processors = 0, direct_init = 0;
+
+    if (!PyArg_UnpackTuple(args, "make_rows", 6, 6, &row_cls, &parent,
+                           &rows, &processors, &row_processors, &keymap))
+        return NULL;
+
+    if (!PyList_CheckExact(processors) ||
+            !PyList_CheckExact(row_processors)) {
+        PyErr_SetString(PyExc_TypeError, "processors must be a list");
+        return NULL;
+    }
+    if (!PyDict_CheckExact(keymap)) {
+        PyErr_SetString(PyExc_TypeError, "keymap must be a dict");
+        return NULL;
+    }
+
+    num_processors = PyList_GET_SIZE(processors);
+    for (i = 0; i < num_processors; i++) {
+        if (PyList_GET_ITEM(processors, i) != Py_None) {
+            has_processors = 1;
+            break;
+        }
+    }
+
+    /* subclasses which don't override __new__() or __init__() are
+     * populated directly */
+    if (PyType_Check(row_cls)) {
+        row_type = (PyTypeObject *)row_cls;
+        direct_init = PyType_IsSubtype(row_type, &BaseRowProxyType) &&
+            row_type->tp_new == BaseRowProxyType.tp_new &&
+            row_type->tp_init == BaseRowProxyType.tp_init;
+    }
+
+    rows_fastseq = PySequence_Fast(rows, "rows must be a sequence");
+    if (rows_fastseq == NULL)
+        return NULL;
+
+    num_rows = PySequence_Fast_GET_SIZE(rows_fastseq);
+    result = PyList_New(num_rows);
+    if (result == NULL) {
+        Py_DECREF(rows_fastseq);
+        return NULL;
+    }
+
+    for (i = 0; i < num_rows; i++) {
+        row = PySequence_Fast_GET_ITEM(rows_fastseq, i);
+        if (has_processors) {
+            row = process_row(row, processors);
+            if (row == NULL)
+                goto error;
+        } else if (!PySequence_Check(row)) {
+            PyErr_SetString(PyExc_TypeError, "row must be a sequence");
+            goto error;
+        } else {
+            Py_INCREF(row);
+        }
+
+        if (direct_init) {
+            proxy = (BaseRowProxy *)row_type->tp_alloc(row_type, 0);
+            if (proxy == NULL) {
+                Py_DECREF(row);
+                goto error;
+            }
+            Py_INCREF(parent);
+            proxy->parent = parent;
+            proxy->row = row;
+            Py_INCREF(row_processors);
+            proxy->processors = row_processors;
+            Py_INCREF(keymap);
+            proxy->keymap = keymap;
+            obj = (PyObject *)proxy;
+        } else {
+            obj = PyObject_CallFunctionObjArgs(row_cls, parent, row,
+                                               row_processors, keymap, NULL);
+            Py_DECREF(row);
+            if (obj == NULL)
+                goto error;
+        }
+        PyList_SET_ITEM(result, i, obj);
+    }
+
+    Py_DECREF(rows_fastseq);
+    return result;
+
+error:
+    Py_DECREF(rows_fastseq);
+    Py_DECREF(result);
+    return NULL;
+}
+
 static PyMethodDef module_methods[] = {
     {"safe_rowproxy_reconstructor", safe_rowproxy_reconstructor, METH_VARARGS,
      "reconstruct a RowProxy instance from its pickled form."},
+    {"make_rows", make_rows, METH_VARARGS,
+     "Construct row objects of the given class from raw DBAPI rows, "
+     "applying result processors to each row as a whole."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -605,6 +605,22 @@ Declarative form::
 This option can also be specified engine-wide using the
 ``implicit_returning=False`` argument on :func:`.create_engine`.
 
+INSERT of Many Rows with OUTPUT
+-------------------------------
+
+On SQL Server 2008 and above, an INSERT which makes use of
+:meth:`.UpdateBase.returning` and is executed with many parameter sets is
+rendered as a series of INSERT..OUTPUT statements, each of which includes
+many rows in its VALUES clause, limited to 2099 bound parameters per
+statement.  As SQL Server doesn't guarantee that the rows delivered by
+OUTPUT INSERTED are in the order of the VALUES clause, newly generated
+primary keys are not fetched for an INSERT using
+:meth:`.ValuesBase.return_defaults` with many parameter sets, and the ORM
+continues to INSERT new objects one row at a time when it needs to fetch
+their primary keys.
+
+.. versionadded:: 1.4
+
 .. _mssql_rowcount_versioning:
 
 Rowcount Support / ORM Versioning
@@ -2193,6 +2209,12 @@ class MSDialect(default.DefaultDialect):
     supports_unicode_binds = True
     postfetch_lastrowid = True
 
+    # SQL Server accepts at most 2100 parameters per statement.  The rows
+    # of an INSERT..OUTPUT with many VALUES aren't guaranteed to be
+    # delivered in order, so new primary keys aren't fetched for an
+    # executemany, however statements using returning() are batched
+    insertmanyvalues_max_parameters = 2099
+
     server_version_info = ()
 
     statement_compiler = MSSQLCompiler
@@ -2339,6 +2361,7 @@ class MSDialect(default.DefaultDialect):
             self.implicit_returning = True
         if self.server_version_info >= MS_2008_VERSION:
             self.supports_multivalues_insert = True
+            self.use_insertmanyvalues = True
         if self.deprecate_large_types is None:
             self.deprecate_large_types = (
                 self.server_version_info >= MS_2012_VERSION
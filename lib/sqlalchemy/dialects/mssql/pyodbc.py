@@ -110,6 +110,28 @@ in order to use this flag::
     `fast executemany <https://github.com/mkleehammer/pyodbc/wiki/Features-beyond-the-DB-API#fast_executemany>`_
     - on github
 
+.. _mssql_pyodbc_stream_results:
+
+Streaming Results
+-----------------
+
+Pyodbc retrieves the rows of a result from the ODBC driver as they are
+fetched.  The pyodbc SQL Server dialect therefore supports the
+:paramref:`.Connection.execution_options.stream_results` execution option,
+as well as the ``server_side_cursors=True`` argument to
+:func:`.create_engine` which enables it for all SELECT statements; a
+:class:`.BufferedRowResultProxy` is used so that the number of rows held in
+memory at once is limited to that set by the ``max_row_buffer`` execution
+option, defaulting to 1000.   This is also used by the ORM
+:meth:`.Query.yield_per` method.
+
+Note that unless Multiple Active Result Sets are enabled for the connection,
+using the ``MARS_Connection=yes`` ODBC keyword, SQL Server does not allow
+other statements to be executed on the same connection until a streamed
+result is fully consumed or closed.
+
+.. versionadded:: 1.4
+
 
 """  # noqa
 
@@ -232,6 +254,10 @@ class _BINARY_pyodbc(_ms_binary_pyodbc, BINARY):
 class MSExecutionContext_pyodbc(MSExecutionContext):
     _embedded_scope_identity = False
 
+    def create_server_side_cursor(self):
+        # pyodbc fetches rows from the driver as they are requested
+        return self._dbapi_connection.cursor()
+
     def pre_exec(self):
         """where appropriate, issue "select scope_identity()" in the same
         statement.
@@ -283,6 +309,8 @@ class MSDialect_pyodbc(PyODBCConnector, MSDialect):
 
     execution_ctx_cls = MSExecutionContext_pyodbc
 
+    supports_server_side_cursors = True
+
     colspecs = util.update_copy(
         MSDialect.colspecs,
         {
@@ -299,7 +327,11 @@ class MSDialect_pyodbc(PyODBCConnector, MSDialect):
     )
 
     def __init__(
-        self, description_encoding=None, fast_executemany=False, **params
+        self,
+        description_encoding=None,
+        fast_executemany=False,
+        server_side_cursors=False,
+        **params
     ):
         if "description_encoding" in params:
             self.description_encoding = params.pop("description_encoding")
@@ -315,6 +347,7 @@ class MSDialect_pyodbc(PyODBCConnector, MSDialect):
             8,
         )
         self.fast_executemany = fast_executemany
+        self.server_side_cursors = server_side_cursors
 
     def _get_server_version_info(self, connection):
         try:
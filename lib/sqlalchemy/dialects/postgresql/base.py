@@ -38,7 +38,17 @@ subsequent insert. Note that when an
 :func:`~sqlalchemy.sql.expression.insert()` construct is executed using
 "executemany" semantics, the "last inserted identifier" functionality does not
 apply; no RETURNING clause is emitted nor is the sequence pre-executed in this
-case.
+case, unless :meth:`.ValuesBase.return_defaults` is used.  In that case,
+as well as when :meth:`.UpdateBase.returning` is used, the parameter sets
+are rendered as many rows into the VALUES clause of a series of INSERT
+statements, each of which includes up to
+:paramref:`.create_engine.insertmanyvalues_page_size` rows, and the new
+primary key values are available from
+:attr:`.ResultProxy.inserted_primary_key_rows`.  The ORM makes use of this
+when flushing many new objects.
+
+.. versionchanged:: 1.4  INSERT executed with many parameter sets may fetch
+   newly generated primary key values using RETURNING.
 
 To force the usage of RETURNING by default off, specify the flag
 ``implicit_returning=False`` to :func:`.create_engine`.
@@ -2358,6 +2368,8 @@ class PGDialect(default.DefaultDialect):
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    use_insertmanyvalues = True
+    supports_multi_reflection = True
     default_paramstyle = "pyformat"
     ischema_names = ischema_names
     colspecs = colspecs
@@ -2419,6 +2431,7 @@ class PGDialect(default.DefaultDialect):
             8,
             2,
         ) and self.__dict__.get("implicit_returning", True)
+        self.insert_executemany_returning = self.implicit_returning
         self.supports_native_enum = self.server_version_info >= (8, 3)
         if not self.supports_native_enum:
             self.colspecs = self.colspecs.copy()
@@ -2707,6 +2720,123 @@ class PGDialect(default.DefaultDialect):
             raise exc.NoSuchTableError(table_name)
         return table_oid
 
+    def get_schema_fingerprint(self, connection):
+        # every DDL statement inserts, updates or deletes rows in the
+        # catalogs consulted by reflection, giving each affected row a new
+        # xmin; the search path is included as it determines the tables
+        # reflected when no schema is given.  The temporary schemas of
+        # all sessions are excluded, as they change constantly.
+        query = """
+            WITH temp_ns AS (
+                SELECT oid FROM pg_catalog.pg_namespace
+                WHERE nspname LIKE 'pg\\_temp\\_%'
+                    OR nspname LIKE 'pg\\_toast\\_temp\\_%'
+            ), cls AS (
+                SELECT oid, xmin FROM pg_catalog.pg_class
+                WHERE relnamespace NOT IN (SELECT oid FROM temp_ns)
+            ), typ AS (
+                SELECT oid, xmin FROM pg_catalog.pg_type
+                WHERE typnamespace NOT IN (SELECT oid FROM temp_ns)
+            )
+            SELECT md5(string_agg(entry, ',' ORDER BY entry))
+            FROM (
+                SELECT 'n' || oid::text || ':' || xmin::text
+                FROM pg_catalog.pg_namespace
+                WHERE oid NOT IN (SELECT oid FROM temp_ns)
+                UNION ALL
+                SELECT 'c' || oid::text || ':' || xmin::text
+                FROM cls
+                UNION ALL
+                SELECT 'a' || attrelid::text || '.' || attnum::text
+                    || ':' || xmin::text
+                FROM pg_catalog.pg_attribute
+                WHERE attnum > 0 AND attrelid IN (SELECT oid FROM cls)
+                UNION ALL
+                SELECT 'o' || oid::text || ':' || xmin::text
+                FROM pg_catalog.pg_constraint
+                WHERE connamespace NOT IN (SELECT oid FROM temp_ns)
+                UNION ALL
+                SELECT 'd' || objoid::text || '.' || objsubid::text
+                    || ':' || xmin::text
+                FROM pg_catalog.pg_description
+                WHERE objoid NOT IN (
+                    SELECT oid FROM pg_catalog.pg_class
+                    WHERE relnamespace IN (SELECT oid FROM temp_ns)
+                )
+                UNION ALL
+                SELECT 't' || oid::text || ':' || xmin::text
+                FROM typ
+                UNION ALL
+                SELECT 'e' || oid::text || ':' || xmin::text
+                FROM pg_catalog.pg_enum
+                WHERE enumtypid IN (SELECT oid FROM typ)
+            ) AS fingerprint (entry)
+        """
+        return (
+            connection.execute(sql.text("SHOW search_path")).scalar(),
+            connection.execute(sql.text(query)).scalar(),
+        )
+
+    def _get_table_oids(self, connection, schema, filter_names):
+        """Fetch the oids of the given tables, or of all tables and views
+        in the schema, as a dictionary of oid to table name."""
+
+        params = {}
+        binds = []
+        if schema is None and filter_names is not None:
+            # as is the case for get_table_oid()
+            where = ["pg_catalog.pg_table_is_visible(c.oid)"]
+        else:
+            where = ["n.nspname = :schema"]
+            binds.append(sql.bindparam("schema", type_=sqltypes.Unicode))
+            params["schema"] = util.text_type(
+                schema if schema is not None else self.default_schema_name
+            )
+        if filter_names is not None:
+            where.append("c.relname IN :filter_names")
+            binds.append(
+                sql.bindparam(
+                    "filter_names", type_=sqltypes.Unicode, expanding=True
+                )
+            )
+            params["filter_names"] = [
+                util.text_type(name) for name in filter_names
+            ]
+
+        query = """
+            SELECT c.oid, c.relname
+            FROM pg_catalog.pg_class c
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE %s
+            AND c.relkind in ('r', 'v', 'm', 'f', 'p')
+        """ % " AND ".join(
+            where
+        )
+        s = (
+            sql.text(query)
+            .bindparams(*binds)
+            .columns(oid=sqltypes.Integer, relname=sqltypes.Unicode)
+        )
+        return dict(connection.execute(s, **params).fetchall())
+
+    def _get_multi(self, fn, default, connection, schema, filter_names, **kw):
+        """Implement a ``get_multi_*`` method given a function which
+        returns information for a list of table oids."""
+
+        table_oids = self._get_table_oids(connection, schema, filter_names)
+        if not table_oids:
+            return {}
+        by_oid = fn(connection, list(table_oids), schema, **kw)
+        return dict(
+            ((schema, table_name), by_oid.get(table_oid, default()))
+            for table_oid, table_name in table_oids.items()
+        )
+
+    def _table_oids_text(self, query):
+        return sql.text(query).bindparams(
+            sql.bindparam("table_oids", type_=sqltypes.Integer, expanding=True)
+        )
+
     @reflection.cache
     def get_schema_names(self, connection, **kw):
         result = connection.execute(
@@ -2792,6 +2922,22 @@ class PGDialect(default.DefaultDialect):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_columns_for_oids(connection, [table_oid], schema).get(
+            table_oid, []
+        )
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self._get_columns_for_oids,
+            list,
+            connection,
+            schema,
+            filter_names,
+        )
+
+    def _get_columns_for_oids(self, connection, table_oids, schema):
         SQL_COLS = """
             SELECT a.attname,
               pg_catalog.format_type(a.atttypid, a.atttypmod),
@@ -2805,16 +2951,14 @@ class PGDialect(default.DefaultDialect):
             FROM pg_catalog.pg_attribute a
             LEFT JOIN pg_catalog.pg_description pgd ON (
                 pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
-            WHERE a.attrelid = :table_oid
+            WHERE a.attrelid IN :table_oids
             AND a.attnum > 0 AND NOT a.attisdropped
-            ORDER BY a.attnum
+            ORDER BY a.attrelid, a.attnum
         """
-        s = (
-            sql.text(SQL_COLS)
-            .bindparams(sql.bindparam("table_oid", type_=sqltypes.Integer))
-            .columns(attname=sqltypes.Unicode, default=sqltypes.Unicode)
+        s = self._table_oids_text(SQL_COLS).columns(
+            attname=sqltypes.Unicode, default=sqltypes.Unicode
         )
-        c = connection.execute(s, table_oid=table_oid)
+        c = connection.execute(s, table_oids=table_oids)
         rows = c.fetchall()
 
         # dictionary with (name, ) if default search path or (schema, name)
@@ -2831,7 +2975,7 @@ class PGDialect(default.DefaultDialect):
         )
 
         # format columns
-        columns = []
+        columns = defaultdict(list)
 
         for (
             name,
@@ -2852,7 +2996,7 @@ class PGDialect(default.DefaultDialect):
                 schema,
                 comment,
             )
-            columns.append(column_info)
+            columns[table_oid].append(column_info)
         return columns
 
     def _get_column_info(
@@ -3011,17 +3155,32 @@ class PGDialect(default.DefaultDialect):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_pk_constraint_for_oids(
+            connection, [table_oid], schema
+        )[table_oid]
 
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self._get_pk_constraint_for_oids,
+            dict,
+            connection,
+            schema,
+            filter_names,
+        )
+
+    def _get_pk_constraint_for_oids(self, connection, table_oids, schema):
         if self.server_version_info < (8, 4):
             PK_SQL = """
-                SELECT a.attname
+                SELECT t.oid, a.attname
                 FROM
                     pg_class t
                     join pg_index ix on t.oid = ix.indrelid
                     join pg_attribute a
                         on t.oid=a.attrelid AND %s
                  WHERE
-                  t.oid = :table_oid and ix.indisprimary = 't'
+                  t.oid IN :table_oids and ix.indisprimary = 't'
                 ORDER BY a.attnum
             """ % self._pg_index_any(
                 "a.attnum", "ix.indkey"
@@ -3031,31 +3190,45 @@ class PGDialect(default.DefaultDialect):
             # unnest() and generate_subscripts() both introduced in
             # version 8.4
             PK_SQL = """
-                SELECT a.attname
+                SELECT a.attrelid, a.attname
                 FROM pg_attribute a JOIN (
-                    SELECT unnest(ix.indkey) attnum,
+                    SELECT ix.indrelid, unnest(ix.indkey) attnum,
                            generate_subscripts(ix.indkey, 1) ord
                     FROM pg_index ix
-                    WHERE ix.indrelid = :table_oid AND ix.indisprimary
-                    ) k ON a.attnum=k.attnum
-                WHERE a.attrelid = :table_oid
+                    WHERE ix.indrelid IN :table_oids AND ix.indisprimary
+                    ) k ON a.attrelid=k.indrelid AND a.attnum=k.attnum
                 ORDER BY k.ord
             """
-        t = sql.text(PK_SQL).columns(attname=sqltypes.Unicode)
-        c = connection.execute(t, table_oid=table_oid)
-        cols = [r[0] for r in c.fetchall()]
+        t = self._table_oids_text(PK_SQL).columns(attname=sqltypes.Unicode)
+        c = connection.execute(t, table_oids=table_oids)
+        cols = defaultdict(list)
+        for table_oid, attname in c.fetchall():
+            cols[table_oid].append(attname)
 
         PK_CONS_SQL = """
-        SELECT conname
+        SELECT r.conrelid, conname
            FROM  pg_catalog.pg_constraint r
-           WHERE r.conrelid = :table_oid AND r.contype = 'p'
-           ORDER BY 1
+           WHERE r.conrelid IN :table_oids AND r.contype = 'p'
+           ORDER BY 2
         """
-        t = sql.text(PK_CONS_SQL).columns(conname=sqltypes.Unicode)
-        c = connection.execute(t, table_oid=table_oid)
-        name = c.scalar()
+        t = self._table_oids_text(PK_CONS_SQL).columns(
+            conname=sqltypes.Unicode
+        )
+        c = connection.execute(t, table_oids=table_oids)
+        names = {}
+        for table_oid, conname in c.fetchall():
+            names.setdefault(table_oid, conname)
 
-        return {"constrained_columns": cols, "name": name}
+        return dict(
+            (
+                table_oid,
+                {
+                    "constrained_columns": cols[table_oid],
+                    "name": names.get(table_oid),
+                },
+            )
+            for table_oid in table_oids
+        )
 
     @reflection.cache
     def get_foreign_keys(
@@ -3066,20 +3239,52 @@ class PGDialect(default.DefaultDialect):
         postgresql_ignore_search_path=False,
         **kw
     ):
-        preparer = self.identifier_preparer
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_foreign_keys_for_oids(
+            connection,
+            [table_oid],
+            schema,
+            postgresql_ignore_search_path=postgresql_ignore_search_path,
+        ).get(table_oid, [])
+
+    def get_multi_foreign_keys(
+        self,
+        connection,
+        schema=None,
+        filter_names=None,
+        postgresql_ignore_search_path=False,
+        **kw
+    ):
+        return self._get_multi(
+            self._get_foreign_keys_for_oids,
+            list,
+            connection,
+            schema,
+            filter_names,
+            postgresql_ignore_search_path=postgresql_ignore_search_path,
+        )
+
+    def _get_foreign_keys_for_oids(
+        self,
+        connection,
+        table_oids,
+        schema,
+        postgresql_ignore_search_path=False,
+    ):
+        preparer = self.identifier_preparer
 
         FK_SQL = """
           SELECT r.conname,
                 pg_catalog.pg_get_constraintdef(r.oid, true) as condef,
-                n.nspname as conschema
+                n.nspname as conschema,
+                r.conrelid
           FROM  pg_catalog.pg_constraint r,
                 pg_namespace n,
                 pg_class c
 
-          WHERE r.conrelid = :table AND
+          WHERE r.conrelid IN :table_oids AND
                 r.contype = 'f' AND
                 c.oid = confrelid AND
                 n.oid = c.relnamespace
@@ -3097,12 +3302,12 @@ class PGDialect(default.DefaultDialect):
             r"[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?"
         )
 
-        t = sql.text(FK_SQL).columns(
+        t = self._table_oids_text(FK_SQL).columns(
             conname=sqltypes.Unicode, condef=sqltypes.Unicode
         )
-        c = connection.execute(t, table=table_oid)
-        fkeys = []
-        for conname, condef, conschema in c.fetchall():
+        c = connection.execute(t, table_oids=table_oids)
+        fkeys = defaultdict(list)
+        for conname, condef, conschema, table_oid in c.fetchall():
             m = re.search(FK_REGEX, condef).groups()
 
             (
@@ -3169,7 +3374,7 @@ class PGDialect(default.DefaultDialect):
                 "referred_columns": referred_columns,
                 "options": options,
             }
-            fkeys.append(fkey_d)
+            fkeys[table_oid].append(fkey_d)
         return fkeys
 
     def _pg_index_any(self, col, compare_to):
@@ -3191,7 +3396,22 @@ class PGDialect(default.DefaultDialect):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_indexes_for_oids(connection, [table_oid], schema).get(
+            table_oid, []
+        )
 
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self._get_indexes_for_oids,
+            list,
+            connection,
+            schema,
+            filter_names,
+        )
+
+    def _get_indexes_for_oids(self, connection, table_oids, schema):
         # cast indkey as varchar since it's an int2vector,
         # returned as a list by some drivers such as pypostgresql
 
@@ -3201,7 +3421,7 @@ class PGDialect(default.DefaultDialect):
                   i.relname as relname,
                   ix.indisunique, ix.indexprs, ix.indpred,
                   a.attname, a.attnum, NULL, ix.indkey%s,
-                  %s, %s, am.amname
+                  %s, %s, am.amname, t.oid
               FROM
                   pg_class t
                         join pg_index ix on t.oid = ix.indrelid
@@ -3214,7 +3434,7 @@ class PGDialect(default.DefaultDialect):
                             on i.relam = am.oid
               WHERE
                   t.relkind IN ('r', 'v', 'f', 'm')
-                  and t.oid = :table_oid
+                  and t.oid IN :table_oids
                   and ix.indisprimary = 'f'
               ORDER BY
                   t.relname,
@@ -3238,7 +3458,7 @@ class PGDialect(default.DefaultDialect):
                   i.relname as relname,
                   ix.indisunique, ix.indexprs, ix.indpred,
                   a.attname, a.attnum, c.conrelid, ix.indkey::varchar,
-                  ix.indoption::varchar, i.reloptions, am.amname
+                  ix.indoption::varchar, i.reloptions, am.amname, t.oid
               FROM
                   pg_class t
                         join pg_index ix on t.oid = ix.indrelid
@@ -3256,19 +3476,21 @@ class PGDialect(default.DefaultDialect):
                             on i.relam = am.oid
               WHERE
                   t.relkind IN ('r', 'v', 'f', 'm', 'p')
-                  and t.oid = :table_oid
+                  and t.oid IN :table_oids
                   and ix.indisprimary = 'f'
               ORDER BY
                   t.relname,
                   i.relname
             """
 
-        t = sql.text(IDX_SQL).columns(
+        t = self._table_oids_text(IDX_SQL).columns(
             relname=sqltypes.Unicode, attname=sqltypes.Unicode
         )
-        c = connection.execute(t, table_oid=table_oid)
+        c = connection.execute(t, table_oids=table_oids)
 
-        indexes = defaultdict(lambda: defaultdict(dict))
+        table_indexes = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(dict))
+        )
 
         sv_idx_name = None
         for row in c.fetchall():
@@ -3284,6 +3506,7 @@ class PGDialect(default.DefaultDialect):
                 idx_option,
                 options,
                 amname,
+                table_oid,
             ) = row
 
             if expr:
@@ -3302,6 +3525,7 @@ class PGDialect(default.DefaultDialect):
                 )
                 sv_idx_name = idx_name
 
+            indexes = table_indexes[table_oid]
             has_idx = idx_name in indexes
             index = indexes[idx_name]
             if col is not None:
@@ -3346,29 +3570,32 @@ class PGDialect(default.DefaultDialect):
                 if amname and amname != "btree":
                     index["amname"] = amname
 
-        result = []
-        for name, idx in indexes.items():
-            entry = {
-                "name": name,
-                "unique": idx["unique"],
-                "column_names": [idx["cols"][i] for i in idx["key"]],
-            }
-            if "duplicates_constraint" in idx:
-                entry["duplicates_constraint"] = idx["duplicates_constraint"]
-            if "sorting" in idx:
-                entry["column_sorting"] = dict(
-                    (idx["cols"][idx["key"][i]], value)
-                    for i, value in idx["sorting"].items()
-                )
-            if "options" in idx:
-                entry.setdefault("dialect_options", {})[
-                    "postgresql_with"
-                ] = idx["options"]
-            if "amname" in idx:
-                entry.setdefault("dialect_options", {})[
-                    "postgresql_using"
-                ] = idx["amname"]
-            result.append(entry)
+        result = defaultdict(list)
+        for table_oid, indexes in table_indexes.items():
+            for name, idx in indexes.items():
+                entry = {
+                    "name": name,
+                    "unique": idx["unique"],
+                    "column_names": [idx["cols"][i] for i in idx["key"]],
+                }
+                if "duplicates_constraint" in idx:
+                    entry["duplicates_constraint"] = idx[
+                        "duplicates_constraint"
+                    ]
+                if "sorting" in idx:
+                    entry["column_sorting"] = dict(
+                        (idx["cols"][idx["key"][i]], value)
+                        for i, value in idx["sorting"].items()
+                    )
+                if "options" in idx:
+                    entry.setdefault("dialect_options", {})[
+                        "postgresql_with"
+                    ] = idx["options"]
+                if "amname" in idx:
+                    entry.setdefault("dialect_options", {})[
+                        "postgresql_using"
+                    ] = idx["amname"]
+                result[table_oid].append(entry)
         return result
 
     @reflection.cache
@@ -3378,9 +3605,25 @@ class PGDialect(default.DefaultDialect):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_unique_constraints_for_oids(
+            connection, [table_oid], schema
+        ).get(table_oid, [])
 
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self._get_unique_constraints_for_oids,
+            list,
+            connection,
+            schema,
+            filter_names,
+        )
+
+    def _get_unique_constraints_for_oids(self, connection, table_oids, schema):
         UNIQUE_SQL = """
             SELECT
+                cons.conrelid as table_oid,
                 cons.conname as name,
                 cons.conkey as key,
                 a.attnum as col_num,
@@ -3391,61 +3634,113 @@ class PGDialect(default.DefaultDialect):
                   on cons.conrelid = a.attrelid AND
                     a.attnum = ANY(cons.conkey)
             WHERE
-                cons.conrelid = :table_oid AND
+                cons.conrelid IN :table_oids AND
                 cons.contype = 'u'
         """
 
-        t = sql.text(UNIQUE_SQL).columns(col_name=sqltypes.Unicode)
-        c = connection.execute(t, table_oid=table_oid)
+        t = self._table_oids_text(UNIQUE_SQL).columns(
+            col_name=sqltypes.Unicode
+        )
+        c = connection.execute(t, table_oids=table_oids)
 
-        uniques = defaultdict(lambda: defaultdict(dict))
+        table_uniques = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(dict))
+        )
         for row in c.fetchall():
-            uc = uniques[row.name]
+            uc = table_uniques[row.table_oid][row.name]
             uc["key"] = row.key
             uc["cols"][row.col_num] = row.col_name
 
-        return [
-            {"name": name, "column_names": [uc["cols"][i] for i in uc["key"]]}
-            for name, uc in uniques.items()
-        ]
+        return dict(
+            (
+                table_oid,
+                [
+                    {
+                        "name": name,
+                        "column_names": [uc["cols"][i] for i in uc["key"]],
+                    }
+                    for name, uc in uniques.items()
+                ],
+            )
+            for table_oid, uniques in table_uniques.items()
+        )
 
     @reflection.cache
     def get_table_comment(self, connection, table_name, schema=None, **kw):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_table_comment_for_oids(
+            connection, [table_oid], schema
+        ).get(table_oid, {"text": None})
 
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self._get_table_comment_for_oids,
+            lambda: {"text": None},
+            connection,
+            schema,
+            filter_names,
+        )
+
+    def _get_table_comment_for_oids(self, connection, table_oids, schema):
         COMMENT_SQL = """
             SELECT
+                pgd.objoid as table_oid,
                 pgd.description as table_comment
             FROM
                 pg_catalog.pg_description pgd
             WHERE
                 pgd.objsubid = 0 AND
-                pgd.objoid = :table_oid
+                pgd.objoid IN :table_oids
         """
 
-        c = connection.execute(sql.text(COMMENT_SQL), table_oid=table_oid)
-        return {"text": c.scalar()}
+        c = connection.execute(
+            self._table_oids_text(COMMENT_SQL), table_oids=table_oids
+        )
+        return dict(
+            (table_oid, {"text": comment})
+            for table_oid, comment in c.fetchall()
+        )
 
     @reflection.cache
     def get_check_constraints(self, connection, table_name, schema=None, **kw):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_check_constraints_for_oids(
+            connection, [table_oid], schema
+        ).get(table_oid, [])
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi(
+            self._get_check_constraints_for_oids,
+            list,
+            connection,
+            schema,
+            filter_names,
+        )
 
+    def _get_check_constraints_for_oids(self, connection, table_oids, schema):
         CHECK_SQL = """
             SELECT
+                cons.conrelid as table_oid,
                 cons.conname as name,
                 pg_get_constraintdef(cons.oid) as src
             FROM
                 pg_catalog.pg_constraint cons
             WHERE
-                cons.conrelid = :table_oid AND
+                cons.conrelid IN :table_oids AND
                 cons.contype = 'c'
         """
 
-        c = connection.execute(sql.text(CHECK_SQL), table_oid=table_oid)
+        c = connection.execute(
+            self._table_oids_text(CHECK_SQL), table_oids=table_oids
+        )
 
         # samples:
         # "CHECK (((a > 1) AND (a < 5)))"
@@ -3457,10 +3752,12 @@ class PGDialect(default.DefaultDialect):
                 return ""
             return m.group(1)
 
-        return [
-            {"name": name, "sqltext": match_cons(src)}
-            for name, src in c.fetchall()
-        ]
+        checks = defaultdict(list)
+        for table_oid, name, src in c.fetchall():
+            checks[table_oid].append(
+                {"name": name, "sqltext": match_cons(src)}
+            )
+        return checks
 
     def _load_enums(self, connection, schema=None):
         schema = schema or self.default_schema_name
@@ -456,6 +456,27 @@ The index will be rendered at create time as::
 
 .. versionadded:: 0.9.9
 
+.. _sqlite_insertmanyvalues:
+
+INSERT of Many Rows with RETURNING
+----------------------------------
+
+SQLite version 3.35 and above supports the RETURNING clause.  When an
+INSERT which makes use of :meth:`.ValuesBase.return_defaults` or
+:meth:`.UpdateBase.returning` is executed with many parameter sets, the
+SQLite dialect renders many rows into the VALUES clause of each INSERT
+statement, so that newly generated primary key values are fetched for
+all rows in a small number of statements.  The ORM makes use of this when
+flushing many new objects.  The number of rows rendered into each
+statement is configured using the
+:paramref:`.create_engine.insertmanyvalues_page_size` parameter.
+
+RETURNING is not otherwise used by the SQLite dialect, which continues
+to fetch the primary key of a single-row INSERT using
+``cursor.lastrowid``.
+
+.. versionadded:: 1.4
+
 .. _sqlite_dotted_column_names:
 
 Dotted Column Names
@@ -570,6 +591,7 @@ When using the per-:class:`.Engine` execution option, note that
 """  # noqa
 
 import datetime
+import itertools
 import re
 
 from .json import JSON
@@ -610,6 +632,16 @@ class _DateTimeMixin(object):
         if storage_format is not None:
             self._storage_format = storage_format
 
+    @util.memoized_property
+    def _cache_key(self):
+        # the storage format and regexp determine the bind and result
+        # processing of the type, so must be part of the key used by
+        # the compiled cache
+        return super(_DateTimeMixin, self)._cache_key + (
+            self._storage_format,
+            self._reg.pattern if self._reg is not None else None,
+        )
+
     @property
     def format_is_text_affinity(self):
         """return True if the storage format will automatically imply
@@ -1029,6 +1061,14 @@ class SQLiteCompiler(compiler.SQLCompiler):
             ", ".join("1" for type_ in element_types or [INTEGER()]),
         )
 
+    def returning_clause(self, stmt, returning_cols):
+        columns = [
+            self._label_select_column(None, c, True, False, {})
+            for c in sql.expression._select_iterables(returning_cols)
+        ]
+
+        return "RETURNING " + ", ".join(columns)
+
 
 class SQLiteDDLCompiler(compiler.DDLCompiler):
     def get_column_specification(self, column, **kwargs):
@@ -1473,6 +1513,20 @@ class SQLiteDialect(default.DefaultDialect):
                 14,
             )
 
+            # table-valued PRAGMA functions, used by the get_multi_*
+            # reflection methods
+            # http://www.sqlite.org/releaselog/3_16_0.html
+            self.supports_multi_reflection = (
+                self.dbapi.sqlite_version_info >= (3, 16)
+            )
+
+            # http://www.sqlite.org/releaselog/3_35_0.html
+            self.use_insertmanyvalues = self.dbapi.sqlite_version_info >= (
+                3,
+                35,
+            )
+            self.insert_executemany_returning = self.use_insertmanyvalues
+
     _isolation_lookup = {"READ UNCOMMITTED": 1, "SERIALIZABLE": 0}
 
     def set_isolation_level(self, connection, level):
@@ -1720,6 +1774,253 @@ class SQLiteDialect(default.DefaultDialect):
 
         return {"constrained_columns": pkeys, "name": constraint_name}
 
+    def _multi_reflection_schemas(self, schema, filter_names):
+        # as is the case for _get_table_pragma(), tables in the 'temp'
+        # schema share the namespace of those in 'main' when named
+        # explicitly; otherwise, as for get_table_names(), only 'main'
+        # is included
+        if schema is not None:
+            return [schema]
+        elif filter_names is not None:
+            return ["main", "temp"]
+        else:
+            return ["main"]
+
+    def _get_multi_pragma(
+        self, connection, schema, filter_names, columns, joins, order_by=None
+    ):
+        # a single statement per database, joining sqlite_master to the
+        # table-valued forms of PRAGMA (SQLite 3.16 and above); yields
+        # (key, sql, rows) for each table or view, where rows contains
+        # the given columns.  joins are made in the order given, so that
+        # without an ORDER BY, rows come in the order the PRAGMA itself
+        # returns them, grouped by table.
+        quote = self.identifier_preparer.quote_identifier
+        seen = set()
+        for dbname in self._multi_reflection_schemas(schema, filter_names):
+            s = sql.text(
+                "SELECT m.name, m.type, m.sql, %s "
+                "FROM %s.sqlite_master AS m %s "
+                "WHERE m.type IN ('table', 'view')%s%s"
+                % (
+                    columns,
+                    quote(dbname),
+                    joins,
+                    " AND m.name IN :filter_names"
+                    if filter_names is not None
+                    else "",
+                    " ORDER BY %s" % order_by if order_by else "",
+                )
+            )
+            params = {"dbname": dbname}
+            if filter_names is not None:
+                s = s.bindparams(sql.bindparam("filter_names", expanding=True))
+                params["filter_names"] = list(filter_names)
+
+            for name, rows in itertools.groupby(
+                connection.execute(s, **params), lambda row: row[0]
+            ):
+                if name in seen:
+                    # a 'temp' table hidden by one in 'main'
+                    continue
+                seen.add(name)
+                rows = list(rows)
+                table_sql = rows[0][2] if rows[0][1] == "table" else None
+                yield (schema, name), table_sql, [row[3:] for row in rows]
+
+    def _get_multi_table_info(self, connection, schema, filter_names):
+        return self._get_multi_pragma(
+            connection,
+            schema,
+            filter_names,
+            'p.name, p.type, p."notnull", p.dflt_value, p.pk',
+            "JOIN pragma_table_info(m.name, :dbname) AS p",
+            order_by="m.name, p.cid",
+        )
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_columns(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        return dict(
+            (
+                key,
+                [
+                    self._get_column_info(
+                        row[0], row[1].upper(), not row[2], row[3], row[4]
+                    )
+                    for row in rows
+                ],
+            )
+            for key, table_sql, rows in self._get_multi_table_info(
+                connection, schema, filter_names
+            )
+        )
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        result = {}
+        for key, table_sql, rows in self._get_multi_table_info(
+            connection, schema, filter_names
+        ):
+            constraint_name = None
+            if table_sql:
+                PK_PATTERN = r"CONSTRAINT (\w+) PRIMARY KEY"
+                m = re.search(PK_PATTERN, table_sql, re.I)
+                constraint_name = m.group(1) if m else None
+
+            result[key] = {
+                "constrained_columns": [row[0] for row in rows if row[4]],
+                "name": constraint_name,
+            }
+        return result
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_foreign_keys(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        return dict(
+            (
+                key,
+                self._get_foreign_keys_from_pragma(
+                    key[1],
+                    schema,
+                    [row for row in rows if row[0] is not None],
+                    table_sql,
+                ),
+            )
+            for key, table_sql, rows in self._get_multi_pragma(
+                connection,
+                schema,
+                filter_names,
+                'p.id, p.seq, p."table", p."from", p."to"',
+                "LEFT OUTER JOIN "
+                "pragma_foreign_key_list(m.name, :dbname) AS p",
+            )
+        )
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        include_auto_indexes = kw.pop("include_auto_indexes", False)
+        result = {}
+        for key, table_sql, rows in self._get_multi_pragma(
+            connection,
+            schema,
+            filter_names,
+            'il.name, il."unique", ii.name',
+            "LEFT OUTER JOIN pragma_index_list(m.name, :dbname) AS il "
+            "LEFT OUTER JOIN pragma_index_info(il.name, :dbname) AS ii",
+        ):
+            indexes = result[key] = []
+            for name, idx_rows in itertools.groupby(rows, lambda row: row[0]):
+                if name is None or (
+                    not include_auto_indexes
+                    and name.startswith("sqlite_autoindex")
+                ):
+                    continue
+                idx_rows = list(idx_rows)
+                if any(row[2] is None for row in idx_rows):
+                    util.warn(
+                        "Skipped unsupported reflection of "
+                        "expression-based index %s" % name
+                    )
+                    continue
+                indexes.append(
+                    dict(
+                        name=name,
+                        column_names=[row[2] for row in idx_rows],
+                        unique=idx_rows[0][1],
+                    )
+                )
+        return result
+
+    def _get_multi_table_sql(self, connection, schema, filter_names):
+        return dict(
+            (key, table_sql)
+            for key, table_sql, rows in self._get_multi_pragma(
+                connection, schema, filter_names, "NULL", ""
+            )
+        )
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_unique_constraints(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        indexes = self.get_multi_indexes(
+            connection,
+            schema=schema,
+            filter_names=filter_names,
+            include_auto_indexes=True,
+            **kw
+        )
+        return dict(
+            (
+                key,
+                self._get_unique_constraints_from_sql(
+                    table_sql, indexes.get(key, [])
+                ),
+            )
+            for key, table_sql in self._get_multi_table_sql(
+                connection, schema, filter_names
+            ).items()
+        )
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_check_constraints(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        return dict(
+            (key, self._get_check_constraints_from_sql(table_sql))
+            for key, table_sql in self._get_multi_table_sql(
+                connection, schema, filter_names
+            ).items()
+        )
+
+    def get_schema_fingerprint(self, connection):
+        # an in-memory or temporary database isn't shared with any other
+        # process, so there's nothing to compare against
+        files = dict(
+            (row[1], row[2])
+            for row in connection.execute("PRAGMA database_list")
+        )
+        if not files.get("main"):
+            return None
+
+        # SQLite increments the schema_version of a database each time
+        # its schema is changed
+        return (files["main"],) + tuple(
+            connection.execute("PRAGMA %s.schema_version" % dbname).scalar()
+            for dbname in ("main", "temp")
+        )
+
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
         # sqlite makes this *extremely difficult*.
@@ -1727,7 +2028,14 @@ class SQLiteDialect(default.DefaultDialect):
         pragma_fks = self._get_table_pragma(
             connection, "foreign_key_list", table_name, schema=schema
         )
+        table_data = self._get_table_sql(connection, table_name, schema=schema)
+        return self._get_foreign_keys_from_pragma(
+            table_name, schema, pragma_fks, table_data
+        )
 
+    def _get_foreign_keys_from_pragma(
+        self, table_name, schema, pragma_fks, table_data
+    ):
         fks = {}
 
         for row in pragma_fks:
@@ -1778,7 +2086,6 @@ class SQLiteDialect(default.DefaultDialect):
             for fk in fks.values()
         )
 
-        table_data = self._get_table_sql(connection, table_name, schema=schema)
         if table_data is None:
             # system tables, etc.
             return []
@@ -1865,25 +2172,29 @@ class SQLiteDialect(default.DefaultDialect):
         self, connection, table_name, schema=None, **kw
     ):
 
-        auto_index_by_sig = {}
-        for idx in self.get_indexes(
+        indexes = self.get_indexes(
             connection,
             table_name,
             schema=schema,
             include_auto_indexes=True,
             **kw
-        ):
-            if not idx["name"].startswith("sqlite_autoindex"):
-                continue
-            sig = tuple(idx["column_names"])
-            auto_index_by_sig[sig] = idx
-
+        )
         table_data = self._get_table_sql(
             connection, table_name, schema=schema, **kw
         )
+        return self._get_unique_constraints_from_sql(table_data, indexes)
+
+    def _get_unique_constraints_from_sql(self, table_data, indexes):
         if not table_data:
             return []
 
+        auto_index_by_sig = {}
+        for idx in indexes:
+            if not idx["name"].startswith("sqlite_autoindex"):
+                continue
+            sig = tuple(idx["column_names"])
+            auto_index_by_sig[sig] = idx
+
         unique_constraints = []
 
         def parse_uqs():
@@ -1920,6 +2231,9 @@ class SQLiteDialect(default.DefaultDialect):
         table_data = self._get_table_sql(
             connection, table_name, schema=schema, **kw
         )
+        return self._get_check_constraints_from_sql(table_data)
+
+    def _get_check_constraints_from_sql(self, table_data):
         if not table_data:
             return []
 
@@ -180,6 +180,33 @@ Note that :class:`.SingletonThreadPool` should be configured for the number
 of threads that are to be used; beyond that number, connections will be
 closed out in a non deterministic way.
 
+.. _pysqlite_stream_results:
+
+Streaming Results
+-----------------
+
+The pysqlite driver steps through the rows of a result as they are fetched,
+rather than loading the full result into memory when the statement is
+executed.  The pysqlite dialect therefore supports the
+:paramref:`.Connection.execution_options.stream_results` execution option,
+as well as the ``server_side_cursors=True`` argument to
+:func:`.create_engine` which enables it for all SELECT statements, in the
+same way as the psycopg2 and MySQL dialects; a
+:class:`.BufferedRowResultProxy` is used so that the number of rows held in
+memory at once is limited to that set by the ``max_row_buffer`` execution
+option, defaulting to 1000::
+
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, max_row_buffer=100
+        ).execute("select * from big_table")
+        for row in result:
+            print(row)
+
+This is also used by the ORM :meth:`.Query.yield_per` method.
+
+.. versionadded:: 1.4
+
 Unicode
 -------
 
@@ -267,6 +294,7 @@ import os
 from .base import DATE
 from .base import DATETIME
 from .base import SQLiteDialect
+from .base import SQLiteExecutionContext
 from ... import exc
 from ... import pool
 from ... import types as sqltypes
@@ -301,9 +329,19 @@ class _SQLite_pysqliteDate(DATE):
             return DATE.result_processor(self, dialect, coltype)
 
 
+class SQLiteExecutionContext_pysqlite(SQLiteExecutionContext):
+    def create_server_side_cursor(self):
+        # pysqlite cursors step through rows as they are fetched
+        return self._dbapi_connection.cursor()
+
+
 class SQLiteDialect_pysqlite(SQLiteDialect):
     default_paramstyle = "qmark"
 
+    execution_ctx_cls = SQLiteExecutionContext_pysqlite
+
+    supports_server_side_cursors = True
+
     colspecs = util.update_copy(
         SQLiteDialect.colspecs,
         {
@@ -317,8 +355,9 @@ class SQLiteDialect_pysqlite(SQLiteDialect):
 
     driver = "pysqlite"
 
-    def __init__(self, **kwargs):
+    def __init__(self, server_side_cursors=False, **kwargs):
         SQLiteDialect.__init__(self, **kwargs)
+        self.server_side_cursors = server_side_cursors
 
         if self.dbapi is not None:
             sqlite_ver = self.dbapi.version_info
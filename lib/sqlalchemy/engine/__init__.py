@@ -36,6 +36,7 @@ from .result import BaseRowProxy  # noqa
 from .result import BufferedColumnResultProxy  # noqa
 from .result import BufferedColumnRow  # noqa
 from .result import BufferedRowResultProxy  # noqa
+from .result import FrozenResult  # noqa
 from .result import FullyBufferedResultProxy  # noqa
 from .result import ResultProxy  # noqa
 from .result import RowProxy  # noqa
@@ -306,7 +306,13 @@ class Connection(Connectable):
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
           of many DBAPIs.  The flag is currently understood only by the
-          psycopg2, mysqldb and pymysql dialects.
+          psycopg2, mysqldb, pymysql, pysqlite and SQL Server pyodbc
+          dialects.  When streaming, rows are buffered in batches of
+          increasing size up to the number given by the ``max_row_buffer``
+          execution option, which defaults to 1000.
+
+          .. versionchanged:: 1.4 Added support for ``stream_results`` to
+             the pysqlite and SQL Server pyodbc dialects.
 
         :param schema_translate_map: Available on: Connection, Engine.
           A dictionary mapping schema names to schema names, that will be
@@ -1053,6 +1059,8 @@ class Connection(Connectable):
             None,
             compiled,
         )
+        if self.engine._reflection_cache is not None:
+            self.engine._discard_reflection_entry()
         if self._has_events or self.engine._has_events:
             self.dispatch.after_execute(self, ddl, multiparams, params, ret)
         return ret
@@ -1073,6 +1081,7 @@ class Connection(Connectable):
             keys = []
 
         dialect = self.dialect
+        extracted_params = None
         if "compiled_cache" in self._execution_options:
             key = (
                 dialect,
@@ -1086,17 +1095,21 @@ class Connection(Connectable):
                 compiled_sql = elem.compile(
                     dialect=dialect,
                     column_keys=keys,
-                    inline=len(distilled_params) > 1,
+                    for_executemany=len(distilled_params) > 1,
                     schema_translate_map=self.schema_for_object
                     if not self.schema_for_object.is_default
                     else None,
                 )
                 self._execution_options["compiled_cache"][key] = compiled_sql
+        elif self.engine._compiled_cache is not None:
+            compiled_sql, extracted_params = self._compile_w_engine_cache(
+                elem, keys, distilled_params
+            )
         else:
             compiled_sql = elem.compile(
                 dialect=dialect,
                 column_keys=keys,
-                inline=len(distilled_params) > 1,
+                for_executemany=len(distilled_params) > 1,
                 schema_translate_map=self.schema_for_object
                 if not self.schema_for_object.is_default
                 else None,
@@ -1109,11 +1122,57 @@ class Connection(Connectable):
             distilled_params,
             compiled_sql,
             distilled_params,
+            elem,
+            extracted_params,
         )
         if self._has_events or self.engine._has_events:
             self.dispatch.after_execute(self, elem, multiparams, params, ret)
         return ret
 
+    def _compile_w_engine_cache(self, elem, keys, distilled_params):
+        """Compile a statement using the compiled cache of the
+        :class:`.Engine`, keyed on the structure of the statement.
+
+        Returns the :class:`.Compiled` object along with the list of
+        bound parameters from the given statement, which will be
+        non-None if the :class:`.Compiled` was produced from a different
+        statement.
+
+        """
+        dialect = self.dialect
+        compiled_cache = self.engine._compiled_cache
+
+        cache_key = elem._generate_cache_key()
+        if cache_key is not None:
+            key = (
+                cache_key.key,
+                tuple(sorted(keys)),
+                self.schema_for_object.hash_key,
+                len(distilled_params) > 1,
+                tuple(sorted(elem._execution_options.items())),
+            )
+            try:
+                compiled_sql = compiled_cache.get(key)
+            except TypeError:
+                # unhashable execution option
+                cache_key = None
+            else:
+                if compiled_sql is not None:
+                    return compiled_sql, cache_key.bindparams
+
+        compiled_sql = elem.compile(
+            dialect=dialect,
+            column_keys=keys,
+            for_executemany=len(distilled_params) > 1,
+            schema_translate_map=self.schema_for_object
+            if not self.schema_for_object.is_default
+            else None,
+            cache_key=cache_key,
+        )
+        if compiled_sql.cache_key is not None:
+            compiled_cache[key] = compiled_sql
+        return compiled_sql, None
+
     def _execute_compiled(self, compiled, multiparams, params):
         """Execute a sql.Compiled object."""
 
@@ -1228,7 +1287,9 @@ class Connection(Connectable):
 
         evt_handled = False
         try:
-            if context.executemany:
+            if context._insertmanyvalues_rows is not None:
+                self._exec_insertmanyvalues(cursor, context)
+            elif context.executemany:
                 if self.dialect._has_events:
                     for fn in self.dialect.dispatch.do_executemany:
                         if fn(cursor, statement, parameters, context):
@@ -1299,6 +1360,36 @@ class Connection(Connectable):
                 result._autoclose_connection = True
         return result
 
+    def _exec_insertmanyvalues(self, cursor, context):
+        """Execute an INSERT with many parameter sets as a series of
+        INSERT..VALUES statements, each of which includes many rows,
+        collecting the rows returned by each one."""
+
+        rows = context._insertmanyvalues_rows
+        for (
+            statement,
+            parameters,
+            batchnum,
+            total_batches,
+        ) in context._deliver_insertmanyvalues_batches():
+            if self._echo and total_batches > 1:
+                self.engine.logger.info(
+                    "[insertmanyvalues batch %d of %d]",
+                    batchnum,
+                    total_batches,
+                )
+
+            evt_handled = False
+            if self.dialect._has_events:
+                for fn in self.dialect.dispatch.do_execute:
+                    if fn(cursor, statement, parameters, context):
+                        evt_handled = True
+                        break
+            if not evt_handled:
+                self.dialect.do_execute(cursor, statement, parameters, context)
+
+            rows.extend(cursor.fetchall())
+
     def _cursor_execute(self, cursor, statement, parameters, context=None):
         """Execute a statement + params on the given cursor.
 
@@ -1878,6 +1969,7 @@ class Engine(Connectable, log.Identified):
     _execution_options = util.immutabledict()
     _has_events = False
     _connection_cls = Connection
+    _compiled_cache = None
 
     schema_for_object = schema._schema_getter(None)
     """Return the ".schema" attribute for an object.
@@ -1904,10 +1996,17 @@ class Engine(Connectable, log.Identified):
         echo=None,
         proxy=None,
         execution_options=None,
+        query_cache_size=500,
+        reflection_cache=None,
     ):
         self.pool = pool
         self.url = url
         self.dialect = dialect
+        if query_cache_size:
+            self._compiled_cache = util.LRUCache(query_cache_size)
+        else:
+            self._compiled_cache = None
+        self._reflection_cache = reflection_cache
         if logging_name:
             self.logging_name = logging_name
         self.echo = echo
@@ -2064,8 +2163,30 @@ class Engine(Connectable, log.Identified):
         """
         self.pool.dispose()
         self.pool = self.pool.recreate()
+        if self._reflection_cache is not None:
+            self._discard_reflection_entry()
         self.dispatch.engine_disposed(self)
 
+    def _discard_reflection_entry(self):
+        # schema information loaded from the reflection cache is
+        # re-validated against the database by the next Inspector
+        self._reflection_cache._discard_entry(repr(self.url))
+
+    def clear_compiled_cache(self):
+        """Clear the compiled cache associated with this :class:`.Engine`.
+
+        The cache stores :class:`.Compiled` objects keyed on the structure
+        of the statements executed, so that a statement need not be
+        compiled again when a statement of the same structure is
+        executed.  Its size is configured using the
+        :paramref:`.create_engine.query_cache_size` parameter.
+
+        .. versionadded:: 1.4
+
+        """
+        if self._compiled_cache is not None:
+            self._compiled_cache.clear()
+
     def _execute_default(self, default):
         with self.connect() as conn:
             return conn._execute_default(default, (), {})
@@ -2337,6 +2458,8 @@ class OptionEngine(Engine):
         self._proxied = proxied
         self.url = proxied.url
         self.dialect = proxied.dialect
+        self._compiled_cache = proxied._compiled_cache
+        self._reflection_cache = proxied._reflection_cache
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         log.instance_logger(self, echoflag=self.echo)
@@ -206,6 +206,16 @@ def create_engine(url, **kwargs):
         Microsoft SQL Server.   Set this to ``False`` to disable
         the automatic usage of RETURNING.
 
+    :param insertmanyvalues_page_size: number of rows to render into each
+        INSERT..VALUES statement when an INSERT which includes RETURNING is
+        executed with many parameter sets on a backend which supports
+        "insertmanyvalues", such as PostgreSQL and SQLite 3.35 and above.
+        Defaults to 1000.  The number of rows may be further limited so
+        that each statement stays below the dialect's maximum number of
+        bound parameters.
+
+        .. versionadded:: 1.4
+
     :param isolation_level: this string parameter is interpreted by various
         dialects in order to affect the transaction isolation level of the
         database connection.   The parameter essentially accepts some subset of
@@ -288,6 +298,28 @@ def create_engine(url, **kwargs):
         instantiate the pool in this case, you just indicate what type
         of pool to be used.
 
+    :param pool_fair=False: when connections must be waited for, give
+        connections returned to a :class:`.QueuePool` to waiting checkouts
+        strictly in the order in which they began waiting.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`pool_fair`
+
+    :param pool_maintenance_interval=None: when set to a number of seconds,
+        a :class:`.QueuePool` maintains its connections from a background
+        thread, opening ``pool_size`` connections up front and replacing
+        idle connections which fail a ping or are due for recycling,
+        checking at this interval.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`pool_maintenance`
+
     :param pool_logging_name:  String identifier which will be used within
        the "name" field of logging records generated within the
        "sqlalchemy.pool" logger. Defaults to a hexstring of the object's
@@ -357,6 +389,30 @@ def create_engine(url, **kwargs):
 
         .. versionadded:: 1.2.3
 
+    :param query_cache_size=500: size of the cache used to store the
+        compiled forms of statements executed by this :class:`.Engine`.
+        Statements are keyed on their structure, independently of the
+        values of their bound parameters, so that a statement which is
+        constructed again for each execution need only be compiled once.
+        Set to zero to disable the cache.  The cache is not used for a
+        :class:`.Connection` that makes use of the
+        :paramref:`.Connection.execution_options.compiled_cache` option.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Engine.clear_compiled_cache`
+
+    :param reflection_cache=None: a :class:`.ReflectionCache`, such as
+        :class:`.FileReflectionCache`, in which information gathered by
+        :class:`.Inspector` for this engine is stored persistently.  Later
+        reflection against an unchanged schema, including that performed by
+        a new process, loads the information from the cache rather than
+        querying the database's catalog.
+
+        .. versionadded:: 1.4
+
 
     """  # noqa
 
@@ -446,6 +502,8 @@ def create_engine(url, **kwargs):
             "reset_on_return": "pool_reset_on_return",
             "pre_ping": "pool_pre_ping",
             "use_lifo": "pool_use_lifo",
+            "fair": "pool_fair",
+            "maintenance_interval": "pool_maintenance_interval",
         }
         for k in util.get_cls_kwargs(poolclass):
             tk = translate.get(k, k)
@@ -76,6 +76,8 @@ class DefaultDialect(interfaces.Dialect):
 
     tuple_in_values = False
 
+    supports_multi_reflection = False
+
     engine_config_types = util.immutabledict(
         [
             ("convert_unicode", util.bool_or_str("force")),
@@ -125,6 +127,11 @@ class DefaultDialect(interfaces.Dialect):
     supports_empty_insert = True
     supports_multivalues_insert = False
 
+    use_insertmanyvalues = False
+    insert_executemany_returning = False
+    insertmanyvalues_page_size = 1000
+    insertmanyvalues_max_parameters = 32700
+
     supports_server_side_cursors = False
 
     server_version_info = None
@@ -205,6 +212,7 @@ class DefaultDialect(interfaces.Dialect):
         supports_native_boolean=None,
         empty_in_strategy="static",
         label_length=None,
+        insertmanyvalues_page_size=None,
         **kwargs
     ):
 
@@ -256,6 +264,9 @@ class DefaultDialect(interfaces.Dialect):
             )
         self.label_length = label_length
 
+        if insertmanyvalues_page_size is not None:
+            self.insertmanyvalues_page_size = insertmanyvalues_page_size
+
         if self.description_encoding == "use_encoding":
             self._description_decoder = (
                 processors.to_unicode_processor_factory
@@ -426,6 +437,68 @@ class DefaultDialect(interfaces.Dialect):
             )
         }
 
+    def _default_multi_reflect(
+        self,
+        single_tbl_method,
+        connection,
+        schema=None,
+        filter_names=None,
+        **kw
+    ):
+        """Implement a ``get_multi_*`` reflection method in terms of the
+        corresponding per-table method."""
+
+        if filter_names is None:
+            filter_names = self.get_table_names(connection, schema, **kw)
+            if self.supports_views:
+                filter_names = filter_names + self.get_view_names(
+                    connection, schema, **kw
+                )
+
+        result = {}
+        for table_name in filter_names:
+            try:
+                result[(schema, table_name)] = single_tbl_method(
+                    connection, table_name, schema, **kw
+                )
+            except exc.NoSuchTableError:
+                pass
+        return result
+
+    def get_multi_columns(self, connection, **kw):
+        return self._default_multi_reflect(self.get_columns, connection, **kw)
+
+    def get_multi_pk_constraint(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_pk_constraint, connection, **kw
+        )
+
+    def get_multi_foreign_keys(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_foreign_keys, connection, **kw
+        )
+
+    def get_multi_indexes(self, connection, **kw):
+        return self._default_multi_reflect(self.get_indexes, connection, **kw)
+
+    def get_multi_unique_constraints(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_unique_constraints, connection, **kw
+        )
+
+    def get_multi_check_constraints(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_check_constraints, connection, **kw
+        )
+
+    def get_multi_table_comment(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_table_comment, connection, **kw
+        )
+
+    def get_schema_fingerprint(self, connection):
+        return None
+
     def has_index(self, connection, table_name, index_name, schema=None):
         if not self.has_table(connection, table_name, schema=schema):
             return False
@@ -584,10 +657,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     executemany = False
     compiled = None
     statement = None
+    invoked_statement = None
     result_column_struct = None
     returned_defaults = None
+    returned_defaults_rows = None
+    inserted_primary_key_rows = None
     _is_implicit_returning = False
     _is_explicit_returning = False
+    _insertmanyvalues_rows = None
 
     # a hook for SQLite's translation of
     # result column names
@@ -630,7 +707,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @classmethod
     def _init_compiled(
-        cls, dialect, connection, dbapi_connection, compiled, parameters
+        cls,
+        dialect,
+        connection,
+        dbapi_connection,
+        compiled,
+        parameters,
+        invoked_statement=None,
+        extracted_parameters=None,
     ):
         """Initialize execution context for a Compiled construct."""
 
@@ -641,6 +725,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         self.compiled = compiled
 
+        if invoked_statement is None:
+            invoked_statement = compiled.statement
+        self.invoked_statement = invoked_statement
+
         # this should be caught in the engine before
         # we get here
         assert compiled.can_execute
@@ -649,8 +737,16 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             connection._execution_options
         )
 
+        if invoked_statement is not compiled.statement:
+            # the compiled object was retrieved from the compiled cache
+            # using a different statement; allow result columns to be
+            # targeted using that statement's column objects as well
+            result_columns = compiled._adapt_result_columns(invoked_statement)
+        else:
+            result_columns = compiled._result_columns
+
         self.result_column_struct = (
-            compiled._result_columns,
+            result_columns,
             compiled._ordered_columns,
             compiled._textual_ordered_columns,
         )
@@ -668,17 +764,19 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.isdelete = compiled.isdelete
         self.is_text = compiled.isplaintext
 
-        if not parameters:
-            self.compiled_parameters = [compiled.construct_params()]
-        else:
-            self.compiled_parameters = [
-                compiled.construct_params(m, _group_number=grp)
-                for grp, m in enumerate(parameters)
-            ]
-
+        if parameters:
             self.executemany = len(parameters) > 1
 
-        self.cursor = self.create_cursor()
+            if (
+                self.executemany
+                and compiled.returning
+                and compiled.isinsert
+                and (
+                    compiled._insertmanyvalues is not None
+                    or dialect.use_insertmanyvalues
+                )
+            ):
+                self._insertmanyvalues_rows = []
 
         if self.isinsert or self.isupdate or self.isdelete:
             self.is_crud = True
@@ -687,6 +785,53 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                 compiled.returning and not compiled.statement._returning
             )
 
+        if (
+            (self.executemany or not self.is_crud)
+            and not extracted_parameters
+            and not compiled.contains_expanding_parameters
+            and not compiled.insert_prefetch
+            and not compiled.update_prefetch
+        ):
+            assembler = compiled._bind_assembler
+        else:
+            assembler = None
+
+        if assembler is not None:
+            # convert the given parameters directly into those sent to
+            # the DBAPI; the compiled_parameters dictionaries are only
+            # constructed if subsequently requested.  A single INSERT,
+            # UPDATE or DELETE always takes the long way, as its
+            # compiled_parameters are consulted for primary key and
+            # default values after execution.
+            self._given_parameters = parameters
+            if not parameters:
+                parameters = [assembler(util.EMPTY_DICT, None)]
+            else:
+                parameters = [
+                    assembler(m, grp) for grp, m in enumerate(parameters)
+                ]
+            self.parameters = dialect.execute_sequence_format(parameters)
+            self.cursor = self.create_cursor()
+            return self
+
+        if not parameters:
+            self.compiled_parameters = [
+                compiled.construct_params(
+                    extracted_parameters=extracted_parameters
+                )
+            ]
+        else:
+            self.compiled_parameters = [
+                compiled.construct_params(
+                    m,
+                    _group_number=grp,
+                    extracted_parameters=extracted_parameters,
+                )
+                for grp, m in enumerate(parameters)
+            ]
+
+        self.cursor = self.create_cursor()
+
         if self.compiled.insert_prefetch or self.compiled.update_prefetch:
             if self.executemany:
                 self._process_executemany_defaults()
@@ -744,6 +889,22 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         return self
 
+    @util.memoized_property
+    def compiled_parameters(self):
+        """The bind parameter dictionaries for a statement whose DBAPI
+        parameters were assembled directly from those given, constructed
+        upon first access.
+
+        """
+        parameters = self._given_parameters
+        if not parameters:
+            return [self.compiled.construct_params()]
+        else:
+            return [
+                self.compiled.construct_params(m, _group_number=grp)
+                for grp, m in enumerate(parameters)
+            ]
+
     def _expand_in_parameters(self, compiled, processors):
         """handle special 'expanding' parameters, IN tuples that are rendered
         on a per-parameter basis for an otherwise fixed SQL statement string.
@@ -771,6 +932,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         replacement_expressions = {}
         to_update_sets = {}
+        tuple_processor_sets = {}
 
         for name in (
             self.compiled.positiontup
@@ -822,6 +984,23 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                             )
                             for i, tuple_element in enumerate(values)
                         )
+                        # each element of the tuple is processed by the
+                        # type of its corresponding column, not by the
+                        # type of the parameter as a whole
+                        if parameter._expanding_in_types:
+                            tuple_processors = [
+                                type_._cached_bind_processor(self.dialect)
+                                for type_ in parameter._expanding_in_types
+                            ]
+                            tuple_processor_sets[name] = [
+                                (
+                                    "%s_%s_%s" % (name, i, j),
+                                    tuple_processors[j - 1],
+                                )
+                                for i, tuple_element in enumerate(values, 1)
+                                for j, value in enumerate(tuple_element, 1)
+                                if tuple_processors[j - 1] is not None
+                            ]
                     else:
                         to_update = to_update_sets[name] = [
                             ("%s_%s" % (name, i), value)
@@ -833,11 +1012,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                         )
 
                 compiled_params.update(to_update)
-                processors.update(
-                    (key, processors[name])
-                    for key, value in to_update
-                    if name in processors
-                )
+                if name in tuple_processor_sets:
+                    processors.update(tuple_processor_sets[name])
+                else:
+                    processors.update(
+                        (key, processors[name])
+                        for key, value in to_update
+                        if name in processors
+                    )
                 if compiled.positional:
                     positiontup.extend(name for name, value in to_update)
                 self._expanded_parameters[name] = [
@@ -1090,8 +1272,84 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         else:
             return result.ResultProxy(self)
 
+    def _deliver_insertmanyvalues_batches(self):
+        """Yield the statement and parameters for each batch of an
+        "insertmanyvalues" execution, along with the batch number and the
+        total number of batches.
+
+        Each batch renders as many rows into the VALUES clause of the
+        INSERT as the page size and the dialect's maximum number of bound
+        parameters allow.  Positional parameter sets are concatenated,
+        while named parameters are renamed for each row.  An INSERT which
+        can't be rendered this way, such as one that uses DEFAULT VALUES,
+        is invoked once for each parameter set.
+
+        """
+        dialect = self.dialect
+        compiled = self.compiled
+        imv = compiled._insertmanyvalues
+
+        if imv is None:
+            total_batches = len(self.parameters)
+            for batchnum, parameters in enumerate(self.parameters, 1):
+                yield self.statement, parameters, batchnum, total_batches
+            return
+
+        batch_size = dialect.insertmanyvalues_page_size
+        if imv.num_params:
+            batch_size = min(
+                batch_size,
+                dialect.insertmanyvalues_max_parameters // imv.num_params,
+            )
+        batch_size = max(batch_size, 1)
+
+        statement = self.unicode_statement
+        idx = statement.rfind(imv.values_clause)
+        before = statement[:idx] + " VALUES "
+        after = statement[idx + len(imv.values_clause) :]
+
+        parameters = self.parameters
+        total_batches = -(-len(parameters) // batch_size)
+        bindtemplate = compiled.bindtemplate
+
+        for batchnum, start in enumerate(
+            range(0, len(parameters), batch_size), 1
+        ):
+            batch = parameters[start : start + batch_size]
+
+            if compiled.positional:
+                values_expr = ", ".join([imv.single_values_expr] * len(batch))
+                batch_params = dialect.execute_sequence_format(
+                    [value for params in batch for value in params]
+                )
+            else:
+                values_expr = ", ".join(
+                    "".join(
+                        bindtemplate % {"name": "%s__%d" % (piece, rownum)}
+                        if idx % 2
+                        else piece
+                        for idx, piece in enumerate(imv.pieces)
+                    )
+                    for rownum in range(len(batch))
+                )
+                batch_params = {}
+                for rownum, params in enumerate(batch):
+                    for key, value in params.items():
+                        batch_params["%s__%d" % (key, rownum)] = value
+
+            batch_statement = before + values_expr + after
+            if not dialect.supports_unicode_statements:
+                batch_statement = batch_statement.encode(dialect.encoding)
+
+            yield batch_statement, batch_params, batchnum, total_batches
+
+    def _get_insertmanyvalues_result_proxy(self):
+        return result.FullyBufferedResultProxy(self)
+
     @property
     def rowcount(self):
+        if self._insertmanyvalues_rows is not None:
+            return len(self._insertmanyvalues_rows)
         return self.cursor.rowcount
 
     def supports_sane_rowcount(self):
@@ -1113,10 +1371,20 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             elif not self._is_implicit_returning:
                 self._setup_ins_pk_from_empty()
 
-        result = self.get_result_proxy()
+        if self._insertmanyvalues_rows is not None:
+            # rows from all batches were fetched as they were executed
+            result = self._get_insertmanyvalues_result_proxy()
+        else:
+            result = self.get_result_proxy()
 
         if self.isinsert:
-            if self._is_implicit_returning:
+            if self._is_implicit_returning and self.executemany:
+                rows = result.fetchall()
+                self.returned_defaults_rows = rows
+                self._setup_ins_pk_rows_from_implicit_returning(rows)
+                result._soft_close()
+                result._metadata = None
+            elif self._is_implicit_returning:
                 row = result.fetchone()
                 self.returned_defaults = row
                 self._setup_ins_pk_from_implicit_returning(row)
@@ -1181,10 +1449,27 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             self.inserted_primary_key = None
             return
 
+        self.inserted_primary_key = self._ins_pk_from_returning_row(
+            row, self.compiled_parameters[0]
+        )
+
+    def _setup_ins_pk_rows_from_implicit_returning(self, rows):
+        if len(rows) != len(self.compiled_parameters):
+            raise exc.InvalidRequestError(
+                "INSERT statement returned %d rows for %d parameter sets; "
+                "can't correlate returned primary key values"
+                % (len(rows), len(self.compiled_parameters))
+            )
+
+        self.inserted_primary_key_rows = [
+            self._ins_pk_from_returning_row(row, compiled_params)
+            for row, compiled_params in zip(rows, self.compiled_parameters)
+        ]
+
+    def _ins_pk_from_returning_row(self, row, compiled_params):
         key_getter = self.compiled._key_getters_for_crud_column[2]
         table = self.compiled.statement.table
-        compiled_params = self.compiled_parameters[0]
-        self.inserted_primary_key = [
+        return [
             row[col] if value is None else value
             for col, value in [
                 (col, compiled_params.get(key_getter(col), None))
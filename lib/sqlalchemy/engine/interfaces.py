@@ -109,6 +109,20 @@ class Dialect(object):
       the "implicit" functionality is not used and inserted_primary_key
       will not be available.
 
+    use_insertmanyvalues
+      True if an INSERT statement which includes RETURNING, when invoked
+      with a list of parameter sets, should be rendered as a series of
+      single INSERT..VALUES statements each containing many rows, rather
+      than being passed to ``cursor.executemany()``.  The rows returned
+      by each statement are delivered in order.
+
+    insert_executemany_returning
+      True if the rows returned by "insertmanyvalues" INSERT statements
+      are known to correspond to the order of the parameter sets, such
+      that newly generated primary keys and other column defaults may be
+      fetched for an INSERT that is executed with many parameter sets and
+      uses :meth:`.ValuesBase.return_defaults`.
+
     colspecs
       A dictionary of TypeEngine classes from sqlalchemy.types mapped
       to subclasses that are specific to the dialect class.  This
@@ -139,6 +153,11 @@ class Dialect(object):
       This will prevent types.Boolean from generating a CHECK
       constraint when that type is used.
 
+    supports_multi_reflection
+      Indicates if the dialect implements the ``get_multi_*`` reflection
+      methods using one query for all tables, in which case
+      :meth:`.MetaData.reflect` will make use of them.
+
     dbapi_exception_translation_map
        A dictionary of names that will contain as values the names of
        pep-249 exceptions ("IntegrityError", "OperationalError", etc)
@@ -408,6 +427,139 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about columns in all tables and views in
+        the given `schema`.
+
+        Given a :class:`.Connection`, an optional string `schema` and an
+        optional list of table names `filter_names`, return a dictionary
+        of ``(schema, table_name)`` keys to lists of column information in
+        the format returned by :meth:`.Dialect.get_columns`.   Tables and
+        views which don't exist are omitted from the result.
+
+        The ``get_multi_*`` methods are intended to be implemented by
+        dialects using one query per method across all of the tables
+        requested, rather than one query per table.  The default
+        implementation calls the per-table method for each table.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the primary key constraints of all
+        tables in the given `schema`, in the format returned by
+        :meth:`.Dialect.get_pk_constraint`.
+
+        See :meth:`.Dialect.get_multi_columns` for the arguments and the
+        structure of the return value.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the foreign keys of all tables in
+        the given `schema`, in the format returned by
+        :meth:`.Dialect.get_foreign_keys`.
+
+        See :meth:`.Dialect.get_multi_columns` for the arguments and the
+        structure of the return value.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the indexes of all tables in the
+        given `schema`, in the format returned by
+        :meth:`.Dialect.get_indexes`.
+
+        See :meth:`.Dialect.get_multi_columns` for the arguments and the
+        structure of the return value.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the unique constraints of all tables
+        in the given `schema`, in the format returned by
+        :meth:`.Dialect.get_unique_constraints`.
+
+        See :meth:`.Dialect.get_multi_columns` for the arguments and the
+        structure of the return value.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the check constraints of all tables
+        in the given `schema`, in the format returned by
+        :meth:`.Dialect.get_check_constraints`.
+
+        See :meth:`.Dialect.get_multi_columns` for the arguments and the
+        structure of the return value.
+
+        .. versionadded:: 1.4
+
+         """
+
+        raise NotImplementedError()
+
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return the comments of all tables in the given `schema`, in the
+        format returned by :meth:`.Dialect.get_table_comment`.
+
+        See :meth:`.Dialect.get_multi_columns` for the arguments and the
+        structure of the return value.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_schema_fingerprint(self, connection):
+        """Return a value which changes whenever the schema of the database
+        accessed by `connection` is altered, or None if the dialect has no
+        inexpensive means of determining one.
+
+        The value is used by :class:`.ReflectionCache` to determine if
+        reflection information stored by a previous process is still
+        current; it must be comparable for equality and picklable.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
     def normalize_name(self, name):
         """convert the given name to lowercase if it is detected as
         case insensitive.
@@ -509,7 +661,7 @@ class Dialect(object):
         :param dbapi_connection: a DBAPI connection, typically
          proxied within a :class:`.ConnectionFairy`.
 
-         """
+        """
 
         raise NotImplementedError()
 
@@ -520,7 +672,7 @@ class Dialect(object):
         :param dbapi_connection: a DBAPI connection, typically
          proxied within a :class:`.ConnectionFairy`.
 
-         """
+        """
 
         raise NotImplementedError()
 
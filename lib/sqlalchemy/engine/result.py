@@ -9,11 +9,14 @@
 and :class:`.RowProxy."""
 
 
+import array
 import collections
 import operator
 
 from .. import exc
 from .. import util
+from ..sql import compiler
+from ..sql import elements
 from ..sql import expression
 from ..sql import sqltypes
 from ..sql import util as sql_util
@@ -115,6 +118,33 @@ except ImportError:
                 raise AttributeError(e.args[0])
 
 
+def _py_make_rows(row_cls, parent, rows, processors, row_processors, keymap):
+    """Construct row objects of the given class from raw DBAPI rows,
+    applying result processors to each row as a whole."""
+
+    processors = [
+        (index, processor)
+        for index, processor in enumerate(processors)
+        if processor is not None
+    ]
+    if not processors:
+        return [row_cls(parent, row, row_processors, keymap) for row in rows]
+
+    result = []
+    for row in rows:
+        row = list(row)
+        for index, processor in processors:
+            row[index] = processor(row[index])
+        result.append(row_cls(parent, tuple(row), row_processors, keymap))
+    return result
+
+
+try:
+    from sqlalchemy.cresultproxy import make_rows
+except ImportError:
+    make_rows = _py_make_rows
+
+
 class RowProxy(BaseRowProxy):
     """Proxy values from a single cursor row.
 
@@ -217,7 +247,6 @@ class ResultMetaData(object):
         dialect = context.dialect
         self.case_sensitive = dialect.case_sensitive
         self.matched_on_name = False
-        self._orig_processors = None
 
         if context.result_column_struct:
             result_columns, cols_are_ordered, textual_ordered = (
@@ -251,19 +280,22 @@ class ResultMetaData(object):
             len_raw = len(raw)
 
             self._keymap.update(
-                [(elem[0], (elem[3], elem[4], elem[0])) for elem in raw]
+                [(elem[0], (None, elem[4], elem[0])) for elem in raw]
                 + [
-                    (elem[0] - len_raw, (elem[3], elem[4], elem[0]))
+                    (elem[0] - len_raw, (None, elem[4], elem[0]))
                     for elem in raw
                 ]
             )
 
-        # processors in key order for certain per-row
-        # views like __iter__ and slices
-        self._processors = [elem[3] for elem in raw]
+        # result processors are applied to each row as a whole when it's
+        # fetched, so the processors in the keymap above and in
+        # self._processors, which the row consults for per-column access,
+        # are all None
+        self._orig_processors = [elem[3] for elem in raw]
+        self._processors = [None for elem in raw]
 
         # keymap by primary string...
-        by_key = dict([(elem[2], (elem[3], elem[4], elem[0])) for elem in raw])
+        by_key = dict([(elem[2], (None, elem[4], elem[0])) for elem in raw])
 
         # for compiled SQL constructs, copy additional lookup keys into
         # the key lookup map, such as Column objects, labels,
@@ -304,7 +336,7 @@ class ResultMetaData(object):
                 if not self.matched_on_name:
                     self._keymap.update(
                         [
-                            (elem[4][0], (elem[3], elem[4], elem[0]))
+                            (elem[4][0], (None, elem[4], elem[0]))
                             for elem in raw
                             if elem[4]
                         ]
@@ -314,7 +346,7 @@ class ResultMetaData(object):
                 # columns into self._keymap
                 self._keymap.update(
                     [
-                        (obj_elem, (elem[3], elem[4], elem[0]))
+                        (obj_elem, (None, elem[4], elem[0]))
                         for elem in raw
                         if elem[4]
                         for obj_elem in elem[4]
@@ -638,7 +670,7 @@ class ResultMetaData(object):
         else:
             return self._key_fallback(key, False) is not None
 
-    def _getter(self, key, raiseerr=True):
+    def _index_and_processor(self, key, raiseerr=True):
         if key in self._keymap:
             processor, obj, index = self._keymap[key]
         else:
@@ -653,7 +685,43 @@ class ResultMetaData(object):
                 "result set column descriptions" % obj
             )
 
-        return operator.itemgetter(index)
+        return index, processor
+
+    def _getter(self, key, raiseerr=True):
+        ret = self._index_and_processor(key, raiseerr)
+        if ret is None:
+            return None
+
+        return operator.itemgetter(ret[0])
+
+    def _adapt_to_statement(self, statement, invoked_statement):
+        """Return a copy of this :class:`.ResultMetaData`, where the
+        selected column objects of the given invoked statement, which has
+        the same cache key as the statement that produced this metadata,
+        are also present as targets."""
+
+        compiled_cols = compiler._selected_column_objects(statement)
+        invoked_cols = compiler._selected_column_objects(invoked_statement)
+
+        adapted = self.__class__.__new__(self.__class__)
+        for attr in self.__slots__:
+            setattr(adapted, attr, getattr(self, attr))
+
+        if not compiled_cols or len(compiled_cols) != len(invoked_cols):
+            return adapted
+
+        adapted._keymap = keymap = dict(self._keymap)
+        for compiled_col, invoked_col in zip(compiled_cols, invoked_cols):
+            if compiled_col in self._keymap:
+                keymap[invoked_col] = self._keymap[compiled_col]
+            if (
+                isinstance(compiled_col, elements.Label)
+                and compiled_col.element in self._keymap
+            ):
+                keymap[invoked_col.element] = self._keymap[
+                    compiled_col.element
+                ]
+        return adapted
 
     def __getstate__(self):
         return {
@@ -670,7 +738,9 @@ class ResultMetaData(object):
     def __setstate__(self, state):
         # the row has been processed at pickling time so we don't need any
         # processor anymore
-        self._processors = [None for _ in range(len(state["keys"]))]
+        self._processors = self._orig_processors = [
+            None for _ in range(len(state["keys"]))
+        ]
         self._keymap = keymap = {}
         for key, index in state["_pickled_keymap"].items():
             # not preserving "obj" here, unfortunately our
@@ -727,6 +797,14 @@ class ResultProxy(object):
         else:
             return getter(key, raiseerr)
 
+    def _index_and_processor(self, key, raiseerr=True):
+        try:
+            index_and_processor = self._metadata._index_and_processor
+        except AttributeError:
+            return self._non_result(None)
+        else:
+            return index_and_processor(key, raiseerr)
+
     def _has_key(self, key):
         try:
             has_key = self._metadata._has_key
@@ -1005,6 +1083,42 @@ class ResultProxy(object):
 
         return self.context.inserted_primary_key
 
+    @property
+    def inserted_primary_key_rows(self):
+        """Return the primary key for each row inserted by an
+        :func:`.insert` construct which was executed with many parameter
+        sets and made use of :meth:`.ValuesBase.return_defaults`.
+
+        The value is a list of lists of scalar values, one for each
+        parameter set in the order given, or ``None`` if the backend
+        doesn't support retrieving new primary key values for an
+        "executemany", as is indicated by the
+        ``dialect.insert_executemany_returning`` attribute.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :attr:`.ResultProxy.inserted_primary_key`
+
+        """
+        if not self.context.compiled:
+            raise exc.InvalidRequestError(
+                "Statement is not a compiled " "expression construct."
+            )
+        elif not self.context.isinsert:
+            raise exc.InvalidRequestError(
+                "Statement is not an insert() " "expression construct."
+            )
+        elif self.context._is_explicit_returning:
+            raise exc.InvalidRequestError(
+                "Can't call inserted_primary_key_rows "
+                "when returning() "
+                "is used."
+            )
+
+        return self.context.inserted_primary_key_rows
+
     def last_updated_params(self):
         """Return the collection of updated parameters from this
         execution.
@@ -1067,6 +1181,26 @@ class ResultProxy(object):
         """
         return self.context.returned_defaults
 
+    @property
+    def returned_defaults_rows(self):
+        """Return a list of rows containing the values of default columns
+        that were fetched using the :meth:`.ValuesBase.return_defaults`
+        feature, for an :func:`.insert` executed with many parameter sets.
+
+        The value is a list of :class:`.RowProxy` objects, one for each
+        parameter set in the order given, or ``None`` if
+        :meth:`.ValuesBase.return_defaults` was not used or if the backend
+        doesn't support RETURNING for an "executemany".
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :attr:`.ResultProxy.returned_defaults`
+
+        """
+        return self.context.returned_defaults_rows
+
     def lastrow_has_defaults(self):
         """Return ``lastrow_has_defaults()`` from the underlying
         :class:`.ExecutionContext`.
@@ -1174,21 +1308,19 @@ class ResultProxy(object):
             return default
 
     def process_rows(self, rows):
-        process_row = self._process_row
         metadata = self._metadata
-        keymap = metadata._keymap
-        processors = metadata._processors
         if self._echo:
             log = self.context.engine.logger.debug
-            l = []
             for row in rows:
                 log("Row %r", sql_util._repr_row(row))
-                l.append(process_row(metadata, row, processors, keymap))
-            return l
-        else:
-            return [
-                process_row(metadata, row, processors, keymap) for row in rows
-            ]
+        return make_rows(
+            self._process_row,
+            metadata,
+            rows,
+            metadata._orig_processors,
+            metadata._processors,
+            metadata._keymap,
+        )
 
     def fetchall(self):
         """Fetch all rows, just like DB-API ``cursor.fetchall()``.
@@ -1274,6 +1406,26 @@ class ResultProxy(object):
                 e, None, None, self.cursor, self.context
             )
 
+    def freeze(self):
+        """Fetch all remaining rows and return them as a
+        :class:`.FrozenResult`.
+
+        The :class:`.FrozenResult` stores the raw rows along with the
+        result metadata of this :class:`.ResultProxy`, and may be invoked
+        any number of times to produce a new :class:`.ResultProxy` which
+        delivers the same rows, without a DBAPI cursor or connection.
+        This :class:`.ResultProxy` is exhausted after the call.
+
+        .. versionadded:: 1.4
+
+        """
+        try:
+            return FrozenResult(self)
+        except BaseException as e:
+            self.connection._handle_dbapi_exception(
+                e, None, None, self.cursor, self.context
+            )
+
     def first(self):
         """Fetch the first row and then close the result set unconditionally.
 
@@ -1316,6 +1468,114 @@ class ResultProxy(object):
         else:
             return None
 
+    def process_columns(self, rows, arrays=False):
+        """Convert a sequence of DBAPI rows into a list of column
+        sequences, applying each column's result processor to the
+        column as a whole.
+
+        This is the column-oriented counterpart to
+        :meth:`.ResultProxy.process_rows` used by
+        :meth:`.ResultProxy.fetch_columns`.
+
+        """
+        metadata = self._metadata
+        if self._echo:
+            log = self.context.engine.logger.debug
+            for row in rows:
+                log("Row %r", sql_util._repr_row(row))
+
+        if rows:
+            columns = zip(*rows)
+        else:
+            columns = [() for key in metadata.keys]
+
+        result = []
+        for processor, column in zip(metadata._orig_processors, columns):
+            if processor is not None:
+                column = list(map(processor, column))
+            else:
+                column = list(column)
+            if arrays:
+                column = _column_array(column)
+            result.append(column)
+        return result
+
+    def fetch_columns(self, size=None, arrays=False):
+        """Fetch rows in column-oriented form.
+
+        Returns a list containing one sequence per column, in the same
+        order as :meth:`.ResultProxy.keys`, each containing the values for
+        that column in the fetched rows.  No :class:`.RowProxy` objects
+        are created; the result processor of each column, if any, is
+        applied to the column as a whole.  This is well suited to
+        consuming very large results, such as for analytical use::
+
+            result = conn.execute(select([table.c.x, table.c.y]))
+            while True:
+                x, y = result.fetch_columns(10000)
+                if not x:
+                    break
+                process_chunk(x, y)
+
+        :param size: the number of rows to fetch, as for
+         :meth:`.ResultProxy.fetchmany`.  If ``None``, all remaining rows
+         are fetched, after which the underlying cursor is released as for
+         :meth:`.ResultProxy.fetchall`.
+
+        :param arrays: if True, a column in which all values are
+         integers or all values are floats is returned as an
+         ``array.array``, which is considerably more compact than a list.
+         Other columns, including those containing any ``None`` values,
+         booleans, or a mixture of integers and floats, are returned as
+         lists.
+
+        Once all rows have been exhausted, columns of length zero are
+        returned.
+
+        .. versionadded:: 1.4
+
+        """
+        try:
+            if size is None:
+                rows = self._fetchall_impl()
+            else:
+                rows = self._fetchmany_impl(size)
+            l = self.process_columns(rows, arrays)
+            if size is None or len(rows) == 0:
+                self._soft_close()
+            return l
+        except BaseException as e:
+            self.connection._handle_dbapi_exception(
+                e, None, None, self.cursor, self.context
+            )
+
+
+if util.py2k:
+    _array_int_typecode = "l"
+else:
+    _array_int_typecode = "q"
+
+
+def _column_array(column):
+    if not column:
+        return column
+
+    # every value must be of the same kind, so that the array doesn't
+    # silently convert values, e.g. bools or ints within floats
+    types = set(map(type, column))
+    if types.issubset(util.int_types):
+        typecode = _array_int_typecode
+    elif types == {float}:
+        typecode = "d"
+    else:
+        return column
+
+    try:
+        return array.array(typecode, column)
+    except OverflowError:
+        # integers too large for the array type
+        return column
+
 
 class BufferedRowResultProxy(ResultProxy):
     """A ResultProxy with row buffering behavior.
@@ -1325,11 +1585,15 @@ class BufferedRowResultProxy(ResultProxy):
     ``cursor.description`` to be available immediately, when
     interfacing with a DB-API that requires rows to be consumed before
     this information is available (currently psycopg2, when used with
-    server-side cursors).
+    server-side cursors).  It is used for all results which make use of
+    the ``stream_results`` execution option, so that the number of rows
+    held in memory at once is bounded.
 
     The pre-fetching behavior fetches only one row initially, and then
     grows its buffer size by a fixed amount with each successive need
-    for additional rows up to a size of 1000.
+    for additional rows up to a size of 1000.  A call to ``fetchmany()``
+    for more rows than are buffered fetches the remainder directly from
+    the cursor, without growing the buffer.
 
     The size argument is configurable using the ``max_row_buffer``
     execution option::
@@ -1394,12 +1658,18 @@ class BufferedRowResultProxy(ResultProxy):
     def _fetchmany_impl(self, size=None):
         if size is None:
             return self._fetchall_impl()
-        result = []
-        for x in range(0, size):
-            row = self._fetchone_impl()
-            if row is None:
-                break
-            result.append(row)
+        if self.cursor is None:
+            return self._non_result([])
+        rowbuffer = self.__rowbuffer
+        if len(rowbuffer) >= size:
+            return [rowbuffer.popleft() for x in range(size)]
+
+        # rows beyond what's buffered are fetched directly from the
+        # cursor, so that the buffer never holds more than its current
+        # size regardless of the size requested
+        result = list(rowbuffer)
+        rowbuffer.clear()
+        result.extend(self.cursor.fetchmany(size - len(result)))
         return result
 
     def _fetchall_impl(self):
@@ -1425,6 +1695,9 @@ class FullyBufferedResultProxy(ResultProxy):
         self.__rowbuffer = self._buffer_rows()
 
     def _buffer_rows(self):
+        rows = self.context._insertmanyvalues_rows
+        if rows is not None:
+            return collections.deque(rows)
         return collections.deque(self.cursor.fetchall())
 
     def _soft_close(self, **kw):
@@ -1456,20 +1729,109 @@ class FullyBufferedResultProxy(ResultProxy):
         return ret
 
 
+class FrozenResult(object):
+    """The fully fetched rows of a :class:`.ResultProxy`, which may be
+    stored and invoked to produce new :class:`.ResultProxy` objects.
+
+    The rows are stored in their raw form as returned by the DBAPI, so that
+    result processing is applied each time the rows are delivered, in the
+    same way as for a newly executed statement.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :meth:`.ResultProxy.freeze`
+
+    """
+
+    def __init__(self, result):
+        self.metadata = result._metadata
+        self.statement = getattr(result.context, "invoked_statement", None)
+        self.rows = [tuple(row) for row in result._fetchall_impl()]
+        result._soft_close()
+
+    def __call__(self, statement=None):
+        """Return a new :class:`.ResultProxy` delivering the rows of this
+        :class:`.FrozenResult`.
+
+        :param statement: optional statement which is to be used to target
+         columns in the result, which must have the same cache key as the
+         statement that originally produced the rows.
+
+        """
+        metadata = self.metadata
+        if (
+            statement is not None
+            and self.statement is not None
+            and statement is not self.statement
+        ):
+            metadata = metadata._adapt_to_statement(self.statement, statement)
+        return FrozenResultProxy(metadata, self.rows)
+
+
+class FrozenResultProxy(ResultProxy):
+    """A :class:`.ResultProxy` which delivers rows from a
+    :class:`.FrozenResult`, rather than from a DBAPI cursor."""
+
+    def __init__(self, metadata, rows):
+        self.context = None
+        self.dialect = None
+        self.cursor = self._saved_cursor = None
+        self.connection = None
+        self._echo = False
+        self._metadata = metadata
+        self.__rowbuffer = collections.deque(rows)
+
+    def _soft_close(self):
+        self._soft_closed = True
+        self.__rowbuffer.clear()
+
+    def _fetchone_impl(self):
+        if self.__rowbuffer:
+            return self.__rowbuffer.popleft()
+        else:
+            return self._non_result(None)
+
+    def _fetchmany_impl(self, size=None):
+        if size is None:
+            return self._fetchall_impl()
+        rowbuffer = self.__rowbuffer
+        return [
+            rowbuffer.popleft() for idx in range(min(size, len(rowbuffer)))
+        ]
+
+    def _fetchall_impl(self):
+        if self.closed:
+            return self._non_result([])
+        ret = list(self.__rowbuffer)
+        self.__rowbuffer.clear()
+        return ret
+
+    def fetchall(self):
+        l = self.process_rows(self._fetchall_impl())
+        self._soft_close()
+        return l
+
+    def fetchmany(self, size=None):
+        l = self.process_rows(self._fetchmany_impl(size))
+        if len(l) == 0:
+            self._soft_close()
+        return l
+
+    def fetchone(self):
+        row = self._fetchone_impl()
+        if row is not None:
+            return self.process_rows([row])[0]
+        else:
+            self._soft_close()
+            return None
+
+
 class BufferedColumnRow(RowProxy):
-    def __init__(self, parent, row, processors, keymap):
-        # preprocess row
-        row = list(row)
-        # this is a tad faster than using enumerate
-        index = 0
-        for processor in parent._orig_processors:
-            if processor is not None:
-                row[index] = processor(row[index])
-            index += 1
-        row = tuple(row)
-        super(BufferedColumnRow, self).__init__(
-            parent, row, processors, keymap
-        )
+    # rows are fully processed by ResultProxy.process_rows() in all
+    # cases; this class remains for backwards compatibility
+    pass
 
 
 class BufferedColumnResultProxy(ResultProxy):
@@ -1488,24 +1850,6 @@ class BufferedColumnResultProxy(ResultProxy):
 
     _process_row = BufferedColumnRow
 
-    def _init_metadata(self):
-        super(BufferedColumnResultProxy, self)._init_metadata()
-
-        metadata = self._metadata
-
-        # don't double-replace the processors, in the case
-        # of a cached ResultMetaData
-        if metadata._orig_processors is None:
-            # orig_processors will be used to preprocess each row when
-            # they are constructed.
-            metadata._orig_processors = metadata._processors
-            # replace the all type processors by None processors.
-            metadata._processors = [None for _ in range(len(metadata.keys))]
-            keymap = {}
-            for k, (func, obj, index) in metadata._keymap.items():
-                keymap[k] = (None, obj, index)
-            metadata._keymap = keymap
-
     def fetchall(self):
         # can't call cursor.fetchall(), since rows must be
         # fully processed before requesting more from the DBAPI.
@@ -1529,3 +1873,15 @@ class BufferedColumnResultProxy(ResultProxy):
                 break
             l.append(row)
         return l
+
+    def fetch_columns(self, size=None, arrays=False):
+        # rows are fully processed by fetchmany(), so only need
+        # to be transposed here.
+        rows = self.fetchmany(size)
+        if rows:
+            columns = [list(column) for column in zip(*rows)]
+        else:
+            columns = [[] for key in self._metadata.keys]
+        if arrays:
+            columns = [_column_array(column) for column in columns]
+        return columns
@@ -395,6 +395,41 @@ class PoolEvents(event.Events):
 
         """
 
+    def checkout_wait(self, connection_record, wait_time):
+        """Called when a checkout has waited for a connection to be
+        returned to the pool.
+
+        This event is emitted by :class:`.QueuePool` for each checkout
+        which finds no connection available in the pool, while the pool has
+        reached its overflow limit so that no new connection may be opened,
+        including checkouts which time out.  It is suitable for collecting a
+        histogram of wait times, to determine whether the pool is a source
+        of latency::
+
+            wait_times = collections.Counter()
+
+            @event.listens_for(engine, "checkout_wait")
+            def checkout_wait(connection_record, wait_time):
+                # count waits by order of magnitude, in milliseconds
+                wait_times[int(math.log10(wait_time * 1000 + 1))] += 1
+
+        The :meth:`.PoolEvents.checkout` event is emitted subsequently
+        for checkouts which succeed.
+
+        :param connection_record: the :class:`._ConnectionRecord` which was
+         retrieved from the pool, or ``None`` if the checkout timed out or
+         otherwise failed.
+
+        :param wait_time: the time spent waiting, in seconds.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :paramref:`.QueuePool.fair`
+
+        """
+
     def checkin(self, dbapi_connection, connection_record):
         """Called when a connection returns to the pool.
 
@@ -306,6 +306,18 @@ class DontWrapMixin(object):
     """
 
 
+class AwaitRequired(DontWrapMixin, InvalidRequestError):
+    """Database I/O using an asyncio DBAPI was attempted outside of an
+    asyncio facade operation, where it could not be awaited.
+
+    This is typically the result of an attribute lazy load, or of a
+    synchronous API being used directly from within a coroutine.
+
+    .. versionadded:: 1.4
+
+    """
+
+
 # Moved to orm.exc; compatibility definition installed by orm import until 0.6
 UnmappedColumnError = None
 
@@ -0,0 +1,62 @@
+# ext/asyncio/__init__.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""asyncio facades for the :class:`.Engine`, :class:`.Connection` and
+:class:`.Session`.
+
+An :class:`.AsyncEngine` is created using :func:`.create_async_engine`,
+given an asyncio DBAPI whose connection and cursor methods are
+coroutines::
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(
+        "sqlite:///file.db", async_module=some_async_sqlite_module)
+
+    async def main():
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            await conn.execute(users.insert(), name="ed")
+
+        async with engine.connect() as conn:
+            result = await conn.stream(users.select())
+            async for row in result:
+                print(row)
+
+        async with AsyncSession(engine) as session:
+            user = await session.query(User).filter_by(name="ed").one()
+            user.name = "edward"
+            await session.commit()
+
+Statement compilation, execution context setup and result processing are
+performed by the usual :class:`.Connection`, :class:`.ExecutionContext`
+and :class:`.ResultProxy` within a greenlet, via :func:`.run_sync`, while
+all database I/O is awaited on the event loop in the same thread.   Waiting
+for a connection from the pool likewise takes place on the event loop; see
+:class:`.AsyncAdaptedQueuePool`.
+
+The :mod:`sqlalchemy.testing.asyncio_sqlite` module provides an asyncio
+DBAPI which runs the ``sqlite3`` module in threads, for use in tests.
+
+Requires Python 3.5 or above, as well as the
+`greenlet <https://pypi.org/project/greenlet/>`_ library.
+
+.. versionadded:: 1.4
+
+"""
+
+from .base import await_only  # noqa
+from .base import run_sync  # noqa
+from .engine import AsyncConnection  # noqa
+from .engine import AsyncEngine  # noqa
+from .engine import AsyncTransaction  # noqa
+from .engine import create_async_engine  # noqa
+from .pool import AsyncAdaptedQueuePool  # noqa
+from .result import AsyncResult  # noqa
+from .session import AsyncQuery  # noqa
+from .session import AsyncSession  # noqa
@@ -0,0 +1,206 @@
+# ext/asyncio/base.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Bridging between asyncio coroutines and the synchronous Core / ORM.
+
+The :class:`.Engine`, :class:`.Connection` and :class:`.Session` internals
+are left entirely synchronous.  An asyncio facade method runs the
+synchronous operation within a greenlet using :func:`.run_sync`; the
+adapted DBAPI connection, when called upon from within that greenlet,
+switches the coroutine-based DBAPI method back out to :func:`.run_sync`,
+which awaits it on the event loop and switches the result back in, via
+:func:`.await_only`.  All DBAPI I/O is therefore awaited on the event
+loop, in the same thread, while statement compilation, execution context
+setup and result processing run unchanged.
+
+Requires the `greenlet <https://pypi.org/project/greenlet/>`_ library.
+
+"""
+
+import asyncio
+import sys
+
+from ... import exc
+
+try:
+    import greenlet
+except ImportError:
+    greenlet = None
+
+
+def _get_running_loop():
+    # asyncio.get_running_loop() is Python 3.7 and above
+    return asyncio.get_event_loop()
+
+
+if greenlet is not None:
+
+    class _AsyncIoGreenlet(greenlet.greenlet):
+        """A greenlet running a synchronous callable on behalf of
+        :func:`.run_sync`, which is its ``driver``."""
+
+        def __init__(self, fn, driver):
+            greenlet.greenlet.__init__(self, fn, driver)
+            self.driver = driver
+
+
+async def run_sync(fn, *args, **kw):
+    """Run the given synchronous callable within a greenlet, from which
+    :func:`.await_only` may be used to wait upon coroutines running on the
+    current event loop.
+
+    """
+    if greenlet is None:
+        raise exc.InvalidRequestError(
+            "The greenlet library is required to use the asyncio extension"
+        )
+
+    context = _AsyncIoGreenlet(fn, greenlet.getcurrent())
+    result = context.switch(*args, **kw)
+    while not context.dead:
+        try:
+            value = await result
+        except BaseException:
+            result = context.throw(*sys.exc_info())
+        else:
+            result = context.switch(value)
+    return result
+
+
+def in_async_context():
+    """Return True if the current greenlet was invoked via
+    :func:`.run_sync`."""
+    return greenlet is not None and isinstance(
+        greenlet.getcurrent(), _AsyncIoGreenlet
+    )
+
+
+def await_only(coroutine):
+    """Wait upon the given coroutine from within a :func:`.run_sync`
+    greenlet, returning its result.
+
+    The coroutine is switched out to :func:`.run_sync`, which awaits it on
+    the event loop.  Calling this function from any other context,
+    including directly from within a coroutine, raises
+    :class:`.AwaitRequired`.
+
+    """
+    if not in_async_context():
+        coroutine.close()
+        raise exc.AwaitRequired(
+            "await_only() was called outside of an asyncio facade "
+            "operation; can't perform database I/O here.  Was I/O "
+            "attempted in an unexpected place, such as an attribute "
+            "lazy load?"
+        )
+    return greenlet.getcurrent().driver.switch(coroutine)
+
+
+class AsyncAdaptedCursor(object):
+    """Present a coroutine-based DBAPI cursor as a blocking one, for use
+    within a :func:`.run_sync` greenlet."""
+
+    __slots__ = ("_cursor", "_loop")
+
+    def __init__(self, cursor, loop):
+        self._cursor = cursor
+        self._loop = loop
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def arraysize(self):
+        return self._cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, value):
+        self._cursor.arraysize = value
+
+    def execute(self, operation, parameters=None):
+        if parameters is None:
+            return await_only(self._cursor.execute(operation))
+        else:
+            return await_only(self._cursor.execute(operation, parameters))
+
+    def executemany(self, operation, seq_of_parameters):
+        return await_only(
+            self._cursor.executemany(operation, seq_of_parameters)
+        )
+
+    def setinputsizes(self, *inputsizes):
+        pass
+
+    def fetchone(self):
+        return await_only(self._cursor.fetchone())
+
+    def fetchmany(self, size=None):
+        if size is None:
+            return await_only(self._cursor.fetchmany())
+        else:
+            return await_only(self._cursor.fetchmany(size))
+
+    def fetchall(self):
+        return await_only(self._cursor.fetchall())
+
+    def close(self):
+        _await_or_schedule(self._cursor.close(), self._loop)
+
+
+class AsyncAdaptedConnection(object):
+    """Present a coroutine-based DBAPI connection as a blocking one, for
+    use within a :func:`.run_sync` greenlet.
+
+    The async DBAPI is expected to follow :pep:`249`, with ``cursor()``,
+    ``commit()``, ``rollback()`` and ``close()`` on the connection, as well
+    as ``execute()``, ``executemany()``, ``fetchone()``, ``fetchmany()``,
+    ``fetchall()`` and ``close()`` on the cursor, being coroutines.
+
+    """
+
+    __slots__ = ("_connection", "_loop")
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._loop = _get_running_loop()
+
+    def cursor(self):
+        return AsyncAdaptedCursor(
+            await_only(self._connection.cursor()), self._loop
+        )
+
+    def commit(self):
+        await_only(self._connection.commit())
+
+    def rollback(self):
+        await_only(self._connection.rollback())
+
+    def close(self):
+        _await_or_schedule(self._connection.close(), self._loop)
+
+
+def _await_or_schedule(coroutine, loop):
+    """Wait upon a coroutine which releases resources if we are within a
+    :func:`.run_sync` greenlet; otherwise, such as when a connection is
+    garbage collected, schedule it on the event loop without waiting.
+
+    """
+    if in_async_context():
+        await_only(coroutine)
+    elif not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(coroutine, loop)
+    else:
+        coroutine.close()
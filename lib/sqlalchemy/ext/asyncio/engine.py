@@ -0,0 +1,483 @@
+# ext/asyncio/engine.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+import asyncio
+import weakref
+
+from .base import _get_running_loop
+from .base import await_only
+from .base import AsyncAdaptedConnection
+from .base import run_sync
+from .pool import AsyncAdaptedQueuePool
+from .result import AsyncResult
+from ... import exc
+from ... import util
+from ...engine import create_engine
+
+
+def create_async_engine(*arg, **kw):
+    """Create a new :class:`.AsyncEngine`.
+
+    Arguments are those of :func:`.create_engine`, with the addition
+    of one of the following, which establishes how connections are made
+    using an asyncio DBAPI:
+
+    :param async_module: a module which provides a ``connect()``
+     coroutine function accepting the arguments that the dialect
+     produces for the URL, in the same way as the
+     :paramref:`.create_engine.module` parameter.  The module is expected
+     to raise the exception classes of the dialect's own DBAPI module.
+
+    :param async_creator: a callable returning an awaitable which
+     produces a new asyncio DBAPI connection, which takes the place of the
+     :paramref:`.create_engine.creator` parameter.
+
+    The :class:`.AsyncAdaptedQueuePool` is used unless the
+    :paramref:`.create_engine.poolclass` parameter is passed.
+
+    E.g.::
+
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlalchemy.testing import asyncio_sqlite
+
+        engine = create_async_engine(
+            "sqlite:///file.db", async_module=asyncio_sqlite)
+
+        async with engine.connect() as conn:
+            result = await conn.execute(table.select())
+            for row in await result.fetchall():
+                print(row)
+
+    .. versionadded:: 1.4
+
+    """
+
+    async_module = kw.pop("async_module", None)
+    async_creator = kw.pop("async_creator", None)
+    connect_args = kw.pop("connect_args", {})
+
+    if (async_module is None) is (async_creator is None):
+        raise exc.ArgumentError(
+            "Exactly one of async_module or async_creator is required"
+        )
+    elif "creator" in kw:
+        raise exc.ArgumentError(
+            "The creator argument is not accepted by create_async_engine(); "
+            "use async_creator"
+        )
+
+    if async_creator is None:
+
+        def async_creator():
+            cargs, cparams = sync_engine.dialect.create_connect_args(
+                sync_engine.url
+            )
+            cparams.update(connect_args)
+            return async_module.connect(*cargs, **cparams)
+
+    def creator():
+        return AsyncAdaptedConnection(await_only(async_creator()))
+
+    kw.setdefault("poolclass", AsyncAdaptedQueuePool)
+    sync_engine = create_engine(*arg, creator=creator, **kw)
+    return AsyncEngine(sync_engine)
+
+
+class AsyncEngine(object):
+    """An asyncio facade for an :class:`.Engine`.
+
+    Produced by :func:`.create_async_engine`.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, sync_engine):
+        self.sync_engine = sync_engine
+
+    @property
+    def url(self):
+        return self.sync_engine.url
+
+    @property
+    def dialect(self):
+        return self.sync_engine.dialect
+
+    @property
+    def pool(self):
+        return self.sync_engine.pool
+
+    def __repr__(self):
+        return "AsyncEngine(%r)" % (self.url,)
+
+    def execution_options(self, **opt):
+        """Return a new :class:`.AsyncEngine` that will provide
+        :class:`.AsyncConnection` objects with the given execution options.
+
+        .. seealso::
+
+            :meth:`.Engine.execution_options`
+
+        """
+        return AsyncEngine(self.sync_engine.execution_options(**opt))
+
+    def connect(self):
+        """Return an :class:`.AsyncConnection` object.
+
+        The connection is procured from the pool either when awaited or
+        when used as an async context manager::
+
+            async with engine.connect() as conn:
+                await conn.execute(stmt)
+
+        """
+        return AsyncConnection(self)
+
+    def begin(self):
+        """Return an async context manager delivering an
+        :class:`.AsyncConnection` with a transaction established, which is
+        committed when the block completes successfully, else rolled back.
+
+        """
+        return self._trans_ctx(AsyncConnection(self))
+
+    async def dispose(self):
+        """Dispose of the connection pool used by this
+        :class:`.AsyncEngine`.
+
+        .. seealso::
+
+            :meth:`.Engine.dispose`
+
+        """
+        await run_sync(self.sync_engine.dispose)
+
+    async def _first_connect(self):
+        """Make the first connection from the pool, if not made already.
+
+        The dialect is initialized upon the pool's first connection while
+        a ``threading.Lock`` is held.  All :func:`.run_sync` greenlets share
+        the event loop's thread, so a second greenlet waiting upon that lock
+        would block the event loop entirely; the first connection is
+        therefore made by one task at a time, waiting on the event loop.
+
+        """
+        pool = self.sync_engine.pool
+        if getattr(pool.dispatch.first_connect, "_exec_once", True):
+            return
+
+        lock = _first_connect_locks.get(pool)
+        if lock is None:
+            lock = _first_connect_locks[pool] = asyncio.Lock()
+        async with lock:
+            if not pool.dispatch.first_connect._exec_once:
+                conn = await run_sync(self.sync_engine.connect)
+                await run_sync(conn.close)
+
+    async def _acquire_permit(self):
+        pool = self.sync_engine.pool
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            permits = await pool._async_acquire()
+            if permits is not None:
+                return _ReleasePermit(pool, permits)
+        return None
+
+    class _trans_ctx(object):
+        def __init__(self, conn):
+            self.conn = conn
+
+        async def __aenter__(self):
+            await self.conn.start()
+            try:
+                self.transaction = await self.conn.begin()
+            except:
+                with util.safe_reraise():
+                    await self.conn.close()
+            return self.conn
+
+        async def __aexit__(self, type_, value, traceback):
+            try:
+                if type_ is not None:
+                    await self.transaction.rollback()
+                else:
+                    await self.transaction.commit()
+            finally:
+                await self.conn.close()
+
+
+_first_connect_locks = weakref.WeakKeyDictionary()
+
+
+class _ReleasePermit(object):
+    """Release a pool checkout permit exactly once, either from the event
+    loop or, when the owning connection is garbage collected, from any
+    thread."""
+
+    __slots__ = ("pool", "permits", "loop")
+
+    def __init__(self, pool, permits):
+        self.pool = pool
+        self.permits = permits
+        self.loop = _get_running_loop()
+
+    def __call__(self):
+        permits, self.permits = self.permits, None
+        if permits is not None:
+            self.pool._async_release(permits)
+
+    def threadsafe(self):
+        if self.permits is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self)
+
+
+class AsyncConnection(object):
+    """An asyncio facade for a :class:`.Connection`.
+
+    Produced by :meth:`.AsyncEngine.connect`.  The :class:`.Connection`
+    itself is available as :attr:`.AsyncConnection.sync_connection` once
+    the connection has been started.
+
+    Like :class:`.Connection`, an :class:`.AsyncConnection` is not safe
+    for concurrent use by multiple tasks.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, async_engine, sync_connection=None):
+        self.engine = async_engine
+        self.sync_engine = async_engine.sync_engine
+        self.sync_connection = sync_connection
+        self._release_permit = None
+
+    async def start(self):
+        """Check out a connection from the pool, if not already done."""
+
+        if self.sync_connection is not None:
+            return self
+
+        release = await self.engine._acquire_permit()
+        try:
+            await self.engine._first_connect()
+            self.sync_connection = await run_sync(self.sync_engine.connect)
+        except:
+            if release is not None:
+                release()
+            raise
+
+        if release is not None:
+            self._release_permit = release
+            weakref.finalize(self, release.threadsafe)
+        return self
+
+    def __await__(self):
+        return self.start().__await__()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, type_, value, traceback):
+        await self.close()
+
+    def _sync_connection(self):
+        if self.sync_connection is None:
+            raise exc.InvalidRequestError(
+                "This AsyncConnection has not been started; "
+                "await the connection or use it as an async context manager"
+            )
+        return self.sync_connection
+
+    @property
+    def closed(self):
+        return self.sync_connection is not None and self.sync_connection.closed
+
+    def in_transaction(self):
+        """Return True if a transaction is in progress."""
+
+        return self._sync_connection().in_transaction()
+
+    def execution_options(self, **opt):
+        """Return a new :class:`.AsyncConnection` referencing the same
+        DBAPI connection, which defines the given execution options.
+
+        .. seealso::
+
+            :meth:`.Connection.execution_options`
+
+        """
+        c = AsyncConnection(
+            self.engine, self._sync_connection().execution_options(**opt)
+        )
+        c._release_permit = self._release_permit
+        return c
+
+    def begin(self):
+        """Begin a transaction, returning an :class:`.AsyncTransaction`.
+
+        The transaction may be awaited, or used as an async context
+        manager which commits upon successful completion::
+
+            async with conn.begin():
+                await conn.execute(stmt)
+
+        """
+        return AsyncTransaction(self)
+
+    def begin_nested(self):
+        """Begin a nested transaction (i.e. SAVEPOINT), returning an
+        :class:`.AsyncTransaction`."""
+
+        return AsyncTransaction(self, nested=True)
+
+    async def execute(self, object_, *multiparams, **params):
+        """Execute a SQL statement construct, returning an
+        :class:`.AsyncResult`.
+
+        Arguments are those of :meth:`.Connection.execute`.  Rows are
+        fetched from the result using awaitable methods.
+
+        """
+        conn = self._sync_connection()
+        result = await run_sync(conn.execute, object_, *multiparams, **params)
+        return AsyncResult(result)
+
+    async def stream(self, object_, *multiparams, **params):
+        """Execute a SQL statement construct, returning an
+        :class:`.AsyncResult` which streams rows using a server side
+        cursor, where supported by the dialect.
+
+        The result is intended to be iterated using ``async for``::
+
+            result = await conn.stream(table.select())
+            async for row in result:
+                print(row)
+
+        .. seealso::
+
+            :paramref:`.Connection.execution_options.stream_results`
+
+        """
+        conn = self._sync_connection().execution_options(stream_results=True)
+        result = await run_sync(conn.execute, object_, *multiparams, **params)
+        return AsyncResult(result)
+
+    async def scalar(self, object_, *multiparams, **params):
+        """Execute and return the first column of the first row.
+
+        .. seealso::
+
+            :meth:`.Connection.scalar`
+
+        """
+        conn = self._sync_connection()
+        return await run_sync(conn.scalar, object_, *multiparams, **params)
+
+    async def run_sync(self, fn, *arg, **kw):
+        """Invoke the given synchronous callable, passing the
+        :class:`.Connection` as the first argument.
+
+        This allows APIs which accept a :class:`.Connection`, such as
+        :meth:`.MetaData.create_all`, to be used::
+
+            await conn.run_sync(metadata.create_all)
+
+        """
+        return await run_sync(fn, self._sync_connection(), *arg, **kw)
+
+    async def invalidate(self, exception=None):
+        """Invalidate the underlying DBAPI connection.
+
+        .. seealso::
+
+            :meth:`.Connection.invalidate`
+
+        """
+        await run_sync(self._sync_connection().invalidate, exception)
+
+    async def close(self):
+        """Close this :class:`.AsyncConnection`, returning the DBAPI
+        connection to the pool."""
+
+        if self.sync_connection is not None:
+            try:
+                await run_sync(self.sync_connection.close)
+            finally:
+                if self._release_permit is not None:
+                    self._release_permit()
+
+
+class AsyncTransaction(object):
+    """An asyncio facade for a :class:`.Transaction`.
+
+    Produced by :meth:`.AsyncConnection.begin` and
+    :meth:`.AsyncConnection.begin_nested`.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, connection, nested=False):
+        self.connection = connection
+        self.nested = nested
+        self.sync_transaction = None
+
+    async def start(self):
+        """Begin the transaction, if not already done."""
+
+        if self.sync_transaction is None:
+            conn = self.connection._sync_connection()
+            if self.nested:
+                self.sync_transaction = await run_sync(conn.begin_nested)
+            else:
+                self.sync_transaction = await run_sync(conn.begin)
+        return self
+
+    def __await__(self):
+        return self.start().__await__()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, type_, value, traceback):
+        if type_ is None and self.is_active:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    @property
+    def is_active(self):
+        return (
+            self.sync_transaction is not None
+            and self.sync_transaction.is_active
+        )
+
+    async def commit(self):
+        """Commit this :class:`.AsyncTransaction`."""
+
+        await run_sync(self._sync_transaction().commit)
+
+    async def rollback(self):
+        """Roll back this :class:`.AsyncTransaction`."""
+
+        await run_sync(self._sync_transaction().rollback)
+
+    async def close(self):
+        """Close this :class:`.AsyncTransaction`.
+
+        .. seealso::
+
+            :meth:`.Transaction.close`
+
+        """
+        await run_sync(self._sync_transaction().close)
+
+    def _sync_transaction(self):
+        if self.sync_transaction is None:
+            raise exc.InvalidRequestError(
+                "This AsyncTransaction has not been started"
+            )
+        return self.sync_transaction
@@ -0,0 +1,67 @@
+# ext/asyncio/pool.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+import asyncio
+import weakref
+
+from ... import exc
+from ...pool import QueuePool
+
+
+class AsyncAdaptedQueuePool(QueuePool):
+    """A :class:`.QueuePool` which is aware of asyncio callers.
+
+    Checkouts made via the asyncio facade first acquire a permit on the
+    event loop, of which there are ``pool_size + max_overflow``.  The
+    waiting for a connection to become available therefore takes place on
+    the event loop, and the :class:`.QueuePool` checkout itself, which
+    runs within a :func:`.run_sync` greenlet, never has to block.
+
+    This is the default pool used by :func:`.create_async_engine`.
+
+    """
+
+    def __init__(self, creator, **kw):
+        QueuePool.__init__(self, creator, **kw)
+        self._async_permits = weakref.WeakKeyDictionary()
+
+    def _async_permit_count(self):
+        if self._max_overflow < 0 or self._pool.maxsize <= 0:
+            return None
+        return self._pool.maxsize + self._max_overflow
+
+    async def _async_acquire(self):
+        """Wait for a checkout permit; returns an opaque token to be
+        passed to :meth:`._async_release`."""
+
+        count = self._async_permit_count()
+        if count is None:
+            return None
+
+        loop = asyncio.get_event_loop()
+        try:
+            permits = self._async_permits[loop]
+        except KeyError:
+            permits = self._async_permits[loop] = asyncio.Semaphore(count)
+
+        try:
+            await asyncio.wait_for(permits.acquire(), self._timeout)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            return permits
+
+        raise exc.TimeoutError(
+            "QueuePool limit of size %d overflow %d reached, "
+            "connection timed out, timeout %d"
+            % (self.size(), self.overflow(), self._timeout),
+            code="3o7r",
+        )
+
+    def _async_release(self, permits):
+        if permits is not None:
+            permits.release()
@@ -0,0 +1,145 @@
+# ext/asyncio/result.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+import collections
+
+from .base import run_sync
+
+
+class AsyncResult(object):
+    """An asyncio facade for a :class:`.ResultProxy`.
+
+    Methods which fetch rows are coroutines; rows are processed by the
+    :class:`.ResultProxy` in the usual way.  The result may also be
+    iterated with ``async for``, in which case rows are fetched in batches
+    of :attr:`.AsyncResult.arraysize`.
+
+    .. versionadded:: 1.4
+
+    """
+
+    arraysize = 100
+    """The number of rows fetched at a time when iterating."""
+
+    def __init__(self, result):
+        self.sync_result = result
+        self._buffer = collections.deque()
+
+    def keys(self):
+        """Return the list of string keys that would be represented by each
+        row."""
+
+        return self.sync_result.keys()
+
+    @property
+    def returns_rows(self):
+        return self.sync_result.returns_rows
+
+    @property
+    def rowcount(self):
+        return self.sync_result.rowcount
+
+    @property
+    def lastrowid(self):
+        return self.sync_result.lastrowid
+
+    @property
+    def inserted_primary_key(self):
+        return self.sync_result.inserted_primary_key
+
+    @property
+    def closed(self):
+        return self.sync_result.closed
+
+    async def fetchone(self):
+        """Fetch one row, or None if no rows remain.
+
+        .. seealso::
+
+            :meth:`.ResultProxy.fetchone`
+
+        """
+        if self._buffer:
+            return self._buffer.popleft()
+        return await run_sync(self.sync_result.fetchone)
+
+    async def fetchmany(self, size=None):
+        """Fetch many rows.
+
+        .. seealso::
+
+            :meth:`.ResultProxy.fetchmany`
+
+        """
+        if size is None:
+            size = self.arraysize
+        buffer = self._buffer
+        rows = [buffer.popleft() for idx in range(min(size, len(buffer)))]
+        if len(rows) < size:
+            rows.extend(
+                await run_sync(self.sync_result.fetchmany, size - len(rows))
+            )
+        return rows
+
+    async def fetchall(self):
+        """Fetch all remaining rows.
+
+        .. seealso::
+
+            :meth:`.ResultProxy.fetchall`
+
+        """
+        rows = list(self._buffer)
+        self._buffer.clear()
+        rows.extend(await run_sync(self.sync_result.fetchall))
+        return rows
+
+    async def first(self):
+        """Fetch the first row and then close the result.
+
+        .. seealso::
+
+            :meth:`.ResultProxy.first`
+
+        """
+        if self._buffer:
+            row = self._buffer[0]
+            await self.close()
+            return row
+        return await run_sync(self.sync_result.first)
+
+    async def scalar(self):
+        """Fetch the first column of the first row, and close the result.
+
+        .. seealso::
+
+            :meth:`.ResultProxy.scalar`
+
+        """
+        row = await self.first()
+        if row is not None:
+            return row[0]
+        else:
+            return None
+
+    async def close(self):
+        """Close this :class:`.AsyncResult`, releasing the cursor."""
+
+        self._buffer.clear()
+        await run_sync(self.sync_result.close)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._buffer:
+            self._buffer.extend(
+                await run_sync(self.sync_result.fetchmany, self.arraysize)
+            )
+            if not self._buffer:
+                raise StopAsyncIteration()
+        return self._buffer.popleft()
@@ -0,0 +1,403 @@
+# ext/asyncio/session.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+import itertools
+import weakref
+
+from .base import run_sync
+from .engine import AsyncConnection
+from .engine import AsyncEngine
+from .result import AsyncResult
+from ... import exc
+from ...orm.session import Session
+
+
+class AsyncSession(object):
+    """An asyncio facade for a :class:`.Session`.
+
+    Methods which may emit SQL, such as :meth:`.AsyncSession.flush` and
+    :meth:`.AsyncSession.commit`, are coroutines; methods which only
+    manipulate session state, such as :meth:`.AsyncSession.add`, are not.
+    ORM queries are produced by :meth:`.AsyncSession.query`, which returns
+    an :class:`.AsyncQuery`::
+
+        async with AsyncSession(engine) as session:
+            session.add(User(name="ed"))
+            await session.commit()
+
+            users = await session.query(User).filter_by(name="ed").all()
+
+    The :class:`.Session` itself is available as
+    :attr:`.AsyncSession.sync_session`.  Attributes of objects which are
+    not loaded, such as unloaded relationships or expired attributes,
+    cannot be loaded on access outside of an :class:`.AsyncSession`
+    method; use eager loading, :meth:`.AsyncSession.refresh` or
+    :meth:`.AsyncSession.run_sync` to load them.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, bind=None, binds=None, **kw):
+        """Construct a new :class:`.AsyncSession`.
+
+        :param bind: an :class:`.AsyncEngine` or a started
+         :class:`.AsyncConnection`.  When bound to an
+         :class:`.AsyncEngine`, a checkout permit is acquired from its
+         :class:`.AsyncAdaptedQueuePool` on the event loop before the
+         session first makes use of a connection, and is released when
+         the session's transaction ends.
+
+        :param binds: a dictionary of mapped classes or tables to
+         :class:`.AsyncEngine` or :class:`.AsyncConnection` objects, as for
+         :paramref:`.Session.binds`.
+
+        All other keyword arguments are passed to :class:`.Session`.
+
+        """
+        self.bind = bind
+        self._async_engines = [bind] if isinstance(bind, AsyncEngine) else []
+        if binds is not None:
+            self._async_engines.extend(
+                value
+                for value in binds.values()
+                if isinstance(value, AsyncEngine)
+            )
+            binds = dict(
+                (key, _sync_bind(value)) for key, value in binds.items()
+            )
+        self.sync_session = Session(bind=_sync_bind(bind), binds=binds, **kw)
+        self._release_permit = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type_, value, traceback):
+        await self.close()
+
+    async def _run(self, fn, *arg, **kw):
+        if self._release_permit is None and isinstance(self.bind, AsyncEngine):
+            release = await self.bind._acquire_permit()
+            if release is not None:
+                self._release_permit = release
+                weakref.finalize(self, release.threadsafe)
+        try:
+            for engine in self._async_engines:
+                await engine._first_connect()
+            return await run_sync(fn, *arg, **kw)
+        finally:
+            if self._release_permit is not None and not self._in_use():
+                release, self._release_permit = self._release_permit, None
+                release()
+
+    def _in_use(self):
+        trans = self.sync_session.transaction
+        while trans is not None:
+            if trans._connections:
+                return True
+            trans = trans._parent
+        return False
+
+    async def run_sync(self, fn, *arg, **kw):
+        """Invoke the given synchronous callable, passing the
+        :class:`.Session` as the first argument.
+
+        Within the callable, the :class:`.Session` and the objects it
+        contains may be used normally, including lazy loading::
+
+            def load_addresses(session, user):
+                return list(user.addresses)
+
+            addresses = await session.run_sync(load_addresses, user)
+
+        """
+        return await self._run(fn, self.sync_session, *arg, **kw)
+
+    def query(self, *entities, **kw):
+        """Return a new :class:`.AsyncQuery` object corresponding to this
+        :class:`.AsyncSession`.
+
+        .. seealso::
+
+            :meth:`.Session.query`
+
+        """
+        return AsyncQuery(self.sync_session.query(*entities, **kw), self)
+
+    async def execute(self, clause, params=None, mapper=None, bind=None, **kw):
+        """Execute a SQL expression construct, returning an
+        :class:`.AsyncResult`.
+
+        .. seealso::
+
+            :meth:`.Session.execute`
+
+        """
+        return AsyncResult(
+            await self._run(
+                self.sync_session.execute,
+                clause,
+                params=params,
+                mapper=mapper,
+                bind=_sync_bind(bind),
+                **kw
+            )
+        )
+
+    async def scalar(self, clause, params=None, mapper=None, bind=None, **kw):
+        """Like :meth:`~.AsyncSession.execute` but return a scalar result."""
+
+        return await self._run(
+            self.sync_session.scalar,
+            clause,
+            params=params,
+            mapper=mapper,
+            bind=_sync_bind(bind),
+            **kw
+        )
+
+    async def get(self, entity, ident):
+        """Return an instance based on the given primary key identifier,
+        or ``None`` if not found.
+
+        .. seealso::
+
+            :meth:`.Query.get`
+
+        """
+        return await self.query(entity).get(ident)
+
+
+def _sync_bind(bind):
+    if bind is None:
+        return None
+    elif isinstance(bind, AsyncEngine):
+        return bind.sync_engine
+    elif isinstance(bind, AsyncConnection):
+        if bind.sync_connection is None:
+            raise exc.ArgumentError(
+                "AsyncConnection must be started before it can be used "
+                "as a bind"
+            )
+        return bind.sync_connection
+    else:
+        raise exc.ArgumentError(
+            "AsyncEngine or AsyncConnection object expected, got %r" % bind
+        )
+
+
+def _instrument_sync(name):
+    def do(self, *args, **kwargs):
+        return getattr(self.sync_session, name)(*args, **kwargs)
+
+    do.__name__ = name
+    return do
+
+
+def _instrument_async(name):
+    async def do(self, *args, **kwargs):
+        return await self._run(
+            getattr(self.sync_session, name), *args, **kwargs
+        )
+
+    do.__name__ = name
+    return do
+
+
+def _makeprop(name):
+    def set_(self, attr):
+        setattr(self.sync_session, name, attr)
+
+    def get(self):
+        return getattr(self.sync_session, name)
+
+    return property(get, set_)
+
+
+for meth in (
+    "__contains__",
+    "__iter__",
+    "add",
+    "add_all",
+    "expire",
+    "expire_all",
+    "expunge",
+    "expunge_all",
+    "is_modified",
+):
+    setattr(AsyncSession, meth, _instrument_sync(meth))
+
+for meth in (
+    "bulk_insert_mappings",
+    "bulk_save_objects",
+    "bulk_update_mappings",
+    "close",
+    "commit",
+    "delete",
+    "flush",
+    "merge",
+    "refresh",
+    "rollback",
+):
+    setattr(AsyncSession, meth, _instrument_async(meth))
+
+for prop in (
+    "dirty",
+    "deleted",
+    "new",
+    "identity_map",
+    "is_active",
+    "autoflush",
+    "no_autoflush",
+    "info",
+):
+    setattr(AsyncSession, prop, _makeprop(prop))
+
+
+class AsyncQuery(object):
+    """An asyncio facade for a :class:`.Query`.
+
+    Produced by :meth:`.AsyncSession.query`.  Generative methods such as
+    :meth:`.Query.filter` return a new :class:`.AsyncQuery`; methods which
+    return results, such as :meth:`.AsyncQuery.all`, are coroutines.  The
+    query may also be iterated with ``async for``, in which case objects
+    are produced in batches of the :meth:`.Query.yield_per` size, or
+    :attr:`.AsyncQuery.arraysize` if not set::
+
+        async for user in session.query(User).yield_per(50):
+            print(user.name)
+
+    .. versionadded:: 1.4
+
+    """
+
+    arraysize = 100
+    """The number of objects produced at a time when iterating, if
+    :meth:`.Query.yield_per` is not used."""
+
+    def __init__(self, query, async_session):
+        self.sync_query = query
+        self.session = async_session
+
+    def __getattr__(self, key):
+        return getattr(self.sync_query, key)
+
+    def __aiter__(self):
+        return _AsyncQueryIterator(
+            self, self.sync_query._yield_per or self.arraysize
+        )
+
+
+class _AsyncQueryIterator(object):
+    def __init__(self, async_query, size):
+        self.async_query = async_query
+        self.size = size
+        self.iterator = None
+        self.buffer = []
+
+    def __aiter__(self):
+        return self
+
+    def _fetch(self):
+        if self.iterator is None:
+            self.iterator = iter(self.async_query.sync_query)
+        return list(itertools.islice(self.iterator, self.size))
+
+    async def __anext__(self):
+        if not self.buffer:
+            self.buffer = await self.async_query.session._run(self._fetch)
+            if not self.buffer:
+                raise StopAsyncIteration()
+            self.buffer.reverse()
+        return self.buffer.pop()
+
+
+def _instrument_generative(name):
+    def do(self, *args, **kwargs):
+        args = [
+            arg.sync_query if isinstance(arg, AsyncQuery) else arg
+            for arg in args
+        ]
+        return AsyncQuery(
+            getattr(self.sync_query, name)(*args, **kwargs), self.session
+        )
+
+    do.__name__ = name
+    return do
+
+
+def _instrument_query_async(name):
+    async def do(self, *args, **kwargs):
+        return await self.session._run(
+            getattr(self.sync_query, name), *args, **kwargs
+        )
+
+    do.__name__ = name
+    return do
+
+
+for meth in (
+    "add_column",
+    "add_columns",
+    "add_entity",
+    "autoflush",
+    "correlate",
+    "distinct",
+    "enable_assertions",
+    "enable_eagerloads",
+    "except_",
+    "except_all",
+    "execution_options",
+    "filter",
+    "filter_by",
+    "from_self",
+    "from_statement",
+    "group_by",
+    "having",
+    "intersect",
+    "intersect_all",
+    "join",
+    "limit",
+    "offset",
+    "only_return_tuples",
+    "options",
+    "order_by",
+    "outerjoin",
+    "params",
+    "populate_existing",
+    "prefix_with",
+    "reset_joinpoint",
+    "select_entity_from",
+    "select_from",
+    "slice",
+    "suffix_with",
+    "union",
+    "union_all",
+    "with_entities",
+    "with_for_update",
+    "with_hint",
+    "with_labels",
+    "with_parent",
+    "with_polymorphic",
+    "with_statement_hint",
+    "with_transformation",
+    "yield_per",
+):
+    setattr(AsyncQuery, meth, _instrument_generative(meth))
+
+for meth in (
+    "all",
+    "count",
+    "delete",
+    "first",
+    "get",
+    "one",
+    "one_or_none",
+    "scalar",
+    "update",
+):
+    setattr(AsyncQuery, meth, _instrument_query_async(meth))
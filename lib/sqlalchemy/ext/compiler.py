@@ -226,6 +226,16 @@ MS-SQL specific 'max' keyword for ``String``/``VARCHAR``::
         Column('data', VARCHAR('max'))
     )
 
+Interaction with the compiled cache
+===================================
+
+A custom compilation function may render any state present on the element
+being compiled.  For this reason, a :class:`.ClauseElement` class which has
+a compilation function established using ``@compiles``, as well as statements
+which contain such an element, are not stored in the compiled cache of the
+:class:`.Engine`, and are compiled each time they are executed.  Calling
+:func:`.deregister` restores the caching behavior of the class.
+
 Subclassing Guidelines
 ======================
 
@@ -398,6 +408,7 @@ Example usage::
 
 """
 from .. import exc
+from ..sql import elements
 from ..sql import visitors
 
 
@@ -437,6 +448,15 @@ def compiles(class_, *specs):
             )
             setattr(class_, "_compiler_dispatcher", existing)
 
+            if issubclass(class_, elements.ClauseElement):
+                # a custom compilation function may render any state
+                # present on the element, so the element can no longer
+                # produce a reliable key for the engine-level compiled cache
+                existing.original_cache_key = class_.__dict__.get(
+                    "_cache_key", None
+                )
+                setattr(class_, "_cache_key", _no_cache_key)
+
         if specs:
             for s in specs:
                 existing.specs[s] = fn
@@ -455,13 +475,25 @@ def deregister(class_):
     if hasattr(class_, "_compiler_dispatcher"):
         # regenerate default _compiler_dispatch
         visitors._generate_dispatch(class_)
+        # restore the original cache key function, if any
+        if class_.__dict__.get("_cache_key") is _no_cache_key:
+            original = class_._compiler_dispatcher.original_cache_key
+            if original is not None:
+                setattr(class_, "_cache_key", original)
+            else:
+                del class_._cache_key
         # remove custom directive
         del class_._compiler_dispatcher
 
 
+def _no_cache_key(element, **kw):
+    raise NotImplementedError()
+
+
 class _dispatcher(object):
     def __init__(self):
         self.specs = {}
+        self.original_cache_key = None
 
     def __call__(self, element, compiler, **kw):
         # TODO: yes, this could also switch off of DBAPI in use.
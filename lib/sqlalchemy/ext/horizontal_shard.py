@@ -15,10 +15,21 @@ the source distribution.
 
 """
 
+import heapq
+import itertools
+import sys
+
 from .. import inspect
 from .. import util
+from ..engine.result import FullyBufferedResultProxy
+from ..orm import loading
 from ..orm.query import Query
 from ..orm.session import Session
+from ..sql import operators
+from ..sql.elements import _label_reference
+from ..sql.elements import UnaryExpression
+from ..util import queue
+from ..util import threading
 
 
 __all__ = ["ShardedSession", "ShardedQuery"]
@@ -29,6 +40,7 @@ class ShardedQuery(Query):
         super(ShardedQuery, self).__init__(*args, **kwargs)
         self.id_chooser = self.session.id_chooser
         self.query_chooser = self.session.query_chooser
+        self.execute_concurrently = self.session.execute_concurrently
         self._shard_id = None
 
     def set_shard(self, shard_id):
@@ -55,14 +67,167 @@ class ShardedQuery(Query):
         elif self._shard_id is not None:
             return iter_for_shard(self._shard_id)
         else:
+            shard_ids = list(self.query_chooser(self))
+            if self.execute_concurrently and len(shard_ids) > 1:
+                return self._execute_concurrently(context, shard_ids)
+
             partial = []
-            for shard_id in self.query_chooser(self):
+            for shard_id in shard_ids:
                 partial.extend(iter_for_shard(shard_id))
 
             # if some kind of in memory 'sorting'
             # were done, this is where it would happen
             return iter(partial)
 
+    def _execute_concurrently(self, context, shard_ids):
+        # connections are procured up front in this thread, as the
+        # Session itself is not thread safe; only the execution of the
+        # statement and the fetching of rows takes place in worker threads.
+        connections = [
+            (
+                shard_id,
+                self._connection_from_session(
+                    mapper=self._bind_mapper(), shard_id=shard_id
+                ),
+            )
+            for shard_id in shard_ids
+        ]
+
+        ordered = _has_order_by(context.statement)
+
+        partial = []
+        results = []
+        exc_info = None
+        for shard_id, result, shard_exc_info in _execute_shards(
+            self.session._shard_executor,
+            context.statement,
+            self._params,
+            connections,
+        ):
+            if shard_exc_info is not None:
+                if exc_info is None:
+                    exc_info = shard_exc_info
+            elif ordered or exc_info is not None:
+                results.append((shard_id, result))
+            else:
+                # unordered; process each shard as soon as it arrives
+                try:
+                    partial.extend(
+                        self._instances_for_shard(context, shard_id, result)
+                    )
+                except Exception:
+                    exc_info = sys.exc_info()
+
+        if exc_info is not None:
+            for shard_id, result in results:
+                result.close()
+            util.reraise(*exc_info)
+
+        if ordered:
+            # restore the order in which the shards were given
+            shard_order = dict((id_, i) for i, id_ in enumerate(shard_ids))
+            results.sort(key=lambda rec: shard_order[rec[0]])
+
+            getters = _order_by_getters(context.statement, results[0][1])
+            if getters is not None:
+                return self._merge_ordered(context, results, getters)
+
+            for shard_id, result in results:
+                partial.extend(
+                    self._instances_for_shard(context, shard_id, result)
+                )
+
+        return iter(partial)
+
+    def _instances_for_shard(self, context, shard_id, result):
+        context.attributes["shard_id"] = context.identity_token = shard_id
+        return self.instances(result, context)
+
+    def _merge_ordered(self, context, results, getters):
+        # this mirrors loading.instances(), processing the rows of all
+        # shards in the order given by a merge of their ORDER BY values
+        # and with the row processors set up for each individual shard.
+        context.runid = loading._new_runid()
+        context.post_load_paths = {}
+
+        filtered = self._has_mapper_entities
+
+        single_entity = (
+            not self._only_return_tuples
+            and len(self._entities) == 1
+            and self._entities[0].supports_single_entity
+        )
+
+        if filtered:
+            if single_entity:
+                filter_fn = id
+            else:
+
+                def filter_fn(row):
+                    return tuple(
+                        id(item) if ent.use_id_for_hash else item
+                        for ent, item in zip(self._entities, row)
+                    )
+
+        try:
+            shard_processors = []
+            for shard_id, result in results:
+                context.attributes[
+                    "shard_id"
+                ] = context.identity_token = shard_id
+                (process, labels) = list(
+                    zip(
+                        *[
+                            query_entity.row_processor(self, context, result)
+                            for query_entity in self._entities
+                        ]
+                    )
+                )
+                shard_processors.append(process)
+
+            if not single_entity:
+                keyed_tuple = util.lightweight_named_tuple("result", labels)
+
+            context.partials = {}
+
+            keyed = [
+                [
+                    (_MergeKey(row, getters), index, position, row)
+                    for position, row in enumerate(result.fetchall())
+                ]
+                for index, (shard_id, result) in enumerate(results)
+            ]
+            if all(rec[0].comparable() for recs in keyed for rec in recs):
+                merged = heapq.merge(*keyed)
+            else:
+                # the rows can't be compared in Python in the same way
+                # as the database orders them; they are returned in
+                # shard order
+                merged = itertools.chain(*keyed)
+
+            rows = []
+            for key, index, position, row in merged:
+                context.attributes[
+                    "shard_id"
+                ] = context.identity_token = results[index][0]
+                process = shard_processors[index]
+                if single_entity:
+                    rows.append(process[0](row))
+                else:
+                    rows.append(keyed_tuple([proc(row) for proc in process]))
+
+            for path, post_load in context.post_load_paths.items():
+                post_load.invoke(context, path)
+
+            if filtered:
+                rows = util.unique_list(rows, filter_fn)
+
+            return iter(rows)
+        except Exception as err:
+            for shard_id, result in results:
+                result.close()
+            util.raise_from_cause(err)
+
     def _execute_crud(self, stmt, mapper):
         def exec_for_shard(shard_id):
             conn = self._connection_from_session(
@@ -177,6 +342,201 @@ class ShardedResult(object):
         return self.aggregate_rowcount
 
 
+class _ShardExecutor(object):
+    """A bounded set of worker threads which execute statements against
+    shards, reused from one query to the next.
+
+    Threads are started as needed, up to ``max_workers``; a thread which
+    has been idle for ``idle_timeout`` seconds exits.
+
+    """
+
+    idle_timeout = 60
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._tasks = queue.Queue()
+        self._threads = set()
+        self._lock = threading.Lock()
+
+        # threads waiting for a task which no task has yet claimed
+        self._idle = 0
+
+        # tasks submitted while all max_workers threads were busy
+        self._backlog = 0
+
+    def submit(self, fn, *args):
+        with self._lock:
+            self._tasks.put((fn, args))
+            if self._idle:
+                self._idle -= 1
+            elif len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work, name="sqlalchemy shard execution"
+                )
+                thread.daemon = True
+                self._threads.add(thread)
+                thread.start()
+            else:
+                self._backlog += 1
+
+    def _work(self):
+        while True:
+            try:
+                fn, args = self._tasks.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._idle:
+                        self._idle -= 1
+                        self._threads.discard(threading.current_thread())
+                        return
+                # claimed by a task just submitted
+                continue
+
+            fn(*args)
+
+            with self._lock:
+                if self._backlog:
+                    self._backlog -= 1
+                else:
+                    self._idle += 1
+
+
+def _execute_shards(executor, statement, params, connections):
+    """Execute a statement against a series of ``(shard_id, connection)``
+    pairs concurrently using the given :class:`._ShardExecutor`, yielding
+    ``(shard_id, result, exc_info)`` tuples in the order in which the
+    shards complete.
+
+    Each result is fully buffered within its worker thread.  Shards
+    which share the same DBAPI connection are executed serially within
+    a single task.
+
+    """
+    groups = util.OrderedDict()
+    for shard_id, conn in connections:
+        groups.setdefault(id(conn.connection.connection), []).append(
+            (shard_id, conn)
+        )
+
+    completed = queue.Queue()
+
+    def execute_group(group):
+        for shard_id, conn in group:
+            try:
+                result = conn.execute(statement, params)
+                result = FullyBufferedResultProxy(result.context)
+            except BaseException:
+                completed.put((shard_id, None, sys.exc_info()))
+            else:
+                completed.put((shard_id, result, None))
+
+    for group in groups.values():
+        executor.submit(execute_group, group)
+
+    for i in range(len(connections)):
+        yield completed.get()
+
+
+def _has_order_by(statement):
+    order_by = getattr(statement, "_order_by_clause", None)
+    return order_by is not None and len(order_by.clauses) > 0
+
+
+def _order_by_getters(statement, result):
+    """Return a list of ``(getter, descending, nulls_first)`` tuples for the
+    ORDER BY of the given statement, or None if any of the ORDER BY
+    expressions are not present in the columns of the result.
+
+    ``nulls_first`` is None if NULLS FIRST / NULLS LAST isn't given.
+
+    """
+
+    getters = []
+    for elem in statement._order_by_clause.clauses:
+        descending = False
+        nulls_first = None
+        while True:
+            if isinstance(elem, UnaryExpression) and elem.modifier in (
+                operators.desc_op,
+                operators.asc_op,
+                operators.nullsfirst_op,
+                operators.nullslast_op,
+            ):
+                if elem.modifier is operators.desc_op:
+                    descending = True
+                elif elem.modifier is operators.nullsfirst_op:
+                    nulls_first = True
+                elif elem.modifier is operators.nullslast_op:
+                    nulls_first = False
+                elem = elem.element
+            elif isinstance(elem, _label_reference):
+                elem = elem.element
+            else:
+                break
+
+        getter = result._getter(elem, False)
+        if getter is None:
+            return None
+
+        getters.append((getter, descending, nulls_first))
+    return getters
+
+
+class _MergeKey(object):
+    """Compare rows from different shards according to ORDER BY."""
+
+    __slots__ = ("values",)
+
+    def comparable(self):
+        """Return True if this key compares in the same way as the
+        database would order it.
+
+        NULL is only compared where NULLS FIRST / NULLS LAST is given, as
+        its placement otherwise varies by backend; strings aren't
+        compared at all, as the database may order them according to a
+        collation.
+
+        """
+        for value, descending, nulls_first in self.values:
+            if value is None:
+                if nulls_first is None:
+                    return False
+            elif isinstance(value, util.string_types + (util.binary_type,)):
+                return False
+        return True
+
+    def __init__(self, row, getters):
+        self.values = [
+            (getter(row), descending, nulls_first)
+            for getter, descending, nulls_first in getters
+        ]
+
+    def __eq__(self, other):
+        return [v[0] for v in self.values] == [v[0] for v in other.values]
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __lt__(self, other):
+        for (left, descending, nulls_first), (right, _, _) in zip(
+            self.values, other.values
+        ):
+            if left == right:
+                continue
+            elif left is None:
+                return nulls_first
+            elif right is None:
+                return not nulls_first
+            elif descending:
+                return right < left
+            else:
+                return left < right
+        return False
+
+
 class ShardedSession(Session):
     def __init__(
         self,
@@ -185,6 +545,8 @@ class ShardedSession(Session):
         query_chooser,
         shards=None,
         query_cls=ShardedQuery,
+        execute_concurrently=False,
+        max_workers=None,
         **kwargs
     ):
         """Construct a ShardedSession.
@@ -207,17 +569,61 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param execute_concurrently: if True, a query which is to be
+          issued against more than one shard is executed against the
+          shards at once, using a pool of worker threads held by the
+          session and reused from one query to the next.  Rows are not
+          streamed as they arrive; all the rows of each shard are fully
+          buffered in its worker thread, and are then processed into ORM
+          results as each shard completes.  If the query has an ORDER BY whose
+          expressions are all present in the columns being fetched,
+          the rows from all shards are merged in ORDER BY order.  The
+          merge takes place only if the ordered values can be compared
+          in Python in the same way as the database orders them; rows
+          with a NULL value in an ORDER BY expression that doesn't
+          specify :meth:`.ColumnElement.nullsfirst` or
+          :meth:`.ColumnElement.nullslast`, or with a string value,
+          which the database may order according to a collation, cause
+          the rows to be returned in shard order.  If any shard raises
+          an error, the remaining shards are allowed to complete and
+          their results discarded, and the error of the first shard to
+          fail is then raised.
+
+          The connection for each shard is acquired in the calling
+          thread and then used in the worker thread, so the DBAPI
+          must allow connections to be shared between threads; for
+          pysqlite, this requires ``check_same_thread=False``.  Shards
+          which share the same DBAPI connection are executed one after
+          the other.
+
+          .. versionadded:: 1.4
+
+        :param max_workers: the largest number of worker threads used
+          when ``execute_concurrently`` is set; shards beyond this number
+          wait for a thread to become available.  Defaults to the number
+          of shards present when a query is first executed concurrently.
+          Worker threads are started as needed and exit after remaining
+          idle for a minute.
+
+          .. versionadded:: 1.4
+
         """
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
         self.shard_chooser = shard_chooser
         self.id_chooser = id_chooser
         self.query_chooser = query_chooser
+        self.execute_concurrently = execute_concurrently
+        self.max_workers = max_workers
         self.__binds = {}
         self.connection_callable = self.connection
         if shards is not None:
             for k in shards:
                 self.bind_shard(k, shards[k])
 
+    @util.memoized_property
+    def _shard_executor(self):
+        return _ShardExecutor(self.max_workers or len(self.__binds) or 1)
+
     def _choose_shard_and_assign(self, mapper, instance, **kw):
         if instance is not None:
             state = inspect(instance)
@@ -39,6 +39,9 @@ from .query import Query  # noqa
 from .relationships import foreign  # noqa
 from .relationships import RelationshipProperty  # noqa
 from .relationships import remote  # noqa
+from .result_cache import FromCache  # noqa
+from .result_cache import MemoryResultCache  # noqa
+from .result_cache import ResultCache  # noqa
 from .scoping import scoped_session  # noqa
 from .session import close_all_sessions  # noqa
 from .session import make_transient  # noqa
@@ -618,6 +618,8 @@ class AttributeImpl(object):
         assert self.trackparent, msg
 
         id_ = id(self.parent_token)
+        if not state.parents:
+            state.parents = {}
         if value:
             state.parents[id_] = parent_state
         else:
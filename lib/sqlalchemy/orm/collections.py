@@ -658,6 +658,8 @@ class CollectionAdapter(object):
             not self.empty
         ), "This collection adapter is already in the 'empty' state"
         self.empty = True
+        if not self.owner_state._empty_collections:
+            self.owner_state._empty_collections = {}
         self.owner_state._empty_collections[self._key] = user_data
 
     def _reset_empty(self):
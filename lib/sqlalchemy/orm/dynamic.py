@@ -149,6 +149,8 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
     def _modified_event(self, state, dict_):
 
         if self.key not in state.committed_state:
+            if not state.committed_state:
+                state.committed_state = {}
             state.committed_state[self.key] = CollectionHistory(self, state)
 
         state._modified_event(dict_, self, attributes.NEVER_SET)
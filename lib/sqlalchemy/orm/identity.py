@@ -9,6 +9,7 @@ import weakref
 
 from . import attributes
 from . import util as orm_util
+from .state import _null_ref
 from .. import exc as sa_exc
 from .. import util
 
@@ -46,7 +47,7 @@ class IdentityMap(object):
             self._modified.add(state)
 
     def _manage_removed_state(self, state):
-        del state._instance_dict
+        state._instance_dict = _null_ref
         if state.modified:
             self._modified.discard(state)
 
@@ -241,6 +242,91 @@ class WeakInstanceDict(IdentityMap):
         return 0
 
 
+class LRUInstanceDict(WeakInstanceDict):
+    """A weak-referencing identity map which additionally maintains strong
+    references to the most recently used objects, up to a fixed number.
+
+    Objects which are present in the map are retained, even if not
+    otherwise referenced by the application, until they fall out of
+    the most recently used set, at which point they are only weakly
+    referenced and are removed from the map when garbage collected, as
+    with :class:`.WeakInstanceDict`.  This allows a long-running
+    :class:`.Session` to serve repeated lookups of the same objects from
+    the identity map without growing without bound, as is the case for
+    :class:`.StrongInstanceDict`.
+
+    Only the strong references held by this map are subject to eviction;
+    objects which are dirty, pending or marked for deletion are strongly
+    referenced by the :class:`.Session` itself and are not affected.
+
+    To use, pass a callable that produces the map as the
+    :paramref:`.Session.identity_map_cls` parameter; the number of
+    objects retained is given by ``size``::
+
+        from functools import partial
+        from sqlalchemy.orm.identity import LRUInstanceDict
+
+        Session = sessionmaker(
+            identity_map_cls=partial(LRUInstanceDict, size=50000))
+
+    As with other caches in SQLAlchemy, the retained objects are pruned
+    when their number exceeds ``size`` by half again, so the number of
+    objects strongly referenced at any time may momentarily be up to
+    ``size * 1.5``.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, size=10000):
+        super(LRUInstanceDict, self).__init__()
+        self._recent = util.LRUCache(size)
+
+    def __getitem__(self, key):
+        o = super(LRUInstanceDict, self).__getitem__(key)
+        self._touch_recent(key, o)
+        return o
+
+    def get(self, key, default=None):
+        o = super(LRUInstanceDict, self).get(key)
+        if o is None:
+            return default
+        self._touch_recent(key, o)
+        return o
+
+    def _touch_recent(self, key, o):
+        # retrieving the entry marks it as recently used; replacing
+        # its value alone would not
+        if self._recent.get(key) is not o:
+            self._recent[key] = o
+
+    def _manage_incoming_state(self, state):
+        super(LRUInstanceDict, self)._manage_incoming_state(state)
+        o = state.obj()
+        if o is not None:
+            self._recent[state.key] = o
+
+    def _manage_removed_state(self, state):
+        super(LRUInstanceDict, self)._manage_removed_state(state)
+        self._discard_recent(state)
+
+    def _add_unpresent(self, state, key):
+        # inlined form of add() called by loading.py
+        self._dict[key] = state
+        state._instance_dict = self._wr
+        self._recent[key] = state.obj()
+
+    def _fast_discard(self, state):
+        super(LRUInstanceDict, self)._fast_discard(state)
+        self._discard_recent(state)
+
+    def _discard_recent(self, state):
+        # the key may already refer to a different object, in the
+        # case of replace()
+        if self._recent.get(state.key) is state.obj():
+            self._recent.pop(state.key, None)
+
+
 class StrongInstanceDict(IdentityMap):
     """A 'strong-referencing' version of the identity map.
 
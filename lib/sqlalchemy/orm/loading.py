@@ -15,6 +15,7 @@ as well as some of the attribute loading strategies.
 from __future__ import absolute_import
 
 import collections
+import operator
 
 from . import attributes
 from . import exc as orm_exc
@@ -25,6 +26,7 @@ from .base import _SET_DEFERRED_EXPIRED
 from .util import _none_set
 from .util import state_str
 from .. import exc as sa_exc
+from .. import sql
 from .. import util
 from ..sql import util as sql_util
 
@@ -284,6 +286,91 @@ def load_on_pk_identity(
         return None
 
 
+def load_on_pk_identities(
+    query, primary_key_identities, identity_token=None, chunksize=500
+):
+    """Load the given primary key identities from the database, using
+    one SELECT per ``chunksize`` identities.
+
+    Returns a dictionary of the given primary key identity tuples to
+    instances for those identities which were found.
+
+    """
+
+    mapper = query._mapper_zero()
+    pk_cols = mapper.primary_key
+
+    q = query._clone()
+    q._get_condition()
+
+    if len(pk_cols) > 1:
+        in_expr = sql.tuple_(*pk_cols)
+        zero_idx = False
+    else:
+        in_expr = pk_cols[0]
+        zero_idx = True
+
+    q._criterion = q._adapt_clause(
+        in_expr.in_(sql.bindparam("primary_keys", expanding=True)),
+        True,
+        False,
+    )
+
+    if query._for_update_arg is not None:
+        version_check = True
+        q._for_update_arg = query._for_update_arg
+    else:
+        version_check = False
+
+    q._get_options(version_check=version_check, identity_token=identity_token)
+    q._order_by = None
+
+    result = {}
+    our_keys = []
+    individual_keys = []
+    for primary_key_identity in util.unique_list(primary_key_identities):
+        if None in primary_key_identity:
+            # None can't be located using IN; fall back to the
+            # single-identity form which renders IS NULL
+            individual_keys.append(primary_key_identity)
+        else:
+            our_keys.append(primary_key_identity)
+
+    while our_keys:
+        chunk = our_keys[0:chunksize]
+        our_keys = our_keys[chunksize:]
+
+        loaded = {}
+        for instance in q.params(
+            primary_keys=[key[0] for key in chunk] if zero_idx else chunk
+        ):
+            loaded[attributes.instance_state(instance).key[1]] = instance
+
+        unmatched = []
+        for primary_key_identity in chunk:
+            instance = loaded.pop(primary_key_identity, None)
+            if instance is not None:
+                result[primary_key_identity] = instance
+            else:
+                unmatched.append(primary_key_identity)
+
+        if loaded:
+            # rows were located for identities given in a form other
+            # than that of the identity returned by the database, such
+            # as a string for an integer column; let the database
+            # compare each of the remaining identities individually
+            individual_keys.extend(unmatched)
+
+    for primary_key_identity in individual_keys:
+        instance = load_on_pk_identity(
+            query, primary_key_identity, identity_token=identity_token
+        )
+        if instance is not None:
+            result[primary_key_identity] = instance
+
+    return result
+
+
 def _setup_entity_query(
     context,
     mapper,
@@ -363,6 +450,10 @@ def _instance_processor(
 
     populators = collections.defaultdict(list)
 
+    # (key, index, processor) for each "quick" populator, used to build
+    # a single straight-line population function; see _quick_populator()
+    quick_columns = []
+
     props = mapper._prop_set
     if only_load_props is not None:
         props = props.intersection(mapper._props[k] for k in only_load_props)
@@ -385,7 +476,7 @@ def _instance_processor(
                 # be present in some unexpected way.
                 populators["expire"].append((prop.key, False))
             else:
-                getter = None
+                ret = None
                 # the "adapter" can be here via different paths,
                 # e.g. via adapter present at setup_query or adapter
                 # applied to the query afterwards via eager load subquery.
@@ -396,15 +487,20 @@ def _instance_processor(
                 # currently does not accommodate for this.   OTOH, if the
                 # column were never applied through this adapter, we may get
                 # None back, in which case we still won't get our "getter".
-                # so try both against result._getter().  See issue #4048
+                # so try both against result._index_and_processor().
+                # See issue #4048
                 if adapter:
                     adapted_col = adapter.columns[col]
                     if adapted_col is not None:
-                        getter = result._getter(adapted_col, False)
-                if not getter:
-                    getter = result._getter(col, False)
-                if getter:
-                    populators["quick"].append((prop.key, getter))
+                        ret = result._index_and_processor(adapted_col, False)
+                if ret is None:
+                    ret = result._index_and_processor(col, False)
+                if ret is not None:
+                    index, processor = ret
+                    populators["quick"].append(
+                        (prop.key, operator.itemgetter(index))
+                    )
+                    quick_columns.append((prop.key, index, processor))
                 else:
                     # fall back to the ColumnProperty itself, which
                     # will iterate through all of its columns
@@ -417,6 +513,29 @@ def _instance_processor(
                 context, path, mapper, result, adapter, populators
             )
 
+    if len(quick_columns) == len(populators["quick"]):
+        populate_quick = _quick_populator(mapper, tuple(quick_columns))
+    else:
+        # a strategy has added a getter which isn't a plain column
+        # lookup; use the generic loop
+        populate_quick = _generic_quick_populator(populators["quick"])
+
+    if context.readonly_entities:
+        _instance = _readonly_instance_processor(
+            mapper, pk_cols, populate_quick
+        )
+        if mapper.polymorphic_map and not _polymorphic_from:
+            _instance = _decorate_polymorphic_switch(
+                _instance,
+                context,
+                mapper,
+                result,
+                path,
+                polymorphic_discriminator,
+                adapter,
+            )
+        return _instance
+
     propagate_options = context.propagate_options
     load_path = (
         context.query._current_path + path
@@ -570,6 +689,7 @@ def _instance_processor(
                 loaded_instance,
                 populate_existing,
                 populators,
+                populate_quick,
             )
 
             if isnew:
@@ -642,6 +762,70 @@ def _instance_processor(
     return _instance
 
 
+def _readonly_instance_processor(mapper, pk_cols, populate_quick):
+    """Produce a row processor for the "readonly_entities" execution
+    option, which creates instances having only their column-based
+    attributes populated, without an :class:`.InstanceState`."""
+
+    class_ = mapper.class_
+
+    if mapper.allow_partial_pks:
+        is_not_primary_key = _none_set.issuperset
+    else:
+        is_not_primary_key = _none_set.intersection
+
+    def _instance(row):
+        if is_not_primary_key([row[column] for column in pk_cols]):
+            return None
+
+        instance = class_.__new__(class_)
+        populate_quick(row, instance.__dict__)
+        return instance
+
+    return _instance
+
+
+def _quick_populator(mapper, quick_columns):
+    """Return a function which populates an instance dictionary with
+    the given ``(key, index, processor)`` columns from a row.
+
+    The function is generated as straight-line code, reading directly
+    from the raw DBAPI row and applying result processors inline, and
+    is cached on the :class:`.Mapper` for the given set of columns.
+
+    """
+    cache = mapper._quick_populator_cache
+    fn = cache.get(quick_columns)
+    if fn is None:
+        cache[quick_columns] = fn = _compile_quick_populator(quick_columns)
+    return fn
+
+
+def _compile_quick_populator(quick_columns):
+    env = {}
+    lines = ["def populate_quick(row, dict_):", "    raw = row._row"]
+    for key, index, processor in quick_columns:
+        if processor is None:
+            lines.append("    dict_[%r] = raw[%d]" % (key, index))
+        else:
+            proc_name = "processor_%d" % index
+            env[proc_name] = processor
+            lines.append(
+                "    dict_[%r] = %s(raw[%d])" % (key, proc_name, index)
+            )
+    return util.langhelpers._exec_code_in_env(
+        "\n".join(lines) + "\n", env, "populate_quick"
+    )
+
+
+def _generic_quick_populator(quick_populators):
+    def populate_quick(row, dict_):
+        for key, getter in quick_populators:
+            dict_[key] = getter(row)
+
+    return populate_quick
+
+
 def _load_subclass_via_in(context, path, entity):
     mapper = entity.mapper
 
@@ -684,21 +868,25 @@ def _populate_full(
     loaded_instance,
     populate_existing,
     populators,
+    populate_quick,
 ):
     if isnew:
         # first time we are seeing a row with this identity.
         state.runid = context.runid
 
-        for key, getter in populators["quick"]:
-            dict_[key] = getter(row)
+        populate_quick(row, dict_)
         if populate_existing:
             for key, set_callable in populators["expire"]:
                 dict_.pop(key, None)
                 if set_callable:
+                    if not state.expired_attributes:
+                        state.expired_attributes = set()
                     state.expired_attributes.add(key)
         else:
             for key, set_callable in populators["expire"]:
                 if set_callable:
+                    if not state.expired_attributes:
+                        state.expired_attributes = set()
                     state.expired_attributes.add(key)
         for key, populator in populators["new"]:
             populator(state, dict_, row)
@@ -751,6 +939,8 @@ def _populate_partial(
             if key in to_load:
                 dict_.pop(key, None)
                 if set_callable:
+                    if not state.expired_attributes:
+                        state.expired_attributes = set()
                     state.expired_attributes.add(key)
         for key, populator in populators["new"]:
             if key in to_load:
@@ -160,6 +160,7 @@ class Mapper(InspectionAttr):
         passive_updates=True,
         passive_deletes=False,
         confirm_deleted_rows=True,
+        delete_chunksize=None,
         eager_defaults=False,
         legacy_is_orphan=False,
         _compiled_cache_size=100,
@@ -270,6 +271,21 @@ class Mapper(InspectionAttr):
              :paramref:`.mapper.confirm_deleted_rows` as well as conditional
              matched row checking on delete.
 
+        :param delete_chunksize: when set to an integer, the unit of work
+          emits DELETE statements for this mapper that match a list of
+          primary key values using IN, in chunks of at most the given size,
+          rather than an executemany() of a DELETE per primary key.  Tables
+          with a composite primary key, as well as those which make use of
+          :paramref:`.mapper.version_id_col`, are compared using a tuple IN
+          against the primary key and version id values, which requires
+          a backend that supports this syntax.  The number of rows matched
+          across all chunks is checked against the number of rows expected,
+          in the same way as :paramref:`.mapper.confirm_deleted_rows`.  As
+          with that parameter, the setting on the base mapper of an
+          inheritance hierarchy applies to all of its mappers.
+
+          .. versionadded:: 1.4
+
         :param eager_defaults: if True, the ORM will immediately fetch the
           value of server-generated default values after an INSERT or UPDATE,
           rather than leaving them as expired to be fetched on next access.
@@ -651,6 +667,7 @@ class Mapper(InspectionAttr):
         self._init_properties = properties or {}
         self._delete_orphans = []
         self.batch = batch
+        self.delete_chunksize = delete_chunksize
         self.eager_defaults = eager_defaults
         self.column_prefix = column_prefix
         self.polymorphic_on = (
@@ -3067,6 +3084,18 @@ class Mapper(InspectionAttr):
     def _compiled_cache(self):
         return util.LRUCache(self._compiled_cache_size)
 
+    @_memoized_configured_property
+    def _query_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
+    @_memoized_configured_property
+    def _quick_populator_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
+    @_memoized_configured_property
+    def _flush_plan_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
     @_memoized_configured_property
     def _sorted_tables(self):
         table_to_mapper = {}
@@ -885,25 +885,42 @@ def _emit_update_statements(
 
     cached_stmt = base_mapper._memo(("update", table), update_stmt)
 
-    for (
-        (connection, paramkeys, hasvalue, has_all_defaults, has_all_pks),
-        records,
-    ) in groupby(
-        update,
-        lambda rec: (
+    # bucket the records among all those for this table, rather than
+    # only those which are consecutive, so that records with the same
+    # set of parameters can be sent as one executemany().  Records
+    # within a bucket remain in primary key order.
+    buckets = util.OrderedDict()
+    for rec in update:
+        key = (
             rec[4],  # connection
-            set(rec[2]),  # set of parameter keys
+            frozenset(rec[2]),  # set of parameter keys
             bool(rec[5]),  # whether or not we have "value" parameters
             rec[6],  # has_all_defaults
             rec[7],  # has all pks
-        ),
-    ):
+        )
+        if key in buckets:
+            buckets[key].append(rec)
+        else:
+            buckets[key] = [rec]
+
+    for (
+        (connection, paramkeys, hasvalue, has_all_defaults, has_all_pks),
+        records,
+    ) in buckets.items():
         rows = 0
-        records = list(records)
 
         statement = cached_stmt
         return_defaults = False
 
+        # a version counter which is generated on the Python side is
+        # present in the parameters for each row; so long as the total
+        # rowcount can be verified, these rows can be executed together
+        multirow_version_id = (
+            needs_version_id
+            and mapper.version_id_generator is not False
+            and connection.dialect.supports_sane_multi_rowcount
+        )
+
         if not has_all_pks:
             statement = statement.return_defaults()
             return_defaults = True
@@ -914,7 +931,9 @@ def _emit_update_statements(
         ):
             statement = statement.return_defaults()
             return_defaults = True
-        elif mapper.version_id_col is not None:
+        elif mapper.version_id_col is not None and not (
+            multirow_version_id and has_all_defaults and len(records) > 1
+        ):
             statement = statement.return_defaults(mapper.version_id_col)
             return_defaults = True
 
@@ -928,7 +947,9 @@ def _emit_update_statements(
             assert_singlerow
             and connection.dialect.supports_sane_multi_rowcount
         )
-        allow_multirow = has_all_defaults and not needs_version_id
+        allow_multirow = has_all_defaults and (
+            not needs_version_id or multirow_version_id
+        )
 
         if hasvalue:
             for (
@@ -1001,15 +1022,18 @@ def _emit_update_statements(
                 rows += c.rowcount
 
                 for (
-                    state,
-                    state_dict,
-                    params,
-                    mapper,
-                    connection,
-                    value_params,
-                    has_all_defaults,
-                    has_all_pks,
-                ) in records:
+                    (
+                        state,
+                        state_dict,
+                        params,
+                        mapper,
+                        connection,
+                        value_params,
+                        has_all_defaults,
+                        has_all_pks,
+                    ),
+                    compiled_params,
+                ) in zip(records, c.context.compiled_parameters):
                     if bookkeeping:
                         _postfetch(
                             mapper,
@@ -1018,7 +1042,7 @@ def _emit_update_statements(
                             state,
                             state_dict,
                             c,
-                            c.context.compiled_parameters[0],
+                            compiled_params,
                             value_params,
                             True,
                         )
@@ -1115,12 +1139,46 @@ def _emit_insert_statements(
                         _postfetch_bulk_save(mapper_rec, state_dict, table)
 
         else:
+            records = list(records)
+
+            # INSERT many rows at once, fetching new primary keys and
+            # defaults with RETURNING, where the dialect can correlate
+            # the returned rows to the parameter sets
+            use_executemany = (
+                not hasvalue
+                and len(records) > 1
+                and table.implicit_returning
+                and connection.dialect.insert_executemany_returning
+            )
+
             if not has_all_defaults and base_mapper.eager_defaults:
                 statement = statement.return_defaults()
             elif mapper.version_id_col is not None:
                 statement = statement.return_defaults(mapper.version_id_col)
+            elif use_executemany:
+                statement = statement.return_defaults(*table.primary_key)
 
-            for (
+            if use_executemany:
+                multiparams = [rec[2] for rec in records]
+
+                result = cached_connections[connection].execute(
+                    statement, multiparams
+                )
+                # no rows are returned if there was nothing to fetch, e.g.
+                # primary keys generated by Python-side defaults
+                context = result.context
+                empty = [None] * len(records)
+                rows = list(
+                    zip(
+                        context.compiled_parameters,
+                        context.inserted_primary_key_rows or empty,
+                        context.returned_defaults_rows or empty,
+                    )
+                )
+            else:
+                rows = None
+
+            for idx, (
                 state,
                 state_dict,
                 params,
@@ -1129,18 +1187,28 @@ def _emit_insert_statements(
                 value_params,
                 has_all_pks,
                 has_all_defaults,
-            ) in records:
+            ) in enumerate(records):
 
-                if value_params:
-                    result = connection.execute(
-                        statement.values(value_params), params
-                    )
+                if rows is not None:
+                    (
+                        last_inserted_params,
+                        primary_key,
+                        returned_defaults,
+                    ) = rows[idx]
                 else:
-                    result = cached_connections[connection].execute(
-                        statement, params
-                    )
+                    if value_params:
+                        result = connection.execute(
+                            statement.values(value_params), params
+                        )
+                    else:
+                        result = cached_connections[connection].execute(
+                            statement, params
+                        )
+                    context = result.context
+                    last_inserted_params = context.compiled_parameters[0]
+                    primary_key = context.inserted_primary_key
+                    returned_defaults = context.returned_defaults
 
-                primary_key = result.context.inserted_primary_key
                 if primary_key is not None:
                     # set primary key attributes
                     for pk, col in zip(
@@ -1161,9 +1229,10 @@ def _emit_insert_statements(
                             state,
                             state_dict,
                             result,
-                            result.context.compiled_parameters[0],
+                            last_inserted_params,
                             value_params,
                             False,
+                            returned_defaults,
                         )
                     else:
                         _postfetch_bulk_save(mapper_rec, state_dict, table)
@@ -1312,7 +1381,33 @@ def _emit_delete_statements(
 
         return table.delete(clause)
 
-    statement = base_mapper._memo(("delete", table), delete_stmt)
+    chunksize = base_mapper.delete_chunksize
+
+    # when deleting in chunks, the primary key columns plus the version
+    # id column, if any, are compared against a list of values using a
+    # single IN, or a tuple IN for more than one column.
+    key_cols = list(mapper._pks_by_table[table])
+    if need_version_id:
+        key_cols.append(mapper.version_id_col)
+
+    def delete_in_stmt():
+        if len(key_cols) == 1:
+            criterion = key_cols[0].in_(
+                sql.bindparam(
+                    "pk_values", type_=key_cols[0].type, expanding=True
+                )
+            )
+        else:
+            criterion = sql.tuple_(*key_cols).in_(
+                sql.bindparam("pk_values", expanding=True)
+            )
+        return table.delete(criterion)
+
+    if chunksize:
+        statement = base_mapper._memo(("delete_in", table), delete_in_stmt)
+    else:
+        statement = base_mapper._memo(("delete", table), delete_stmt)
+
     for connection, recs in groupby(delete, lambda rec: rec[1]):  # connection
         del_objects = [params for params, connection in recs]
 
@@ -1322,7 +1417,36 @@ def _emit_delete_statements(
         rows_matched = -1
         only_warn = False
 
-        if (
+        if chunksize:
+            if not need_version_id:
+                only_warn = True
+
+            if connection.dialect.supports_sane_rowcount:
+                rows_matched = 0
+            elif need_version_id:
+                util.warn(
+                    "Dialect %s does not support deleted rowcount "
+                    "- versioning cannot be verified."
+                    % connection.dialect.dialect_description,
+                    stacklevel=12,
+                )
+
+            if len(key_cols) == 1:
+                key = key_cols[0].key
+                pk_values = [params[key] for params in del_objects]
+            else:
+                pk_values = [
+                    tuple(params[col.key] for col in key_cols)
+                    for params in del_objects
+                ]
+
+            for idx in range(0, expected, chunksize):
+                c = connection.execute(
+                    statement, {"pk_values": pk_values[idx : idx + chunksize]}
+                )
+                if rows_matched > -1:
+                    rows_matched += c.rowcount
+        elif (
             need_version_id
             and not connection.dialect.supports_sane_multi_rowcount
         ):
@@ -1354,7 +1478,8 @@ def _emit_delete_statements(
             and rows_matched > -1
             and expected != rows_matched
             and (
-                connection.dialect.supports_sane_multi_rowcount
+                chunksize
+                or connection.dialect.supports_sane_multi_rowcount
                 or len(del_objects) == 1
             )
         ):
@@ -1499,10 +1624,17 @@ def _postfetch(
     params,
     value_params,
     isupdate,
+    returned_defaults=None,
 ):
     """Expire attributes in need of newly persisted database state,
     after an INSERT or UPDATE statement has proceeded for that
-    state."""
+    state.
+
+    ``returned_defaults`` is the row fetched via RETURNING for this state,
+    if the statement was executed for many states at once; otherwise
+    it's taken from the result.
+
+    """
 
     prefetch_cols = result.context.compiled.prefetch
     postfetch_cols = result.context.compiled.postfetch
@@ -1519,7 +1651,10 @@ def _postfetch(
         load_evt_attrs = []
 
     if returning_cols:
-        row = result.context.returned_defaults
+        if returned_defaults is not None:
+            row = returned_defaults
+        else:
+            row = result.context.returned_defaults
         if row is not None:
             for col in returning_cols:
                 # pk cols returned from insert are handled
@@ -19,6 +19,7 @@ database to return iterable result sets.
 
 """
 
+import copy
 from itertools import chain
 
 from . import attributes
@@ -34,6 +35,7 @@ from .base import _is_mapped_class
 from .base import _orm_columns
 from .base import InspectionAttr
 from .path_registry import PathRegistry
+from .strategy_options import Load
 from .util import _entity_corresponds_to
 from .util import aliased
 from .util import AliasedClass
@@ -53,6 +55,8 @@ from ..sql import roles
 from ..sql import util as sql_util
 from ..sql import visitors
 from ..sql.base import ColumnCollection
+from ..sql.elements import _cache_key_anon_map
+from ..sql.elements import CacheKey
 from ..sql.selectable import ForUpdateArg
 
 
@@ -104,6 +108,7 @@ class Query(object):
     _correlate = frozenset()
     _populate_existing = False
     _invoke_all_eagers = True
+    _enable_query_cache = True
     _version_check = False
     _autoflush = True
     _only_load_props = None
@@ -126,6 +131,7 @@ class Query(object):
     _orm_only_from_obj_alias = True
     _current_path = _path_registry
     _has_mapper_entities = False
+    _from_cache = None
 
     lazy_loaded_from = None
     """An :class:`.InstanceState` that is using this :class:`.Query` for a
@@ -858,11 +864,13 @@ class Query(object):
             ``stream_results`` execution option to True, currently
             this is only understood by
             :mod:`~sqlalchemy.dialects.postgresql.psycopg2`,
-            :mod:`~sqlalchemy.dialects.mysql.mysqldb` and
-            :mod:`~sqlalchemy.dialects.mysql.pymysql` dialects
-            which will stream results using server side cursors
-            instead of pre-buffer all rows for this query. Other
-            DBAPIs **pre-buffer all rows** before making them
+            :mod:`~sqlalchemy.dialects.mysql.mysqldb`,
+            :mod:`~sqlalchemy.dialects.mysql.pymysql`,
+            :mod:`~sqlalchemy.dialects.sqlite.pysqlite` and
+            :mod:`~sqlalchemy.dialects.mssql.pyodbc` dialects
+            which will stream results instead of pre-buffer all rows for
+            this query, holding no more than ``count`` rows in memory at
+            once. Other DBAPIs **pre-buffer all rows** before making them
             available.  The memory use of raw database rows is much less
             than that of an ORM-mapped object, but should still be taken into
             consideration when benchmarking.
@@ -1017,12 +1025,41 @@ class Query(object):
         return loading.get_from_identity(self.session, key, passive)
 
     def _get_impl(self, primary_key_identity, db_load_fn, identity_token=None):
+        mapper = self._only_full_mapper_zero("get")
+
+        primary_key_identity = self._primary_key_identity(
+            mapper, primary_key_identity
+        )
+
+        if (
+            not self._populate_existing
+            and not mapper.always_refresh
+            and self._for_update_arg is None
+        ):
+
+            instance = self._identity_lookup(
+                mapper, primary_key_identity, identity_token=identity_token
+            )
+
+            if instance is not None:
+                self._get_existing_condition()
+                # reject calls for id in identity map but class
+                # mismatch.
+                if not issubclass(instance.__class__, mapper.class_):
+                    return None
+                return instance
+
+        return db_load_fn(self, primary_key_identity)
+
+    def _primary_key_identity(self, mapper, primary_key_identity):
+        """Convert a scalar, tuple, dictionary or composite primary key
+        identifier as accepted by :meth:`.Query.get` into a list of values
+        in mapper primary key order."""
+
         # convert composite types to individual args
         if hasattr(primary_key_identity, "__composite_values__"):
             primary_key_identity = primary_key_identity.__composite_values__()
 
-        mapper = self._only_full_mapper_zero("get")
-
         is_dict = isinstance(primary_key_identity, dict)
         if not is_dict:
             primary_key_identity = util.to_list(primary_key_identity)
@@ -1052,25 +1089,104 @@ class Query(object):
                     )
                 )
 
+        return primary_key_identity
+
+    def get_many(self, idents):
+        """Return a list of instances based on the given primary key
+        identifiers, with ``None`` in place of those which aren't found.
+
+        E.g.::
+
+            user_5, user_7, user_12 = session.query(User).get_many([5, 7, 12])
+
+        :meth:`~.Query.get_many` is equivalent to calling :meth:`~.Query.get`
+        for each identifier, except that those objects which aren't already
+        present in the identity map of the :class:`.Session`, or which are
+        present but marked as expired, are loaded together using a single
+        SELECT which locates them using an IN expression, rather than
+        using one SELECT per object.   For a large number of identifiers,
+        more than one SELECT is emitted, each of which locates up to 500
+        objects.  As is the case with :meth:`~.Query.get`, the originating
+        :class:`.Query` must be constructed against a single mapped entity,
+        with no additional filtering criterion.
+
+        :param idents: sequence of primary key identifiers, each of which is
+         a scalar, tuple, or dictionary as accepted by :meth:`~.Query.get`.
+
+        :return: a list of object instances and/or ``None``, in the same
+         order as the given identifiers.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :meth:`.Session.get_many`
+
+        """
+        return self._get_many_impl(idents, loading.load_on_pk_identities)
+
+    def _get_many_impl(self, idents, db_load_fn, identity_token=None):
+        mapper = self._only_full_mapper_zero("get_many")
+
+        idents = [
+            tuple(self._primary_key_identity(mapper, primary_key_identity))
+            for primary_key_identity in idents
+        ]
+        result = [None] * len(idents)
+
         if (
             not self._populate_existing
             and not mapper.always_refresh
             and self._for_update_arg is None
         ):
-
-            instance = self._identity_lookup(
-                mapper, primary_key_identity, identity_token=identity_token
-            )
-
-            if instance is not None:
+            to_load = []
+            expired = []
+            for idx, primary_key_identity in enumerate(idents):
+                # objects which are expired are loaded along with
+                # those which aren't present, rather than individually
+                instance = self._identity_lookup(
+                    mapper,
+                    primary_key_identity,
+                    identity_token=identity_token,
+                    passive=attributes.PASSIVE_NO_FETCH,
+                )
+                if instance is attributes.PASSIVE_NO_RESULT:
+                    expired.append(primary_key_identity)
+                    to_load.append(idx)
+                elif instance is None:
+                    to_load.append(idx)
+                elif issubclass(instance.__class__, mapper.class_):
+                    result[idx] = instance
+
+            if len(to_load) < len(idents):
                 self._get_existing_condition()
-                # reject calls for id in identity map but class
-                # mismatch.
-                if not issubclass(instance.__class__, mapper.class_):
-                    return None
-                return instance
+        else:
+            to_load = list(range(len(idents)))
+            expired = ()
+
+        loaded = {}
+        if to_load:
+            loaded = db_load_fn(
+                self,
+                [idents[idx] for idx in to_load],
+                identity_token=identity_token,
+            )
+            for idx in to_load:
+                result[idx] = loaded.get(idents[idx])
+
+        for primary_key_identity in expired:
+            if primary_key_identity not in loaded:
+                # expired object whose row is no longer present
+                key = mapper.identity_key_from_primary_key(
+                    primary_key_identity, identity_token=identity_token
+                )
+                instance = self.session.identity_map.get(key)
+                if instance is not None:
+                    self.session._remove_newly_deleted(
+                        [attributes.instance_state(instance)]
+                    )
 
-        return db_load_fn(self, primary_key_identity)
+        return result
 
     @_generative()
     def correlate(self, *args):
@@ -1140,6 +1256,17 @@ class Query(object):
         """
         self._invoke_all_eagers = value
 
+    @_generative()
+    def _with_query_cache(self, value):
+        """Set the 'query cache' flag which indicates if the
+        :class:`.QueryContext` produced by this :class:`.Query` may be
+        cached.
+
+        Default is that of :attr:`.Query._enable_query_cache`.
+
+        """
+        self._enable_query_cache = value
+
     def with_parent(self, instance, property=None, from_entity=None):  # noqa
         """Add filtering criterion that relates the given instance
         to a child object or collection, using its attribute state
@@ -1638,6 +1765,30 @@ class Query(object):
         automatically if the :meth:`~sqlalchemy.orm.query.Query.yield_per()`
         method is used.
 
+        The :class:`.Query` additionally accepts the ``readonly_entities``
+        option.  When set to True, mapped entities are returned as plain
+        instances of the mapped class with only their column-based
+        attributes populated, bypassing the :class:`.InstanceState`, the
+        identity map and attribute history that normally accompany each
+        loaded object, which greatly reduces the overhead of loading large
+        numbers of rows::
+
+            for user in session.query(User).execution_options(
+                readonly_entities=True
+            ):
+                print(user.id, user.name)
+
+        The objects so loaded aren't associated with the :class:`.Session`,
+        and each row produces a new object, even if an object with the same
+        identity is already present in the :class:`.Session` or earlier in
+        the same result.  Attributes which weren't loaded, including
+        relationships, deferred columns and composites, raise
+        ``AttributeError`` when accessed, as does setting any mapped
+        attribute.  Eager loading options are ignored, and
+        :meth:`.InstanceEvents.load` events are not emitted.
+
+        .. versionadded:: 1.4 Added the ``readonly_entities`` option.
+
         .. seealso::
 
             :meth:`.Query.get_execution_options`
@@ -3337,11 +3488,287 @@ class Query(object):
             return None
 
     def __iter__(self):
-        context = self._compile_context()
+        query, context = self._cached_compile_context()
         context.statement.use_labels = True
         if self._autoflush and not self._populate_existing:
             self.session._autoflush()
-        return self._execute_and_instances(context)
+        if self._from_cache is not None:
+            return self._from_cache._execute_and_instances(query, context)
+        return query._execute_and_instances(context)
+
+    def _cached_compile_context(self):
+        """Return a tuple of ``(query, context)`` to be used to invoke
+        this :class:`.Query`.
+
+        The :class:`.QueryContext` is retrieved from a cache local to the
+        :class:`.Mapper` of the lead entity, keyed on the structure of the
+        :class:`.Query` as returned by :meth:`.Query._generate_cache_key`.
+        On a cache hit, the :class:`.Query` returned is a copy of the one
+        which produced the cached context, associated with this
+        :class:`.Query` object's :class:`.Session` and carrying the bound
+        parameter values of this :class:`.Query`; it's this query which must
+        be used to execute the context, so that result rows are processed
+        against the entities and adapters that produced the statement.
+
+        If this :class:`.Query` can't be cached, it's returned along with a
+        newly compiled context.
+
+        """
+        if (
+            not self._entities
+            or not self._enable_query_cache
+            or self.dispatch.before_compile
+            or self._refresh_state is not None
+            or self.session is None
+            or not self.session.enable_baked_queries
+            or not util.methods_equivalent(
+                type(self)._compile_context, Query._compile_context
+            )
+        ):
+            return self, self._compile_context()
+
+        mapper = self._bind_mapper()
+        if mapper is None:
+            return self, self._compile_context()
+
+        cache_key = self._generate_cache_key()
+        if cache_key is None or any(
+            bind.callable is not None for bind in cache_key.bindparams
+        ):
+            # bound parameters that refer to a callable, such as those
+            # produced by with_parent(), are resolved at execution time
+            return self, self._compile_context()
+
+        cache = mapper._query_cache
+        cached = cache.get(cache_key.key)
+        if cached is None:
+            cached = cache[cache_key.key] = self._cacheable_context(
+                self._compile_context(), cache_key
+            )
+
+        return self._from_cached_context(cached, cache_key)
+
+    def _cacheable_context(self, context, cache_key):
+        """Prepare a newly compiled :class:`.QueryContext` to be stored
+        in the query cache, disassociating it from this :class:`.Query`
+        object's :class:`.Session` and bound parameter values."""
+
+        query = context.query.with_session(None)
+        query._params = util.immutabledict()
+        query.lazy_loaded_from = None
+
+        context.query = query
+        context.session = None
+        context.attributes = self._loader_queries_for_context(
+            context.attributes, query, None
+        )
+
+        return query, context, cache_key.bindparams
+
+    def _from_cached_context(self, cached, cache_key):
+        """Produce a ``(query, context)`` tuple from a cached
+        :class:`.QueryContext`, applying this :class:`.Query` object's
+        :class:`.Session` and bound parameter values."""
+
+        cached_query, cached_context, cached_bindparams = cached
+
+        params = {}
+        for cached_bind, bind in zip(cached_bindparams, cache_key.bindparams):
+            if not bind.required:
+                params[cached_bind.key] = bind.effective_value
+        params.update(self._params)
+
+        query = cached_query._clone()
+        query.session = self.session
+        query._params = params
+        query.lazy_loaded_from = self.lazy_loaded_from
+
+        context = copy.copy(cached_context)
+        context.query = query
+        context.session = self.session
+        context.attributes = self._loader_queries_for_context(
+            context.attributes, query, params
+        )
+
+        return query, context
+
+    def _loader_queries_for_context(self, attributes, query, params):
+        """Return a copy of the given context attributes where
+        :class:`.Query` objects established by loader strategies, i.e.
+        those of the subquery eager loader, are associated with the
+        :class:`.Session` and parameters of the given :class:`.Query`,
+        and refer to it as their originating query."""
+
+        attributes = attributes.copy()
+        for key, value in list(attributes.items()):
+            if isinstance(value, Query):
+                value = value.with_session(query.session)
+                if params:
+                    value = value.params(params)
+                value._attributes = dict(
+                    (
+                        attr_key,
+                        query
+                        if isinstance(attr_key, tuple)
+                        and attr_key[0] == "orig_query"
+                        else attr_value,
+                    )
+                    for attr_key, attr_value in value._attributes.items()
+                )
+                attributes[key] = value
+        return attributes
+
+    _cache_key_ignore_attrs = frozenset(
+        [
+            "session",
+            "dispatch",
+            "_params",
+            "lazy_loaded_from",
+            "_primary_entity",
+            "_has_mapper_entities",
+            "_mapper_adapter_map",
+            "_joinpath",
+            "_joinpoint",
+            "_with_options",
+            "_enable_assertions",
+            "_enable_query_cache",
+            "_orm_only_from_obj_alias",
+            "_refresh_identity_token",
+            "_from_cache",
+        ]
+    )
+
+    _cache_key_empty_attrs = (
+        "_polymorphic_adapters",
+        "_filter_aliases",
+        "_from_obj_alias",
+        "_refresh_state",
+    )
+
+    _cache_key_element_attrs = (
+        "_criterion",
+        "_order_by",
+        "_group_by",
+        "_having",
+        "_distinct",
+        "_from_obj",
+        "_statement",
+        "_prefixes",
+        "_suffixes",
+        "_for_update_arg",
+        "_with_hints",
+        "_limit",
+        "_offset",
+        "_select_from_entity",
+        "_join_entities",
+        "_execution_options",
+        "_only_return_tuples",
+        "_enable_eagerloads",
+        "_with_labels",
+        "_yield_per",
+        "_populate_existing",
+        "_invoke_all_eagers",
+        "_version_check",
+        "_autoflush",
+        "_enable_single_crit",
+        "_orm_only_adapt",
+    )
+
+    def _generate_cache_key(self):
+        """return a :class:`.CacheKey` for this :class:`.Query`, or None.
+
+        The key is generated from the entities, criteria, loader options
+        and flags that determine the :class:`.QueryContext` produced by
+        :meth:`.Query._compile_context`.  The
+        :class:`.BindParameter` objects within the structure are gathered
+        in traversal order, so that the parameter values of this
+        :class:`.Query` may be applied to a context produced by another
+        :class:`.Query` with the same key.
+
+        Returns None if the :class:`.Query` has state that can't be
+        represented within a key, such as adaptation of criteria to
+        aliased or polymorphic selectables, options which don't
+        support caching, or attributes established by a subclass.
+
+        """
+        bindparams = []
+        kw = {"bindparams": bindparams, "anon_map": _cache_key_anon_map()}
+
+        try:
+            for attr in self.__dict__:
+                if (
+                    attr not in self._cache_key_ignore_attrs
+                    and attr not in self._cache_key_empty_attrs
+                    and attr not in self._cache_key_element_attrs
+                    and attr
+                    not in (
+                        "_entities",
+                        "_attributes",
+                        "_correlate",
+                        "_current_path",
+                        "_only_load_props",
+                    )
+                ):
+                    raise NotImplementedError()
+
+            for attr in self._cache_key_empty_attrs:
+                if getattr(self, attr):
+                    raise NotImplementedError()
+
+            if len(self._correlate) > 1:
+                raise NotImplementedError()
+
+            # loader options are represented by the state they've
+            # established in self._attributes; other options must
+            # supply a key, as is the case for the baked lazy loader
+            option_keys = []
+            for opt in self._with_options:
+                if isinstance(opt, Load):
+                    continue
+                mapper = self._bind_mapper()
+                if mapper is None:
+                    raise NotImplementedError()
+                opt_key = opt._generate_cache_key(mapper._path_registry)
+                if opt_key is False:
+                    raise NotImplementedError()
+                elif opt_key is not None:
+                    option_keys.append(opt_key)
+
+            key = (
+                (
+                    type(self),
+                    tuple(
+                        _query_entity_cache_key(ent, kw)
+                        for ent in self._entities
+                    ),
+                    tuple(
+                        _cache_key_for_value(elem, kw)
+                        for elem in self._correlate
+                    ),
+                    _cache_key_for_value(self._current_path.path, kw),
+                    tuple(sorted(self._only_load_props))
+                    if self._only_load_props
+                    else None,
+                    tuple(
+                        (
+                            _cache_key_for_value(attr_key, kw),
+                            _cache_key_for_value(value, kw),
+                        )
+                        for attr_key, value in self._attributes.items()
+                        if attr_key != "_unbound_load_dedupes"
+                    ),
+                    tuple(option_keys),
+                )
+                + tuple(
+                    _cache_key_for_value(getattr(self, attr), kw)
+                    for attr in self._cache_key_element_attrs
+                )
+            )
+            hash(key)
+        except (NotImplementedError, TypeError):
+            return None
+        else:
+            return CacheKey(key, bindparams)
 
     def __str__(self):
         context = self._compile_context()
@@ -4641,6 +5068,77 @@ class _ColumnEntity(_QueryEntity):
         return str(self.column)
 
 
+def _query_entity_cache_key(ent, kw):
+    """Return a cache key for a :class:`._QueryEntity`."""
+
+    if isinstance(ent, _MapperEntity):
+        return (
+            _MapperEntity,
+            _cache_key_for_value(ent.entity_zero, kw),
+            tuple(ent._with_polymorphic or ()),
+        )
+    elif isinstance(ent, _BundleEntity):
+        return (
+            _BundleEntity,
+            type(ent.bundle),
+            ent.bundle.name,
+            ent.bundle.single_entity,
+            tuple(_query_entity_cache_key(sub, kw) for sub in ent._entities),
+        )
+    else:
+        return (
+            _ColumnEntity,
+            ent.column._cache_key(**kw),
+            ent._label_name,
+            _cache_key_for_value(ent.entity_zero, kw),
+            _cache_key_for_value(ent.entities, kw),
+            _cache_key_for_value(ent.namespace, kw),
+        )
+
+
+def _cache_key_for_value(value, kw):
+    """Return a cache key for an attribute value of a :class:`.Query`.
+
+    Values which aren't recognized raise ``NotImplementedError``, indicating
+    the :class:`.Query` can't be cached.
+
+    """
+
+    if value is None or isinstance(
+        value, (bool, float, type) + util.int_types + util.string_types
+    ):
+        return value
+    elif isinstance(value, (list, tuple)):
+        return tuple(_cache_key_for_value(elem, kw) for elem in value)
+    elif isinstance(value, Load):
+        return (
+            Load,
+            value.strategy,
+            tuple(
+                (opt_key, _cache_key_for_value(value.local_opts[opt_key], kw))
+                for opt_key in sorted(value.local_opts)
+            ),
+            _cache_key_for_value(value._of_type, kw),
+            value.is_class_strategy,
+            value.is_opts_only,
+            value.propagate_to_loaders,
+        )
+    elif isinstance(value, util.immutabledict):
+        return tuple(
+            (opt_key, _cache_key_for_value(value[opt_key], kw))
+            for opt_key in sorted(value)
+        )
+    elif isinstance(value, expression.ClauseElement):
+        return value._cache_key(**kw)
+    elif isinstance(value, InspectionAttr) and not value.is_aliased_class:
+        # mappers and mapper properties are keyed on identity; aliased
+        # entities are typically generated for each query and aren't
+        # cacheable in this way
+        return value
+    else:
+        raise NotImplementedError()
+
+
 class QueryContext(object):
     __slots__ = (
         "multi_row_eager_loaders",
@@ -4672,6 +5170,7 @@ class QueryContext(object):
         "partials",
         "post_load_paths",
         "identity_token",
+        "readonly_entities",
     )
 
     def __init__(self, query):
@@ -4713,8 +5212,12 @@ class QueryContext(object):
         self.attributes = query._attributes.copy()
         if self.refresh_state is not None:
             self.identity_token = query._refresh_identity_token
+            self.readonly_entities = False
         else:
             self.identity_token = None
+            self.readonly_entities = query._execution_options.get(
+                "readonly_entities", False
+            )
 
 
 class AliasOption(interfaces.MapperOption):
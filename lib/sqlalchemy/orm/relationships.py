@@ -321,7 +321,9 @@ class RelationshipProperty(StrategizedProperty):
           Use the :class:`.BakedQuery` cache to cache the construction of SQL
           used in lazy loads.  True by default.   Set to False if the
           join condition of the relationship has unusual features that
-          might not respond well to statement caching.
+          might not respond well to statement caching; when False, the
+          :class:`.Query` used for the lazy load also won't make use of
+          the structural cache of :class:`.Query` compilation.
 
           .. versionchanged:: 1.2
              "Baked" loading is the default implementation for the "select",
@@ -532,6 +534,17 @@ class RelationshipProperty(StrategizedProperty):
             first accessed, using a separate SELECT statement, or identity map
             fetch for simple many-to-one references.
 
+          * ``batch`` - items should be loaded lazily when the property is
+            first accessed, for the given object as well as for all of the
+            other objects which were loaded by the same query and remain in
+            the :class:`.Session`, using a SELECT statement which specifies
+            their primary key or foreign key identifiers using an IN
+            clause, in the same way as ``selectin`` loading.  Simple
+            many-to-one references that are present in the identity map are
+            still returned without emitting SQL.
+
+            .. versionadded:: 1.4
+
           * ``immediate`` - items should be loaded as the parents are loaded,
             using a separate SELECT statement, or identity map fetch for
             simple many-to-one references.
@@ -0,0 +1,287 @@
+# orm/result_cache.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Caching of :class:`.Query` results, as raw rows, within a backend
+associated with the :class:`.Session`.
+
+The cache is configured using the :paramref:`.Session.result_cache`
+parameter, and is consulted for those queries which include the
+:class:`.FromCache` option.   Results are keyed on the structure of the
+SQL statement along with its bound parameter values, and are stored as
+the rows returned by the DBAPI, rather than as ORM objects; each time a
+cached result is used, the rows are processed into objects local to the
+:class:`.Session` in the same way as rows that are newly fetched from the
+database.
+
+.. versionadded:: 1.4
+
+"""
+
+import time
+
+from . import loading
+from .interfaces import MapperOption
+from .. import exc as sa_exc
+from .. import util
+from ..sql import util as sql_util
+
+
+class ResultCache(object):
+    """Base class for a backend which stores query results on behalf
+    of the :class:`.FromCache` option.
+
+    A backend stores :class:`.FrozenResult` objects, each of which is
+    associated with the :class:`.Table` objects its statement selects
+    from.  When a :class:`.Session` flushes or commits changes to a
+    table, the :meth:`.ResultCache.invalidate` method is called for that
+    table, after which results which refer to it should no longer be
+    returned.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :class:`.MemoryResultCache`
+
+    """
+
+    def checkpoint(self):
+        """Return a value representing the current state of invalidation,
+        which is passed to :meth:`.ResultCache.set` along with a result that
+        was fetched after this method was called.
+
+        A backend may use this value to reject a result if
+        :meth:`.ResultCache.invalidate` was called for one of its tables
+        while the result was being fetched.
+
+        """
+        return None
+
+    def get(self, key):
+        """Return the :class:`.FrozenResult` for the given key, or None."""
+        raise NotImplementedError()
+
+    def set(self, key, value, tables, checkpoint, ttl=None):
+        """Store a :class:`.FrozenResult` under the given key.
+
+        :param tables: set of :class:`.Table` objects that the result
+         was selected from.
+
+        :param checkpoint: the value of :meth:`.ResultCache.checkpoint`
+         taken before the result was fetched.
+
+        :param ttl: number of seconds for which the result may be
+         returned, if different from the backend's default.
+
+        """
+        raise NotImplementedError()
+
+    def invalidate(self, tables):
+        """Invalidate all results which refer to any of the given
+        :class:`.Table` objects."""
+        raise NotImplementedError()
+
+    def clear(self):
+        """Remove all results."""
+        raise NotImplementedError()
+
+
+class MemoryResultCache(ResultCache):
+    """A :class:`.ResultCache` which stores results in process memory.
+
+    E.g.::
+
+        from sqlalchemy.orm import FromCache, MemoryResultCache
+
+        cache = MemoryResultCache(size=5000, ttl=300)
+        Session = sessionmaker(engine, result_cache=cache)
+
+        session = Session()
+        users = session.query(User).options(FromCache()).all()
+
+    :param size: number of results to be stored; when this number is
+     exceeded, least recently used results are discarded.
+
+    :param ttl: default number of seconds after which a result expires,
+     or None for no expiration.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, size=1000, ttl=None):
+        self.ttl = ttl
+        self._cache = util.LRUCache(size)
+        self._counter = 0
+        self._invalidated = {}
+        self._mutex = util.threading.Lock()
+
+    def checkpoint(self):
+        return self._counter
+
+    def get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        value, tables, checkpoint, expires = entry
+        if (expires is not None and expires < time.time()) or any(
+            self._invalidated.get(table, 0) > checkpoint for table in tables
+        ):
+            self._cache.pop(key, None)
+            return None
+        return value
+
+    def set(self, key, value, tables, checkpoint, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+        self._cache[key] = (
+            value,
+            tables,
+            checkpoint,
+            time.time() + ttl if ttl is not None else None,
+        )
+
+    def invalidate(self, tables):
+        with self._mutex:
+            self._counter += 1
+            for table in tables:
+                self._invalidated[table] = self._counter
+
+    def clear(self):
+        self._cache.clear()
+
+
+class FromCache(MapperOption):
+    """Indicate that the results of a :class:`.Query` are to be retrieved
+    from the :paramref:`.Session.result_cache` when present, and are
+    otherwise stored there after being fetched.
+
+    E.g.::
+
+        q = session.query(User).filter(User.name == "ed").options(
+            FromCache(ttl=60)
+        )
+
+    Cached results are invalidated when the :class:`.Session` flushes
+    changes to any of the tables they were selected from, and again when
+    the :class:`.Session` commits.  Within a transaction that has flushed
+    changes to a table, queries that refer to that table bypass the cache,
+    so that uncommitted data is neither stored nor hidden by an earlier
+    result.  Statements which modify tables that aren't emitted by the
+    flush process, such as those of :meth:`.Query.update` and
+    :meth:`.Session.execute`, are not tracked; use
+    :meth:`.ResultCache.invalidate` in these cases.
+
+    A query which uses :meth:`.Query.with_for_update` bypasses the cache,
+    so that its row locks are acquired.  A query which uses
+    :meth:`.Query.populate_existing` is always emitted, and its result
+    replaces that which is cached.
+
+    The option applies to the statement of the :class:`.Query` itself, as
+    well as to the queries of :func:`.subqueryload`, which are derived from
+    it; other queries emitted by loader strategies, such as lazy loads and
+    :func:`.selectinload`, are not affected.
+
+    :param ttl: number of seconds after which the cached result expires,
+     overriding the default of the :class:`.ResultCache`.
+
+    .. versionadded:: 1.4
+
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl
+
+    def process_query(self, query):
+        query._from_cache = self
+
+    def _generate_cache_key(self, path):
+        # doesn't affect the SQL emitted
+        return None
+
+    def _execute_and_instances(self, query, context):
+        session = query.session
+        cache = session.result_cache
+        if cache is None:
+            raise sa_exc.InvalidRequestError(
+                "The FromCache option requires that the Session be "
+                "configured with a result_cache"
+            )
+
+        if query._for_update_arg is not None:
+            # the SELECT acquires row locks, so is always emitted
+            return query._execute_and_instances(context)
+
+        statement = context.statement
+        tables = None
+        if session._result_cache_tables:
+            tables = frozenset(sql_util.find_tables(statement))
+            if not session._result_cache_tables.isdisjoint(tables):
+                return query._execute_and_instances(context)
+
+        key = self._result_key(query, context)
+        if key is None:
+            return query._execute_and_instances(context)
+
+        checkpoint = cache.checkpoint()
+        if query._populate_existing:
+            # refresh the cached result along with the objects
+            frozen = None
+        else:
+            frozen = cache.get(key)
+        if frozen is None:
+            conn = query._get_bind_args(
+                context, query._connection_from_session, close_with_result=True
+            )
+            frozen = conn.execute(statement, query._params).freeze()
+            if tables is None:
+                tables = frozenset(sql_util.find_tables(statement))
+            cache.set(key, frozen, tables, checkpoint, ttl=self.ttl)
+
+        return loading.instances(query, frozen(statement), context)
+
+    @util.dependencies("sqlalchemy.orm.query")
+    def _result_key(self, querylib, query, context):
+        """Return the key for the result of the given :class:`.Query`,
+        or None if its result can't be cached."""
+
+        if not util.methods_equivalent(
+            type(query)._execute_and_instances,
+            querylib.Query._execute_and_instances,
+        ):
+            # e.g. ShardedQuery, which executes against multiple binds
+            return None
+
+        cache_key = context.statement._generate_cache_key()
+        if cache_key is None:
+            return None
+
+        params = query._params
+        values = []
+        for bind in cache_key.bindparams:
+            if bind.key in params:
+                value = params[bind.key]
+            else:
+                value = bind.effective_value
+            if isinstance(value, list):
+                value = tuple(value)
+            values.append(value)
+
+        bind = query._get_bind_args(context, query.session.get_bind)
+        key = (
+            getattr(bind, "engine", bind),
+            cache_key.key,
+            tuple(values),
+            tuple(sorted(query._execution_options.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        else:
+            return key
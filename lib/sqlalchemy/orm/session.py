@@ -498,6 +498,11 @@ class SessionTransaction(object):
             for t in set(self._connections.values()):
                 t[1].commit()
 
+            if self._parent is None and self.session._result_cache_tables:
+                self.session.result_cache.invalidate(
+                    self.session._result_cache_tables
+                )
+
             self._state = COMMITTED
             self.session.dispatch.after_commit(self.session)
 
@@ -571,6 +576,7 @@ class SessionTransaction(object):
     def close(self, invalidate=False):
         self.session.transaction = self._parent
         if self._parent is None:
+            self.session._result_cache_tables.clear()
             for connection, transaction, autoclose in set(
                 self._connections.values()
             ):
@@ -633,6 +639,7 @@ class Session(_SessionClassMethods):
         "expunge_all",
         "flush",
         "get_bind",
+        "get_many",
         "is_modified",
         "bulk_save_objects",
         "bulk_insert_mappings",
@@ -682,6 +689,8 @@ class Session(_SessionClassMethods):
         enable_baked_queries=True,
         info=None,
         query_cls=None,
+        identity_map_cls=None,
+        result_cache=None,
     ):
         r"""Construct a new Session.
 
@@ -768,7 +777,9 @@ class Session(_SessionClassMethods):
         :param enable_baked_queries: defaults to ``True``.  A flag consumed
            by the :mod:`sqlalchemy.ext.baked` extension to determine if
            "baked queries" should be cached, as is the normal operation
-           of this extension.  When set to ``False``, all caching is disabled,
+           of this extension, as well as by the :class:`.Query` object to
+           determine if the compilation of the query may be cached based on
+           its structure.  When set to ``False``, all caching is disabled,
            including baked queries defined by the calling application as
            well as those used internally.  Setting this flag to ``False``
            can significantly reduce memory use, however will also degrade
@@ -807,6 +818,19 @@ class Session(_SessionClassMethods):
           objects, as returned by the :meth:`~.Session.query` method.
           Defaults to :class:`.Query`.
 
+        :param result_cache: a :class:`.ResultCache` in which the results
+          of queries that include the :class:`.FromCache` option are
+          stored.  The same :class:`.ResultCache` may be shared among many
+          :class:`.Session` objects, typically by passing it to
+          :class:`.sessionmaker`; each :class:`.Session` invalidates the
+          results which refer to the tables it flushes changes to.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+                :class:`.MemoryResultCache`
+
         :param twophase:  When ``True``, all transactions will be started as
             a "two phase" transaction, i.e. using the "two phase" semantics
             of the database in use along with an XID.  During a
@@ -816,6 +840,21 @@ class Session(_SessionClassMethods):
             called. This allows each database to roll back the entire
             transaction, before each transaction is committed.
 
+        :param identity_map_cls: optional callable which will be used to
+           create the :class:`.IdentityMap` for this :class:`.Session`,
+           including when the identity map is replaced by
+           :meth:`.Session.close`.  The callable is invoked with no
+           arguments; to pass arguments, use ``functools.partial``.  This
+           may be used to establish a size-bounded identity map using
+           :class:`.LRUInstanceDict`.  Takes precedence over
+           :paramref:`.Session.weak_identity_map`.
+
+           .. versionadded:: 1.4
+
+           .. seealso::
+
+                :class:`.LRUInstanceDict`
+
         :param weak_identity_map:  Defaults to ``True`` - when set to
            ``False``, objects placed in the :class:`.Session` will be
            strongly referenced until explicitly removed or the
@@ -824,13 +863,20 @@ class Session(_SessionClassMethods):
 
         """
 
-        if weak_identity_map in (True, None):
+        if identity_map_cls is not None:
+            self._identity_cls = identity_map_cls
+        elif weak_identity_map in (True, None):
             self._identity_cls = identity.WeakInstanceDict
         else:
             self._identity_cls = identity.StrongInstanceDict
 
         self.identity_map = self._identity_cls()
 
+        self.result_cache = result_cache
+        # tables flushed within the current transaction, which are
+        # invalidated in the result cache again upon commit
+        self._result_cache_tables = set()
+
         self._new = {}  # InstanceState->object, strong refs object
         self._deleted = {}  # same
         self.bind = bind
@@ -1542,6 +1588,25 @@ class Session(_SessionClassMethods):
 
         return self._query_cls(entities, self, **kwargs)
 
+    def get_many(self, entity, idents):
+        """Return a list of instances of the given entity based on the given
+        primary key identifiers, with ``None`` in place of those which
+        aren't found.
+
+        E.g.::
+
+            users = session.get_many(User, [5, 7, 12])
+
+        Objects which are already present in the identity map are returned
+        directly; the remainder are loaded using a single SELECT.   This
+        is a shorthand for ``session.query(entity).get_many(idents)``; see
+        :meth:`.Query.get_many` for details.
+
+        .. versionadded:: 1.4
+
+        """
+        return self.query(entity).get_many(idents)
+
     @property
     @util.contextmanager
     def no_autoflush(self):
@@ -2557,6 +2622,11 @@ class Session(_SessionClassMethods):
             finally:
                 self._warn_on_events = False
 
+            if self.result_cache is not None:
+                tables = flush_context.affected_tables()
+                self._result_cache_tables.update(tables)
+                self.result_cache.invalidate(tables)
+
             self.dispatch.after_flush(self, flush_context)
 
             flush_context.finalize_flush_changes()
@@ -3301,14 +3371,14 @@ def make_transient(instance):
         s._expunge_states([state])
 
     # remove expired state
-    state.expired_attributes.clear()
+    state.expired_attributes = util.EMPTY_SET
 
     # remove deferred callables
     if state.callables:
         del state.callables
 
     if state.key:
-        del state.key
+        state.key = None
     if state._deleted:
         del state._deleted
 
@@ -31,6 +31,11 @@ from .. import inspection
 from .. import util
 
 
+def _null_ref():
+    """Stand-in for a weak reference whose referent is not present."""
+    return None
+
+
 @inspection._self_inspects
 class InstanceState(interfaces.InspectionAttrInfo):
     """tracks state information at the instance level.
@@ -58,20 +63,37 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
     """
 
-    session_id = None
-    key = None
-    runid = None
-    load_options = util.EMPTY_SET
-    load_path = ()
-    insert_order = None
-    _strong_obj = None
-    modified = False
-    expired = False
+    # attributes which are present on every state are stored in slots;
+    # those which are rarely set remain class-level defaults which may be
+    # overridden in __dict__.  collections which are usually empty refer
+    # to shared immutable empty collections until they are first
+    # written to.
+    __slots__ = (
+        "class_",
+        "manager",
+        "obj",
+        "committed_state",
+        "expired_attributes",
+        "key",
+        "identity_token",
+        "session_id",
+        "runid",
+        "load_options",
+        "load_path",
+        "insert_order",
+        "modified",
+        "expired",
+        "parents",
+        "_strong_obj",
+        "_instance_dict",
+        "_pending_mutations",
+        "_empty_collections",
+    )
+
     _deleted = False
     _load_pending = False
     _orphaned_outside_of_session = False
     is_instance = True
-    identity_token = None
     _last_known_values = ()
 
     callables = ()
@@ -90,16 +112,21 @@ class InstanceState(interfaces.InspectionAttrInfo):
         self.class_ = obj.__class__
         self.manager = manager
         self.obj = weakref.ref(obj, self._cleanup)
-        self.committed_state = {}
-        self.expired_attributes = set()
-
-    expired_attributes = None
-    """The set of keys which are 'expired' to be loaded by
-       the manager's deferred scalar loader, assuming no pending
-       changes.
 
-       see also the ``unmodified`` collection which is intersected
-       against this set when a refresh operation occurs."""
+        # expired_attributes is the set of keys which are 'expired' to be
+        # loaded by the manager's deferred scalar loader, assuming no
+        # pending changes.  see also the ``unmodified`` collection which
+        # is intersected against this set when a refresh operation occurs.
+        self.expired_attributes = util.EMPTY_SET
+
+        self.committed_state = self.parents = util.EMPTY_DICT
+        self._pending_mutations = self._empty_collections = util.EMPTY_DICT
+        self.key = self.identity_token = self.session_id = self.runid = None
+        self.insert_order = self._strong_obj = None
+        self.load_options = util.EMPTY_SET
+        self.load_path = ()
+        self.modified = self.expired = False
+        self._instance_dict = _null_ref
 
     @util.memoized_property
     def attrs(self):
@@ -302,19 +329,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         # the board ?  probably
         return self.key
 
-    @util.memoized_property
-    def parents(self):
-        return {}
-
-    @util.memoized_property
-    def _pending_mutations(self):
-        return {}
-
-    @util.memoized_property
-    def _empty_collections(self):
-        return {}
-
-    @util.memoized_property
+    @property
     def mapper(self):
         """Return the :class:`.Mapper` used for this mapped object."""
         return self.manager.mapper
@@ -348,7 +363,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
             state.session_id = None
 
             if to_transient and state.key:
-                del state.key
+                state.key = None
             if persistent:
                 if to_transient:
                     if persistent_to_transient is not None:
@@ -378,7 +393,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
     def _dispose(self):
         self._detach()
-        del self.obj
+        self.obj = _null_ref
 
     def _cleanup(self, ref):
         """Weakref callback cleanup.
@@ -400,7 +415,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         instance_dict = self._instance_dict()
         if instance_dict is not None:
             instance_dict._fast_discard(self)
-            del self._instance_dict
+            self._instance_dict = _null_ref
 
             # we can't possibly be in instance_dict._modified
             # b.c. this is weakref cleanup only, that set
@@ -408,10 +423,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
             # assert self not in instance_dict._modified
 
         self.session_id = self._strong_obj = None
-        del self.obj
-
-    def obj(self):
-        return None
+        self.obj = _null_ref
 
     @property
     def dict(self):
@@ -451,27 +463,34 @@ class InstanceState(interfaces.InspectionAttrInfo):
         return self.manager[key].impl
 
     def _get_pending_mutation(self, key):
+        if not self._pending_mutations:
+            self._pending_mutations = {}
         if key not in self._pending_mutations:
             self._pending_mutations[key] = PendingCollection()
         return self._pending_mutations[key]
 
     def __getstate__(self):
-        state_dict = {"instance": self.obj()}
+        state_dict = {
+            "instance": self.obj(),
+            "class_": self.class_,
+            "modified": self.modified,
+            "expired": self.expired,
+        }
         state_dict.update(
-            (k, self.__dict__[k])
+            (k, getattr(self, k))
             for k in (
                 "committed_state",
                 "_pending_mutations",
-                "modified",
-                "expired",
-                "callables",
                 "key",
                 "parents",
                 "load_options",
-                "class_",
                 "expired_attributes",
-                "info",
             )
+            if getattr(self, k)
+        )
+        state_dict.update(
+            (k, self.__dict__[k])
+            for k in ("callables", "info")
             if k in self.__dict__
         )
         if self.load_path:
@@ -493,11 +512,21 @@ class InstanceState(interfaces.InspectionAttrInfo):
             self.obj = None
             self.class_ = state_dict["class_"]
 
-        self.committed_state = state_dict.get("committed_state", {})
-        self._pending_mutations = state_dict.get("_pending_mutations", {})
-        self.parents = state_dict.get("parents", {})
+        self.committed_state = state_dict.get(
+            "committed_state", util.EMPTY_DICT
+        )
+        self._pending_mutations = state_dict.get(
+            "_pending_mutations", util.EMPTY_DICT
+        )
+        self.parents = state_dict.get("parents", util.EMPTY_DICT)
+        self._empty_collections = util.EMPTY_DICT
         self.modified = state_dict.get("modified", False)
         self.expired = state_dict.get("expired", False)
+        self.key = state_dict.get("key", None)
+        self.load_options = state_dict.get("load_options", util.EMPTY_SET)
+        self.identity_token = self.session_id = self.runid = None
+        self.insert_order = self._strong_obj = None
+        self._instance_dict = _null_ref
         if "info" in state_dict:
             self.info.update(state_dict["info"])
         if "callables" in state_dict:
@@ -513,18 +542,10 @@ class InstanceState(interfaces.InspectionAttrInfo):
                         self.expired_attributes.add(k)
                         del self.callables[k]
         else:
-            if "expired_attributes" in state_dict:
-                self.expired_attributes = state_dict["expired_attributes"]
-            else:
-                self.expired_attributes = set()
+            self.expired_attributes = state_dict.get(
+                "expired_attributes", util.EMPTY_SET
+            )
 
-        self.__dict__.update(
-            [
-                (k, state_dict[k])
-                for k in ("key", "load_options")
-                if k in state_dict
-            ]
-        )
         if self.key:
             try:
                 self.identity_token = self.key[2]
@@ -536,6 +557,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
         if "load_path" in state_dict:
             self.load_path = PathRegistry.deserialize(state_dict["load_path"])
+        else:
+            self.load_path = ()
 
         state_dict["manager"](self, inst, state_dict)
 
@@ -546,7 +569,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
         old = dict_.pop(key, None)
         if old is not None and self.manager[key].impl.collection:
             self.manager[key].impl._invalidate_collection(old)
-        self.expired_attributes.discard(key)
+        if self.expired_attributes:
+            self.expired_attributes.discard(key)
         if self.callables:
             self.callables.pop(key, None)
 
@@ -581,24 +605,22 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
         if self.modified:
             modified_set.discard(self)
-            self.committed_state.clear()
+            self.committed_state = util.EMPTY_DICT
             self.modified = False
 
         self._strong_obj = None
 
-        if "_pending_mutations" in self.__dict__:
-            del self.__dict__["_pending_mutations"]
+        self._pending_mutations = self.parents = util.EMPTY_DICT
 
-        if "parents" in self.__dict__:
-            del self.__dict__["parents"]
-
-        self.expired_attributes.update(
-            [
-                impl.key
-                for impl in self.manager._scalar_loader_impls
-                if impl.expire_missing or impl.key in dict_
-            ]
-        )
+        expired_attributes = [
+            impl.key
+            for impl in self.manager._scalar_loader_impls
+            if impl.expire_missing or impl.key in dict_
+        ]
+        if expired_attributes:
+            if not self.expired_attributes:
+                self.expired_attributes = set()
+            self.expired_attributes.update(expired_attributes)
 
         if self.callables:
             for k in self.expired_attributes.intersection(self.callables):
@@ -619,7 +641,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         self.manager.dispatch.expire(self, None)
 
     def _expire_attributes(self, dict_, attribute_names, no_loader=False):
-        pending = self.__dict__.get("_pending_mutations", None)
+        pending = self._pending_mutations
 
         callables = self.callables
 
@@ -629,6 +651,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
                 if no_loader and (impl.callable_ or key in callables):
                     continue
 
+                if not self.expired_attributes:
+                    self.expired_attributes = set()
                 self.expired_attributes.add(key)
                 if callables and key in callables:
                     del callables[key]
@@ -643,7 +667,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
             ):
                 self._last_known_values[key] = old
 
-            self.committed_state.pop(key, None)
+            if self.committed_state:
+                self.committed_state.pop(key, None)
             if pending:
                 pending.pop(key, None)
 
@@ -667,7 +692,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         # instance state didn't have an identity,
         # the attributes still might be in the callables
         # dict.  ensure they are removed.
-        self.expired_attributes.clear()
+        self.expired_attributes = util.EMPTY_SET
 
         return ATTR_WAS_SET
 
@@ -722,9 +747,6 @@ class InstanceState(interfaces.InspectionAttrInfo):
             if self.manager[attr].impl.accepts_scalar_loader
         )
 
-    def _instance_dict(self):
-        return None
-
     def _modified_event(
         self, dict_, attr, previous, collection=False, is_userland=False
     ):
@@ -744,6 +766,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
 
                     if previous not in (None, NO_VALUE, NEVER_SET):
                         previous = attr.copy(previous)
+                if not self.committed_state:
+                    self.committed_state = {}
                 self.committed_state[attr.key] = previous
 
             if attr.key in self._last_known_values:
@@ -782,14 +806,16 @@ class InstanceState(interfaces.InspectionAttrInfo):
         this step if a value was not populated in state.dict.
 
         """
-        for key in keys:
-            self.committed_state.pop(key, None)
+        if self.committed_state:
+            for key in keys:
+                self.committed_state.pop(key, None)
 
         self.expired = False
 
-        self.expired_attributes.difference_update(
-            set(keys).intersection(dict_)
-        )
+        if self.expired_attributes:
+            self.expired_attributes.difference_update(
+                set(keys).intersection(dict_)
+            )
 
         # the per-keys commit removes object-level callables,
         # while that of commit_all does not.  it's not clear
@@ -824,14 +850,10 @@ class InstanceState(interfaces.InspectionAttrInfo):
         """Mass / highly inlined version of commit_all()."""
 
         for state, dict_ in iter_:
-            state_dict = state.__dict__
-
-            state.committed_state.clear()
-
-            if "_pending_mutations" in state_dict:
-                del state_dict["_pending_mutations"]
+            state.committed_state = state._pending_mutations = util.EMPTY_DICT
 
-            state.expired_attributes.difference_update(dict_)
+            if state.expired_attributes:
+                state.expired_attributes.difference_update(dict_)
 
             if instance_dict and state.modified:
                 instance_dict._modified.discard(state)
@@ -780,6 +780,7 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
 
         if not self.parent_property.bake_queries:
             q.spoil(full=True)
+            q.add_criteria(lambda q: q._with_query_cache(False))
 
         if self.parent_property.secondary is not None:
             q.add_criteria(
@@ -934,6 +935,128 @@ class LoadLazyAttribute(object):
         return strategy._load_for_state(state, passive)
 
 
+@properties.RelationshipProperty.strategy_for(lazy="batch")
+class BatchLazyLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    with "lazy='batch'", that is loads when first accessed, for all
+    of the instances loaded by the same query at once.
+
+    """
+
+    __slots__ = ()
+
+    def create_row_processor(
+        self, context, path, loadopt, mapper, result, adapter, populators
+    ):
+        key = self.key
+
+        batch = LoadBatchAttribute(
+            key,
+            self,
+            (context.query._current_path or orm_util.PathRegistry.root) + path,
+            context.query._with_options,
+        )
+        states = batch.states
+
+        set_lazy_callable = InstanceState._instance_level_callable_processor(
+            mapper.class_manager, batch, key
+        )
+
+        def set_batch_callable(state, dict_, row):
+            set_lazy_callable(state, dict_, row)
+            states.append(state)
+
+        populators["new"].append((key, set_batch_callable))
+
+    def _load_for_batch(self, batch, state, passive):
+        states = batch.states
+
+        if (
+            not states
+            or not state.key
+            or passive & attributes.PASSIVE_OFF != attributes.PASSIVE_OFF
+            or passive & attributes.LOAD_AGAINST_COMMITTED
+            or self._raise_always
+        ):
+            return self._load_for_state(state, passive)
+
+        session = _state_session(state)
+        if not session:
+            return self._load_for_state(state, passive)
+
+        if self.use_get:
+            # the related object may be present in the identity map, or
+            # known to be None, without emitting SQL
+            value = self._load_for_state(state, passive ^ attributes.SQL_OK)
+            if value is not attributes.PASSIVE_NO_RESULT:
+                return value
+
+        if self._raise_on_sql:
+            self._invoke_raise_load(state, passive, "raise_on_sql")
+
+        key = self.key
+        batch.states = []
+        to_load = [(state, False)]
+        for sibling in states:
+            if (
+                sibling is not state
+                and sibling.session_id == state.session_id
+                and sibling.key is not None
+                and sibling.obj() is not None
+                and key not in sibling.dict
+                and sibling.callables.get(key) is batch
+            ):
+                to_load.append((sibling, False))
+
+        selectin = self.parent_property._get_strategy((("lazy", "selectin"),))
+        selectin._load_for_states(
+            session,
+            batch.options,
+            False,
+            batch.path,
+            to_load,
+            None,
+            self.entity,
+        )
+
+        if key in state.dict:
+            return attributes.ATTR_WAS_SET
+        else:
+            return self._load_for_state(state, passive)
+
+
+class LoadBatchAttribute(LoadLazyAttribute):
+    """loader object used by BatchLazyLoader, shared among the
+    instances loaded by a single query.
+
+    When pickled, the other instances aren't carried along; the
+    attribute is then loaded individually.
+
+    """
+
+    def __init__(self, key, initiating_strategy, path, options):
+        super(LoadBatchAttribute, self).__init__(key, initiating_strategy)
+        self.path = path
+        self.options = options
+        self.states = []
+
+    def __getstate__(self):
+        return {
+            "key": self.key,
+            "strategy_key": self.strategy_key,
+            "path": None,
+            "options": (),
+            "states": [],
+        }
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        instance_mapper = state.manager.mapper
+        prop = instance_mapper._props[self.key]
+        strategy = prop._strategies[self.strategy_key]
+
+        return strategy._load_for_batch(self, state, passive)
+
+
 @properties.RelationshipProperty.strategy_for(lazy="immediate")
 class ImmediateLoader(AbstractRelationshipLoader):
     __slots__ = ()
@@ -991,7 +1114,7 @@ class SubqueryLoader(AbstractRelationshipLoader):
         **kwargs
     ):
 
-        if not context.query._enable_eagerloads:
+        if not context.query._enable_eagerloads or context.readonly_entities:
             return
         elif context.query._yield_per:
             context.query._no_yield_per("subquery")
@@ -1273,6 +1396,10 @@ class SubqueryLoader(AbstractRelationshipLoader):
         q = q._conditional_options(*orig_query._with_options)
         if orig_query._populate_existing:
             q._populate_existing = orig_query._populate_existing
+        if orig_query._params:
+            # bound parameters of the original query are embedded
+            # within the subquery
+            q = q.params(orig_query._params)
 
         return q
 
@@ -1447,7 +1574,7 @@ class JoinedLoader(AbstractRelationshipLoader):
     ):
         """Add a left outer join to the statement that's being constructed."""
 
-        if not context.query._enable_eagerloads:
+        if not context.query._enable_eagerloads or context.readonly_entities:
             return
         elif context.query._yield_per and self.uselist:
             context.query._no_yield_per("joined collection")
@@ -2225,10 +2352,38 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             effective_entity,
         )
 
-    @util.dependencies("sqlalchemy.ext.baked")
     def _load_for_path(
-        self, baked, context, path, states, load_only, effective_entity
+        self, context, path, states, load_only, effective_entity
+    ):
+        orig_query = context.query
+        self._load_for_states(
+            context.session,
+            orig_query._with_options,
+            orig_query._populate_existing,
+            path,
+            states,
+            load_only,
+            effective_entity,
+        )
+
+    def _load_for_states(
+        self,
+        session,
+        options,
+        populate_existing,
+        path,
+        states,
+        load_only,
+        effective_entity,
     ):
+        """Load this attribute for the given ``(state, overwrite)`` tuples
+        using the given :class:`.Session`, applying the given options
+        in terms of the given path.
+
+        This is the body of the selectin loader, also used by
+        :class:`.BatchLazyLoader` when loading outside of a query.
+
+        """
 
         if load_only and self.key not in load_only:
             return
@@ -2324,13 +2479,9 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                 ).order_by(*pk_cols)
             )
 
-        orig_query = context.query
-
-        q._add_lazyload_options(
-            orig_query._with_options, path[self.parent_property]
-        )
+        q._add_lazyload_options(options, path[self.parent_property])
 
-        if orig_query._populate_existing:
+        if populate_existing:
             q.add_criteria(lambda q: q.populate_existing())
 
         if self.parent_property.order_by:
@@ -2357,11 +2508,11 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                 q.add_criteria(_setup_outermost_orderby)
 
         if query_info.load_only_child:
-            self._load_via_child(our_states, query_info, q, context)
+            self._load_via_child(our_states, query_info, q, session)
         else:
-            self._load_via_parent(our_states, query_info, q, context)
+            self._load_via_parent(our_states, query_info, q, session)
 
-    def _load_via_child(self, our_states, query_info, q, context):
+    def _load_via_child(self, our_states, query_info, q, session):
         uselist = self.uselist
 
         # this sort is really for the benefit of the unit tests
@@ -2372,7 +2523,7 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
 
             data = {
                 k: v
-                for k, v in q(context.session).params(
+                for k, v in q(session).params(
                     primary_keys=[
                         key[0] if query_info.zero_idx else key for key in chunk
                     ]
@@ -2396,7 +2547,7 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                         related_obj if not uselist else [related_obj],
                     )
 
-    def _load_via_parent(self, our_states, query_info, q, context):
+    def _load_via_parent(self, our_states, query_info, q, session):
         uselist = self.uselist
         _empty_result = () if uselist else None
 
@@ -2412,7 +2563,7 @@ class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             data = {
                 k: [vv[1] for vv in v]
                 for k, v in itertools.groupby(
-                    q(context.session).params(primary_keys=primary_keys),
+                    q(session).params(primary_keys=primary_keys),
                     lambda x: x[0],
                 )
             }
@@ -19,6 +19,7 @@ from . import persistence
 from . import util as orm_util
 from .. import event
 from .. import util
+from ..sql import util as sql_util
 from ..util import topological
 
 
@@ -173,10 +174,30 @@ class UOWTransaction(object):
         # columns which should be included in the update.
         self.post_update_states = util.defaultdict(lambda: (set(), set()))
 
+        # mappers for which per-mapper flush actions have been set up
+        self.flush_action_mappers = set()
+
+        # the PostSortRec objects in execution order, when retrieved
+        # from the flush plan cache
+        self.sorted_actions = None
+
     @property
     def has_work(self):
         return bool(self.states)
 
+    def affected_tables(self):
+        """Return the set of :class:`.Table` objects which may be written
+        to by this flush, including the "secondary" tables of
+        many-to-many relationships."""
+
+        tables = set()
+        for mapper in self.mappers:
+            tables.update(mapper.tables)
+            for prop in mapper.relationships:
+                if prop.secondary is not None:
+                    tables.update(sql_util.find_tables(prop.secondary))
+        return tables
+
     def was_already_deleted(self, state):
         """return true if the given state is expired and was deleted
         previously.
@@ -305,6 +326,7 @@ class UOWTransaction(object):
         cols.update(post_update_cols)
 
     def _per_mapper_flush_actions(self, mapper):
+        self.flush_action_mappers.add(mapper)
         saves = SaveUpdateAll(self, mapper.base_mapper)
         deletes = DeleteAll(self, mapper.base_mapper)
         self.dependencies.add((saves, deletes))
@@ -363,6 +385,16 @@ class UOWTransaction(object):
             if not ret:
                 break
 
+        # see if the same set of actions and dependencies has been
+        # sorted by a previous flush; if so, the graph has no cycles
+        # and the ordering established there can be used directly.
+        # the plan is only used if it covers exactly the actions present.
+        plan = self._flush_plan_cache.get(self._flush_plan_key)
+        if plan is not None and set(plan) == set(self.postsort_actions):
+            self.cycles = set()
+            self.sorted_actions = [self.postsort_actions[key] for key in plan]
+            return set(self.sorted_actions)
+
         # see if the graph of mapper dependencies has cycles.
         self.cycles = cycles = topological.find_cycles(
             self.dependencies, list(self.postsort_actions.values())
@@ -399,6 +431,43 @@ class UOWTransaction(object):
             [a for a in self.postsort_actions.values() if not a.disabled]
         ).difference(cycles)
 
+    @util.memoized_property
+    def _flush_plan_key(self):
+        """Return a key which determines the per-mapper PostSortRec objects
+        and dependencies generated for this flush.
+
+        These are established by _per_mapper_flush_actions() for each
+        mapper, and by per_property_flush_actions() for each
+        DependencyProcessor which has changes to flush; given the same
+        mappers and DependencyProcessors, the same actions and
+        dependencies are produced.
+
+        """
+        return (
+            frozenset(self.flush_action_mappers),
+            frozenset(
+                key
+                for key, action in self.presort_actions.items()
+                if action.setup_flush_actions
+            ),
+        )
+
+    @util.memoized_property
+    def _flush_plan_cache(self):
+        """Return the cache of sorted flush plans for the mappers
+        involved in this flush.
+
+        The cache is stored on one of the involved base mappers, chosen
+        consistently for a given set of mappers, so that it is shared
+        among all Session objects and is discarded along with the
+        mappers themselves.
+
+        """
+        return min(
+            set(mapper.base_mapper for mapper in self.flush_action_mappers),
+            key=id,
+        )._flush_plan_cache
+
     def execute(self):
         postsort_actions = self._generate_actions()
 
@@ -418,7 +487,19 @@ class UOWTransaction(object):
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(self.dependencies, postsort_actions):
+            sorted_actions = self.sorted_actions
+            if sorted_actions is None:
+                self.sorted_actions = sorted_actions = list(
+                    topological.sort(self.dependencies, postsort_actions)
+                )
+                rec_keys = dict(
+                    (rec, key) for key, rec in self.postsort_actions.items()
+                )
+                self._flush_plan_cache[self._flush_plan_key] = [
+                    rec_keys[rec] for rec in sorted_actions
+                ]
+
+            for rec in sorted_actions:
                 rec.execute(self)
 
     def finalize_flush_changes(self):
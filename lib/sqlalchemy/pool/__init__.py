@@ -22,6 +22,7 @@ from .base import _ConnectionRecord  # noqa
 from .base import _finalize_fairy  # noqa
 from .base import _refs  # noqa
 from .base import Pool
+from .base import PoolMetrics
 from .base import reset_commit
 from .base import reset_none
 from .base import reset_rollback
@@ -36,6 +37,7 @@ from .impl import StaticPool
 
 __all__ = [
     "Pool",
+    "PoolMetrics",
     "reset_commit",
     "reset_none",
     "reset_rollback",
@@ -10,6 +10,7 @@
 
 """
 
+import bisect
 from collections import deque
 import time
 import weakref
@@ -27,6 +28,173 @@ reset_commit = util.symbol("reset_commit")
 reset_none = util.symbol("reset_none")
 
 
+class _Histogram(object):
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": list(
+                zip(self.bounds + (float("inf"),), list(self.counts))
+            ),
+        }
+
+
+class PoolMetrics(object):
+    """Counters and histograms describing the use of a :class:`.Pool`.
+
+    Each :class:`.Pool` maintains a :class:`.PoolMetrics` object as its
+    :attr:`.Pool.metrics` attribute, e.g.::
+
+        >>> engine.pool.metrics.checkouts
+        1250
+        >>> engine.pool.metrics.as_dict()
+        {'checkouts': 1250, 'checkins': 1248, 'checked_out_high_water': 7,
+         'overflow_high_water': 2, 'connects': 7, 'invalidations': 0,
+         'soft_invalidations': 0, 'pre_ping_failures': 0, 'timeouts': 0,
+         'checked_out': 2,
+         'wait_time': {'count': 3, 'sum': 0.0741, 'buckets': [...]},
+         'time_held': {'count': 1248, 'sum': 4.6033, 'buckets': [...]}}
+
+    The values are maintained without locking so that they may be left
+    in place in production; as a result, under heavy concurrency, an
+    occasional update may be lost.  The counters are reset using
+    :meth:`.PoolMetrics.reset`, and begin again from zero when the pool
+    is re-created, such as by :meth:`.Engine.dispose`.  The
+    :attr:`.PoolMetrics.checked_out` gauge is not a counter, and is not
+    affected by a reset.
+
+    .. versionadded:: 1.4
+
+    """
+
+    wait_time_buckets = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30)
+    """Upper bounds in seconds of the :attr:`.PoolMetrics.wait_time`
+    histogram buckets."""
+
+    time_held_buckets = (0.001, 0.01, 0.1, 1, 10, 60, 600, 3600)
+    """Upper bounds in seconds of the :attr:`.PoolMetrics.time_held`
+    histogram buckets."""
+
+    _counters = (
+        "checkouts",
+        "checkins",
+        "checked_out_high_water",
+        "overflow_high_water",
+        "connects",
+        "invalidations",
+        "soft_invalidations",
+        "pre_ping_failures",
+        "timeouts",
+    )
+
+    def __init__(self):
+        self.wait_time = _Histogram(self.wait_time_buckets)
+        self.time_held = _Histogram(self.time_held_buckets)
+        self.reset()
+
+    checkouts = 0
+    """Number of connections checked out from the pool."""
+
+    checkins = 0
+    """Number of connections returned to the pool, including those
+    detached from it using :meth:`._ConnectionFairy.detach`."""
+
+    checked_out = 0
+    """Number of connections currently checked out."""
+
+    checked_out_high_water = 0
+    """The largest number of connections checked out at once.
+
+    Following a :meth:`.PoolMetrics.reset`, begins from the number of
+    connections checked out at that time.
+
+    """
+
+    overflow_high_water = 0
+    """For :class:`.QueuePool`, the largest number of connections opened
+    beyond :paramref:`.QueuePool.pool_size`."""
+
+    connects = 0
+    """Number of DBAPI connections opened."""
+
+    invalidations = 0
+    """Number of connections invalidated, not including soft
+    invalidations."""
+
+    soft_invalidations = 0
+    """Number of connections soft invalidated."""
+
+    pre_ping_failures = 0
+    """Number of "pre ping" operations which found a connection to be
+    unusable.
+
+    .. seealso::
+
+        :ref:`pool_disconnects_pessimistic`
+
+    """
+
+    timeouts = 0
+    """Number of checkouts which timed out waiting for a connection."""
+
+    wait_time = None
+    """Histogram of the time spent by checkouts waiting for a connection
+    to be returned to a :class:`.QueuePool` which has reached its overflow
+    limit, in seconds.
+
+    Checkouts which don't wait are not included.
+
+    .. seealso::
+
+        :meth:`.PoolEvents.checkout_wait`
+
+    """
+
+    time_held = None
+    """Histogram of the time between checkout and checkin of
+    connections, in seconds."""
+
+    def reset(self):
+        """Reset all counters and histograms to zero."""
+
+        for name in self._counters:
+            setattr(self, name, 0)
+        self.checked_out_high_water = self.checked_out
+        self.wait_time.reset()
+        self.time_held.reset()
+
+    def as_dict(self):
+        """Return the current values as a dictionary.
+
+        Histograms are represented as a dictionary with the keys
+        ``"count"``, ``"sum"`` and ``"buckets"``, the latter being a list
+        of ``(upper_bound, count)`` tuples, where the final upper bound is
+        infinity.
+
+        """
+        d = dict((name, getattr(self, name)) for name in self._counters)
+        d["checked_out"] = self.checked_out
+        d["wait_time"] = self.wait_time.as_dict()
+        d["time_held"] = self.time_held.as_dict()
+        return d
+
+
 class _ConnDialect(object):
 
     """partial implementation of :class:`.Dialect`
@@ -191,6 +359,7 @@ class Pool(log.Identified):
         self._recycle = recycle
         self._invalidate_time = 0
         self._pre_ping = pre_ping
+        self.metrics = PoolMetrics()
         if reset_on_return in ("rollback", True, reset_rollback):
             self._reset_on_return = reset_rollback
         elif reset_on_return in ("none", None, False, reset_none):
@@ -224,6 +393,14 @@ class Pool(log.Identified):
         self.__dict__["_creator"] = creator
         self._invoke_creator = self._should_wrap_creator(creator)
 
+    metrics = None
+    """A :class:`.PoolMetrics` object, which tracks the use of this
+    :class:`.Pool`.
+
+    .. versionadded:: 1.4
+
+    """
+
     def _should_wrap_creator(self, creator):
         """Detect if creator accepts a single argument, or is sent
         as a legacy style no-arg function.
@@ -399,6 +576,8 @@ class _ConnectionRecord(object):
 
     starttime = None
 
+    _checkout_time = None
+
     connection = None
     """A reference to the actual DBAPI connection being tracked.
 
@@ -453,6 +632,14 @@ class _ConnectionRecord(object):
         except Exception as err:
             with util.safe_reraise():
                 rec._checkin_failed(err)
+
+        metrics = pool.metrics
+        rec._checkout_time = time.time()
+        metrics.checkouts += 1
+        metrics.checked_out += 1
+        if metrics.checked_out > metrics.checked_out_high_water:
+            metrics.checked_out_high_water = metrics.checked_out
+
         echo = pool._should_log_debug()
         fairy = _ConnectionFairy(dbapi_connection, rec, echo)
         rec.fairy_ref = weakref.ref(
@@ -467,6 +654,14 @@ class _ConnectionRecord(object):
             )
         return fairy
 
+    def _record_checkin(self, pool):
+        if self._checkout_time is not None:
+            metrics = pool.metrics
+            metrics.checkins += 1
+            metrics.checked_out -= 1
+            metrics.time_held.add(time.time() - self._checkout_time)
+            self._checkout_time = None
+
     def _checkin_failed(self, err):
         self.invalidate(e=err)
         self.checkin(_no_fairy_ref=True)
@@ -478,6 +673,7 @@ class _ConnectionRecord(object):
         self.fairy_ref = None
         connection = self.connection
         pool = self.__pool
+        self._record_checkin(pool)
         while self.finalize_callback:
             finalizer = self.finalize_callback.pop()
             finalizer(connection)
@@ -539,8 +735,10 @@ class _ConnectionRecord(object):
                 self.connection,
             )
         if soft:
+            self.__pool.metrics.soft_invalidations += 1
             self._soft_invalidate_time = time.time()
         else:
+            self.__pool.metrics.invalidations += 1
             self.__close()
             self.connection = None
 
@@ -579,6 +777,70 @@ class _ConnectionRecord(object):
             self.__connect()
         return self.connection
 
+    def _maintain(self, ping, recycle_margin):
+        """Check an idle connection on behalf of a pool's maintenance
+        worker.
+
+        The connection is replaced if it would exceed the pool's recycle
+        time within the next ``recycle_margin`` seconds, if it has been
+        invalidated, or if ``ping`` is True and the connection fails a
+        ping or raises an error when pinged, so that it does not need to
+        be replaced upon checkout.  A successful ping is followed by a
+        rollback.
+
+        """
+        pool = self.__pool
+        if self.connection is None:
+            self.info.clear()
+            self.__connect()
+            return
+
+        if (
+            pool._recycle > -1
+            and time.time() - self.starttime > pool._recycle - recycle_margin
+        ):
+            pool.logger.info(
+                "Connection %r nearing recycle time; recycling",
+                self.connection,
+            )
+        elif (
+            pool._invalidate_time > self.starttime
+            or self._soft_invalidate_time > self.starttime
+        ):
+            pool.logger.info(
+                "Connection %r was invalidated; recycling", self.connection
+            )
+        elif ping:
+            try:
+                alive = pool._dialect.do_ping(self.connection)
+                if alive:
+                    # end the transaction the ping may have begun, so
+                    # that the connection isn't left idle within it
+                    pool._dialect.do_rollback(self.connection)
+            except Exception as err:
+                pool.logger.error(
+                    "Exception during ping of connection %r; recycling",
+                    self.connection,
+                    exc_info=True,
+                )
+                self.invalidate(err)
+            else:
+                if alive:
+                    return
+                pool.logger.info(
+                    "Connection %r failed ping; recycling", self.connection
+                )
+                self.invalidate()
+            self.info.clear()
+            self.__connect()
+            return
+        else:
+            return
+
+        self.__close()
+        self.info.clear()
+        self.__connect()
+
     def __close(self):
         self.finalize_callback.clear()
         if self.__pool.dispatch.close:
@@ -597,6 +859,7 @@ class _ConnectionRecord(object):
             connection = pool._invoke_creator(self)
             pool.logger.debug("Created new connection %r", connection)
             self.connection = connection
+            pool.metrics.connects += 1
         except Exception as e:
             pool.logger.debug("Error on connect(): %s", e)
             raise
@@ -748,6 +1011,7 @@ class _ConnectionFairy(object):
 
                     result = pool._dialect.do_ping(fairy.connection)
                     if not result:
+                        pool.metrics.pre_ping_failures += 1
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s failed, "
@@ -943,6 +1207,7 @@ class _ConnectionFairy(object):
             _refs.remove(rec)
             rec.fairy_ref = None
             rec.connection = None
+            rec._record_checkin(self._pool)
             # TODO: should this be _return_conn?
             self._pool._do_return_conn(self._connection_record)
             self.info = self.info.copy()
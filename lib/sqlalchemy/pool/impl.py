@@ -10,9 +10,11 @@
 
 """
 
+import time
 import traceback
 import weakref
 
+from .base import _ConnDialect
 from .base import _ConnectionFairy
 from .base import _ConnectionRecord
 from .base import Pool
@@ -39,6 +41,8 @@ class QueuePool(Pool):
         max_overflow=10,
         timeout=30,
         use_lifo=False,
+        fair=False,
+        maintenance_interval=None,
         **kw
     ):
         r"""
@@ -87,6 +91,42 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+        :param fair: when the pool has reached its overflow limit, so that
+          checkouts must wait for a connection to be returned, give
+          returned connections to waiting checkouts strictly in the order
+          in which they began waiting.  By default, a checkout which
+          arrives just as a connection is returned may receive it ahead
+          of checkouts which are already waiting, which gives somewhat
+          higher throughput but may cause individual checkouts to wait for
+          much longer under heavy contention.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`pool_fair`
+
+            :meth:`.PoolEvents.checkout_wait`
+
+        :param maintenance_interval: if set to a number of seconds, a
+          background thread is started when the pool first creates a
+          connection, which opens connections until ``pool_size``
+          connections are present, and then at this interval checks each
+          connection that is idle in the pool.  Idle connections which
+          would reach the :paramref:`.Pool.recycle` time before the next
+          check, or which were invalidated, are replaced, and when the
+          pool is associated with a dialect, each remaining idle
+          connection is "pinged" and replaced if the ping fails.  This
+          allows checkouts to proceed without connecting or pinging, in
+          contrast to :paramref:`.Pool.pre_ping`.  The thread is stopped
+          by :meth:`.QueuePool.dispose`.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`pool_maintenance`
+
         :param \**kw: Other keyword arguments including
           :paramref:`.Pool.recycle`, :paramref:`.Pool.echo`,
           :paramref:`.Pool.reset_on_return` and others are passed to the
@@ -94,15 +134,17 @@ class QueuePool(Pool):
 
         """
         Pool.__init__(self, creator, **kw)
-        self._pool = sqla_queue.Queue(pool_size, use_lifo=use_lifo)
+        self._pool = sqla_queue.Queue(pool_size, use_lifo=use_lifo, fair=fair)
         self._overflow = 0 - pool_size
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._maintenance_interval = maintenance_interval
+        self._maintenance = None
 
     def _do_return_conn(self, conn):
         try:
-            self._pool.put(conn, False)
+            self._pool.put(conn)
         except sqla_queue.Full:
             try:
                 conn.close()
@@ -114,7 +156,9 @@ class QueuePool(Pool):
 
         try:
             wait = use_overflow and self._overflow >= self._max_overflow
-            return self._pool.get(wait, self._timeout)
+            if wait:
+                return self._timed_wait()
+            return self._pool.get(False)
         except sqla_queue.Empty:
             # don't do things inside of "except Empty", because when we say
             # we timed out or can't connect and raise, Python 3 tells
@@ -124,6 +168,7 @@ class QueuePool(Pool):
             if not wait:
                 return self._do_get()
             else:
+                self.metrics.timeouts += 1
                 raise exc.TimeoutError(
                     "QueuePool limit of size %d overflow %d reached, "
                     "connection timed out, timeout %d"
@@ -133,20 +178,99 @@ class QueuePool(Pool):
 
         if self._inc_overflow():
             try:
-                return self._create_connection()
+                rec = self._create_connection()
             except:
                 with util.safe_reraise():
                     self._dec_overflow()
+            if (
+                self._maintenance_interval is not None
+                and self._maintenance is None
+            ):
+                self._start_maintenance()
+            return rec
         else:
             return self._do_get()
 
+    def _timed_wait(self):
+        try:
+            return self._pool.get(False)
+        except sqla_queue.Empty:
+            pass
+
+        start = time.time()
+        rec = None
+        try:
+            rec = self._pool.get(True, self._timeout)
+            return rec
+        finally:
+            wait_time = time.time() - start
+            self.metrics.wait_time.add(wait_time)
+            if self.dispatch.checkout_wait:
+                self.dispatch.checkout_wait(rec, wait_time)
+
+    def _start_maintenance(self):
+        with self._overflow_lock:
+            if self._maintenance is not None:
+                return
+            self._maintenance = stop = threading.Event()
+
+        worker = threading.Thread(
+            target=_maintenance_worker,
+            args=(weakref.ref(self), self._maintenance_interval, stop),
+            name="sqlalchemy pool maintenance",
+        )
+        worker.daemon = True
+        worker.start()
+
+    def _stop_maintenance(self):
+        stop, self._maintenance = self._maintenance, None
+        if stop is not None:
+            stop.set()
+
+    def _run_maintenance(self):
+        """Open connections up to the pool size, then check each idle
+        connection once."""
+
+        while True:
+            with self._overflow_lock:
+                if self._overflow >= 0:
+                    break
+                self._overflow += 1
+            try:
+                rec = self._create_connection()
+            except:
+                with util.safe_reraise():
+                    self._dec_overflow()
+            self._do_return_conn(rec)
+
+        ping = not isinstance(self._dialect, _ConnDialect)
+        for i in range(self._pool.qsize()):
+            try:
+                rec = self._pool.get(False)
+            except sqla_queue.Empty:
+                break
+            try:
+                rec._maintain(ping, self._maintenance_interval)
+            finally:
+                try:
+                    self._pool.put(rec, last=True)
+                except sqla_queue.Full:
+                    try:
+                        rec.close()
+                    finally:
+                        self._dec_overflow()
+
     def _inc_overflow(self):
         if self._max_overflow == -1:
             self._overflow += 1
+            if self._overflow > self.metrics.overflow_high_water:
+                self.metrics.overflow_high_water = self._overflow
             return True
         with self._overflow_lock:
             if self._overflow < self._max_overflow:
                 self._overflow += 1
+                if self._overflow > self.metrics.overflow_high_water:
+                    self.metrics.overflow_high_water = self._overflow
                 return True
             else:
                 return False
@@ -166,6 +290,9 @@ class QueuePool(Pool):
             pool_size=self._pool.maxsize,
             max_overflow=self._max_overflow,
             timeout=self._timeout,
+            use_lifo=self._pool.use_lifo,
+            fair=self._pool.fair,
+            maintenance_interval=self._maintenance_interval,
             recycle=self._recycle,
             echo=self.echo,
             logging_name=self._orig_logging_name,
@@ -175,6 +302,7 @@ class QueuePool(Pool):
         )
 
     def dispose(self):
+        self._stop_maintenance()
         while True:
             try:
                 conn = self._pool.get(False)
@@ -214,6 +342,24 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+def _maintenance_worker(pool_ref, interval, stop):
+    # refers to the pool weakly, so that a pool which is discarded
+    # without being disposed doesn't remain in memory
+    while True:
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            pool._run_maintenance()
+        except Exception:
+            pool.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+        del pool
+        if stop.wait(interval):
+            return
+
+
 class NullPool(Pool):
 
     """A Pool which does not pool connections.
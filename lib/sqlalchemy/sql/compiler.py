@@ -23,6 +23,7 @@ To generate user-defined SQL strings, see
 
 """
 
+import collections
 import contextlib
 import itertools
 import re
@@ -153,6 +154,12 @@ FK_INITIALLY = re.compile(r"^(?:DEFERRED|IMMEDIATE)$", re.I)
 BIND_PARAMS = re.compile(r"(?<![:\w\$\x5c]):([\w\$]+)(?![:\w\$])", re.UNICODE)
 BIND_PARAMS_ESC = re.compile(r"\x5c(:[\w\$]*)(?![:\w\$])", re.UNICODE)
 
+_InsertManyValues = collections.namedtuple(
+    "_InsertManyValues",
+    ["values_clause", "single_values_expr", "pieces", "num_params"],
+)
+
+
 BIND_TEMPLATES = {
     "pyformat": "%%(%(name)s)s",
     "qmark": "?",
@@ -427,6 +434,22 @@ class _CompileLabel(elements.ColumnElement):
         return self
 
 
+def _selected_column_objects(statement):
+    """Return the column objects delivered in the result rows of the
+    given statement, in order, or None if not known."""
+
+    if isinstance(statement, selectable.Select):
+        # equivalent to .selected_columns, without requiring that each
+        # column have a name; e.g. select([text("1")])
+        return list(elements._select_iterables(statement._raw_columns))
+    elif isinstance(statement, selectable.SelectBase):
+        return list(statement.selected_columns)
+    elif getattr(statement, "_returning", None):
+        return list(elements._select_iterables(statement._returning))
+    else:
+        return None
+
+
 class SQLCompiler(Compiled):
     """Default implementation of :class:`.Compiled`.
 
@@ -500,8 +523,23 @@ class SQLCompiler(Compiled):
 
     insert_prefetch = update_prefetch = ()
 
+    _insertmanyvalues = None
+    """when not None, an INSERT..RETURNING statement which may be invoked
+    against many parameter sets by rendering many rows into its VALUES
+    clause, as a series of statements; see
+    :meth:`.DefaultExecutionContext._deliver_insertmanyvalues_batches`.
+
+    """
+
     def __init__(
-        self, dialect, statement, column_keys=None, inline=False, **kwargs
+        self,
+        dialect,
+        statement,
+        column_keys=None,
+        inline=False,
+        cache_key=None,
+        for_executemany=False,
+        **kwargs
     ):
         """Construct a new :class:`.SQLCompiler` object.
 
@@ -515,16 +553,34 @@ class SQLCompiler(Compiled):
         :param inline: whether to generate INSERT statements as "inline", e.g.
          not formatted to return any generated defaults
 
+        :param cache_key: optional :class:`.CacheKey` generated from the
+         statement, indicating this compiled object will be cached and
+         invoked against other statements of the same structure.  If
+         the compilation process determines the statement can't be
+         invoked in this way, the attribute is reset to None.
+
+        :param for_executemany: whether INSERT / UPDATE statements should
+         expect that they are to be invoked in an "executemany" style,
+         which may impact how the statement will be expected to return the
+         values of defaults and autoincrement / sequences and similar.
+         Depending on the backend and driver in use, support for retrieving
+         these values may be disabled which means SQL expressions may
+         be rendered inline, RETURNING may not be rendered, etc.
+
         :param kwargs: additional keyword arguments to be consumed by the
          superclass.
 
         """
         self.column_keys = column_keys
 
+        self.cache_key = cache_key
+
         # compile INSERT/UPDATE defaults/sequences inlined (no pre-
         # execute)
         self.inline = inline or getattr(statement, "inline", False)
 
+        self.for_executemany = for_executemany
+
         # a dictionary of bind parameter keys to BindParameter
         # instances.
         self.binds = {}
@@ -572,6 +628,30 @@ class SQLCompiler(Compiled):
         if self.positional and self._numeric_binds:
             self._apply_numbered_params()
 
+        if self.cache_key is not None:
+            self._check_cache_key()
+
+    def _check_cache_key(self):
+        """Reset the cache key if the compiled statement refers to bound
+        values which aren't among those gathered by the cache key.
+
+        Such values would be those of the originally compiled statement
+        and not those of the statement being invoked, for example those
+        generated by a custom compilation or a column default.
+
+        """
+        cache_keys = set(bind.key for bind in self.cache_key.bindparams)
+        for bindparam in self.bind_names:
+            if bindparam.key not in cache_keys and (
+                bindparam.callable is not None
+                or (
+                    bindparam.value is not None
+                    and bindparam.value is not crud.REQUIRED
+                )
+            ):
+                self.cache_key = None
+                break
+
     @property
     def prefetch(self):
         return list(self.insert_prefetch + self.update_prefetch)
@@ -634,6 +714,129 @@ class SQLCompiler(Compiled):
             if value is not None
         )
 
+    @util.memoized_property
+    def _bind_assembly(self):
+        """A list of ``(name, processor, position)`` tuples, one for each
+        parameter to be passed to the DBAPI.
+
+        ``position`` is the index within the positional parameter sequence
+        for a positional paramstyle, otherwise the (possibly encoded) key
+        within the parameter dictionary.
+
+        """
+        processors = self._bind_processors
+        if self.positional:
+            return [
+                (name, processors.get(name), position)
+                for position, name in enumerate(self.positiontup)
+            ]
+        else:
+            encode = not self.dialect.supports_unicode_statements
+            return [
+                (
+                    name,
+                    processors.get(name),
+                    self.dialect._encoder(name)[0] if encode else name,
+                )
+                for name in util.unique_list(self.bind_names.values())
+            ]
+
+    @util.memoized_property
+    def _bind_assembler(self):
+        """Return a function which converts a single set of user-supplied
+        parameters directly into the DBAPI-ready sequence or dictionary
+        for this statement.
+
+        The function is generated as straight-line code from the
+        ``bind_names`` collection and :attr:`._bind_assembly`, resolving
+        each value as :meth:`.construct_params` would and applying bind
+        processors inline, without producing an intermediary dictionary.
+        It accepts the parameter dictionary and the parameter group number
+        used in error messages.  ``None`` is returned if the statement's
+        parameters can't be assembled this way.
+
+        """
+        env = {"_missing": self._missing_bind_value}
+        lines = ["def assemble(params, group):"]
+
+        names = {}
+        for index, bindparam in enumerate(self.bind_names):
+            name = self.bind_names[bindparam]
+            if name not in names:
+                names[name] = "v_%d" % len(names)
+            var = names[name]
+
+            env["key_%d" % index] = bindparam.key
+            lines.append("    if key_%d in params:" % index)
+            lines.append("        %s = params[key_%d]" % (var, index))
+            if name != bindparam.key:
+                env["name_%d" % index] = name
+                lines.append("    elif name_%d in params:" % index)
+                lines.append("        %s = params[name_%d]" % (var, index))
+            lines.append("    else:")
+            env["bind_%d" % index] = bindparam
+            if bindparam.required:
+                lines.append(
+                    "        %s = _missing(bind_%d, group)" % (var, index)
+                )
+            elif bindparam.callable:
+                lines.append(
+                    "        %s = bind_%d.effective_value" % (var, index)
+                )
+            else:
+                lines.append("        %s = bind_%d.value" % (var, index))
+
+        elements = []
+        for name, processor, position in self._bind_assembly:
+            if name not in names:
+                # parameter not derived from a bound parameter of the
+                # statement; parameters have to be constructed the
+                # long way
+                return None
+            elif processor is not None:
+                proc_name = "processor_%s" % names[name]
+                env[proc_name] = processor
+                value = "%s(%s)" % (proc_name, names[name])
+            else:
+                value = names[name]
+
+            if self.positional:
+                elements.append(value)
+            else:
+                env["position_%d" % len(elements)] = position
+                elements.append("position_%d: %s" % (len(elements), value))
+
+        if not self.positional:
+            lines.append("    return {%s}" % ", ".join(elements))
+        elif self.dialect.execute_sequence_format is tuple:
+            lines.append(
+                "    return (%s)" % "".join(e + ", " for e in elements)
+            )
+        elif self.dialect.execute_sequence_format is list:
+            lines.append("    return [%s]" % ", ".join(elements))
+        else:
+            env["sequence_format"] = self.dialect.execute_sequence_format
+            lines.append(
+                "    return sequence_format([%s])" % ", ".join(elements)
+            )
+
+        return util.langhelpers._exec_code_in_env(
+            "\n".join(lines) + "\n", env, "assemble"
+        )
+
+    def _missing_bind_value(self, bindparam, group):
+        if group:
+            raise exc.InvalidRequestError(
+                "A value is required for bind parameter %r, "
+                "in parameter group %d" % (bindparam.key, group),
+                code="cd3x",
+            )
+        else:
+            raise exc.InvalidRequestError(
+                "A value is required for bind parameter %r" % bindparam.key,
+                code="cd3x",
+            )
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -641,13 +844,40 @@ class SQLCompiler(Compiled):
     def sql_compiler(self):
         return self
 
-    def construct_params(self, params=None, _group_number=None, _check=True):
+    def construct_params(
+        self,
+        params=None,
+        _group_number=None,
+        _check=True,
+        extracted_parameters=None,
+    ):
         """return a dictionary of bind parameter keys and values"""
 
+        if extracted_parameters:
+            # the statement being invoked is not the one that was compiled,
+            # but one with the same cache key; its bound parameters
+            # correspond positionally to those of our own cache key
+            resolved_extracted = dict(
+                (bind.key, extracted)
+                for bind, extracted in zip(
+                    self.cache_key.bindparams, extracted_parameters
+                )
+            )
+        else:
+            resolved_extracted = None
+
         if params:
             pd = {}
             for bindparam in self.bind_names:
                 name = self.bind_names[bindparam]
+
+                if resolved_extracted:
+                    value_param = resolved_extracted.get(
+                        bindparam.key, bindparam
+                    )
+                else:
+                    value_param = bindparam
+
                 if bindparam.key in params:
                     pd[name] = params[bindparam.key]
                 elif name in params:
@@ -668,10 +898,10 @@ class SQLCompiler(Compiled):
                             code="cd3x",
                         )
 
-                elif bindparam.callable:
-                    pd[name] = bindparam.effective_value
+                elif value_param.callable:
+                    pd[name] = value_param.effective_value
                 else:
-                    pd[name] = bindparam.value
+                    pd[name] = value_param.value
             return pd
         else:
             pd = {}
@@ -691,10 +921,19 @@ class SQLCompiler(Compiled):
                             code="cd3x",
                         )
 
-                if bindparam.callable:
-                    pd[self.bind_names[bindparam]] = bindparam.effective_value
+                if resolved_extracted:
+                    value_param = resolved_extracted.get(
+                        bindparam.key, bindparam
+                    )
+                else:
+                    value_param = bindparam
+
+                if value_param.callable:
+                    pd[
+                        self.bind_names[bindparam]
+                    ] = value_param.effective_value
                 else:
-                    pd[self.bind_names[bindparam]] = bindparam.value
+                    pd[self.bind_names[bindparam]] = value_param.value
             return pd
 
     @property
@@ -708,6 +947,40 @@ class SQLCompiler(Compiled):
         """utility method used for unit tests only."""
         return result.ResultMetaData._create_result_map(self._result_columns)
 
+    def _adapt_result_columns(self, statement):
+        """Return the ``_result_columns`` collection, augmented such that
+        the selected column objects of the given statement, which has the
+        same cache key as the statement that was compiled, are also
+        present as targets.
+
+        """
+        compiled_cols = _selected_column_objects(self.statement)
+        invoked_cols = _selected_column_objects(statement)
+        if not compiled_cols or len(compiled_cols) != len(invoked_cols):
+            return self._result_columns
+
+        adapted = {}
+        for compiled_col, invoked_col in zip(compiled_cols, invoked_cols):
+            adapted[compiled_col] = invoked_col
+            if isinstance(compiled_col, elements.Label):
+                adapted[compiled_col.element] = invoked_col.element
+
+        return [
+            (
+                keyname,
+                name,
+                objects
+                + tuple(
+                    adapted[obj]
+                    for obj in objects
+                    if isinstance(obj, elements.ColumnElement)
+                    and obj in adapted
+                ),
+                type_,
+            )
+            for keyname, name, objects, type_ in self._result_columns
+        ]
+
     def default_from(self):
         """Called when a SELECT statement has no froms, and no FROM clause is
         to be appended.
@@ -1469,6 +1742,8 @@ class SQLCompiler(Compiled):
                     "Bind parameter '%s' without a "
                     "renderable value not allowed here." % bindparam.key
                 )
+            # the value is now part of the SQL string
+            self.cache_key = None
             return self.render_literal_bindparam(
                 bindparam, within_columns_clause=True, **kwargs
             )
@@ -2427,6 +2702,7 @@ class SQLCompiler(Compiled):
 
     def visit_insert(self, insert_stmt, **kw):
         toplevel = not self.stack
+        num_binds = self._num_rendered_binds()
 
         self.stack.append(
             {
@@ -2439,6 +2715,7 @@ class SQLCompiler(Compiled):
         crud_params = crud._setup_crud_params(
             self, insert_stmt, crud.ISINSERT, **kw
         )
+        num_values_binds = self._num_rendered_binds() - num_binds
 
         if (
             not crud_params
@@ -2512,7 +2789,25 @@ class SQLCompiler(Compiled):
                 )
             )
         else:
-            text += " VALUES (%s)" % ", ".join([c[1] for c in crud_params])
+            insert_single_values_expr = "(%s)" % ", ".join(
+                [c[1] for c in crud_params]
+            )
+            text += " VALUES " + insert_single_values_expr
+
+            if (
+                self.for_executemany
+                and returning_clause
+                and toplevel
+                and self.dialect.use_insertmanyvalues
+                and not self._numeric_binds
+                and insert_stmt._post_values_clause is None
+            ):
+                self._insertmanyvalues = _InsertManyValues(
+                    " VALUES " + insert_single_values_expr,
+                    insert_single_values_expr,
+                    None,
+                    num_values_binds,
+                )
 
         if insert_stmt._post_values_clause is not None:
             post_values_clause = self.process(
@@ -2527,10 +2822,54 @@ class SQLCompiler(Compiled):
         if self.ctes and toplevel and not self.dialect.cte_follows_insert:
             text = self._render_cte_clause() + text
 
+        if self._insertmanyvalues is not None:
+            self._setup_insertmanyvalues(num_binds)
+
         self.stack.pop(-1)
 
         return text
 
+    def _num_rendered_binds(self):
+        if self.positional:
+            return len(self.positiontup)
+        else:
+            return len(self.bind_names)
+
+    def _setup_insertmanyvalues(self, num_preceding_binds):
+        """Complete the "insertmanyvalues" structure for an INSERT, or
+        discard it if bound parameters were rendered outside of the
+        VALUES clause."""
+
+        imv = self._insertmanyvalues
+
+        if num_preceding_binds or self._num_rendered_binds() != imv.num_params:
+            # the statement will be invoked once per parameter set
+            self._insertmanyvalues = None
+            return
+
+        if not self.positional:
+            # split the VALUES expression around each bound parameter,
+            # so that the parameters may be renamed per row
+            names = dict(
+                (self.bindtemplate % {"name": name}, name)
+                for name in self.bind_names.values()
+            )
+            if names:
+                tokens = re.compile(
+                    "(%s)"
+                    % "|".join(
+                        re.escape(token) + r"(?![\w\$])"
+                        for token in sorted(names, key=len, reverse=True)
+                    )
+                )
+                pieces = tokens.split(imv.single_values_expr)
+            else:
+                pieces = [imv.single_values_expr]
+            pieces[1::2] = [names[token] for token in pieces[1::2]]
+            self._insertmanyvalues = imv._replace(
+                pieces=pieces, num_params=len(names)
+            )
+
     def update_limit_clause(self, update_stmt):
         """Provide a hook for MySQL to add LIMIT to the UPDATE"""
         return None
@@ -748,16 +748,34 @@ def _get_stmt_parameters_params(
 
 
 def _get_returning_modifiers(compiler, stmt):
+    dialect = compiler.dialect
+
     need_pks = (
         compiler.isinsert
         and not compiler.inline
+        and (
+            not compiler.for_executemany
+            or (
+                dialect.insert_executemany_returning
+                and stmt._return_defaults
+                and stmt.select is None
+                and stmt._post_values_clause is None
+                and not compiler._numeric_binds
+            )
+        )
         and not stmt._returning
         and not stmt._has_multi_parameters
     )
 
     implicit_returning = (
         need_pks
-        and compiler.dialect.implicit_returning
+        and (
+            dialect.implicit_returning
+            or (
+                compiler.for_executemany
+                and dialect.insert_executemany_returning
+            )
+        )
         and stmt.table.implicit_returning
     )
 
@@ -780,7 +798,11 @@ def _get_returning_modifiers(compiler, stmt):
         else:
             implicit_return_defaults = set(stmt._return_defaults)
 
-    postfetch_lastrowid = need_pks and compiler.dialect.postfetch_lastrowid
+    postfetch_lastrowid = (
+        need_pks
+        and dialect.postfetch_lastrowid
+        and not compiler.for_executemany
+    )
 
     return (
         need_pks,
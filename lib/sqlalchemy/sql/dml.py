@@ -44,6 +44,7 @@ class UpdateBase(
     )
     _hints = util.immutabledict()
     _parameter_ordering = None
+    _return_defaults = False
     _prefixes = ()
     named_with_column = False
 
@@ -87,6 +88,29 @@ class UpdateBase(
         else:
             return process_single(parameters), False
 
+    def _cache_key(self, **kw):
+        if self.dialect_kwargs:
+            # dialect-specific arguments may be of any form
+            raise NotImplementedError()
+        return (
+            self.__class__,
+            self.table._cache_key(**kw),
+            tuple(col._cache_key(**kw) for col in self._returning)
+            if self._returning
+            else None,
+            tuple(col._cache_key(**kw) for col in self._return_defaults)
+            if isinstance(self._return_defaults, (list, tuple))
+            else self._return_defaults,
+            tuple(
+                (elem._cache_key(**kw), dialect_name)
+                for elem, dialect_name in self._prefixes
+            ),
+            tuple(
+                (selectable._cache_key(**kw), dialect_name, text)
+                for (selectable, dialect_name), text in self._hints.items()
+            ),
+        )
+
     def params(self, *arg, **kw):
         """Set the parameters for the statement.
 
@@ -225,6 +249,32 @@ class ValuesBase(UpdateBase):
         if prefixes:
             self._setup_prefixes(prefixes)
 
+    def _cache_key(self, **kw):
+        if self._has_multi_parameters or self._post_values_clause is not None:
+            raise NotImplementedError()
+
+        def key_for(key):
+            if isinstance(key, ClauseElement):
+                return key._cache_key(**kw)
+            else:
+                return key
+
+        parameters = []
+        for key, value in (self.parameters or {}).items():
+            if not isinstance(value, ClauseElement):
+                # literal values are rendered as bound parameters by the
+                # compiler, which aren't part of the statement itself
+                raise NotImplementedError()
+            parameters.append((key_for(key), value._cache_key(**kw)))
+
+        return super(ValuesBase, self)._cache_key(**kw) + (
+            self.parameters is None,
+            tuple(parameters),
+            tuple(key_for(key) for key in self._parameter_ordering)
+            if self._parameter_ordering is not None
+            else None,
+        )
+
     @_generative
     def values(self, *args, **kwargs):
         r"""specify a fixed VALUES clause for an INSERT statement, or the SET
@@ -556,6 +606,21 @@ class Insert(ValuesBase):
         self._validate_dialect_kwargs(dialect_kw)
         self._return_defaults = return_defaults
 
+    def _cache_key(self, **kw):
+        return super(Insert, self)._cache_key(**kw) + (
+            self.inline,
+            self.select._cache_key(**kw) if self.select is not None else None,
+            tuple(
+                name._cache_key(**kw)
+                if isinstance(name, ClauseElement)
+                else name
+                for name in self.select_names
+            )
+            if self.select_names is not None
+            else None,
+            self.include_insert_from_select_defaults,
+        )
+
     def get_children(self, **kwargs):
         if self.select is not None:
             return (self.select,)
@@ -779,6 +844,15 @@ class Update(ValuesBase):
         self._validate_dialect_kwargs(dialect_kw)
         self._return_defaults = return_defaults
 
+    def _cache_key(self, **kw):
+        return super(Update, self)._cache_key(**kw) + (
+            self.inline,
+            self._preserve_parameter_order,
+            self._whereclause._cache_key(**kw)
+            if self._whereclause is not None
+            else None,
+        )
+
     def get_children(self, **kwargs):
         if self._whereclause is not None:
             return (self._whereclause,)
@@ -889,6 +963,13 @@ class Delete(UpdateBase):
 
         self._validate_dialect_kwargs(dialect_kw)
 
+    def _cache_key(self, **kw):
+        return super(Delete, self)._cache_key(**kw) + (
+            self._whereclause._cache_key(**kw)
+            if self._whereclause is not None
+            else None,
+        )
+
     def get_children(self, **kwargs):
         if self._whereclause is not None:
             return (self._whereclause,)
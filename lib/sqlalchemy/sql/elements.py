@@ -233,6 +233,31 @@ class ClauseElement(roles.SQLRole, Visitable):
         """
         raise NotImplementedError()
 
+    def _generate_cache_key(self):
+        """return a :class:`.CacheKey` for this element, or None.
+
+        The :class:`.CacheKey` contains the structural key produced by
+        :meth:`.ClauseElement._cache_key`, along with the list of
+        :class:`.BindParameter` objects gathered in traversal order.  The
+        bound parameters allow a :class:`.Compiled` object that was produced
+        from one statement to be invoked using the parameter values of
+        another statement which has the same structure.
+
+        Returns None if any element within the structure can't produce
+        a cache key.
+
+        """
+        bindparams = []
+        try:
+            key = self._cache_key(
+                bindparams=bindparams, anon_map=_cache_key_anon_map()
+            )
+            hash(key)
+        except (NotImplementedError, TypeError):
+            return None
+        else:
+            return CacheKey(key, bindparams)
+
     @property
     def _constructor(self):
         """return the 'constructor' for this ClauseElement.
@@ -1275,7 +1300,25 @@ class BindParameter(roles.InElementRole, ColumnElement):
                 )
         else:
             bindparams.append(self)
-        return (BindParameter, self.type._cache_key, self._orig_key)
+
+        if kw.get("anon_map") is not None and isinstance(
+            self.key, _anonymous_label
+        ):
+            key = _anon_cache_key(self.key, kw)
+        else:
+            key = self._orig_key
+
+        return (
+            BindParameter,
+            self.type._cache_key,
+            key,
+            getattr(key, "quote", None),
+            self.unique,
+            self.required,
+            self.expanding,
+            self.isoutparam,
+            tuple(type_._cache_key for type_ in self._expanding_in_types),
+        )
 
     def _convert_to_unique(self):
         if not self.unique:
@@ -1773,8 +1816,8 @@ class TextClause(
         return list(self._bindparams.values())
 
     def _cache_key(self, **kw):
-        return (self.text,) + tuple(
-            bind._cache_key for bind in self._bindparams.values()
+        return (TextClause, self.text) + tuple(
+            bind._cache_key(**kw) for bind in self._bindparams.values()
         )
 
 
@@ -1992,7 +2035,7 @@ class ClauseList(
         return self.clauses
 
     def _cache_key(self, **kw):
-        return (ClauseList, self.operator) + tuple(
+        return (ClauseList, self.operator, self._tuple_values) + tuple(
             clause._cache_key(**kw) for clause in self.clauses
         )
 
@@ -2679,7 +2722,13 @@ class TypeCoerce(ColumnElement):
         return (self.clause,)
 
     def _cache_key(self, **kw):
-        return (TypeCoerce, self.type._cache_key, self.clause._cache_key(**kw))
+        # use the element that's actually rendered by the compiler, which
+        # for a bound parameter is a copy that's established with our type.
+        return (
+            TypeCoerce,
+            self.type._cache_key,
+            self.typed_expression._cache_key(**kw),
+        )
 
     @property
     def _from_objects(self):
@@ -3038,6 +3087,7 @@ class UnaryExpression(ColumnElement):
             self.element._cache_key(**kw),
             self.operator,
             self.modifier,
+            self.type._cache_key,
         )
 
     def get_children(self, **kwargs):
@@ -3178,6 +3228,7 @@ class AsBoolean(UnaryExpression):
 
     def _cache_key(self, **kw):
         return (
+            AsBoolean,
             self.element._cache_key(**kw),
             self.type._cache_key,
             self.operator,
@@ -3262,7 +3313,10 @@ class BinaryExpression(ColumnElement):
             BinaryExpression,
             self.left._cache_key(**kw),
             self.right._cache_key(**kw),
-        )
+            self.operator,
+            self.negate,
+            self.type._cache_key,
+        ) + tuple(sorted(self.modifiers.items()))
 
     def self_group(self, against=None):
         # type: (Optional[Any]) -> ClauseElement
@@ -3901,7 +3955,13 @@ class Label(roles.LabeledColumnExprRole, ColumnElement):
         return self.__class__, (self.name, self._element, self._type)
 
     def _cache_key(self, **kw):
-        return (Label, self.element._cache_key(**kw), self._resolve_label)
+        return (
+            Label,
+            self.element._cache_key(**kw),
+            _anon_cache_key(self.name, kw),
+            _anon_cache_key(self._resolve_label, kw),
+            self.type._cache_key,
+        )
 
     @util.memoized_property
     def _is_implicitly_boolean(self):
@@ -4139,9 +4199,13 @@ class ColumnClause(roles.LabeledColumnExprRole, Immutable, ColumnElement):
     table = property(_get_table, _set_table)
 
     def _cache_key(self, **kw):
+        table = self.table
         return (
-            self.name,
-            self.table.name if self.table is not None else None,
+            self.__class__,
+            _anon_cache_key(self.name, kw),
+            self.key,
+            _anon_cache_key(getattr(table, "name", None), kw),
+            getattr(table, "schema", None),
             self.is_literal,
             self.type._cache_key,
         )
@@ -4590,3 +4654,41 @@ class _anonymous_label(_truncated_label):
         else:
             # else skip the constructor call
             return self % map_
+
+
+CacheKey = util.namedtuple("CacheKey", ["key", "bindparams"])
+
+
+def _cache_key_anon_map():
+    """Return a dictionary used to render anonymous names for cache keys.
+
+    Anonymous names embed the ``id()`` of the object that generated them;
+    the map given here replaces each such token with a counter that's
+    local to a single cache key generation, in the same way that
+    :class:`.SQLCompiler` renders these names, so that two statements of
+    the same structure produce the same key.
+
+    """
+    counter = itertools.count(1)
+
+    def process_anon(key):
+        (ident, derived) = key.split(" ", 1)
+        return "%s_%d" % (derived, next(counter))
+
+    return util.PopulateDict(process_anon)
+
+
+def _anon_cache_key(name, kw):
+    """Given a name that may be an :class:`._anonymous_label`, return a
+    value for it that's suitable for a cache key.
+
+    Anonymous names are rendered deterministically if an ``anon_map`` is
+    present in the cache key arguments, otherwise the name is returned
+    as is.
+
+    """
+    anon_map = kw.get("anon_map")
+    if anon_map is not None and isinstance(name, _anonymous_label):
+        return name.apply_map(anon_map)
+    else:
+        return name
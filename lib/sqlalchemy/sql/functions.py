@@ -272,7 +272,11 @@ class FunctionElement(Executable, ColumnElement, FromClause):
         return (self.clause_expr,)
 
     def _cache_key(self, **kw):
-        return (FunctionElement, self.clause_expr._cache_key(**kw))
+        return (
+            self.__class__,
+            self.type._cache_key,
+            self.clause_expr._cache_key(**kw),
+        )
 
     def _copy_internals(self, clone=_clone, **kw):
         self.clause_expr = clone(self.clause_expr, **kw)
@@ -592,10 +596,10 @@ class Function(FunctionElement):
         )
 
     def _cache_key(self, **kw):
-        return (
-            (Function,) + tuple(self.packagenames)
-            if self.packagenames
-            else () + (self.name, self.clause_expr._cache_key(**kw))
+        return (self.__class__,) + tuple(self.packagenames) + (
+            self.name,
+            self.type._cache_key,
+            self.clause_expr._cache_key(**kw),
         )
 
 
@@ -733,7 +737,7 @@ class next_value(GenericFunction):
         self.sequence = seq
 
     def _cache_key(self, **kw):
-        return (next_value, self.sequence.name)
+        return (next_value, self.sequence.name, self.sequence.schema)
 
     def compare(self, other, **kw):
         return (
@@ -615,6 +615,8 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
             resolve_fks,
             _extend_on=_extend_on,
         )
+        if insp is not autoload_with:
+            insp._store_reflection_cache()
 
     @property
     def _sorted_constraints(self):
@@ -1381,6 +1383,19 @@ class Column(DialectKWArgs, SchemaItem, ColumnClause):
     def _extra_kwargs(self, **kwargs):
         self._validate_dialect_kwargs(kwargs)
 
+    def _cache_key(self, **kw):
+        # defaults and primary key configuration determine how INSERT
+        # and UPDATE statements are rendered for this column
+        return super(Column, self)._cache_key(**kw) + (
+            self.primary_key,
+            self.autoincrement,
+            self.nullable,
+            self.default,
+            self.onupdate,
+            self.server_default,
+            self.server_onupdate,
+        )
+
     #    @property
     #    def quote(self):
     #        return getattr(self.name, "quote", None)
@@ -4092,6 +4107,16 @@ class MetaData(SchemaItem):
         added to the database, however no special action is taken if a table
         in this ``MetaData`` no longer exists in the database.
 
+        For dialects which support it, information about all of the tables
+        to be reflected is fetched up front using one query for each kind
+        of object, such as columns or foreign keys, rather than querying
+        the database separately for each table.
+
+        .. versionchanged:: 1.4  :meth:`.MetaData.reflect` makes use of the
+           ``get_multi_*`` methods of :class:`.Inspector`, such as
+           :meth:`.Inspector.get_multi_columns`, for dialects which
+           support them.
+
         :param bind:
           A :class:`.Connectable` used to access the database; if None, uses
           the existing bind on this ``MetaData``, if any.
@@ -4222,12 +4247,17 @@ class MetaData(SchemaItem):
                     if extend_existing or name not in current
                 ]
 
+            if load and insp.dialect.supports_multi_reflection:
+                insp._prefetch_tables(schema, load, **dialect_kwargs)
+
             for name in load:
                 try:
                     Table(name, self, **reflect_opts)
                 except exc.UnreflectableTableError as uerr:
                     util.warn("Skipping table %s: %s" % (name, uerr))
 
+            insp._store_reflection_cache()
+
     @util.deprecated(
         "0.7",
         "the :meth:`.MetaData.append_ddl_listener` method is deprecated and "
@@ -32,6 +32,7 @@ from .base import Executable
 from .base import Generative
 from .base import Immutable
 from .coercions import _document_text_coercion
+from .elements import _anon_cache_key
 from .elements import _anonymous_label
 from .elements import _select_iterables
 from .elements import and_
@@ -1261,7 +1262,11 @@ class AliasedReturnsRows(FromClause):
         yield self.element
 
     def _cache_key(self, **kw):
-        return (self.__class__, self.element._cache_key(**kw), self._orig_name)
+        if kw.get("anon_map") is not None:
+            name = _anon_cache_key(self.name, kw)
+        else:
+            name = self._orig_name
+        return (self.__class__, self.element._cache_key(**kw), name)
 
     @property
     def _from_objects(self):
@@ -1461,6 +1466,14 @@ class TableSample(AliasedReturnsRows):
         else:
             return functions.func.system(self.sampling)
 
+    def _cache_key(self, **kw):
+        return super(TableSample, self)._cache_key(**kw) + (
+            self.sampling._cache_key(**kw)
+            if isinstance(self.sampling, ClauseElement)
+            else self.sampling,
+            self.seed._cache_key(**kw) if self.seed is not None else None,
+        )
+
 
 class CTE(Generative, HasSuffixes, AliasedReturnsRows):
     """Represent a Common Table Expression.
@@ -1508,6 +1521,22 @@ class CTE(Generative, HasSuffixes, AliasedReturnsRows):
             [clone(elem, **kw) for elem in self._restates]
         )
 
+    def _cache_key(self, **kw):
+        if len(self._restates) > 1:
+            # not deterministically ordered
+            raise NotImplementedError()
+        return super(CTE, self)._cache_key(**kw) + (
+            self.recursive,
+            self._cte_alias._cache_key(**kw)
+            if self._cte_alias is not None
+            else None,
+            tuple(elem._cache_key(**kw) for elem in self._restates),
+            tuple(
+                (elem._cache_key(**kw), dialect_name)
+                for elem, dialect_name in self._suffixes
+            ),
+        )
+
     def alias(self, name=None, flat=False):
         """Return an :class:`.Alias` of this :class:`.CTE`.
 
@@ -1894,9 +1923,12 @@ class TableClause(Immutable, FromClause):
             return []
 
     def _cache_key(self, **kw):
-        return (TableClause, self.name) + tuple(
-            col._cache_key(**kw) for col in self._columns
-        )
+        return (
+            self.__class__,
+            self.name,
+            getattr(self, "schema", None),
+            self.implicit_returning,
+        ) + tuple(col._cache_key(**kw) for col in self._columns)
 
     @util.dependencies("sqlalchemy.sql.dml")
     def insert(self, dml, values=None, inline=False, **kwargs):
@@ -2031,7 +2063,10 @@ class ForUpdateArg(ClauseElement):
             self.nowait,
             self.read,
             self.skip_locked,
-            self.of._cache_key(**kw) if self.of is not None else None,
+            self.key_share,
+            tuple(elem._cache_key(**kw) for elem in self.of)
+            if self.of is not None
+            else None,
         )
 
     def __init__(
@@ -2576,6 +2611,33 @@ class GenerativeSelect(SelectBase):
         """
         return self._offset_or_limit_clause_asint(self._limit_clause, "limit")
 
+    def _generative_select_cache_key(self, **kw):
+        """Return the portion of a cache key common to all
+        :class:`.GenerativeSelect` constructs."""
+
+        return (
+            self.use_labels,
+            self._order_by_clause._cache_key(**kw)
+            if self._order_by_clause is not None
+            else None,
+            self._group_by_clause._cache_key(**kw)
+            if self._group_by_clause is not None
+            else None,
+            self._limit_clause._cache_key(**kw)
+            if self._limit_clause is not None
+            else None,
+            self._offset_clause._cache_key(**kw)
+            if self._offset_clause is not None
+            else None,
+            # some backends render simple integer LIMIT / OFFSET values
+            # inline, so these are part of the key as well.
+            self._limit if self._simple_int_limit else None,
+            self._offset if self._simple_int_offset else None,
+            self._for_update_arg._cache_key(**kw)
+            if self._for_update_arg is not None
+            else None,
+        )
+
     @property
     def _simple_int_limit(self):
         """True if the LIMIT clause is a simple integer, False
@@ -3007,21 +3069,7 @@ class CompoundSelect(GenerativeSelect):
         return (
             (CompoundSelect, self.keyword)
             + tuple(stmt._cache_key(**kw) for stmt in self.selects)
-            + (
-                self._order_by_clause._cache_key(**kw)
-                if self._order_by_clause is not None
-                else None,
-            )
-            + (
-                self._group_by_clause._cache_key(**kw)
-                if self._group_by_clause is not None
-                else None,
-            )
-            + (
-                self._for_update_arg._cache_key(**kw)
-                if self._for_update_arg is not None
-                else None,
-            )
+            + self._generative_select_cache_key(**kw)
         )
 
     def bind(self):
@@ -3651,23 +3699,18 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
             + ("elements",)
             + tuple(
                 elem._cache_key(**kw) if elem is not None else None
-                for elem in (
-                    self._whereclause,
-                    self._having,
-                    self._order_by_clause,
-                    self._group_by_clause,
-                )
+                for elem in (self._whereclause, self._having)
             )
             + ("from_obj",)
             + tuple(elem._cache_key(**kw) for elem in self._from_obj)
-            + ("correlate",)
+            + ("correlate", self._auto_correlate)
             + tuple(
                 elem._cache_key(**kw)
                 for elem in (
                     self._correlate if self._correlate is not None else ()
                 )
             )
-            + ("correlate_except",)
+            + ("correlate_except", self._correlate_except is None)
             + tuple(
                 elem._cache_key(**kw)
                 for elem in (
@@ -3676,12 +3719,30 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
                     else ()
                 )
             )
-            + ("for_update",),
-            (
-                self._for_update_arg._cache_key(**kw)
-                if self._for_update_arg is not None
-                else None,
-            ),
+            + ("distinct",)
+            + (
+                tuple(elem._cache_key(**kw) for elem in self._distinct)
+                if isinstance(self._distinct, list)
+                else (self._distinct,)
+            )
+            + ("prefixes",)
+            + tuple(
+                (elem._cache_key(**kw), dialect_name)
+                for elem, dialect_name in self._prefixes
+            )
+            + ("suffixes",)
+            + tuple(
+                (elem._cache_key(**kw), dialect_name)
+                for elem, dialect_name in self._suffixes
+            )
+            + ("hints",)
+            + tuple(
+                (selectable._cache_key(**kw), dialect_name, text)
+                for (selectable, dialect_name), text in self._hints.items()
+            )
+            + self._statement_hints
+            + ("generative",)
+            + self._generative_select_cache_key(**kw)
         )
 
     @_generative
@@ -4431,9 +4492,11 @@ class TextualSelect(SelectBase):
         return [self.element]
 
     def _cache_key(self, **kw):
-        return (TextualSelect, self.element._cache_key(**kw)) + tuple(
-            col._cache_key(**kw) for col in self.column_args
-        )
+        return (
+            TextualSelect,
+            self.element._cache_key(**kw),
+            self.positional,
+        ) + tuple(col._cache_key(**kw) for col in self.column_args)
 
     def _scalar_type(self):
         return self.column_args[0].type
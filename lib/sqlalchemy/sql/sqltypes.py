@@ -1453,6 +1453,15 @@ class Enum(Emulated, String, SchemaType):
     def native(self):
         return self.native_enum
 
+    @util.memoized_property
+    def _cache_key(self):
+        return super(Enum, self)._cache_key + (
+            tuple(self.enums),
+            self.enum_class,
+            self.native_enum,
+            self.validate_strings,
+        )
+
     def _db_value_for_elem(self, elem):
         try:
             return self._valid_lookup[elem]
@@ -662,6 +662,13 @@ class UserDefinedType(util.with_metaclass(VisitableCheckKWArg, TypeEngine)):
 
     ensure_kwarg = "get_col_spec"
 
+    @util.memoized_property
+    def _cache_key(self):
+        # user defined types may make use of any internal state within
+        # their processing and rendering functions, so aren't keyed on
+        # their constructor arguments; the type object itself is used.
+        return (self.__class__, id(self))
+
     class Comparator(TypeEngine.Comparator):
         __slots__ = ()
 
@@ -865,6 +872,11 @@ class TypeDecorator(SchemaEventTarget, TypeEngine):
 
     __visit_name__ = "type_decorator"
 
+    @util.memoized_property
+    def _cache_key(self):
+        # see UserDefinedType._cache_key
+        return (self.__class__, id(self))
+
     def __init__(self, *args, **kwargs):
         """Construct a :class:`.TypeDecorator`.
 
@@ -100,10 +100,11 @@ class CompiledSQL(SQLMatchRule):
                 ),
             )
         else:
-            compiled = context.compiled.statement.compile(
+            compiled = context.invoked_statement.compile(
                 dialect=compare_dialect,
                 column_keys=context.compiled.column_keys,
                 inline=context.compiled.inline,
+                for_executemany=context.compiled.for_executemany,
                 schema_translate_map=context.execution_options.get(
                     "schema_translate_map"
                 ),
@@ -317,6 +318,14 @@ class EachOf(AssertRule):
             super(EachOf, self).no_more_statements()
 
 
+class Conditional(EachOf):
+    def __init__(self, condition, rules, else_rules):
+        if condition:
+            super(Conditional, self).__init__(*rules)
+        else:
+            super(Conditional, self).__init__(*else_rules)
+
+
 class Or(AllOf):
     def process_statement(self, execute_observed):
         for rule in self.rules:
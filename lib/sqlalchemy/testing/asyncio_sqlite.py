@@ -0,0 +1,103 @@
+# testing/asyncio_sqlite.py
+# Copyright (C) 2005-2019 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""A stand-in asyncio DBAPI which runs the ``sqlite3`` module in threads.
+
+Each connection owns a single worker thread in which all of its
+``sqlite3`` calls take place; the connection and cursor methods which
+perform I/O are coroutines.  This is used to exercise
+:mod:`sqlalchemy.ext.asyncio` without requiring a third party async driver.
+
+Python 3 only.
+
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import sqlite3
+
+from sqlite3 import *  # noqa
+
+
+class Cursor(object):
+    def __init__(self, connection, cursor):
+        self._connection = connection
+        self._cursor = cursor
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self.arraysize = cursor.arraysize
+
+    def _sync_attributes(self):
+        self.description = self._cursor.description
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+
+    async def execute(self, operation, parameters=()):
+        def go():
+            self._cursor.execute(operation, parameters)
+            self._sync_attributes()
+
+        await self._connection._run(go)
+
+    async def executemany(self, operation, seq_of_parameters):
+        def go():
+            self._cursor.executemany(operation, seq_of_parameters)
+            self._sync_attributes()
+
+        await self._connection._run(go)
+
+    async def fetchone(self):
+        return await self._connection._run(self._cursor.fetchone)
+
+    async def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        return await self._connection._run(self._cursor.fetchmany, size)
+
+    async def fetchall(self):
+        return await self._connection._run(self._cursor.fetchall)
+
+    async def close(self):
+        await self._connection._run(self._cursor.close)
+
+
+class Connection(object):
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._connection = None
+
+    async def _run(self, fn, *args, **kw):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kw)
+        )
+
+    async def cursor(self):
+        return Cursor(self, await self._run(self._connection.cursor))
+
+    async def commit(self):
+        await self._run(self._connection.commit)
+
+    async def rollback(self):
+        await self._run(self._connection.rollback)
+
+    async def close(self):
+        try:
+            await self._run(self._connection.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+async def connect(database, **kw):
+    """Create a new :class:`.Connection`, accepting the same arguments
+    as ``sqlite3.connect()``."""
+
+    conn = Connection()
+    conn._connection = await conn._run(sqlite3.connect, database, **kw)
+    return conn
@@ -275,6 +275,18 @@ class SuiteRequirements(Requirements):
             "%(database)s %(does_support)s 'returning'",
         )
 
+    @property
+    def insert_executemany_returning(self):
+        """target platform supports RETURNING when INSERT is used with
+        executemany(), e.g. multiple parameter sets, indicating that
+        the rows returned may be correlated to the parameter sets."""
+
+        return exclusions.only_if(
+            lambda config: config.db.dialect.insert_executemany_returning,
+            "%(database)s %(does_support)s 'RETURNING of "
+            "multiple rows with INSERT executemany'",
+        )
+
     @property
     def tuple_in(self):
         """Target platform supports the syntax
@@ -773,6 +785,11 @@ class SuiteRequirements(Requirements):
         """Target must support UPDATE..FROM syntax"""
         return exclusions.closed()
 
+    @property
+    def select_for_update(self):
+        """Target must support the SELECT..FOR UPDATE syntax."""
+        return exclusions.open()
+
     @property
     def delete_from(self):
         """Target must support DELETE FROM..FROM or DELETE..USING syntax"""
@@ -960,6 +977,12 @@ class SuiteRequirements(Requirements):
             lambda: not self._has_cextensions(), "C extensions not installed"
         )
 
+    @property
+    def greenlet(self):
+        return exclusions.skip_if(
+            lambda: not self._has_greenlet(), "greenlet not installed"
+        )
+
     def _has_sqlite(self):
         from sqlalchemy import create_engine
 
@@ -976,3 +999,11 @@ class SuiteRequirements(Requirements):
             return True
         except ImportError:
             return False
+
+    def _has_greenlet(self):
+        try:
+            import greenlet  # noqa
+
+            return True
+        except ImportError:
+            return False
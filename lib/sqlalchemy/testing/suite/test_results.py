@@ -15,6 +15,7 @@ from ... import sql
 from ... import String
 from ... import testing
 from ... import text
+from ...engine.result import BufferedRowResultProxy
 
 
 class RowFetchTest(fixtures.TablesTest):
@@ -223,7 +224,8 @@ class ServerSideCursorsTest(
 
     __backend__ = True
 
-    def _is_server_side(self, cursor):
+    def _is_server_side(self, result):
+        cursor = result.cursor
         if self.engine.dialect.driver == "psycopg2":
             return cursor.name
         elif self.engine.dialect.driver == "pymysql":
@@ -233,7 +235,12 @@ class ServerSideCursorsTest(
             sscursor = __import__("MySQLdb.cursors").cursors.SSCursor
             return isinstance(cursor, sscursor)
         else:
-            return False
+            # drivers such as pysqlite and pyodbc don't use a distinct
+            # cursor class for streaming; check that the result is
+            # buffered in batches
+            return result.context._is_server_side and isinstance(
+                result, BufferedRowResultProxy
+            )
 
     def _fixture(self, server_side_cursors):
         self.engine = engines.testing_engine(
@@ -241,24 +248,27 @@ class ServerSideCursorsTest(
         )
         return self.engine
 
+    engine = None
+
     def tearDown(self):
         engines.testing_reaper.close_all()
-        self.engine.dispose()
+        if self.engine is not None:
+            self.engine.dispose()
 
     def test_global_string(self):
         engine = self._fixture(True)
         result = engine.execute("select 1")
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
     def test_global_text(self):
         engine = self._fixture(True)
         result = engine.execute(text("select 1"))
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
     def test_global_expr(self):
         engine = self._fixture(True)
         result = engine.execute(select([1]))
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
     def test_global_off_explicit(self):
         engine = self._fixture(False)
@@ -266,7 +276,7 @@ class ServerSideCursorsTest(
 
         # It should be off globally ...
 
-        assert not self._is_server_side(result.cursor)
+        assert not self._is_server_side(result)
 
     def test_stmt_option(self):
         engine = self._fixture(False)
@@ -276,7 +286,7 @@ class ServerSideCursorsTest(
 
         # ... but enabled for this one.
 
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
     def test_conn_option(self):
         engine = self._fixture(False)
@@ -287,7 +297,7 @@ class ServerSideCursorsTest(
             .execution_options(stream_results=True)
             .execute("select 1")
         )
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
     def test_stmt_enabled_conn_option_disabled(self):
         engine = self._fixture(False)
@@ -298,48 +308,49 @@ class ServerSideCursorsTest(
         result = (
             engine.connect().execution_options(stream_results=False).execute(s)
         )
-        assert not self._is_server_side(result.cursor)
+        assert not self._is_server_side(result)
 
     def test_stmt_option_disabled(self):
         engine = self._fixture(True)
         s = select([1]).execution_options(stream_results=False)
         result = engine.execute(s)
-        assert not self._is_server_side(result.cursor)
+        assert not self._is_server_side(result)
 
     def test_aliases_and_ss(self):
         engine = self._fixture(False)
         s1 = select([1]).execution_options(stream_results=True).alias()
         result = engine.execute(s1)
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
         # s1's options shouldn't affect s2 when s2 is used as a
         # from_obj.
         s2 = select([1], from_obj=s1)
         result = engine.execute(s2)
-        assert not self._is_server_side(result.cursor)
+        assert not self._is_server_side(result)
 
     def test_for_update_expr(self):
         engine = self._fixture(True)
         s1 = select([1]).with_for_update()
         result = engine.execute(s1)
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
+    @testing.requires.select_for_update
     def test_for_update_string(self):
         engine = self._fixture(True)
         result = engine.execute("SELECT 1 FOR UPDATE")
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
     def test_text_no_ss(self):
         engine = self._fixture(False)
         s = text("select 42")
         result = engine.execute(s)
-        assert not self._is_server_side(result.cursor)
+        assert not self._is_server_side(result)
 
     def test_text_ss_option(self):
         engine = self._fixture(False)
         s = text("select 42").execution_options(stream_results=True)
         result = engine.execute(s)
-        assert self._is_server_side(result.cursor)
+        assert self._is_server_side(result)
 
     @testing.provide_metadata
     def test_roundtrip(self):
@@ -9,6 +9,7 @@
 
 from __future__ import absolute_import
 
+from collections import deque
 import operator
 import types
 import weakref
@@ -165,6 +166,9 @@ class immutabledict(ImmutableContainer, dict):
         return "immutabledict(%s)" % dict.__repr__(self)
 
 
+EMPTY_DICT = immutabledict()
+
+
 class Properties(object):
     """Provide a __getattr__/__setattr__ interface over a dict."""
 
@@ -872,15 +876,47 @@ class LRUCache(dict):
     generally its not safe to do an "in" check first as the dictionary
     can change subsequent to that call.
 
+    Entries are removed using a "second chance" approximation of least
+    recently used order, also known as the "clock" algorithm.  Entries are
+    queued in the order in which they were added; when the size threshold
+    is exceeded, entries are taken from the front of the queue, and those
+    which have been accessed since they were queued are placed at the back
+    of the queue rather than removed.  Retrieving, adding and removing
+    an entry are each amortized constant time operations, and retrieval
+    doesn't require the mutex.  The queued items of entries which are
+    removed directly are discarded once they outnumber the entries
+    present.
+
+    The ``hits``, ``misses`` and ``evictions`` attributes count the
+    retrievals which located an entry, the retrievals which did not, and
+    the entries which were removed in order to reduce the size of the
+    cache, so that an appropriate capacity for a given cache may be
+    determined.  These counters are not synchronized and are approximate
+    under concurrent use.
+
     """
 
-    __slots__ = "capacity", "threshold", "size_alert", "_counter", "_mutex"
+    __slots__ = (
+        "capacity",
+        "threshold",
+        "size_alert",
+        "hits",
+        "misses",
+        "evictions",
+        "_counter",
+        "_queue",
+        "_stale",
+        "_mutex",
+    )
 
     def __init__(self, capacity=100, threshold=0.5, size_alert=None):
         self.capacity = capacity
         self.threshold = threshold
         self.size_alert = size_alert
+        self.hits = self.misses = self.evictions = 0
         self._counter = 0
+        self._queue = deque()
+        self._stale = 0
         self._mutex = threading.Lock()
 
     def _inc_counter(self):
@@ -888,16 +924,23 @@ class LRUCache(dict):
         return self._counter
 
     def get(self, key, default=None):
-        item = dict.get(self, key, default)
-        if item is not default:
+        item = dict.get(self, key)
+        if item is not None:
             item[2] = self._inc_counter()
+            self.hits += 1
             return item[1]
         else:
+            self.misses += 1
             return default
 
     def __getitem__(self, key):
-        item = dict.__getitem__(self, key)
+        try:
+            item = dict.__getitem__(self, key)
+        except KeyError:
+            self.misses += 1
+            raise
         item[2] = self._inc_counter()
+        self.hits += 1
         return item[1]
 
     def values(self):
@@ -913,12 +956,67 @@ class LRUCache(dict):
     def __setitem__(self, key, value):
         item = dict.get(self, key)
         if item is None:
-            item = [key, value, self._inc_counter()]
+            # [key, value, counter as of last access,
+            # counter as of when the item was queued]
+            counter = self._inc_counter()
+            item = [key, value, counter, counter]
             dict.__setitem__(self, key, item)
+            self._queue.append(item)
         else:
             item[1] = value
         self._manage_size()
 
+    def __delitem__(self, key):
+        self._discard(dict.pop(self, key))
+
+    def pop(self, key, *default):
+        try:
+            item = dict.pop(self, key)
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        value = item[1]
+        self._discard(item)
+        return value
+
+    def popitem(self):
+        key, item = dict.popitem(self)
+        value = item[1]
+        self._discard(item)
+        return key, value
+
+    def clear(self):
+        dict.clear(self)
+        self._queue.clear()
+        self._stale = 0
+
+    def _discard(self, item):
+        # the item remains in the queue until evicted or compacted;
+        # release its value in the meantime
+        item[1] = None
+        self._stale += 1
+        if self._stale > len(self):
+            self._compact()
+
+    def _compact(self):
+        if not self._mutex.acquire(False):
+            return
+        try:
+            queue = self._queue
+            for i in range(len(queue)):
+                item = queue.popleft()
+                if dict.get(self, item[0]) is item:
+                    queue.append(item)
+            self._stale = 0
+        finally:
+            self._mutex.release()
+
+    def reset_stats(self):
+        """Reset the ``hits``, ``misses`` and ``evictions`` counters."""
+
+        self.hits = self.misses = self.evictions = 0
+
     @property
     def size_threshold(self):
         return self.capacity + self.capacity * self.threshold
@@ -928,22 +1026,37 @@ class LRUCache(dict):
             return
         try:
             size_alert = bool(self.size_alert)
-            while len(self) > self.capacity + self.capacity * self.threshold:
+            if len(self) > self.capacity + self.capacity * self.threshold:
                 if size_alert:
-                    size_alert = False
                     self.size_alert(self)
-                by_counter = sorted(
-                    dict.values(self), key=operator.itemgetter(2), reverse=True
-                )
-                for item in by_counter[self.capacity :]:
-                    try:
-                        del self[item[0]]
-                    except KeyError:
-                        # deleted elsewhere; skip
-                        continue
+                self._evict(len(self) - self.capacity)
         finally:
             self._mutex.release()
 
+    def _evict(self, count):
+        queue = self._queue
+        while count > 0 and queue:
+            item = queue.popleft()
+            key = item[0]
+            if dict.get(self, key) is not item:
+                # removed or replaced elsewhere; discard
+                self._stale -= 1
+                continue
+            elif item[2] > item[3]:
+                # accessed since it was queued; requeue
+                item[3] = item[2]
+                queue.append(item)
+                continue
+            try:
+                dict.__delitem__(self, key)
+            except KeyError:
+                # deleted elsewhere; skip
+                self._stale -= 1
+                continue
+            else:
+                self.evictions += 1
+                count -= 1
+
 
 _lw_tuples = LRUCache(100)
 
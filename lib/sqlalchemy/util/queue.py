@@ -16,6 +16,11 @@ rare cases be invoked within the ``get()`` method of the Queue itself,
 producing a ``put()`` inside the ``get()`` and therefore a reentrant
 condition.
 
+Unlike ``Queue.Queue``, items are retrieved without acquiring the mutex
+when the queue is not empty, so that uncontended use doesn't serialize on
+a lock, and each thread which waits in ``get()`` is woken individually,
+optionally in strict first-come-first-served order.
+
 """
 
 from collections import deque
@@ -34,34 +39,48 @@ class Empty(Exception):
 
 
 class Full(Exception):
-    "Exception raised by Queue.put(block=0)/put_nowait()."
+    "Exception raised by Queue.put()/put_nowait()."
 
     pass
 
 
+_NO_ITEM = object()
+
+
+class _Waiter(object):
+    __slots__ = ("event", "item")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.item = _NO_ITEM
+
+
 class Queue:
-    def __init__(self, maxsize=0, use_lifo=False):
+    def __init__(self, maxsize=0, use_lifo=False, fair=False):
         """Initialize a queue object with a given maximum size.
 
         If `maxsize` is <= 0, the queue size is infinite.
 
         If `use_lifo` is True, this Queue acts like a Stack (LIFO).
+
+        If `fair` is True, threads waiting in ``get()`` receive items
+        strictly in the order in which they began to wait; an item
+        ``put()`` while threads are waiting is handed directly to the
+        thread which has waited longest.  Otherwise, a newly arriving
+        thread may take an item before a waiting thread has woken up.
         """
 
         self._init(maxsize)
-        # mutex must be held whenever the queue is mutating.  All methods
-        # that acquire mutex must release it before returning.  mutex
-        # is shared between the two conditions, so acquiring and
-        # releasing the conditions also acquires and releases mutex.
+        # mutex must be held whenever items are added to the queue or
+        # the list of waiters is mutating.  Items may be removed without
+        # the mutex, as deque.pop() and deque.popleft() are atomic.
         self.mutex = threading.RLock()
-        # Notify not_empty whenever an item is added to the queue; a
-        # thread waiting to get is notified then.
-        self.not_empty = threading.Condition(self.mutex)
-        # Notify not_full whenever an item is removed from the queue;
-        # a thread waiting to put is notified then.
-        self.not_full = threading.Condition(self.mutex)
+        # threads waiting in get(), each with its own event, so that
+        # put() wakes exactly one of them.
+        self.waiters = deque()
         # If this queue uses LIFO or FIFO
         self.use_lifo = use_lifo
+        self.fair = fair
 
     def qsize(self):
         """Return the approximate size of the queue (not reliable!)."""
@@ -89,40 +108,37 @@ class Queue:
         self.mutex.release()
         return n
 
-    def put(self, item, block=True, timeout=None):
+    def put(self, item, last=False):
         """Put an item into the queue.
 
-        If optional args `block` is True and `timeout` is None (the
-        default), block if necessary until a free slot is
-        available. If `timeout` is a positive number, it blocks at
-        most `timeout` seconds and raises the ``Full`` exception if no
-        free slot was available within that time.  Otherwise (`block`
-        is false), put an item on the queue if a free slot is
-        immediately available, else raise the ``Full`` exception
-        (`timeout` is ignored in that case).
+        If a thread is waiting in ``get()``, it is woken, and in "fair"
+        mode receives the item directly.  Otherwise the item is placed
+        on the queue if a free slot is available, else the ``Full``
+        exception is raised.  Unlike ``Queue.Queue``, this method never
+        blocks.
+
+        If `last` is True, the item is placed so that it is retrieved
+        only after all other items currently in the queue, regardless
+        of whether this Queue is LIFO or FIFO.
         """
 
-        self.not_full.acquire()
+        self.mutex.acquire()
         try:
-            if not block:
-                if self._full():
-                    raise Full
-            elif timeout is None:
-                while self._full():
-                    self.not_full.wait()
+            if self.fair and self.waiters:
+                waiter = self.waiters.popleft()
+                waiter.item = item
+                waiter.event.set()
+                return
+            if self._full():
+                raise Full
+            if last:
+                self._put_last(item)
             else:
-                if timeout < 0:
-                    raise ValueError("'timeout' must be a positive number")
-                endtime = _time() + timeout
-                while self._full():
-                    remaining = endtime - _time()
-                    if remaining <= 0.0:
-                        raise Full
-                    self.not_full.wait(remaining)
-            self._put(item)
-            self.not_empty.notify()
+                self._put(item)
+            if self.waiters:
+                self.waiters.popleft().event.set()
         finally:
-            self.not_full.release()
+            self.mutex.release()
 
     def put_nowait(self, item):
         """Put an item into the queue without blocking.
@@ -130,7 +146,7 @@ class Queue:
         Only enqueue the item if a free slot is immediately available.
         Otherwise raise the ``Full`` exception.
         """
-        return self.put(item, False)
+        return self.put(item)
 
     def get(self, block=True, timeout=None):
         """Remove and return an item from the queue.
@@ -143,28 +159,59 @@ class Queue:
         return an item if one is immediately available, else raise the
         ``Empty`` exception (`timeout` is ignored in that case).
         """
-        self.not_empty.acquire()
+
+        # fast path; an item present on the queue is taken without
+        # acquiring the mutex.  In "fair" mode, items are only present
+        # when no thread is waiting, as put() hands them to waiters
+        # directly.
         try:
-            if not block:
-                if self._empty():
-                    raise Empty
-            elif timeout is None:
-                while self._empty():
-                    self.not_empty.wait()
-            else:
-                if timeout < 0:
-                    raise ValueError("'timeout' must be a positive number")
-                endtime = _time() + timeout
-                while self._empty():
-                    remaining = endtime - _time()
-                    if remaining <= 0.0:
-                        raise Empty
-                    self.not_empty.wait(remaining)
-            item = self._get()
-            self.not_full.notify()
-            return item
+            return self._get()
+        except IndexError:
+            pass
+
+        self.mutex.acquire()
+        try:
+            if not self._empty():
+                return self._get()
+            elif not block:
+                raise Empty
+            elif timeout is not None and timeout < 0:
+                raise ValueError("'timeout' must be a positive number")
+            waiter = _Waiter()
+            self.waiters.append(waiter)
         finally:
-            self.not_empty.release()
+            self.mutex.release()
+
+        return self._wait(waiter, timeout)
+
+    def _wait(self, waiter, timeout):
+        if timeout is not None:
+            endtime = _time() + timeout
+
+        while True:
+            if timeout is None:
+                waiter.event.wait()
+            else:
+                remaining = endtime - _time()
+                if remaining > 0.0:
+                    waiter.event.wait(remaining)
+
+            self.mutex.acquire()
+            try:
+                if waiter.item is not _NO_ITEM:
+                    return waiter.item
+                elif waiter.event.is_set():
+                    if not self._empty():
+                        return self._get()
+                    # another thread took the item first; keep our
+                    # place at the front of the line
+                    waiter.event.clear()
+                    self.waiters.appendleft(waiter)
+                elif timeout is not None and remaining <= 0.0:
+                    self.waiters.remove(waiter)
+                    raise Empty
+            finally:
+                self.mutex.release()
 
     def get_nowait(self):
         """Remove and return an item from the queue without blocking.
@@ -177,7 +224,8 @@ class Queue:
 
     # Override these methods to implement other queue organizations
     # (e.g. stack or priority queue).
-    # These will only be called with appropriate locks held
+    # _put() is only called with the mutex held; _get() may be called
+    # without it, and must raise IndexError if the queue is empty.
 
     # Initialize the queue representation
     def _init(self, maxsize):
@@ -199,6 +247,13 @@ class Queue:
     def _put(self, item):
         self.queue.append(item)
 
+    # Put a new item in the queue, to be retrieved after all others
+    def _put_last(self, item):
+        if self.use_lifo:
+            self.queue.appendleft(item)
+        else:
+            self.queue.append(item)
+
     # Get an item from the queue
     def _get(self):
         if self.use_lifo:
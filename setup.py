@@ -192,6 +192,7 @@ def run_setup(with_cext):
             "mssql_pyodbc": ["pyodbc"],
             "mssql_pymssql": ["pymssql"],
             "mssql": ["pyodbc"],
+            "asyncio": ["greenlet"],
         },
         **kwargs
     )
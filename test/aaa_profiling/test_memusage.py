@@ -29,6 +29,8 @@ from sqlalchemy.sql import column
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import gc_collect
@@ -1054,3 +1056,91 @@ class MemUsageWBackendTest(EnsureZeroed):
             go()
         finally:
             metadata.drop_all()
+
+
+class InstanceStateSizeTest(fixtures.MappedTest):
+    __requires__ = ("cpython",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "a",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(A, cls.tables.a)
+
+    @classmethod
+    def insert_data(cls):
+        testing.db.execute(
+            cls.tables.a.insert(),
+            [{"id": i, "data": "d%d" % i} for i in range(1, 501)],
+        )
+
+    def test_loaded_states_share_empty_collections(self):
+        sess = Session()
+        objs = sess.query(A).all()
+        eq_(len(objs), 500)
+
+        for obj in objs:
+            state = sa.inspect(obj)
+            is_(state.committed_state, util.EMPTY_DICT)
+            is_(state.expired_attributes, util.EMPTY_SET)
+            is_(state.parents, util.EMPTY_DICT)
+            is_(state._pending_mutations, util.EMPTY_DICT)
+            eq_(state.__dict__, {})
+
+    def test_collections_allocated_on_write(self):
+        sess = Session()
+        a1 = sess.query(A).first()
+        state = sa.inspect(a1)
+
+        a1.data = "new data"
+        is_not_(state.committed_state, util.EMPTY_DICT)
+        eq_(state.committed_state, {"data": "d1"})
+
+        sess.flush()
+        is_(state.committed_state, util.EMPTY_DICT)
+
+        sess.expire(a1, ["data"])
+        eq_(state.expired_attributes, set(["data"]))
+        eq_(a1.data, "new data")
+        is_(state.expired_attributes, util.EMPTY_SET)
+
+    @testing.requires.python3
+    def test_loaded_state_bytes(self):
+        """Per-instance bytes allocated by InstanceState when loading
+        objects does not include any mutable collections."""
+
+        import sys
+        import tracemalloc
+
+        from sqlalchemy.orm import state as statelib
+
+        sess = Session()
+        sess.query(A).all()
+        sess.close()
+
+        gc_collect()
+        tracemalloc.start()
+        try:
+            objs = sess.query(A).all()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        state_bytes = sum(
+            stat.size
+            for stat in snapshot.filter_traces(
+                [tracemalloc.Filter(True, statelib.__file__)]
+            ).statistics("filename")
+        )
+        per_instance = state_bytes / len(objs)
+
+        # formerly each state allocated an empty set() and an empty dict
+        # up front, along with its __dict__
+        assert per_instance < sys.getsizeof(set()), per_instance
@@ -3,6 +3,7 @@
 import copy
 import inspect
 import sys
+import weakref
 
 from sqlalchemy import exc
 from sqlalchemy import sql
@@ -1128,6 +1129,101 @@ class LRUTest(fixtures.TestBase):
         assert 25 in lru
         assert lru[25] is i2
 
+    def test_counters(self):
+        lru = util.LRUCache(10, threshold=0.2)
+
+        for id_ in range(1, 14):
+            lru[id_] = id_
+
+        eq_(lru.evictions, 3)
+
+        eq_(lru.get(1), None)
+        eq_(lru.get(12), 12)
+        eq_(lru[13], 13)
+        assert_raises(KeyError, lru.__getitem__, 2)
+
+        eq_((lru.hits, lru.misses, lru.evictions), (2, 2, 3))
+
+        lru.reset_stats()
+        eq_((lru.hits, lru.misses, lru.evictions), (0, 0, 0))
+
+    def test_accessed_items_retained(self):
+        lru = util.LRUCache(10, threshold=0.2)
+
+        for id_ in range(1, 13):
+            lru[id_] = id_
+
+        # items accessed since they were added are moved to the back
+        # of the queue rather than removed
+        for id_ in range(1, 10):
+            lru[id_]
+
+        lru[13] = 13
+
+        eq_(sorted(lru), [1, 2, 3, 4, 5, 6, 7, 8, 9, 13])
+
+    def test_removed_and_replaced_items(self):
+        lru = util.LRUCache(10, threshold=0.2)
+
+        for id_ in range(1, 13):
+            lru[id_] = id_
+
+        del lru[1]
+        lru[2] = "two"
+        lru[1] = "one"
+
+        lru[13] = 13
+
+        eq_(sorted(lru), [1, 5, 6, 7, 8, 9, 10, 11, 12, 13])
+        eq_(lru[1], "one")
+
+    def test_pop(self):
+        lru = util.LRUCache(10, threshold=0.2)
+        lru[1] = "one"
+        lru[2] = "two"
+
+        eq_(lru.pop(1), "one")
+        eq_(lru.pop(1, None), None)
+        assert_raises(KeyError, lru.pop, 1)
+        eq_(lru.popitem(), (2, "two"))
+        eq_(len(lru), 0)
+
+    def test_removed_items_released(self):
+        class item(object):
+            pass
+
+        lru = util.LRUCache(10, threshold=0.2)
+        lru[0] = 0
+
+        refs = []
+        for id_ in range(1, 1000):
+            obj = item()
+            refs.append(weakref.ref(obj))
+            lru[id_] = obj
+            if id_ % 2:
+                lru.pop(id_)
+            else:
+                del lru[id_]
+            del obj
+
+        gc_collect()
+        eq_([ref for ref in refs if ref() is not None], [])
+        eq_(len(lru), 1)
+        assert len(lru._queue) <= 2
+
+    def test_clear(self):
+        lru = util.LRUCache(10, threshold=0.2)
+
+        for id_ in range(1, 13):
+            lru[id_] = id_
+
+        lru.clear()
+        eq_(len(lru), 0)
+
+        for id_ in range(1, 13):
+            lru[id_] = id_
+        eq_(lru.evictions, 0)
+
 
 class ImmutableSubclass(str):
     pass
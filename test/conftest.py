@@ -9,6 +9,10 @@ installs SQLAlchemy's testing plugin into the local environment.
 import os
 import sys
 
+collect_ignore_glob = []
+if sys.version_info[0] < 3:
+    collect_ignore_glob.append("*_py3k.py")
+
 
 if not sys.flags.no_user_site:
     # this is needed so that test scenarios like "python setup.py test"
@@ -19,6 +19,7 @@ from sqlalchemy import select
 from sqlalchemy import Sequence
 from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy import text
 from sqlalchemy import TypeDecorator
 from sqlalchemy import util
 from sqlalchemy import VARCHAR
@@ -580,6 +581,33 @@ class ExecuteTest(fixtures.TestBase):
         )
         eq_(testing.db.execute(users_autoinc.select()).fetchall(), [(1, None)])
 
+    def test_executemany_compiled_parameters(self):
+        """test that compiled_parameters are available for an executemany
+        whose DBAPI parameters were assembled directly"""
+
+        with testing.db.connect() as conn:
+            result = conn.execute(
+                users.insert(),
+                [
+                    {"user_id": 7, "user_name": "jack"},
+                    {"user_id": 8, "user_name": "ed"},
+                ],
+            )
+            assert "compiled_parameters" not in result.context.__dict__
+            eq_(
+                result.context.compiled_parameters,
+                [
+                    {"user_id": 7, "user_name": "jack"},
+                    {"user_id": 8, "user_name": "ed"},
+                ],
+            )
+            eq_(
+                conn.execute(
+                    users.select().order_by(users.c.user_id)
+                ).fetchall(),
+                [(7, "jack"), (8, "ed")],
+            )
+
     @testing.only_on("sqlite")
     def test_execute_compiled_favors_compiled_paramstyle(self):
         with patch.object(testing.db.dialect, "do_execute") as do_exec:
@@ -1013,6 +1041,145 @@ class CompiledCacheTest(fixtures.TestBase):
             eq_(conn.scalar(stmt), 1)
 
 
+class EngineCompiledCacheTest(fixtures.TestBase):
+    @classmethod
+    def setup_class(cls):
+        global users, metadata
+        metadata = MetaData()
+        users = Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True),
+            Column("user_name", VARCHAR(20)),
+        )
+
+    def _engine_fixture(self, **options):
+        eng = testing_engine("sqlite://", options=options)
+        metadata.create_all(eng)
+        eng.execute(
+            users.insert(),
+            [
+                {"user_id": 1, "user_name": "u1"},
+                {"user_id": 2, "user_name": "u2"},
+                {"user_id": 3, "user_name": "u3"},
+            ],
+        )
+        eng.clear_compiled_cache()
+        return eng
+
+    def _compile_fixture(self, eng):
+        return patch.object(
+            eng.dialect,
+            "statement_compiler",
+            Mock(side_effect=eng.dialect.statement_compiler),
+        )
+
+    def test_same_structure_compiled_once(self):
+        eng = self._engine_fixture()
+
+        with self._compile_fixture(eng) as compile_mock:
+            with eng.connect() as conn:
+                for i in range(1, 4):
+                    stmt = select([users.c.user_name]).where(
+                        users.c.user_id == i
+                    )
+                    eq_(conn.execute(stmt).scalar(), "u%d" % i)
+
+        eq_(compile_mock.call_count, 1)
+        eq_(len(eng._compiled_cache), 1)
+
+    def test_result_targets_invoked_columns(self):
+        eng = self._engine_fixture()
+
+        with eng.connect() as conn:
+            for i in range(1, 4):
+                ua = users.alias()
+                label = (ua.c.user_id * 10).label(None)
+                stmt = select([ua.c.user_name, label]).where(
+                    ua.c.user_id == i
+                )
+                row = conn.execute(stmt).first()
+                eq_(row[ua.c.user_name], "u%d" % i)
+                eq_(row[label], i * 10)
+
+        eq_(len(eng._compiled_cache), 1)
+
+    def test_textual_columns(self):
+        eng = self._engine_fixture()
+
+        with eng.connect() as conn:
+            for i in range(1, 4):
+                stmt = select([text("user_name")]).where(users.c.user_id == i)
+                eq_(conn.execute(stmt).scalar(), "u%d" % i)
+
+        eq_(len(eng._compiled_cache), 1)
+
+    def test_literal_values_not_cached(self):
+        eng = self._engine_fixture()
+
+        with eng.connect() as conn:
+            conn.execute(users.insert().values(user_id=4, user_name="u4"))
+            conn.execute(users.insert().values(user_id=5, user_name="u5"))
+            eq_(len(eng._compiled_cache), 0)
+
+            eq_(
+                conn.execute(
+                    select([users.c.user_name]).where(users.c.user_id > 3)
+                ).fetchall(),
+                [("u4",), ("u5",)],
+            )
+
+    def test_column_keys_in_key(self):
+        eng = self._engine_fixture()
+
+        with eng.connect() as conn:
+            conn.execute(users.insert(), {"user_id": 4, "user_name": "u4"})
+            conn.execute(users.insert(), {"user_id": 5})
+            eq_(len(eng._compiled_cache), 2)
+
+            eq_(
+                conn.execute(
+                    select([users.c.user_name]).where(users.c.user_id > 3)
+                ).fetchall(),
+                [("u4",), (None,)],
+            )
+
+    def test_explicit_compiled_cache_takes_precedence(self):
+        eng = self._engine_fixture()
+        cache = {}
+
+        with eng.connect().execution_options(compiled_cache=cache) as conn:
+            conn.execute(select([users.c.user_name]))
+
+        eq_(len(cache), 1)
+        eq_(len(eng._compiled_cache), 0)
+
+    def test_option_engine_shares_cache(self):
+        eng = self._engine_fixture()
+        opt_eng = eng.execution_options(foo="bar")
+
+        is_(opt_eng._compiled_cache, eng._compiled_cache)
+        opt_eng.execute(select([users.c.user_name]))
+        eq_(len(eng._compiled_cache), 1)
+
+    def test_clear_compiled_cache(self):
+        eng = self._engine_fixture()
+        eng.execute(select([users.c.user_name]))
+        eq_(len(eng._compiled_cache), 1)
+
+        eng.clear_compiled_cache()
+        eq_(len(eng._compiled_cache), 0)
+
+    def test_cache_disabled(self):
+        eng = self._engine_fixture(query_cache_size=0)
+        is_(eng._compiled_cache, None)
+
+        with self._compile_fixture(eng) as compile_mock:
+            for i in range(2):
+                eng.execute(select([users.c.user_name]))
+        eq_(compile_mock.call_count, 2)
+
+
 class MockStrategyTest(fixtures.TestBase):
     def _engine_fixture(self):
         buf = util.StringIO()
@@ -23,6 +23,7 @@ from sqlalchemy.testing.mock import Mock
 from sqlalchemy.testing.mock import patch
 from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.testing.util import lazy_gc
+from sqlalchemy.util import queue as sqla_queue
 
 
 join_timeout = 10
@@ -672,6 +673,182 @@ class PoolEventsTest(PoolTestBase):
         pool.Pool.dispatch._clear()
 
 
+class PoolMetricsTest(PoolTestBase):
+    def test_checkout_checkin(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0)
+        metrics = p.metrics
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(metrics.checkouts, 2)
+        eq_(metrics.checkins, 0)
+        eq_(metrics.connects, 2)
+        eq_(metrics.checked_out_high_water, 2)
+
+        c1.close()
+        c1 = p.connect()
+        eq_(metrics.checkouts, 3)
+        eq_(metrics.checkins, 1)
+        eq_(metrics.connects, 2)
+        eq_(metrics.checked_out_high_water, 2)
+
+        c1.close()
+        c2.close()
+        eq_(metrics.checkins, 3)
+        eq_(metrics.time_held.count, 3)
+        eq_(sum(metrics.time_held.counts), 3)
+
+    def test_detach_counts_checkin(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0)
+        metrics = p.metrics
+
+        for i in range(5):
+            c1 = p.connect()
+            c1.detach()
+            c1.close()
+        c1 = p.connect()
+
+        eq_(metrics.checkouts, 6)
+        eq_(metrics.checkins, 5)
+        eq_(metrics.checked_out, 1)
+        eq_(metrics.checked_out_high_water, 1)
+        c1.close()
+        eq_(metrics.checked_out, 0)
+
+    def test_reset_while_checked_out(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0)
+        metrics = p.metrics
+
+        conns = [p.connect() for i in range(2)]
+        metrics.reset()
+        eq_(metrics.checkouts, 0)
+        eq_(metrics.checked_out, 2)
+        eq_(metrics.checked_out_high_water, 2)
+
+        conns.append(p.connect())
+        eq_(metrics.checked_out_high_water, 3)
+
+        for c in conns:
+            c.close()
+        eq_(metrics.checkins, 3)
+        eq_(metrics.checked_out, 0)
+
+        metrics.reset()
+        eq_(metrics.checked_out_high_water, 0)
+        conns = [p.connect() for i in range(3)]
+        eq_(metrics.checked_out_high_water, 3)
+        for c in conns:
+            c.close()
+
+    def test_overflow_high_water(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=5)
+        metrics = p.metrics
+
+        conns = [p.connect() for i in range(3)]
+        eq_(metrics.overflow_high_water, 2)
+        eq_(metrics.checked_out_high_water, 3)
+
+        for c in conns:
+            c.close()
+        conns = [p.connect() for i in range(2)]
+        eq_(metrics.overflow_high_water, 2)
+        eq_(metrics.checked_out_high_water, 3)
+
+    def test_invalidations(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        metrics = p.metrics
+
+        c1 = p.connect()
+        c1.invalidate(soft=True)
+        c1.close()
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+
+        eq_(metrics.invalidations, 1)
+        eq_(metrics.soft_invalidations, 1)
+        eq_(metrics.connects, 2)
+        eq_(metrics.checkins, 2)
+
+    def test_pre_ping_failures(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, pre_ping=True)
+        p._dialect = Mock(do_ping=Mock(side_effect=[True, False, True]))
+
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        c1.close()
+
+        eq_(p.metrics.pre_ping_failures, 1)
+        eq_(p.metrics.invalidations, 1)
+        eq_(p.metrics.checkouts, 2)
+
+    def test_wait_and_timeout(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=0.2)
+        metrics = p.metrics
+
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+
+        eq_(metrics.timeouts, 1)
+        eq_(metrics.checkouts, 1)
+        eq_(metrics.wait_time.count, 1)
+        assert metrics.wait_time.total >= 0.15
+
+        # waits longer than 0.1 and up to 0.5 seconds
+        eq_(metrics.wait_time.counts[5], 1)
+        c1.close()
+
+    def test_as_dict_reset(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        metrics = p.metrics
+
+        c1 = p.connect()
+        c1.close()
+        metrics.time_held.reset()
+        metrics.time_held.add(0.0005)
+        metrics.time_held.add(4000)
+
+        d = metrics.as_dict()
+        eq_(d["checkouts"], 1)
+        eq_(d["checkins"], 1)
+        eq_(d["checked_out"], 0)
+        eq_(d["timeouts"], 0)
+        eq_(d["time_held"]["count"], 2)
+        eq_(
+            d["time_held"]["buckets"],
+            [
+                (0.001, 1),
+                (0.01, 0),
+                (0.1, 0),
+                (1, 0),
+                (10, 0),
+                (60, 0),
+                (600, 0),
+                (3600, 0),
+                (float("inf"), 1),
+            ],
+        )
+        eq_(d["wait_time"]["count"], 0)
+        eq_(d["wait_time"]["sum"], 0)
+
+        metrics.reset()
+        d = metrics.as_dict()
+        eq_(d["checkouts"], 0)
+        eq_(d["time_held"]["count"], 0)
+        eq_(d["time_held"]["sum"], 0)
+        eq_(sum(count for bound, count in d["time_held"]["buckets"]), 0)
+
+    def test_recreate(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        c1 = p.connect()
+        c1.close()
+
+        p2 = p.recreate()
+        is_not_(p2.metrics, p.metrics)
+        eq_(p2.metrics.checkouts, 0)
+
+
 class PoolFirstConnectSyncTest(PoolTestBase):
     # test [ticket:2964]
 
@@ -1633,6 +1810,342 @@ class QueuePoolTest(PoolTestBase):
         pc3.close()
         pc1.close()
 
+    def _wait_for_waiters(self, p, num):
+        for i in range(500):
+            if len(p._pool.waiters) >= num:
+                return
+            time.sleep(0.01)
+        assert False, "threads did not begin waiting"
+
+    def _waiting_checkouts(self, p, num):
+        order = []
+
+        def checkout(idx):
+            c = p.connect()
+            order.append(idx)
+            time.sleep(0.01)
+            c.close()
+
+        threads = []
+        for idx in range(num):
+            th = threading.Thread(target=checkout, args=(idx,))
+            th.start()
+            threads.append(th)
+            # each thread begins waiting in turn
+            self._wait_for_waiters(p, idx + 1)
+        return threads, order
+
+    @testing.requires.threading_with_mock
+    def test_fair_waiter_order(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=10, fair=True
+        )
+        c1 = p.connect()
+        threads, order = self._waiting_checkouts(p, 5)
+
+        c1.close()
+        for th in threads:
+            th.join(join_timeout)
+        eq_(order, [0, 1, 2, 3, 4])
+        eq_(p.checkedout(), 0)
+
+    @testing.requires.threading_with_mock
+    def test_fair_no_barging(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=10, fair=True
+        )
+        c1 = p.connect()
+        threads, order = self._waiting_checkouts(p, 1)
+
+        # the returned connection is handed to the waiting thread,
+        # and is not available for another checkout
+        with p._pool.mutex:
+            c1.close()
+            assert_raises(sqla_queue.Empty, p._pool.get, False)
+
+        for th in threads:
+            th.join(join_timeout)
+        eq_(order, [0])
+
+    @testing.requires.threading_with_mock
+    def test_unfair_barging(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=10)
+        c1 = p.connect()
+        rec = c1._connection_record
+        threads, order = self._waiting_checkouts(p, 1)
+
+        # the waiting thread is woken, however the connection may
+        # be taken first by another checkout
+        with p._pool.mutex:
+            c1.close()
+            is_(p._pool.get(False), rec)
+
+        # the waiting thread continues to wait
+        self._wait_for_waiters(p, 1)
+        eq_(order, [])
+
+        p._pool.put(rec)
+        for th in threads:
+            th.join(join_timeout)
+        eq_(order, [0])
+
+    @testing.requires.threading_with_mock
+    def test_checkout_wait_event(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=1)
+        canary = Mock()
+        event.listen(p, "checkout_wait", canary)
+
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.close()
+        c1 = p.connect()
+        eq_(canary.mock_calls, [])
+
+        timer = threading.Timer(0.2, c1.close)
+        timer.start()
+        c2 = p.connect()
+        timer.join(join_timeout)
+
+        eq_(canary.mock_calls, [call(rec, ANY)])
+        assert canary.mock_calls[0][1][1] >= 0.15
+
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(canary.mock_calls[1], call(None, ANY))
+        assert canary.mock_calls[1][1][1] >= 0.9
+        c2.close()
+
+    def test_recreate_preserves_queue_options(self):
+        p = self._queuepool_fixture(use_lifo=True, fair=True)
+        p2 = p.recreate()
+        is_(p2._pool.use_lifo, True)
+        is_(p2._pool.fair, True)
+
+
+class PoolMaintenanceTest(PoolTestBase):
+    def _wait_for(self, fn):
+        for i in range(500):
+            if fn():
+                return
+            time.sleep(0.01)
+        assert False, "condition not reached"
+
+    def _idle_records(self, p):
+        return list(p._pool.queue)
+
+    def test_no_worker_before_connect(self):
+        dbapi, p = self._queuepool_dbapi_fixture(maintenance_interval=0.01)
+        time.sleep(0.05)
+        is_(p._maintenance, None)
+        eq_(dbapi.connect.call_count, 0)
+
+    @testing.requires.threading_with_mock
+    def test_prewarm_on_first_connect(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, maintenance_interval=1000
+        )
+        canary = Mock()
+        event.listen(p, "first_connect", canary.first_connect)
+        event.listen(p, "connect", canary.connect)
+
+        c1 = p.connect()
+        self._wait_for(lambda: p.checkedin() == 2)
+        eq_(dbapi.connect.call_count, 3)
+        eq_(canary.first_connect.call_count, 1)
+        eq_(canary.connect.call_count, 3)
+
+        c2 = p.connect()
+        c3 = p.connect()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.overflow(), 0)
+
+        c1.close()
+        c2.close()
+        c3.close()
+        p.dispose()
+
+    @testing.requires.threading_with_mock
+    def test_dispose_stops_worker(self):
+        p = self._queuepool_fixture(pool_size=2, maintenance_interval=0.01)
+        c1 = p.connect()
+        c1.close()
+
+        def workers():
+            return [
+                t
+                for t in threading.enumerate()
+                if t.name == "sqlalchemy pool maintenance"
+            ]
+
+        eq_(len(workers()), 1)
+        p.dispose()
+        is_(p._maintenance, None)
+        for t in workers():
+            t.join(join_timeout)
+        eq_(workers(), [])
+
+        p2 = p.recreate()
+        eq_(p2._maintenance_interval, 0.01)
+        is_(p2._maintenance, None)
+
+    def test_run_fills_pool(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=5, maintenance_interval=1000
+        )
+        p._run_maintenance()
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        is_(p._maintenance, None)
+
+    def test_run_recycles_ahead_of_time(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, recycle=10, maintenance_interval=5
+        )
+        p._run_maintenance()
+        r1, r2 = self._idle_records(p)
+        c1, c2 = r1.connection, r2.connection
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 2)
+
+        r2.starttime -= 6
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        is_(r1.connection, c1)
+        is_not_(r2.connection, c2)
+        assert c2.close.called
+        assert not c1.close.called
+        eq_(p.checkedin(), 2)
+
+    def test_run_replaces_invalidated(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, maintenance_interval=5
+        )
+        p._run_maintenance()
+        r1, r2 = self._idle_records(p)
+        c1, c2 = r1.connection, r2.connection
+
+        r1.starttime -= 1
+        r2.starttime -= 1
+        p._invalidate(None)
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 4)
+        assert c1.close.called
+        assert c2.close.called
+
+    def test_run_pings(self):
+        dialect = Mock(do_ping=Mock(side_effect=[True, True, True, False]))
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, maintenance_interval=5, dialect=dialect
+        )
+        p._run_maintenance()
+        r1, r2 = self._idle_records(p)
+        c1, c2 = r1.connection, r2.connection
+        eq_(dialect.do_ping.mock_calls, [call(c1), call(c2)])
+
+        p._run_maintenance()
+        eq_(dialect.do_ping.mock_calls, [call(c1), call(c2)] * 2)
+        is_(r1.connection, c1)
+        is_not_(r2.connection, c2)
+        eq_(dialect.do_close.mock_calls, [call(c2)])
+        eq_(p.metrics.invalidations, 1)
+        eq_(p.checkedin(), 2)
+
+    def test_run_ping_rolls_back(self):
+        dialect = Mock(do_ping=Mock(side_effect=[True, True, True, False]))
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, maintenance_interval=5, dialect=dialect
+        )
+        p._run_maintenance()
+        r1, r2 = self._idle_records(p)
+        c1, c2 = r1.connection, r2.connection
+        eq_(dialect.do_rollback.mock_calls, [call(c1), call(c2)])
+
+        p._run_maintenance()
+        eq_(dialect.do_rollback.mock_calls, [call(c1), call(c2), call(c1)])
+
+    def test_run_ping_error(self):
+        dialect = Mock(
+            do_ping=Mock(
+                side_effect=[True, True, Exception("ping failed"), True]
+            )
+        )
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, maintenance_interval=5, dialect=dialect
+        )
+        p._run_maintenance()
+        r1, r2 = self._idle_records(p)
+        c1, c2 = r1.connection, r2.connection
+
+        p._run_maintenance()
+        eq_(dialect.do_ping.mock_calls, [call(c1), call(c2)] * 2)
+        is_not_(r1.connection, c1)
+        is_(r2.connection, c2)
+        eq_(dialect.do_close.mock_calls, [call(c1)])
+        eq_(p.metrics.invalidations, 1)
+        eq_(p.checkedin(), 2)
+
+    def test_run_no_ping_without_dialect(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, maintenance_interval=5
+        )
+        p._run_maintenance()
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.metrics.invalidations, 0)
+
+    def test_run_skips_checked_out(self):
+        dialect = Mock(do_ping=Mock(return_value=True))
+        p = self._queuepool_fixture(
+            pool_size=2, maintenance_interval=5, dialect=dialect
+        )
+        p._run_maintenance()
+        rec = p._pool.get(False)
+        p._run_maintenance()
+        eq_(dialect.do_ping.call_count, 3)
+        assert call(rec.connection) not in dialect.do_ping.mock_calls[2:]
+        p._pool.put(rec)
+
+    def test_run_checks_each_once_fifo(self):
+        self._test_run_checks_each_once(False)
+
+    def test_run_checks_each_once_lifo(self):
+        self._test_run_checks_each_once(True)
+
+    def _test_run_checks_each_once(self, use_lifo):
+        dialect = Mock(do_ping=Mock(return_value=True))
+        p = self._queuepool_fixture(
+            pool_size=4,
+            maintenance_interval=5,
+            dialect=dialect,
+            use_lifo=use_lifo,
+        )
+        p._run_maintenance()
+        records = self._idle_records(p)
+        dialect.do_ping.reset_mock()
+
+        p._run_maintenance()
+        eq_(
+            sorted(id(c[1][0]) for c in dialect.do_ping.mock_calls),
+            sorted(id(rec.connection) for rec in records),
+        )
+        eq_(self._idle_records(p), records)
+
+    def test_run_connect_failure(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, maintenance_interval=5
+        )
+        dbapi.shutdown(True)
+        assert_raises_message(Exception, "connect failed", p._run_maintenance)
+        eq_(p.overflow(), -2)
+        eq_(p.checkedin(), 0)
+
+        dbapi.shutdown(False)
+        p._run_maintenance()
+        eq_(p.checkedin(), 2)
+
 
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
@@ -198,3 +198,110 @@ class CDistillArgsTest(_DistillArgsTest):
         from sqlalchemy import cutils as util
 
         cls.module = util
+
+
+class _MakeRowsTest(fixtures.TestBase):
+    def _make_rows(self, rows, processors, row_cls=None):
+        from sqlalchemy.engine.result import RowProxy
+
+        return self.make_rows(
+            row_cls or RowProxy,
+            None,
+            rows,
+            processors,
+            [None for p in processors],
+            {},
+        )
+
+    def test_no_processors(self):
+        raw = [(1, "a"), (2, "b")]
+        rows = self._make_rows(raw, [None, None])
+        eq_([tuple(row) for row in rows], raw)
+        assert rows[0]._row is raw[0]
+        eq_(rows[1]._processors, [None, None])
+
+    def test_processors(self):
+        rows = self._make_rows(
+            [[1, "a", 3], [2, None, 4]], [None, lambda v: v and v * 2, str]
+        )
+        eq_([row._row for row in rows], [(1, "aa", "3"), (2, None, "4")])
+        eq_([tuple(row) for row in rows], [(1, "aa", "3"), (2, None, "4")])
+
+    def test_processor_called_once(self):
+        canary = []
+
+        def processor(value):
+            canary.append(value)
+            return value + 1
+
+        rows = self._make_rows([(1,), (2,)], [processor])
+        eq_(canary, [1, 2])
+        eq_([list(rows[0]), list(rows[0]), list(rows[1])], [[2], [2], [3]])
+        eq_(canary, [1, 2])
+
+    def test_processor_raises(self):
+        def processor(value):
+            raise ValueError("bad value %s" % value)
+
+        assert_raises_message(
+            ValueError, "bad value 5", self._make_rows, [(5,)], [processor]
+        )
+
+    def test_row_cls_init(self):
+        from sqlalchemy.engine.result import RowProxy
+
+        class MyRow(RowProxy):
+            def __init__(self, parent, row, processors, keymap):
+                super(MyRow, self).__init__(
+                    parent, tuple(v * 10 for v in row), processors, keymap
+                )
+
+        rows = self._make_rows(
+            [(1, 2)], [None, lambda v: v + 1], row_cls=MyRow
+        )
+        eq_(rows[0]._row, (10, 30))
+
+    def test_empty(self):
+        eq_(self._make_rows([], [None]), [])
+
+
+class PyMakeRowsTest(_MakeRowsTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy.engine import result
+
+        cls.make_rows = staticmethod(result._py_make_rows)
+
+
+class CMakeRowsTest(_MakeRowsTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cresultproxy
+
+        cls.make_rows = staticmethod(cresultproxy.make_rows)
+
+    def test_cprocessors(self):
+        import datetime
+        import decimal
+        from sqlalchemy import cprocessors
+
+        rows = self._make_rows(
+            [("2019-03-05 10:15:00", 5, 1.5)],
+            [
+                cprocessors.str_to_datetime,
+                cprocessors.to_float,
+                cprocessors.DecimalResultProcessor(
+                    decimal.Decimal, "%.2f"
+                ).process,
+            ],
+        )
+        eq_(
+            rows[0]._row,
+            (
+                datetime.datetime(2019, 3, 5, 10, 15),
+                5.0,
+                decimal.Decimal("1.50"),
+            ),
+        )
@@ -1,7 +1,11 @@
+import os
+import shutil
+import tempfile
 import unicodedata
 
 import sqlalchemy as sa
 from sqlalchemy import DefaultClause
+from sqlalchemy import event
 from sqlalchemy import FetchedValue
 from sqlalchemy import ForeignKey
 from sqlalchemy import Index
@@ -13,9 +17,11 @@ from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.engine.reflection import FileReflectionCache
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import AssertsExecutionResults
 from sqlalchemy.testing import ComparesTables
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
@@ -2137,6 +2143,328 @@ class CaseSensitiveTest(fixtures.TablesTest):
         eq_(t2.name, "sOmEtAbLe")
 
 
+class MultiReflectionTest(
+    fixtures.RemovesEvents, fixtures.TablesTest, AssertsExecutionResults
+):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "multi_a",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(20), nullable=False),
+            test_needs_fk=True,
+        )
+        Table(
+            "multi_b",
+            metadata,
+            Column("id", Integer),
+            Column("id2", Integer),
+            Column("a_id", Integer, ForeignKey("multi_a.id")),
+            Column("data", String(20)),
+            sa.PrimaryKeyConstraint("id", "id2", name="pk_multi_b"),
+            UniqueConstraint("a_id", "id2", name="uq_multi_b"),
+            Index("ix_multi_b_data", "data"),
+            test_needs_fk=True,
+        )
+        for name in ("multi_c", "multi_d"):
+            Table(
+                name,
+                metadata,
+                Column("id", Integer, primary_key=True),
+                Column("a_id", Integer, ForeignKey("multi_a.id")),
+                test_needs_fk=True,
+            )
+
+    _multi_kinds = (
+        "columns",
+        "pk_constraint",
+        "foreign_keys",
+        "indexes",
+        "unique_constraints",
+        "check_constraints",
+        "table_comment",
+    )
+
+    def _compare(self, value):
+        if isinstance(value, list):
+            return [self._compare(elem) for elem in value]
+        elif isinstance(value, dict):
+            return dict((k, self._compare(v)) for k, v in value.items())
+        elif isinstance(value, sa.types.TypeEngine):
+            return repr(value)
+        else:
+            return value
+
+    def test_multi_matches_single(self):
+        names = ["multi_a", "multi_b"]
+        for kind in self._multi_kinds:
+            single = getattr(inspect(testing.db), "get_%s" % kind)
+            try:
+                expected = dict(((None, name), single(name)) for name in names)
+            except NotImplementedError:
+                continue
+
+            multi = getattr(inspect(testing.db), "get_multi_%s" % kind)
+            eq_(
+                self._compare(multi(filter_names=names)),
+                self._compare(expected),
+            )
+
+    def test_filter_names(self):
+        insp = inspect(testing.db)
+        eq_(
+            list(
+                insp.get_multi_columns(filter_names=["multi_a", "nonexistent"])
+            ),
+            [(None, "multi_a")],
+        )
+
+    def test_no_filter_names(self):
+        insp = inspect(testing.db)
+        result = insp.get_multi_pk_constraint()
+        eq_(result[(None, "multi_b")]["constrained_columns"], ["id", "id2"])
+        in_((None, "multi_a"), result)
+
+    @testing.only_on(["sqlite", "postgresql"])
+    def test_multi_primes_single(self):
+        insp = inspect(testing.db)
+        result = insp.get_multi_columns(filter_names=["multi_a", "multi_b"])
+
+        def go():
+            eq_(insp.get_columns("multi_b"), result[(None, "multi_b")])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    @testing.only_on(["sqlite", "postgresql"])
+    def test_metadata_reflect(self):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            statements.append(statement)
+
+        self.event_listen(
+            testing.db, "before_cursor_execute", before_cursor_execute
+        )
+
+        def go():
+            del statements[:]
+            m = MetaData()
+            m.reflect(
+                testing.db,
+                only=["multi_a", "multi_b", "multi_c", "multi_d"],
+            )
+            return m, len(statements)
+
+        with mock.patch.object(
+            testing.db.dialect, "supports_multi_reflection", False
+        ):
+            m1, single_count = go()
+
+        m2, multi_count = go()
+        assert multi_count < single_count, (multi_count, single_count)
+
+        for m in (m1, m2):
+            b = m.tables["multi_b"]
+            eq_([c.name for c in b.primary_key], ["id", "id2"])
+            eq_(b.primary_key.name, "pk_multi_b")
+            eq_(
+                [fk.target_fullname for fk in b.foreign_keys],
+                ["multi_a.id"],
+            )
+            eq_([idx.name for idx in b.indexes], ["ix_multi_b_data"])
+            is_false(m.tables["multi_a"].c.name.nullable)
+
+
+    @testing.only_on("sqlite")
+    def test_metadata_reflect_statements_fixed(self):
+        if not testing.db.dialect.supports_multi_reflection:
+            config.skip_test("SQLite 3.16 or greater required")
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            statements.append(statement)
+
+        self.event_listen(
+            testing.db, "before_cursor_execute", before_cursor_execute
+        )
+
+        counts = []
+        for only in (
+            ["multi_a", "multi_b"],
+            ["multi_a", "multi_b", "multi_c", "multi_d"],
+        ):
+            del statements[:]
+            MetaData().reflect(testing.db, only=only)
+            counts.append(len(statements))
+
+        # all kinds of information are batched; reflecting more tables
+        # emits no further statements
+        eq_(counts[0], counts[1])
+
+
+class ReflectionCacheTest(fixtures.TestBase):
+    __only_on__ = "sqlite"
+
+    def setup(self):
+        self.dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.dir, "reflection_cache.db")
+
+        m = MetaData()
+        Table(
+            "parent",
+            m,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(20), nullable=False),
+        )
+        Table(
+            "child",
+            m,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", Integer, ForeignKey("parent.id")),
+            Index("ix_child_parent_id", "parent_id"),
+        )
+        e = self._engine(None)
+        m.create_all(e)
+        e.dispose()
+
+    def teardown(self):
+        shutil.rmtree(self.dir)
+
+    def _engine(self, cache, url=None):
+        e = engines.testing_engine(
+            url or "sqlite:///%s" % self.db_path,
+            options={"reflection_cache": cache},
+        )
+        e.statements = statements = []
+
+        @event.listens_for(e, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            statements.append(statement)
+
+        return e
+
+    def _cache(self):
+        return FileReflectionCache(os.path.join(self.dir, "cache"))
+
+    def _catalog_statements(self, e):
+        return [
+            stmt
+            for stmt in e.statements
+            if "schema_version" not in stmt and "database_list" not in stmt
+        ]
+
+    def test_metadata_reflect_from_cache(self):
+        e1 = self._engine(self._cache())
+        m1 = MetaData()
+        m1.reflect(e1)
+        assert self._catalog_statements(e1)
+
+        e2 = self._engine(self._cache())
+        m2 = MetaData()
+        m2.reflect(e2)
+        eq_(self._catalog_statements(e2), [])
+
+        eq_(sorted(m2.tables), ["child", "parent"])
+        child = m2.tables["child"]
+        eq_([fk.target_fullname for fk in child.foreign_keys], ["parent.id"])
+        eq_([idx.name for idx in child.indexes], ["ix_child_parent_id"])
+        eq_(list(m2.tables["parent"].primary_key.columns.keys()), ["id"])
+        is_false(m2.tables["parent"].c.name.nullable)
+
+    def test_autoload_from_cache(self):
+        e1 = self._engine(self._cache())
+        Table("parent", MetaData(), autoload_with=e1)
+
+        e2 = self._engine(self._cache())
+        parent = Table("parent", MetaData(), autoload_with=e2)
+        eq_(self._catalog_statements(e2), [])
+        eq_(list(parent.c.keys()), ["id", "name"])
+
+    def test_schema_change_invalidates(self):
+        e1 = self._engine(self._cache())
+        Table("parent", MetaData(), autoload_with=e1)
+
+        e1.execute("ALTER TABLE parent ADD COLUMN data VARCHAR(20)")
+
+        e2 = self._engine(self._cache())
+        parent = Table("parent", MetaData(), autoload_with=e2)
+        assert self._catalog_statements(e2)
+        eq_(list(parent.c.keys()), ["id", "name", "data"])
+
+        e3 = self._engine(self._cache())
+        parent = Table("parent", MetaData(), autoload_with=e3)
+        eq_(self._catalog_statements(e3), [])
+        eq_(list(parent.c.keys()), ["id", "name", "data"])
+
+    def test_fingerprint_per_engine(self):
+        cache = self._cache()
+        e1 = self._engine(cache)
+        with mock.patch.object(
+            cache, "get", wraps=cache.get
+        ) as get, mock.patch.object(cache, "set", wraps=cache.set) as set_:
+            Table("parent", MetaData(), autoload_with=e1)
+            Table("child", MetaData(), autoload_with=e1)
+            Table("parent", MetaData(), autoload_with=e1)
+
+        # the fingerprint is queried and the cache is read once; it's
+        # written once for each table not already present
+        eq_(
+            [stmt for stmt in e1.statements if "schema_version" in stmt],
+            ["PRAGMA main.schema_version", "PRAGMA temp.schema_version"],
+        )
+        eq_(get.call_count, 1)
+        eq_(set_.call_count, 2)
+
+    def test_ddl_discards_engine_entry(self):
+        e1 = self._engine(self._cache())
+        Table("parent", MetaData(), autoload_with=e1)
+
+        m = MetaData()
+        Table("other", m, Column("id", Integer, primary_key=True))
+        m.create_all(e1)
+
+        other = Table("other", MetaData(), autoload_with=e1)
+        eq_(list(other.c.keys()), ["id"])
+
+        # stored under the new fingerprint
+        e2 = self._engine(self._cache())
+        Table("other", MetaData(), autoload_with=e2)
+        eq_(self._catalog_statements(e2), [])
+
+    def test_transaction_not_cached(self):
+        cache = self._cache()
+        e1 = self._engine(cache)
+        with mock.patch.object(cache, "get") as get, mock.patch.object(
+            cache, "set"
+        ) as set_:
+            with e1.connect() as conn:
+                trans = conn.begin()
+                conn.execute("ALTER TABLE parent ADD COLUMN data VARCHAR(20)")
+                parent = Table("parent", MetaData(), autoload_with=conn)
+                eq_(list(parent.c.keys()), ["id", "name", "data"])
+                trans.rollback()
+
+        eq_(get.mock_calls, [])
+        eq_(set_.mock_calls, [])
+
+    def test_memory_database_not_cached(self):
+        e = self._engine(self._cache(), url="sqlite://")
+        e.execute("CREATE TABLE t (x INTEGER)")
+        MetaData().reflect(e)
+        is_false(os.path.exists(os.path.join(self.dir, "cache")))
+
+    def test_fingerprint_mismatch(self):
+        cache = self._cache()
+        cache.set("sqlite:///foo.db", (1, 0), {"x": "y"})
+        eq_(cache.get("sqlite:///foo.db", (1, 0)), {"x": "y"})
+        eq_(cache.get("sqlite:///foo.db", (2, 0)), None)
+        eq_(cache.get("sqlite:///bar.db", (1, 0)), None)
+
+
 class ColumnEventsTest(fixtures.RemovesEvents, fixtures.TestBase):
     __backend__ = True
 
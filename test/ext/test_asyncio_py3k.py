@@ -0,0 +1,639 @@
+import asyncio
+import os
+
+from sqlalchemy import Column
+from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import testing
+from sqlalchemy.ext.asyncio import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncResult
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import run_sync
+from sqlalchemy.orm import clear_mappers
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import NullPool
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import asyncio_sqlite
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing import provision
+from sqlalchemy.testing.mock import Mock
+
+
+def async_test(fn):
+    """Run a coroutine test method in a new event loop, disposing of the
+    fixture's engine within the same loop."""
+
+    def run(self):
+        async def go():
+            try:
+                await fn(self)
+            finally:
+                await self.async_engine.dispose()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(go())
+        finally:
+            loop.close()
+
+    run.__name__ = fn.__name__
+    return run
+
+
+class AsyncFixture(fixtures.TestBase):
+    __requires__ = ("python3", "greenlet")
+
+    engine_kw = {}
+
+    def setup(self):
+        self.db_file = "async_%s.db" % provision.FOLLOWER_IDENT
+        self.async_engine = create_async_engine(
+            "sqlite:///%s" % self.db_file,
+            async_module=asyncio_sqlite,
+            **self.engine_kw
+        )
+
+        self.metadata = metadata = MetaData()
+        self.users = Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(30), nullable=False),
+        )
+        self.addresses = Table(
+            "addresses",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("user_id", ForeignKey("users.id"), nullable=False),
+            Column("email", String(50), nullable=False),
+        )
+
+    def teardown(self):
+        if os.path.exists(self.db_file):
+            os.remove(self.db_file)
+
+    async def _fixture_data(self, num_users=10):
+        async with self.async_engine.begin() as conn:
+            await conn.run_sync(self.metadata.create_all)
+            if not num_users:
+                return
+            await conn.execute(
+                self.users.insert(),
+                [
+                    {"id": i, "name": "user %d" % i}
+                    for i in range(1, num_users + 1)
+                ],
+            )
+            await conn.execute(
+                self.addresses.insert(),
+                [
+                    {"user_id": 1, "email": "a1@foo.com"},
+                    {"user_id": 1, "email": "a2@foo.com"},
+                    {"user_id": 2, "email": "a3@foo.com"},
+                ],
+            )
+
+
+class EngineTest(AsyncFixture):
+    def test_arguments(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "Exactly one of async_module or async_creator is required",
+            create_async_engine,
+            "sqlite://",
+        )
+
+    def test_default_pool(self):
+        is_true(isinstance(self.async_engine.pool, AsyncAdaptedQueuePool))
+
+    @async_test
+    async def test_connect_execute(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
+                select([self.users.c.name]).where(self.users.c.id == 2)
+            )
+            is_true(isinstance(result, AsyncResult))
+            eq_(result.keys(), ["name"])
+            eq_(await result.fetchall(), [("user 2",)])
+
+            eq_(
+                await conn.scalar(
+                    select([func.count()]).select_from(self.users)
+                ),
+                10,
+            )
+
+    @async_test
+    async def test_await_connection(self):
+        await self._fixture_data()
+
+        conn = await self.async_engine.connect()
+        is_true(conn.sync_connection is not None)
+        eq_(await conn.scalar(select([func.count(self.users.c.id)])), 10)
+        await conn.close()
+        is_true(conn.closed)
+
+    @async_test
+    async def test_async_creator(self):
+        m1 = Mock()
+
+        async def connect():
+            m1.connect()
+            return await asyncio_sqlite.connect(self.db_file)
+
+        engine = create_async_engine("sqlite://", async_creator=connect)
+        async with engine.connect() as conn:
+            eq_(await conn.scalar(select([1])), 1)
+        await engine.dispose()
+        eq_(m1.connect.call_count, 1)
+
+    @async_test
+    async def test_engine_begin_rollback(self):
+        await self._fixture_data()
+
+        class MyError(Exception):
+            pass
+
+        try:
+            async with self.async_engine.begin() as conn:
+                await conn.execute(self.users.delete())
+                raise MyError()
+        except MyError:
+            pass
+
+        async with self.async_engine.connect() as conn:
+            eq_(await conn.scalar(select([func.count(self.users.c.id)])), 10)
+
+    @async_test
+    async def test_transaction(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            trans = await conn.begin()
+            is_true(conn.in_transaction())
+            await conn.execute(self.users.delete())
+            await trans.rollback()
+            is_(conn.in_transaction(), False)
+
+            async with conn.begin():
+                await conn.execute(
+                    self.users.delete().where(self.users.c.id > 5)
+                )
+
+        async with self.async_engine.connect() as conn:
+            eq_(await conn.scalar(select([func.count(self.users.c.id)])), 5)
+
+    @async_test
+    async def test_begin_nested(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            async with conn.begin():
+                savepoint = await conn.begin_nested()
+                await conn.execute(self.users.delete())
+                await savepoint.rollback()
+
+                eq_(
+                    await conn.scalar(select([func.count(self.users.c.id)])),
+                    10,
+                )
+
+    @async_test
+    async def test_run_sync(self):
+        async with self.async_engine.connect() as conn:
+            await conn.run_sync(self.metadata.create_all)
+            eq_(
+                await conn.run_sync(
+                    lambda sync_conn: sync_conn.dialect.has_table(
+                        sync_conn, "users"
+                    )
+                ),
+                True,
+            )
+
+    @async_test
+    async def test_dbapi_error_wrapped(self):
+        async with self.async_engine.connect() as conn:
+            try:
+                await conn.execute("select * from nonexistent")
+            except exc.OperationalError as err:
+                is_true("no such table" in str(err))
+            else:
+                assert False, "Expected OperationalError"
+
+    @async_test
+    async def test_execution_options(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            c2 = conn.execution_options(foo="bar")
+            eq_(c2.sync_connection.get_execution_options(), {"foo": "bar"})
+            eq_(await c2.scalar(select([func.count(self.users.c.id)])), 10)
+
+    @async_test
+    async def test_sync_io_outside_of_facade(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            assert_raises_message(
+                exc.AwaitRequired,
+                r"await_only\(\) was called outside of an asyncio facade",
+                conn.sync_connection.execute,
+                select([self.users]),
+            )
+
+
+class ResultTest(AsyncFixture):
+    @async_test
+    async def test_fetch(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
+                select([self.users.c.id]).order_by(self.users.c.id)
+            )
+            eq_(await result.fetchone(), (1,))
+            eq_(await result.fetchmany(3), [(2,), (3,), (4,)])
+            eq_(
+                await result.fetchall(),
+                [(5,), (6,), (7,), (8,), (9,), (10,)],
+            )
+            eq_(await result.fetchone(), None)
+
+    @async_test
+    async def test_first_scalar(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
+                select([self.users.c.name]).order_by(self.users.c.id)
+            )
+            eq_(await result.scalar(), "user 1")
+            is_true(result.closed)
+
+            result = await conn.execute(
+                select([self.users]).where(self.users.c.id == 3)
+            )
+            eq_(await result.first(), (3, "user 3"))
+
+    @async_test
+    async def test_insert(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(self.users.insert(), name="new user")
+            eq_(result.inserted_primary_key, [11])
+
+            result = await conn.execute(
+                self.users.update().where(self.users.c.id > 8),
+                name="updated",
+            )
+            eq_(result.rowcount, 3)
+
+    @async_test
+    async def test_stream(self):
+        await self._fixture_data(num_users=250)
+
+        async with self.async_engine.connect() as conn:
+            result = await conn.stream(
+                select([self.users.c.id]).order_by(self.users.c.id)
+            )
+            result.arraysize = 40
+
+            first = await result.fetchmany(5)
+            eq_(first, [(i,) for i in range(1, 6)])
+
+            ids = [row.id async for row in result]
+            eq_(ids, list(range(6, 251)))
+
+    @async_test
+    async def test_iterate_with_buffered_rows(self):
+        await self._fixture_data()
+
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(
+                select([self.users.c.id]).order_by(self.users.c.id)
+            )
+            result.arraysize = 3
+            async for row in result:
+                eq_(row, (1,))
+                break
+
+            eq_(await result.fetchmany(2), [(2,), (3,)])
+            eq_(await result.fetchone(), (4,))
+            eq_(
+                await result.fetchall(),
+                [(i,) for i in range(5, 11)],
+            )
+
+
+class PoolTest(AsyncFixture):
+    engine_kw = {"pool_size": 2, "max_overflow": 1, "pool_timeout": 0.25}
+
+    @async_test
+    async def test_checkout_waits_on_event_loop(self):
+        conns = [await self.async_engine.connect() for i in range(3)]
+
+        async def connect_when_available():
+            async with self.async_engine.connect() as conn:
+                return await conn.scalar(select([1]))
+
+        waiter = asyncio.ensure_future(connect_when_available())
+        await asyncio.sleep(0.05)
+        is_(waiter.done(), False)
+
+        # the loop is not blocked by the waiting checkout
+        eq_(await conns[0].scalar(select([2])), 2)
+
+        await conns[0].close()
+        eq_(await waiter, 1)
+
+        for conn in conns[1:]:
+            await conn.close()
+
+    @async_test
+    async def test_checkout_timeout(self):
+        conns = [await self.async_engine.connect() for i in range(3)]
+
+        try:
+            await self.async_engine.connect()
+        except exc.TimeoutError as err:
+            is_true("QueuePool limit of size 2 overflow 1 reached" in str(err))
+        else:
+            assert False, "Expected TimeoutError"
+
+        for conn in conns:
+            await conn.close()
+
+        conn = await self.async_engine.connect()
+        await conn.close()
+
+    @async_test
+    async def test_concurrent_sessions(self):
+        await self._fixture_data()
+
+        # a new engine, so that the sessions also race to make the first
+        # connection; a timeout long enough that waiting for a permit never
+        # fails, however slow the run
+        engine = create_async_engine(
+            "sqlite:///%s" % self.db_file,
+            async_module=asyncio_sqlite,
+            pool_size=2,
+            max_overflow=1,
+            pool_timeout=30,
+        )
+        in_use = set()
+        counts = []
+
+        async def go(id_):
+            async with AsyncSession(engine) as session:
+                name = await session.scalar(
+                    select([self.users.c.name]).where(self.users.c.id == id_)
+                )
+
+                # the session holds its connection until closed
+                in_use.add(id_)
+                counts.append(len(in_use))
+                await asyncio.sleep(0)
+                in_use.discard(id_)
+                return name
+
+        try:
+            names = await asyncio.gather(*[go(i) for i in range(1, 11)])
+        finally:
+            await engine.dispose()
+
+        eq_(names, ["user %d" % i for i in range(1, 11)])
+        is_true(max(counts) <= 3)
+
+    @async_test
+    async def test_permit_released_on_gc(self):
+        conns = [await self.async_engine.connect() for i in range(3)]
+
+        # return the connection to the pool while the loop is running; only
+        # the permit is left to be released upon garbage collection
+        await run_sync(conns[0].sync_connection.close)
+        del conns[0]
+        testing.util.gc_collect()
+
+        # the released permit is returned via the event loop
+        conn = await self.async_engine.connect()
+        await conn.close()
+
+        for conn in conns:
+            await conn.close()
+
+
+class NullPoolTest(AsyncFixture):
+    engine_kw = {"poolclass": NullPool}
+
+    @async_test
+    async def test_no_permits(self):
+        await self._fixture_data()
+
+        conns = [await self.async_engine.connect() for i in range(5)]
+        for conn in conns:
+            eq_(await conn.scalar(select([func.count(self.users.c.id)])), 10)
+            await conn.close()
+
+
+class SessionTest(AsyncFixture):
+    def setup(self):
+        super(SessionTest, self).setup()
+
+        class User(fixtures.ComparableEntity):
+            pass
+
+        class Address(fixtures.ComparableEntity):
+            pass
+
+        mapper(
+            User,
+            self.users,
+            properties={
+                "addresses": relationship(
+                    Address, order_by=self.addresses.c.id
+                )
+            },
+        )
+        mapper(Address, self.addresses)
+        self.classes = User, Address
+
+    def teardown(self):
+        clear_mappers()
+        super(SessionTest, self).teardown()
+
+    @async_test
+    async def test_query(self):
+        await self._fixture_data()
+        User, Address = self.classes
+
+        async with AsyncSession(self.async_engine) as session:
+            users = (
+                await session.query(User)
+                .filter(User.id < 3)
+                .order_by(User.id)
+                .all()
+            )
+            eq_(users, [User(id=1, name="user 1"), User(id=2, name="user 2")])
+
+            eq_(await session.query(User).count(), 10)
+            eq_(
+                await session.query(User.name).filter_by(id=4).scalar(),
+                "user 4",
+            )
+
+            user = await session.get(User, 5)
+            eq_(user, User(name="user 5"))
+            is_(await session.get(User, 5), user)
+
+    @async_test
+    async def test_persist(self):
+        await self._fixture_data(num_users=0)
+        User, Address = self.classes
+
+        async with AsyncSession(self.async_engine) as session:
+            session.add(
+                User(
+                    id=1,
+                    name="ed",
+                    addresses=[Address(email="ed@foo.com")],
+                )
+            )
+            await session.commit()
+
+            user = await session.query(User).one()
+            user.name = "edward"
+            is_true(user in session.dirty)
+            await session.flush()
+            await session.rollback()
+
+            await session.refresh(user)
+            eq_(user.name, "ed")
+
+            address = await session.query(Address).one()
+            await session.delete(address)
+            await session.commit()
+
+        async with self.async_engine.connect() as conn:
+            eq_(await conn.scalar(select([self.users.c.name])), "ed")
+            eq_(
+                await conn.scalar(select([func.count(self.addresses.c.id)])),
+                0,
+            )
+
+    @async_test
+    async def test_lazyload_requires_run_sync(self):
+        await self._fixture_data()
+        User, Address = self.classes
+
+        async with AsyncSession(self.async_engine) as session:
+            user = await session.get(User, 1)
+
+            assert_raises_message(
+                exc.AwaitRequired,
+                r"await_only\(\) was called outside of an asyncio facade",
+                getattr,
+                user,
+                "addresses",
+            )
+
+            addresses = await session.run_sync(
+                lambda sync_session: user.addresses
+            )
+            eq_(
+                addresses,
+                [Address(email="a1@foo.com"), Address(email="a2@foo.com")],
+            )
+
+    @async_test
+    async def test_eager_load(self):
+        await self._fixture_data()
+        User, Address = self.classes
+
+        async with AsyncSession(self.async_engine) as session:
+            user = (
+                await session.query(User)
+                .options(selectinload(User.addresses))
+                .filter_by(id=2)
+                .one()
+            )
+            eq_(user.addresses, [Address(email="a3@foo.com")])
+
+    @async_test
+    async def test_stream(self):
+        await self._fixture_data(num_users=250)
+        User, Address = self.classes
+
+        async with AsyncSession(self.async_engine) as session:
+            names = [
+                user.name
+                async for user in session.query(User)
+                .order_by(User.id)
+                .yield_per(40)
+            ]
+            eq_(names, ["user %d" % i for i in range(1, 251)])
+
+    @async_test
+    async def test_union(self):
+        await self._fixture_data()
+        User, Address = self.classes
+
+        async with AsyncSession(self.async_engine) as session:
+            q1 = session.query(User.id).filter(User.id == 1)
+            q2 = session.query(User.id).filter(User.id == 2)
+            eq_(
+                sorted(await q1.union(q2).all()),
+                [(1,), (2,)],
+            )
+
+    @async_test
+    async def test_execute(self):
+        await self._fixture_data()
+
+        async with AsyncSession(self.async_engine) as session:
+            result = await session.execute(
+                select([self.users.c.id]).where(self.users.c.id < 3)
+            )
+            eq_(sorted(await result.fetchall()), [(1,), (2,)])
+
+    @async_test
+    async def test_bind_to_connection(self):
+        await self._fixture_data()
+        User, Address = self.classes
+
+        async with self.async_engine.connect() as conn:
+            trans = await conn.begin()
+            session = AsyncSession(conn)
+            session.add(User(id=11, name="new"))
+            await session.flush()
+            await session.close()
+            await trans.rollback()
+
+            eq_(await conn.scalar(select([func.count(self.users.c.id)])), 10)
+
+    @async_test
+    async def test_permit_released_after_commit(self):
+        await self._fixture_data()
+        User, Address = self.classes
+
+        session = AsyncSession(self.async_engine)
+        await session.get(User, 1)
+        is_true(session._release_permit is not None)
+        await session.commit()
+        is_(session._release_permit, None)
+        await session.close()
@@ -22,6 +22,8 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
 from sqlalchemy.types import TypeEngine
 
 
@@ -193,7 +195,6 @@ class UserDefinedTest(fixtures.TestBase, AssertsCompiledSQL):
 
         t1 = table("t1", column("c1"), column("c2"))
 
-        dispatch = Select._compiler_dispatch
         try:
 
             @compiles(Select)
@@ -204,9 +205,7 @@ class UserDefinedTest(fixtures.TestBase, AssertsCompiledSQL):
             self.assert_compile(s1, "OVERRIDE")
             self.assert_compile(s1._annotate({}), "OVERRIDE")
         finally:
-            Select._compiler_dispatch = dispatch
-            if hasattr(Select, "_compiler_dispatcher"):
-                del Select._compiler_dispatcher
+            deregister(Select)
 
     def test_dialect_specific(self):
         class AddThingy(DDLElement):
@@ -400,6 +399,21 @@ class DefaultOnExistingTest(fixtures.TestBase, AssertsCompiledSQL):
 
         self.assert_compile(s1, "OVERRIDE", dialect=sqlite.dialect())
 
+    def test_no_cache_key(self):
+        t1 = table("t1", column("c1"), column("c2"))
+        s1 = select([t1]).where(t1.c.c1 == 5)
+
+        is_not_(s1._generate_cache_key(), None)
+
+        @compiles(BindParameter)
+        def gen_bind(element, compiler, **kw):
+            return "BIND(%s)" % compiler.visit_bindparam(element, **kw)
+
+        is_(s1._generate_cache_key(), None)
+
+        deregister(BindParameter)
+        is_not_(s1._generate_cache_key(), None)
+
     def test_binds_in_select(self):
         t = table("t", column("a"), column("b"), column("c"))
 
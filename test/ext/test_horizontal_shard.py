@@ -1,9 +1,12 @@
 import datetime
 import os
+import threading
+import time
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import inspect
@@ -14,6 +17,7 @@ from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import util
+from sqlalchemy.ext.horizontal_shard import _ShardExecutor
 from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import create_session
@@ -25,8 +29,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.sql import operators
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import provision
 from sqlalchemy.testing.engines import testing_engine
 
@@ -505,6 +511,283 @@ class TableNameConventionShardTest(ShardTest, fixtures.TestBase):
         return db1, db2, db3, db4
 
 
+class ConcurrentShardTest(DistinctEngineShardTest):
+    """Run the shard tests with execute_concurrently=True."""
+
+    def _init_dbs(self):
+        # db1 makes use of SingletonThreadPool so that the id_generator
+        # shares the connection of the Session
+        self.dbs = [
+            testing_engine(
+                "sqlite:///shard%d_%s.db" % (i, provision.FOLLOWER_IDENT),
+                options=dict(
+                    connect_args={"check_same_thread": False},
+                    poolclass=SingletonThreadPool if i == 1 else None,
+                ),
+            )
+            for i in range(1, 5)
+        ]
+        return self.dbs
+
+    @classmethod
+    def setup_session(cls):
+        super(ConcurrentShardTest, cls).setup_session()
+        create_session.configure(execute_concurrently=True)
+
+    def test_shard_id_event(self):
+        canary = []
+
+        def load(instance, ctx):
+            canary.append(ctx.attributes["shard_id"])
+
+        event.listen(WeatherLocation, "load", load)
+        sess = self._fixture_data()
+
+        sess.query(WeatherLocation).all()
+
+        # shards are processed in the order in which they complete
+        eq_(
+            sorted(canary),
+            [
+                "asia",
+                "europe",
+                "europe",
+                "north_america",
+                "north_america",
+                "south_america",
+                "south_america",
+            ],
+        )
+
+    def test_worker_threads_reused(self):
+        self._fixture_data()
+        sess = create_session(max_workers=2)
+
+        threads = set()
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            threads.add(threading.current_thread())
+
+        for db in self.dbs:
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+
+        for i in range(3):
+            eq_(
+                set(loc.id for loc in sess.query(WeatherLocation)),
+                set(range(1, 8)),
+            )
+
+        # four shards, executed by at most two threads across all queries
+        assert len(threads) <= 2, threads
+        is_(sess._shard_executor, sess._shard_executor)
+        eq_(len(sess._shard_executor._threads), 2)
+
+    def test_unordered(self):
+        sess = self._fixture_data()
+
+        eq_(
+            set(loc.id for loc in sess.query(WeatherLocation)),
+            set(range(1, 8)),
+        )
+
+    def test_order_by_merge(self):
+        sess = self._fixture_data()
+
+        eq_(
+            [
+                loc.id
+                for loc in sess.query(WeatherLocation).order_by(
+                    WeatherLocation.id.desc()
+                )
+            ],
+            [7, 6, 5, 4, 3, 2, 1],
+        )
+
+    def test_order_by_merge_columns(self):
+        sess = self._fixture_data()
+
+        eq_(
+            sess.query(Report.temperature, WeatherLocation.id)
+            .join(WeatherLocation.reports)
+            .order_by(Report.temperature, WeatherLocation.id.desc())
+            .all(),
+            [(75.0, 2), (80.0, 1), (85.0, 7)],
+        )
+
+    def test_order_by_merge_nulls(self):
+        sess = self._fixture_data()
+
+        eq_(
+            sess.query(Report.temperature, WeatherLocation.id)
+            .outerjoin(WeatherLocation.reports)
+            .order_by(
+                Report.temperature.desc().nullsfirst(),
+                WeatherLocation.id.desc(),
+            )
+            .all(),
+            [
+                (None, 6),
+                (None, 5),
+                (None, 4),
+                (None, 3),
+                (85.0, 7),
+                (80.0, 1),
+                (75.0, 2),
+            ],
+        )
+
+    def test_order_by_nulls_not_merged(self):
+        sess = self._fixture_data()
+
+        # the placement of NULL varies by backend if not given; the rows
+        # are returned in shard order
+        eq_(
+            sess.query(Report.temperature, WeatherLocation.id)
+            .outerjoin(WeatherLocation.reports)
+            .order_by(Report.temperature.desc(), WeatherLocation.id)
+            .all(),
+            [
+                (75.0, 2),
+                (None, 3),
+                (80.0, 1),
+                (None, 4),
+                (None, 5),
+                (85.0, 7),
+                (None, 6),
+            ],
+        )
+
+    def test_order_by_strings_not_merged(self):
+        sess = self._fixture_data()
+
+        # the database may order strings according to a collation; the
+        # rows are returned in shard order
+        eq_(
+            sess.query(WeatherLocation.continent, WeatherLocation.city)
+            .order_by(WeatherLocation.continent, WeatherLocation.city.desc())
+            .all(),
+            [
+                ("North America", "Toronto"),
+                ("North America", "New York"),
+                ("Asia", "Tokyo"),
+                ("Europe", "London"),
+                ("Europe", "Dublin"),
+                ("South America", "Quito"),
+                ("South America", "Brasila"),
+            ],
+        )
+
+    def test_order_by_merge_shard_id(self):
+        canary = []
+
+        def load(instance, ctx):
+            canary.append((instance.id, ctx.attributes["shard_id"]))
+
+        event.listen(WeatherLocation, "load", load)
+        sess = self._fixture_data()
+
+        sess.query(WeatherLocation).order_by(WeatherLocation.id).all()
+        eq_(
+            canary,
+            [
+                (1, "asia"),
+                (2, "north_america"),
+                (3, "north_america"),
+                (4, "europe"),
+                (5, "europe"),
+                (6, "south_america"),
+                (7, "south_america"),
+            ],
+        )
+
+    def test_order_by_not_fetched(self):
+        sess = self._fixture_data()
+
+        # "city" is deferred, so the rows can't be merged; they are
+        # returned in shard order
+        eq_(
+            set(
+                loc.id
+                for loc in sess.query(WeatherLocation).order_by(
+                    WeatherLocation.city
+                )
+            ),
+            set(range(1, 8)),
+        )
+
+    def test_shard_error(self):
+        sess = self._fixture_data()
+
+        self.dbs[2].execute(weather_reports.delete())
+        self.dbs[2].execute("DROP TABLE weather_locations")
+
+        assert_raises_message(
+            exc.OperationalError,
+            "no such table",
+            sess.query(WeatherLocation).all,
+        )
+        sess.rollback()
+
+        eq_(
+            set(
+                loc.id
+                for loc in sess.query(WeatherLocation).filter(
+                    WeatherLocation.continent.in_(["Asia", "North America"])
+                )
+            ),
+            {1, 2, 3},
+        )
+
+
+class ShardExecutorTest(fixtures.TestBase):
+    def test_bounded(self):
+        executor = _ShardExecutor(2)
+        lock = threading.Lock()
+        running = []
+        max_running = []
+        done = util.queue.Queue()
+
+        def task(i):
+            with lock:
+                running.append(i)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(i)
+            done.put(i)
+
+        for i in range(10):
+            executor.submit(task, i)
+        eq_(sorted(done.get(timeout=5) for i in range(10)), list(range(10)))
+
+        assert max(max_running) <= 2, max_running
+        eq_(len(executor._threads), 2)
+
+        # the threads are reused for further tasks
+        threads = set(executor._threads)
+        for i in range(4):
+            executor.submit(task, i)
+        eq_(sorted(done.get(timeout=5) for i in range(4)), list(range(4)))
+        eq_(executor._threads, threads)
+
+    def test_idle_threads_exit(self):
+        executor = _ShardExecutor(3)
+        executor.idle_timeout = 0.05
+        done = util.queue.Queue()
+
+        for i in range(3):
+            executor.submit(done.put, i)
+        eq_(sorted(done.get(timeout=5) for i in range(3)), [0, 1, 2])
+
+        for thread in list(executor._threads):
+            thread.join(5)
+        eq_(executor._threads, set())
+
+        # new threads are started as needed
+        executor.submit(done.put, 3)
+        eq_(done.get(timeout=5), 3)
+
+
 class SelectinloadRegressionTest(fixtures.DeclarativeMappedTest):
     """test #4175
     """
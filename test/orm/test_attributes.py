@@ -1855,7 +1855,7 @@ class HistoryTest(fixtures.TestBase):
         self._commit_someattr(f)
 
         attributes.instance_state(f).dict.pop("someattr", None)
-        attributes.instance_state(f).expired_attributes.add("someattr")
+        attributes.instance_state(f).expired_attributes = set(["someattr"])
 
         f.someattr = None
         eq_(self._someattr_history(f), ([None], (), ()))
@@ -2212,6 +2212,8 @@ class HistoryTest(fixtures.TestBase):
         # populators.expire.append((self.key, True))
         # does in loading.py
         state.dict.pop("someattr", None)
+        if not state.expired_attributes:
+            state.expired_attributes = set()
         state.expired_attributes.add("someattr")
 
         def scalar_loader(state, toload):
@@ -25,6 +25,7 @@ from sqlalchemy.testing import is_
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import AllOf
 from sqlalchemy.testing.assertsql import CompiledSQL
+from sqlalchemy.testing.assertsql import Conditional
 from sqlalchemy.testing.assertsql import RegexSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -907,21 +908,37 @@ class OneToManyManyToOneTest(fixtures.MappedTest):
             testing.db,
             sess.flush,
             RegexSQL("^INSERT INTO person", {"data": "some data"}),
-            RegexSQL(
-                "^INSERT INTO ball",
-                lambda c: {"person_id": p.id, "data": "some data"},
-            ),
-            RegexSQL(
-                "^INSERT INTO ball",
-                lambda c: {"person_id": p.id, "data": "some data"},
-            ),
-            RegexSQL(
-                "^INSERT INTO ball",
-                lambda c: {"person_id": p.id, "data": "some data"},
-            ),
-            RegexSQL(
-                "^INSERT INTO ball",
-                lambda c: {"person_id": p.id, "data": "some data"},
+            Conditional(
+                testing.db.dialect.insert_executemany_returning,
+                [
+                    RegexSQL(
+                        "^INSERT INTO ball",
+                        lambda c: [
+                            {"person_id": p.id, "data": "some data"},
+                            {"person_id": p.id, "data": "some data"},
+                            {"person_id": p.id, "data": "some data"},
+                            {"person_id": p.id, "data": "some data"},
+                        ],
+                    )
+                ],
+                [
+                    RegexSQL(
+                        "^INSERT INTO ball",
+                        lambda c: {"person_id": p.id, "data": "some data"},
+                    ),
+                    RegexSQL(
+                        "^INSERT INTO ball",
+                        lambda c: {"person_id": p.id, "data": "some data"},
+                    ),
+                    RegexSQL(
+                        "^INSERT INTO ball",
+                        lambda c: {"person_id": p.id, "data": "some data"},
+                    ),
+                    RegexSQL(
+                        "^INSERT INTO ball",
+                        lambda c: {"person_id": p.id, "data": "some data"},
+                    ),
+                ],
             ),
             CompiledSQL(
                 "UPDATE person SET favorite_ball_id=:favorite_ball_id "
@@ -1051,25 +1068,42 @@ class OneToManyManyToOneTest(fixtures.MappedTest):
         self.assert_sql_execution(
             testing.db,
             sess.flush,
-            CompiledSQL(
-                "INSERT INTO ball (person_id, data) "
-                "VALUES (:person_id, :data)",
-                {"person_id": None, "data": "some data"},
-            ),
-            CompiledSQL(
-                "INSERT INTO ball (person_id, data) "
-                "VALUES (:person_id, :data)",
-                {"person_id": None, "data": "some data"},
-            ),
-            CompiledSQL(
-                "INSERT INTO ball (person_id, data) "
-                "VALUES (:person_id, :data)",
-                {"person_id": None, "data": "some data"},
-            ),
-            CompiledSQL(
-                "INSERT INTO ball (person_id, data) "
-                "VALUES (:person_id, :data)",
-                {"person_id": None, "data": "some data"},
+            Conditional(
+                testing.db.dialect.insert_executemany_returning,
+                [
+                    CompiledSQL(
+                        "INSERT INTO ball (person_id, data) "
+                        "VALUES (:person_id, :data)",
+                        [
+                            {"person_id": None, "data": "some data"},
+                            {"person_id": None, "data": "some data"},
+                            {"person_id": None, "data": "some data"},
+                            {"person_id": None, "data": "some data"},
+                        ],
+                    )
+                ],
+                [
+                    CompiledSQL(
+                        "INSERT INTO ball (person_id, data) "
+                        "VALUES (:person_id, :data)",
+                        {"person_id": None, "data": "some data"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO ball (person_id, data) "
+                        "VALUES (:person_id, :data)",
+                        {"person_id": None, "data": "some data"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO ball (person_id, data) "
+                        "VALUES (:person_id, :data)",
+                        {"person_id": None, "data": "some data"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO ball (person_id, data) "
+                        "VALUES (:person_id, :data)",
+                        {"person_id": None, "data": "some data"},
+                    ),
+                ],
             ),
             CompiledSQL(
                 "INSERT INTO person (favorite_ball_id, data) "
@@ -1760,7 +1794,7 @@ class PostUpdateOnUpdateTest(fixtures.DeclarativeMappedTest):
     def test_update_defaults_refresh_flush_event_no_postupdate(self):
         # run the same test as test_update_defaults_refresh_flush_event
         # but don't actually use any postupdate functionality
-        A, = self.classes("A")
+        (A,) = self.classes("A")
 
         canary = mock.Mock()
         event.listen(A, "refresh_flush", canary.refresh_flush)
@@ -1845,7 +1879,7 @@ class PostUpdateOnUpdateTest(fixtures.DeclarativeMappedTest):
         # run the same test as
         # test_update_defaults_dont_expire_on_delete_no_postupdate
         # but don't actually use any postupdate functionality
-        A, = self.classes("A")
+        (A,) = self.classes("A")
 
         canary = mock.Mock()
         event.listen(A, "refresh_flush", canary.refresh_flush)
@@ -29,10 +29,12 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
+from sqlalchemy.testing import pickleable
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.types import TypeDecorator
+from sqlalchemy.util import pickle
 from test.orm import _fixtures
 
 
@@ -1191,6 +1193,212 @@ class GetterStateTest(_fixtures.FixtureTest):
         )
 
 
+class BatchLazyTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _o2m_fixture(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    mapper(Address, addresses),
+                    lazy="batch",
+                    order_by=addresses.c.id,
+                )
+            },
+        )
+        return User, Address
+
+    def _m2o_fixture(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(
+            Address,
+            addresses,
+            properties={
+                "user": relationship(mapper(User, users), lazy="batch")
+            },
+        )
+        return User, Address
+
+    def test_o2m(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(
+                [len(u.addresses) for u in users],
+                [1, 3, 1, 0],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(users[1].addresses, [Address(id=2), Address(id=3), Address(id=4)])
+
+    def test_m2o(self):
+        User, Address = self._m2o_fixture()
+
+        sess = create_session()
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_([a.user.id for a in addresses], [7, 8, 8, 8, 9])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_m2o_identity_map(self):
+        User, Address = self._m2o_fixture()
+
+        sess = create_session()
+        u8 = sess.query(User).get(8)
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(addresses[1].user, u8)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        def go():
+            eq_([a.user.id for a in addresses], [7, 8, 8, 8, 9])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_m2m(self):
+        items, Item, keywords, Keyword, item_keywords = (
+            self.tables.items,
+            self.classes.Item,
+            self.tables.keywords,
+            self.classes.Keyword,
+            self.tables.item_keywords,
+        )
+
+        mapper(
+            Item,
+            items,
+            properties={
+                "keywords": relationship(
+                    mapper(Keyword, keywords),
+                    secondary=item_keywords,
+                    lazy="batch",
+                    order_by=keywords.c.id,
+                )
+            },
+        )
+
+        sess = create_session()
+        items = sess.query(Item).order_by(Item.id).all()
+
+        def go():
+            eq_(
+                [[k.id for k in item.keywords] for item in items],
+                [[2, 4, 6], [2, 5, 7], [3, 4, 6], [], []],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_batch_per_query(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        u7 = sess.query(User).get(7)
+        users = sess.query(User).filter(User.id.in_([8, 9])).all()
+
+        def go():
+            eq_(len(u7.addresses), 1)
+            eq_(sorted(len(u.addresses) for u in users), [1, 3])
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_sibling_not_in_session(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        u7, u8, u9, u10 = sess.query(User).order_by(User.id).all()
+        sess.expunge(u8)
+
+        def go():
+            eq_(len(u7.addresses), 1)
+            eq_(len(u9.addresses), 1)
+
+        self.assert_sql_count(testing.db, go, 1)
+        assert "addresses" not in u8.__dict__
+
+    def test_sibling_already_loaded(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        u7, u8, u9, u10 = sess.query(User).order_by(User.id).all()
+        u8.addresses = [Address(email_address="new")]
+
+        def go():
+            eq_(len(u7.addresses), 1)
+            eq_(len(u9.addresses), 1)
+
+        self.assert_sql_count(testing.db, go, 1)
+        eq_([a.email_address for a in u8.addresses], ["new"])
+
+    def test_lazyload_option(self):
+        User, Address = self._o2m_fixture()
+
+        sess = create_session()
+        users = (
+            sess.query(User)
+            .options(orm.lazyload(User.addresses))
+            .order_by(User.id)
+            .all()
+        )
+
+        def go():
+            eq_([len(u.addresses) for u in users], [1, 3, 1, 0])
+
+        self.assert_sql_count(testing.db, go, 4)
+
+    def test_pickled(self):
+        users, addresses = self.tables.users, self.tables.addresses
+
+        mapper(
+            pickleable.User,
+            users,
+            properties={
+                "addresses": relationship(
+                    mapper(pickleable.Address, addresses), lazy="batch"
+                )
+            },
+        )
+
+        sess = create_session()
+        users = sess.query(pickleable.User).order_by(pickleable.User.id).all()
+        u8 = pickle.loads(pickle.dumps(users[1]))
+
+        sess2 = create_session()
+        sess2.add(u8)
+
+        def go():
+            eq_(len(u8.addresses), 3)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_([len(u.addresses) for u in users], [1, 3, 1, 0])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+
 class M2OGetTest(_fixtures.FixtureTest):
     run_inserts = "once"
     run_deletes = None
@@ -1,12 +1,25 @@
 from sqlalchemy import exc
+from sqlalchemy import inspect
+from sqlalchemy import Integer
 from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import testing
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import defer
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
+from sqlalchemy.orm import mapper
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.schema import Column
+from sqlalchemy.testing.schema import Table
 from sqlalchemy.util import KeyedTuple
 from . import _fixtures
 
@@ -52,6 +65,214 @@ class InstancesTest(_fixtures.FixtureTest):
             q.from_statement(stmt).all,
         )
 
+    def test_quick_populator(self):
+        row = mock.Mock(_row=(5, "some name", "x"))
+        populate = loading._compile_quick_populator(
+            (("id", 0, None), ("name", 1, lambda value: value.upper()))
+        )
+        dict_ = {}
+        populate(row, dict_)
+        eq_(dict_, {"id": 5, "name": "SOME NAME"})
+
+    def test_quick_populator_cached(self):
+        User = self.classes.User
+        user_mapper = inspect(User)
+        s = Session()
+
+        user_mapper._quick_populator_cache.clear()
+        eq_(s.query(User).get(7).name, "jack")
+        eq_(len(user_mapper._quick_populator_cache), 1)
+        fn = list(user_mapper._quick_populator_cache.values())[0]
+
+        s.close()
+        eq_(
+            [u.name for u in s.query(User).order_by(User.id)],
+            ["jack", "ed", "fred", "chuck"],
+        )
+        eq_(list(user_mapper._quick_populator_cache.values()), [fn])
+
+        s.close()
+        eq_(s.query(User).options(defer(User.name)).get(7).id, 7)
+        eq_(len(user_mapper._quick_populator_cache), 2)
+
+
+class ReadonlyEntitiesTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _query(self, *entities):
+        return (
+            Session()
+            .query(*entities)
+            .execution_options(readonly_entities=True)
+        )
+
+    def test_basic(self):
+        User = self.classes.User
+
+        q = self._query(User).order_by(User.id)
+        users = q.all()
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        for u in users:
+            assert isinstance(u, User)
+            is_(inspect(u, raiseerr=False), None)
+        eq_(len(q.session.identity_map), 0)
+
+    def test_not_loaded_attributes(self):
+        User = self.classes.User
+
+        u1 = self._query(User).filter_by(id=7).one()
+        assert_raises(AttributeError, getattr, u1, "addresses")
+        assert_raises(AttributeError, setattr, u1, "name", "ed")
+        eq_(u1.name, "jack")
+
+    def test_not_from_identity_map(self):
+        User = self.classes.User
+
+        s = Session()
+        u1 = s.query(User).get(7)
+        u1.name = "modified"
+
+        u2 = (
+            s.query(User)
+            .execution_options(readonly_entities=True)
+            .filter_by(id=7)
+            .one()
+        )
+        is_not_(u1, u2)
+        eq_(u2.name, "modified")
+        eq_(len(s.identity_map), 1)
+
+        u3 = (
+            s.query(User)
+            .execution_options(readonly_entities=True)
+            .filter_by(id=7)
+            .one()
+        )
+        is_not_(u2, u3)
+
+    def test_eager_loaders_ignored(self):
+        User = self.classes.User
+
+        q = (
+            self._query(User)
+            .options(joinedload(User.addresses), subqueryload(User.orders))
+            .order_by(User.id)
+        )
+
+        def go():
+            eq_([u.id for u in q], [7, 8, 9, 10])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_multiple_entities(self):
+        User, Address = self.classes("User", "Address")
+
+        q = (
+            self._query(User, Address)
+            .outerjoin(User.addresses)
+            .order_by(User.id, Address.id)
+        )
+        eq_(
+            [(u.id, a.email_address if a is not None else None) for u, a in q],
+            [
+                (7, "jack@bean.com"),
+                (8, "ed@wood.com"),
+                (8, "ed@bettyboop.com"),
+                (8, "ed@lala.com"),
+                (9, "fred@fred.com"),
+                (10, None),
+            ],
+        )
+
+    def test_aliased(self):
+        User = self.classes.User
+
+        ua = aliased(User)
+        q = self._query(ua).filter(ua.id.in_([8, 9])).order_by(ua.id)
+        eq_([(u.id, u.name) for u in q], [(8, "ed"), (9, "fred")])
+
+    def test_cached_query_option(self):
+        User = self.classes.User
+
+        s = Session()
+        for i in range(3):
+            u1 = s.query(User).filter_by(id=8).one()
+            u2 = (
+                s.query(User)
+                .execution_options(readonly_entities=True)
+                .filter_by(id=8)
+                .one()
+            )
+            is_not_(inspect(u1, raiseerr=False), None)
+            is_(inspect(u2, raiseerr=False), None)
+
+
+class ReadonlyPolymorphicTest(fixtures.MappedTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "people",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50)),
+            Column("type", String(20)),
+            Column("language", String(50)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Person(cls.Comparable):
+            pass
+
+        class Engineer(Person):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Person, Engineer = cls.classes("Person", "Engineer")
+
+        mapper(
+            Person,
+            cls.tables.people,
+            polymorphic_on=cls.tables.people.c.type,
+            polymorphic_identity="person",
+        )
+        mapper(Engineer, inherits=Person, polymorphic_identity="engineer")
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.people.insert().execute(
+            dict(id=1, name="p1", type="person", language=None),
+            dict(id=2, name="e1", type="engineer", language="python"),
+        )
+
+    def test_polymorphic(self):
+        Person, Engineer = self.classes("Person", "Engineer")
+
+        p1, e1 = (
+            Session()
+            .query(Person)
+            .execution_options(readonly_entities=True)
+            .order_by(Person.id)
+            .all()
+        )
+        eq_(type(p1), Person)
+        eq_(type(e1), Engineer)
+        eq_((p1.name, e1.name, e1.language), ("p1", "e1", "python"))
+
 
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
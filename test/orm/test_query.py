@@ -10,6 +10,7 @@ from sqlalchemy import collate
 from sqlalchemy import column
 from sqlalchemy import desc
 from sqlalchemy import distinct
+from sqlalchemy import event
 from sqlalchemy import exc as sa_exc
 from sqlalchemy import exists
 from sqlalchemy import ForeignKey
@@ -40,12 +41,14 @@ from sqlalchemy.orm import create_session
 from sqlalchemy.orm import defer
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import lazyload
+from sqlalchemy.orm import loading
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import Query
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import subqueryload
 from sqlalchemy.orm import synonym
+from sqlalchemy.orm.interfaces import MapperOption
 from sqlalchemy.orm.util import join
 from sqlalchemy.orm.util import with_parent
 from sqlalchemy.sql import expression
@@ -60,6 +63,7 @@ from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.testing.assertions import eq_ignore_whitespace
 from sqlalchemy.testing.assertions import expect_warnings
+from sqlalchemy.testing.assertions import ne_
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -884,6 +888,155 @@ class GetTest(QueryTest):
         assert u.orders[1].items[2].description == "item 5"
 
 
+class GetManyTest(QueryTest):
+    def test_get_many(self):
+        User = self.classes.User
+
+        s = Session()
+
+        def go():
+            eq_(
+                s.query(User).get_many([8, 19, 7]),
+                [User(id=8, name="ed"), None, User(id=7, name="jack")],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_get_many_coerced_identity(self):
+        User = self.classes.User
+
+        s = Session()
+
+        # "8" comes back from the database as 8; the identities which
+        # weren't matched, "8" and 19, are then located individually
+        def go():
+            eq_(
+                s.query(User).get_many(["8", 19, 7]),
+                [User(id=8, name="ed"), None, User(id=7, name="jack")],
+            )
+
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_get_many_identity_map(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        result = []
+
+        def go():
+            result[:] = s.query(User).get_many([9, 7, 8, 7])
+            is_(result[1], u7)
+            is_(result[3], u7)
+            eq_(result, [User(id=9), u7, User(id=8), u7])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_(s.query(User).get_many([7, 8, 9]), [u7, result[2], result[0]])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_get_many_composite_pk(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        result = s.query(CompositePk).get_many(
+            [(1, 2), {"i": 2, "j": 1}, (100, 100)]
+        )
+        eq_(
+            [(o.i, o.j, o.k) if o is not None else None for o in result],
+            [(1, 2, 3), (2, 1, 4), None],
+        )
+
+    def test_get_many_expired(self):
+        User = self.classes.User
+
+        s = Session()
+        u7, u8 = s.query(User).get_many([7, 8])
+        s.expire_all()
+
+        def go():
+            eq_(s.query(User).get_many([7, 8]), [u7, u8])
+            eq_(u7.name, "jack")
+            eq_(u8.name, "ed")
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_get_many_expired_deleted(self):
+        User, users = self.classes.User, self.tables.users
+
+        s = Session()
+        u7, u8 = s.query(User).get_many([7, 8])
+        s.expire(u7)
+        s.execute(users.delete().where(users.c.id == 7))
+        try:
+            eq_(s.query(User).get_many([7, 8]), [None, u8])
+            assert u7 not in s
+            assert inspect(u7).deleted
+        finally:
+            s.rollback()
+
+    def test_get_many_chunks(self):
+        User = self.classes.User
+
+        load_on_pk_identities = loading.load_on_pk_identities
+
+        def load(query, primary_key_identities, **kw):
+            return load_on_pk_identities(
+                query, primary_key_identities, chunksize=2, **kw
+            )
+
+        s = Session()
+
+        def go():
+            eq_(
+                s.query(User).get_many([10, 7, 9, 8]),
+                [User(id=10), User(id=7), User(id=9), User(id=8)],
+            )
+
+        with mock.patch.object(loading, "load_on_pk_identities", load):
+            self.assert_sql_count(testing.db, go, 2)
+
+    def test_get_many_populate_existing(self):
+        User = self.classes.User
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        u7.name = "modified"
+
+        def go():
+            eq_(s.query(User).populate_existing().get_many([7]), [u7])
+
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(u7.name, "jack")
+
+    def test_get_many_too_few_params(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        q = s.query(CompositePk)
+        assert_raises(sa_exc.InvalidRequestError, q.get_many, [(1, 2), 7])
+
+    def test_get_many_against_col(self):
+        User = self.classes.User
+
+        s = Session()
+        q = s.query(User.id)
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"get_many\(\) can only be used against a single mapped class.",
+            q.get_many,
+            [5],
+        )
+
+    def test_session_get_many(self):
+        User = self.classes.User
+
+        s = Session()
+        eq_(s.get_many(User, [7, 8]), [User(id=7), User(id=8)])
+
+
 class InvalidGenerationsTest(QueryTest, AssertsCompiledSQL):
     def test_no_limit_offset(self):
         User = self.classes.User
@@ -3875,6 +4028,28 @@ class YieldTest(_fixtures.FixtureTest):
             {"stream_results": True, "foo": "bar", "max_row_buffer": 15},
         )
 
+    @testing.requires.server_side_cursors
+    def test_yield_per_streams(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+
+        sess = create_session()
+        contexts = []
+
+        def go(conn, cursor, statement, parameters, context, executemany):
+            contexts.append(context)
+
+        event.listen(testing.db, "after_cursor_execute", go)
+        try:
+            q = iter(sess.query(User).order_by(User.id).yield_per(2))
+            eq_(next(q).id, 7)
+            eq_(len(contexts), 1)
+            assert contexts[0]._is_server_side
+            eq_([u.id for u in q], [8, 9, 10])
+        finally:
+            event.remove(testing.db, "after_cursor_execute", go)
+
     def test_no_joinedload_opt(self):
         self._eagerload_mappings()
 
@@ -5643,3 +5818,159 @@ class QueryClsTest(QueryTest):
 
     def test_fn_m2o_lazyload(self):
         self._test_m2o_lazyload(self._fn_fixture)
+
+
+class QueryCacheTest(QueryTest):
+    def setup(self):
+        inspect(self.classes.User)._query_cache.clear()
+
+    @contextlib.contextmanager
+    def _compile_counter(self):
+        canary = mock.Mock()
+        real_compile_context = Query._compile_context
+
+        def _my_compile_context(*arg, **kw):
+            canary()
+            return real_compile_context(*arg, **kw)
+
+        with mock.patch.object(
+            Query, "_compile_context", _my_compile_context
+        ):
+            yield canary
+
+    def test_cache_key_same_structure(self):
+        User = self.classes.User
+
+        s = Session()
+
+        k1 = s.query(User).filter(User.name == "jack")._generate_cache_key()
+        k2 = s.query(User).filter(User.name == "ed")._generate_cache_key()
+        k3 = s.query(User).filter(User.id == 7)._generate_cache_key()
+
+        eq_(k1.key, k2.key)
+        ne_(k1.key, k3.key)
+        eq_([b.value for b in k1.bindparams], ["jack"])
+        eq_([b.value for b in k2.bindparams], ["ed"])
+
+    def test_cache_key_loader_options(self):
+        User = self.classes.User
+
+        s = Session()
+
+        k1 = s.query(User).options(joinedload(User.addresses))
+        k2 = s.query(User).options(joinedload(User.addresses))
+        k3 = s.query(User).options(subqueryload(User.addresses))
+        k4 = s.query(User)
+
+        eq_(k1._generate_cache_key().key, k2._generate_cache_key().key)
+        ne_(k1._generate_cache_key().key, k3._generate_cache_key().key)
+        ne_(k1._generate_cache_key().key, k4._generate_cache_key().key)
+
+    def test_cache_key_uncacheable(self):
+        User = self.classes.User
+
+        s = Session()
+
+        class MyOption(MapperOption):
+            pass
+
+        is_(s.query(User).options(MyOption())._generate_cache_key(), None)
+        is_(s.query(aliased(User))._generate_cache_key(), None)
+        is_(
+            s.query(User)
+            .from_self()
+            .filter(User.name == "jack")
+            ._generate_cache_key(),
+            None,
+        )
+
+    def test_compiled_once(self):
+        User = self.classes.User
+
+        s = Session()
+
+        with self._compile_counter() as canary:
+            for id_, name in [(7, "jack"), (8, "ed"), (9, "fred")]:
+                eq_(
+                    s.query(User.id).filter(User.name == name).all(), [(id_,)]
+                )
+                eq_(
+                    s.query(User)
+                    .filter(User.name == name)
+                    .order_by(User.id)
+                    .all(),
+                    [User(id=id_)],
+                )
+
+        eq_(canary.call_count, 2)
+
+    def test_params(self):
+        User = self.classes.User
+
+        s = Session()
+
+        with self._compile_counter() as canary:
+            for id_, name in [(7, "jack"), (8, "ed")]:
+                eq_(
+                    s.query(User)
+                    .filter(User.name == bindparam("name"))
+                    .params(name=name)
+                    .all(),
+                    [User(id=id_)],
+                )
+
+        eq_(canary.call_count, 1)
+
+    def test_subqueryload(self):
+        User, Address = self.classes("User", "Address")
+
+        s = Session()
+
+        with self._compile_counter() as canary:
+            for id_, addresses in [
+                (7, [Address(id=1)]),
+                (9, [Address(id=5)]),
+            ]:
+                eq_(
+                    s.query(User)
+                    .filter(User.id == id_)
+                    .options(subqueryload(User.addresses))
+                    .all(),
+                    [User(id=id_, addresses=addresses)],
+                )
+                s.close()
+
+        # the enclosing query and the subquery derived from it are
+        # compiled once; the subquery load query is compiled for each
+        # execution, as it refers to the enclosing query
+        eq_(canary.call_count, 4)
+
+    def test_before_compile_not_cached(self):
+        User = self.classes.User
+
+        s = Session()
+
+        @event.listens_for(Query, "before_compile", retval=True)
+        def before_compile(query):
+            return query
+
+        try:
+            with self._compile_counter() as canary:
+                s.query(User).filter(User.name == "jack").all()
+                s.query(User).filter(User.name == "ed").all()
+        finally:
+            event.remove(Query, "before_compile", before_compile)
+
+        eq_(canary.call_count, 2)
+
+    def test_enable_baked_queries_false(self):
+        User = self.classes.User
+
+        s = Session(enable_baked_queries=False)
+
+        with self._compile_counter() as canary:
+            s.query(User).filter(User.name == "jack").all()
+            s.query(User).filter(User.name == "ed").all()
+
+        eq_(canary.call_count, 2)
+        eq_(len(inspect(User)._query_cache), 0)
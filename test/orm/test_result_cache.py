@@ -0,0 +1,363 @@
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import testing
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import FromCache
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import MemoryResultCache
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not_
+from sqlalchemy.testing import mock
+from test.orm import _fixtures
+
+
+class FromCacheTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "each"
+    run_deletes = "each"
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _session(self, cache, **kw):
+        return Session(testing.db, result_cache=cache, **kw)
+
+    def test_cached_result(self):
+        User = self.classes.User
+        cache = MemoryResultCache()
+
+        def query(s):
+            return (
+                s.query(User)
+                .filter(User.id.in_([7, 8]))
+                .order_by(User.id)
+                .options(FromCache())
+            )
+
+        s1 = self._session(cache)
+        u7 = query(s1).first()
+        eq_(query(s1).all(), [User(id=7, name="jack"), User(id=8, name="ed")])
+
+        s2 = self._session(cache)
+
+        def go():
+            eq_(
+                query(s2).all(),
+                [User(id=7, name="jack"), User(id=8, name="ed")],
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        # objects are local to the Session
+        u7_2 = query(s2).first()
+        is_not_(u7, u7_2)
+        is_(u7_2, s2.query(User).get(7))
+
+    def test_cached_result_params(self):
+        User = self.classes.User
+        cache = MemoryResultCache()
+        s = self._session(cache)
+
+        def query(name):
+            return s.query(User).filter_by(name=name).options(FromCache())
+
+        eq_(query("jack").one().id, 7)
+        eq_(query("ed").one().id, 8)
+
+        def go():
+            eq_(query("jack").one().id, 7)
+            eq_(query("ed").one().id, 8)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_cached_result_columns(self):
+        User, Address = self.classes.User, self.classes.Address
+        cache = MemoryResultCache()
+
+        def query(s):
+            ua = aliased(User)
+            return (
+                s.query(ua, Address.email_address)
+                .join(ua.addresses)
+                .filter(ua.id == 9)
+                .options(FromCache())
+            )
+
+        eq_(
+            query(self._session(cache)).all(),
+            [(User(id=9), "fred@fred.com")],
+        )
+
+        s = self._session(cache, enable_baked_queries=False)
+
+        def go():
+            eq_(query(s).all(), [(User(id=9), "fred@fred.com")])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_joined_eager(self):
+        User, Address = self.classes.User, self.classes.Address
+        cache = MemoryResultCache()
+
+        def query(s):
+            return (
+                s.query(User)
+                .options(joinedload(User.addresses), FromCache())
+                .filter(User.id == 8)
+            )
+
+        query(self._session(cache)).one()
+
+        s = self._session(cache)
+
+        def go():
+            eq_(
+                query(s).one(),
+                User(
+                    id=8,
+                    addresses=[
+                        Address(id=2),
+                        Address(id=3),
+                        Address(id=4),
+                    ],
+                ),
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        # a change to the addresses table invalidates the result
+        s.query(Address).get(2).email_address = "new@ed.com"
+        s.commit()
+
+        u8 = query(self._session(cache)).one()
+        eq_(
+            [a.email_address for a in u8.addresses if a.id == 2],
+            ["new@ed.com"],
+        )
+
+    def test_subquery_eager(self):
+        User = self.classes.User
+        cache = MemoryResultCache()
+
+        def query(s):
+            return (
+                s.query(User)
+                .options(subqueryload(User.addresses), FromCache())
+                .filter(User.id == 8)
+            )
+
+        query(self._session(cache)).one()
+
+        s = self._session(cache)
+
+        def go():
+            eq_(len(query(s).one().addresses), 3)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_selectin_eager_not_cached(self):
+        User = self.classes.User
+        cache = MemoryResultCache()
+
+        def query(s):
+            return (
+                s.query(User)
+                .options(selectinload(User.addresses), FromCache())
+                .filter(User.id == 8)
+            )
+
+        query(self._session(cache)).one()
+
+        s = self._session(cache)
+
+        def go():
+            eq_(len(query(s).one().addresses), 3)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_flush_invalidates(self):
+        User = self.classes.User
+        cache = MemoryResultCache()
+
+        def query(s):
+            return s.query(User).filter(User.id == 7).options(FromCache())
+
+        query(self._session(cache)).one()
+
+        s1 = self._session(cache)
+        s1.query(User).get(7).name = "jack modified"
+        s1.flush()
+
+        # flushed in this transaction; the cache is bypassed
+        eq_(query(s1).one().name, "jack modified")
+        eq_(s1._result_cache_tables, set([self.tables.users]))
+
+        s1.commit()
+        eq_(s1._result_cache_tables, set())
+
+        eq_(query(self._session(cache)).one().name, "jack modified")
+
+    def test_rollback_resets(self):
+        User = self.classes.User
+        cache = MemoryResultCache()
+        s = self._session(cache)
+
+        s.query(User).get(7).name = "jack modified"
+        s.flush()
+        eq_(s._result_cache_tables, set([self.tables.users]))
+
+        s.rollback()
+        eq_(s._result_cache_tables, set())
+
+        q = s.query(User).filter(User.id == 7).options(FromCache())
+        eq_(q.one().name, "jack")
+
+        def go():
+            eq_(q.one().name, "jack")
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_ttl(self):
+        User = self.classes.User
+        cache = MemoryResultCache(ttl=10)
+        s = self._session(cache)
+
+        def go(ttl=None):
+            s.query(User).filter(User.id == 7).options(
+                FromCache(ttl=ttl)
+            ).one()
+
+        with mock.patch("sqlalchemy.orm.result_cache.time.time") as t:
+            t.return_value = 100
+            self.assert_sql_count(testing.db, go, 1)
+
+            t.return_value = 105
+            self.assert_sql_count(testing.db, go, 0)
+
+            t.return_value = 111
+            self.assert_sql_count(testing.db, go, 1)
+
+            t.return_value = 130
+            self.assert_sql_count(testing.db, lambda: go(ttl=1), 1)
+
+            t.return_value = 130.5
+            self.assert_sql_count(testing.db, lambda: go(ttl=1), 0)
+
+            t.return_value = 132
+            self.assert_sql_count(testing.db, lambda: go(ttl=1), 1)
+
+    def test_for_update_not_cached(self):
+        User = self.classes.User
+        cache = MemoryResultCache()
+        s = self._session(cache)
+
+        def go():
+            s.query(User).filter(User.id == 7).with_for_update().options(
+                FromCache()
+            ).one()
+
+        self.assert_sql_count(testing.db, go, 1)
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(len(cache._cache), 0)
+
+    def test_populate_existing(self):
+        User = self.classes.User
+        cache = MemoryResultCache()
+        s = self._session(cache)
+
+        def go(populate_existing=False):
+            q = s.query(User).filter(User.id == 7).options(FromCache())
+            if populate_existing:
+                q = q.populate_existing()
+            return q.one()
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        testing.db.execute(
+            self.tables.users.update()
+            .where(self.tables.users.c.id == 7)
+            .values(name="jack2")
+        )
+
+        # emitted and refreshes both the object and the cached result
+        u7 = []
+        self.assert_sql_count(
+            testing.db, lambda: u7.append(go(populate_existing=True)), 1
+        )
+        eq_(u7[0].name, "jack2")
+
+        s2 = self._session(cache)
+
+        def go():
+            eq_(
+                s2.query(User)
+                .filter(User.id == 7)
+                .options(FromCache())
+                .one()
+                .name,
+                "jack2",
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_no_result_cache(self):
+        User = self.classes.User
+        s = Session(testing.db)
+
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "The FromCache option requires that the Session be configured "
+            "with a result_cache",
+            s.query(User).options(FromCache()).all,
+        )
+
+
+class MemoryResultCacheTest(_fixtures.FixtureTest):
+    run_inserts = None
+    run_deletes = None
+
+    def test_size(self):
+        users = self.tables.users
+        cache = MemoryResultCache(size=10)
+        for i in range(30):
+            cache.set(i, i, frozenset([users]), cache.checkpoint())
+        assert len(cache._cache) <= 15
+        eq_(cache.get(29), 29)
+        eq_(cache.get(0), None)
+
+    def test_invalidate(self):
+        users, addresses = self.tables.users, self.tables.addresses
+        cache = MemoryResultCache()
+        cache.set("u", 1, frozenset([users]), cache.checkpoint())
+        cache.set("ua", 2, frozenset([users, addresses]), cache.checkpoint())
+
+        cache.invalidate([addresses])
+        eq_(cache.get("u"), 1)
+        eq_(cache.get("ua"), None)
+
+        cache.invalidate([users])
+        eq_(cache.get("u"), None)
+
+    def test_invalidate_during_fetch(self):
+        users = self.tables.users
+        cache = MemoryResultCache()
+
+        checkpoint = cache.checkpoint()
+        cache.invalidate([users])
+        cache.set("u", 1, frozenset([users]), checkpoint)
+        eq_(cache.get("u"), None)
+
+        cache.set("u", 1, frozenset([users]), cache.checkpoint())
+        eq_(cache.get("u"), 1)
+
+    def test_clear(self):
+        users = self.tables.users
+        cache = MemoryResultCache()
+        cache.set("u", 1, frozenset([users]), cache.checkpoint())
+        cache.clear()
+        eq_(cache.get("u"), None)
@@ -1,3 +1,5 @@
+import weakref
+
 import sqlalchemy as sa
 from sqlalchemy import event
 from sqlalchemy import ForeignKey
@@ -19,6 +21,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import was_deleted
+from sqlalchemy.orm.identity import LRUInstanceDict
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import assertions
@@ -1465,6 +1468,123 @@ class WeakIdentityMapTest(_fixtures.FixtureTest):
         assert not sess.identity_map.contains_state(u2._sa_instance_state)
 
 
+class LRUIdentityMapTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    @classmethod
+    def setup_mappers(cls):
+        users, User = cls.tables.users, cls.classes.User
+        mapper(User, users)
+
+    def _fixture(self, size):
+        User = self.classes.User
+
+        s = Session(identity_map_cls=lambda: LRUInstanceDict(size=size))
+        s.add_all([User(id=i, name="u%d" % i) for i in range(1, 21)])
+        s.commit()
+        s.close()
+        return s
+
+    def test_identity_map_cls(self):
+        s = self._fixture(5)
+        assert isinstance(s.identity_map, LRUInstanceDict)
+
+        s.close()
+        assert isinstance(s.identity_map, LRUInstanceDict)
+
+    def test_sessionmaker(self):
+        sm = sessionmaker(identity_map_cls=lambda: LRUInstanceDict(size=5))
+        assert isinstance(sm().identity_map, LRUInstanceDict)
+
+    @testing.requires.predictable_gc
+    def test_recent_retained(self):
+        User = self.classes.User
+        s = self._fixture(5)
+
+        u1 = s.query(User).get(1)
+        del u1
+        gc_collect()
+        assert (User, (1,), None) in s.identity_map
+
+        def go():
+            eq_(s.query(User).get(1).name, "u1")
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    @testing.requires.predictable_gc
+    def test_size_bounded(self):
+        User = self.classes.User
+        s = self._fixture(5)
+
+        users = s.query(User).order_by(User.id).all()
+        eq_(len(s.identity_map), 20)
+        del users
+        gc_collect()
+
+        # size plus the pruning threshold
+        assert len(s.identity_map) <= 7
+
+        # most recently loaded are retained
+        assert (User, (20,), None) in s.identity_map
+        assert (User, (1,), None) not in s.identity_map
+
+    @testing.requires.predictable_gc
+    def test_dirty_not_evicted(self):
+        User = self.classes.User
+        s = self._fixture(5)
+
+        u1 = s.query(User).get(1)
+        u1.name = "u1 modified"
+        del u1
+
+        with s.no_autoflush:
+            users = s.query(User).filter(User.id > 1).all()
+        del users
+        gc_collect()
+
+        assert (User, (1,), None) in s.identity_map
+        eq_(len(s.dirty), 1)
+        s.commit()
+        eq_(s.query(User.name).filter(User.id == 1).scalar(), "u1 modified")
+
+    @testing.requires.predictable_gc
+    def test_recent_access_retained(self):
+        User = self.classes.User
+        s = self._fixture(5)
+
+        u1 = s.query(User).get(1)
+        del u1
+
+        def go():
+            s.query(User).get(1)
+
+        for id_ in range(2, 21):
+            s.query(User).get(id_)
+            gc_collect()
+
+            # accessing the object marks it as recently used, so that it
+            # survives each eviction
+            self.assert_sql_count(testing.db, go, 0)
+
+        assert len(s.identity_map) <= 7
+
+    @testing.requires.predictable_gc
+    def test_expunge_releases(self):
+        User = self.classes.User
+        s = self._fixture(5)
+
+        u1 = s.query(User).get(1)
+        s.expunge(u1)
+        assert u1 not in s
+        eq_(len(s.identity_map._recent), 0)
+
+        ref = weakref.ref(u1)
+        del u1
+        gc_collect()
+        eq_(len(s.identity_map), 0)
+        is_(ref(), None)
+
+
 class IsModifiedTest(_fixtures.FixtureTest):
     run_inserts = None
 
@@ -1655,7 +1775,7 @@ class SessionInterface(fixtures.TestBase):
     def _public_session_methods(self):
         Session = sa.orm.session.Session
 
-        blacklist = set(("begin", "query"))
+        blacklist = set(("begin", "get_many", "query"))
 
         ok = set()
         for meth in Session.public_methods:
@@ -14,6 +14,7 @@ from sqlalchemy import text
 from sqlalchemy import util
 from sqlalchemy.orm import attributes
 from sqlalchemy.orm import backref
+from sqlalchemy.orm import class_mapper
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import mapper
@@ -27,10 +28,12 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.assertsql import AllOf
 from sqlalchemy.testing.assertsql import CompiledSQL
+from sqlalchemy.testing.assertsql import Conditional
 from sqlalchemy.testing.mock import Mock
 from sqlalchemy.testing.mock import patch
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
+from sqlalchemy.util import topological
 from test.orm import _fixtures
 
 
@@ -82,15 +85,30 @@ class RudimentaryFlushTest(UOWTest):
             CompiledSQL(
                 "INSERT INTO users (name) VALUES (:name)", {"name": "u1"}
             ),
-            CompiledSQL(
-                "INSERT INTO addresses (user_id, email_address) "
-                "VALUES (:user_id, :email_address)",
-                lambda ctx: {"email_address": "a1", "user_id": u1.id},
-            ),
-            CompiledSQL(
-                "INSERT INTO addresses (user_id, email_address) "
-                "VALUES (:user_id, :email_address)",
-                lambda ctx: {"email_address": "a2", "user_id": u1.id},
+            Conditional(
+                testing.db.dialect.insert_executemany_returning,
+                [
+                    CompiledSQL(
+                        "INSERT INTO addresses (user_id, email_address) "
+                        "VALUES (:user_id, :email_address)",
+                        lambda ctx: [
+                            {"email_address": "a1", "user_id": u1.id},
+                            {"email_address": "a2", "user_id": u1.id},
+                        ],
+                    )
+                ],
+                [
+                    CompiledSQL(
+                        "INSERT INTO addresses (user_id, email_address) "
+                        "VALUES (:user_id, :email_address)",
+                        lambda ctx: {"email_address": "a1", "user_id": u1.id},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO addresses (user_id, email_address) "
+                        "VALUES (:user_id, :email_address)",
+                        lambda ctx: {"email_address": "a2", "user_id": u1.id},
+                    ),
+                ],
             ),
         )
 
@@ -183,15 +201,30 @@ class RudimentaryFlushTest(UOWTest):
             CompiledSQL(
                 "INSERT INTO users (name) VALUES (:name)", {"name": "u1"}
             ),
-            CompiledSQL(
-                "INSERT INTO addresses (user_id, email_address) "
-                "VALUES (:user_id, :email_address)",
-                lambda ctx: {"email_address": "a1", "user_id": u1.id},
-            ),
-            CompiledSQL(
-                "INSERT INTO addresses (user_id, email_address) "
-                "VALUES (:user_id, :email_address)",
-                lambda ctx: {"email_address": "a2", "user_id": u1.id},
+            Conditional(
+                testing.db.dialect.insert_executemany_returning,
+                [
+                    CompiledSQL(
+                        "INSERT INTO addresses (user_id, email_address) "
+                        "VALUES (:user_id, :email_address)",
+                        lambda ctx: [
+                            {"email_address": "a1", "user_id": u1.id},
+                            {"email_address": "a2", "user_id": u1.id},
+                        ],
+                    )
+                ],
+                [
+                    CompiledSQL(
+                        "INSERT INTO addresses (user_id, email_address) "
+                        "VALUES (:user_id, :email_address)",
+                        lambda ctx: {"email_address": "a1", "user_id": u1.id},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO addresses (user_id, email_address) "
+                        "VALUES (:user_id, :email_address)",
+                        lambda ctx: {"email_address": "a2", "user_id": u1.id},
+                    ),
+                ],
             ),
         )
 
@@ -739,6 +772,96 @@ class RudimentaryFlushTest(UOWTest):
         self._assert_uow_size(sess, 6)
 
 
+class FlushPlanCacheTest(UOWTest):
+    def _find_cycles_fixture(self):
+        return patch.object(
+            topological,
+            "find_cycles",
+            Mock(side_effect=topological.find_cycles),
+        )
+
+    def test_plan_reused(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(User, users, properties={"addresses": relationship(Address)})
+        mapper(Address, addresses)
+        sess = create_session()
+
+        with self._find_cycles_fixture() as find_cycles:
+            sess.add(User(name="u1", addresses=[Address(email_address="a1")]))
+            sess.flush()
+            eq_(find_cycles.call_count, 1)
+
+            # same mappers and relationships involved; the plan from the
+            # previous flush is used
+            u2 = User(name="u2", addresses=[Address(email_address="a2")])
+            sess.add(u2)
+            sess.flush()
+            eq_(find_cycles.call_count, 1)
+
+            # only the User mapper is involved; a new plan is made
+            u2.name = "u2 modified"
+            sess.flush()
+            eq_(find_cycles.call_count, 2)
+
+            u2.name = "u2 modified again"
+            sess.flush()
+            eq_(find_cycles.call_count, 2)
+
+        sess.expunge_all()
+        eq_(
+            [
+                (u.name, [a.email_address for a in u.addresses])
+                for u in sess.query(User).order_by(User.id)
+            ],
+            [("u1", ["a1"]), ("u2 modified again", ["a2"])],
+        )
+
+    def test_plan_for_other_actions_not_used(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        sess = create_session()
+
+        with self._find_cycles_fixture() as find_cycles:
+            sess.add(User(name="u1"))
+            sess.flush()
+            eq_(find_cycles.call_count, 1)
+
+            # a plan of the same length but for different actions is
+            # not used
+            plan_cache = class_mapper(User)._flush_plan_cache
+            for key in list(plan_cache.keys()):
+                plan_cache[key] = [("bogus", k) for k in plan_cache[key]]
+
+            sess.add(User(name="u2"))
+            sess.flush()
+            eq_(find_cycles.call_count, 2)
+
+        sess.expunge_all()
+        eq_(
+            [u.name for u in sess.query(User).order_by(User.id)],
+            ["u1", "u2"],
+        )
+
+    def test_plan_shared_among_sessions(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        with self._find_cycles_fixture() as find_cycles:
+            for name in ("u1", "u2", "u3"):
+                sess = create_session()
+                sess.add(User(name=name))
+                sess.flush()
+            eq_(find_cycles.call_count, 1)
+
+
 class SingleCycleTest(UOWTest):
     def teardown(self):
         engines.testing_reaper.rollback_all()
@@ -767,20 +890,45 @@ class SingleCycleTest(UOWTest):
                 "(:parent_id, :data)",
                 {"parent_id": None, "data": "n1"},
             ),
-            AllOf(
-                CompiledSQL(
-                    "INSERT INTO nodes (parent_id, data) VALUES "
-                    "(:parent_id, :data)",
-                    lambda ctx: {"parent_id": n1.id, "data": "n2"},
-                ),
-                CompiledSQL(
-                    "INSERT INTO nodes (parent_id, data) VALUES "
-                    "(:parent_id, :data)",
-                    lambda ctx: {"parent_id": n1.id, "data": "n3"},
-                ),
+            Conditional(
+                testing.db.dialect.insert_executemany_returning,
+                [
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: [
+                            {"parent_id": n1.id, "data": "n2"},
+                            {"parent_id": n1.id, "data": "n3"},
+                        ],
+                    )
+                ],
+                [
+                    AllOf(
+                        CompiledSQL(
+                            "INSERT INTO nodes (parent_id, data) VALUES "
+                            "(:parent_id, :data)",
+                            lambda ctx: {"parent_id": n1.id, "data": "n2"},
+                        ),
+                        CompiledSQL(
+                            "INSERT INTO nodes (parent_id, data) VALUES "
+                            "(:parent_id, :data)",
+                            lambda ctx: {"parent_id": n1.id, "data": "n3"},
+                        ),
+                    )
+                ],
             ),
         )
 
+    def test_cycle_plan_not_cached(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        mapper(Node, nodes, properties={"children": relationship(Node)})
+        sess = create_session()
+
+        sess.add(Node(data="n1", children=[Node(data="n2")]))
+        sess.flush()
+        eq_(len(class_mapper(Node)._flush_plan_cache), 0)
+
     def test_one_to_many_delete_all(self):
         Node, nodes = self.classes.Node, self.tables.nodes
 
@@ -864,17 +1012,32 @@ class SingleCycleTest(UOWTest):
                 "(:parent_id, :data)",
                 {"parent_id": None, "data": "n1"},
             ),
-            AllOf(
-                CompiledSQL(
-                    "INSERT INTO nodes (parent_id, data) VALUES "
-                    "(:parent_id, :data)",
-                    lambda ctx: {"parent_id": n1.id, "data": "n2"},
-                ),
-                CompiledSQL(
-                    "INSERT INTO nodes (parent_id, data) VALUES "
-                    "(:parent_id, :data)",
-                    lambda ctx: {"parent_id": n1.id, "data": "n3"},
-                ),
+            Conditional(
+                testing.db.dialect.insert_executemany_returning,
+                [
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: [
+                            {"parent_id": n1.id, "data": "n2"},
+                            {"parent_id": n1.id, "data": "n3"},
+                        ],
+                    )
+                ],
+                [
+                    AllOf(
+                        CompiledSQL(
+                            "INSERT INTO nodes (parent_id, data) VALUES "
+                            "(:parent_id, :data)",
+                            lambda ctx: {"parent_id": n1.id, "data": "n2"},
+                        ),
+                        CompiledSQL(
+                            "INSERT INTO nodes (parent_id, data) VALUES "
+                            "(:parent_id, :data)",
+                            lambda ctx: {"parent_id": n1.id, "data": "n3"},
+                        ),
+                    )
+                ],
             ),
         )
 
@@ -1009,35 +1172,60 @@ class SingleCycleTest(UOWTest):
                 "(:parent_id, :data)",
                 lambda ctx: {"parent_id": None, "data": "n1"},
             ),
-            CompiledSQL(
-                "INSERT INTO nodes (parent_id, data) VALUES "
-                "(:parent_id, :data)",
-                lambda ctx: {"parent_id": n1.id, "data": "n11"},
-            ),
-            CompiledSQL(
-                "INSERT INTO nodes (parent_id, data) VALUES "
-                "(:parent_id, :data)",
-                lambda ctx: {"parent_id": n1.id, "data": "n12"},
-            ),
-            CompiledSQL(
-                "INSERT INTO nodes (parent_id, data) VALUES "
-                "(:parent_id, :data)",
-                lambda ctx: {"parent_id": n1.id, "data": "n13"},
-            ),
-            CompiledSQL(
-                "INSERT INTO nodes (parent_id, data) VALUES "
-                "(:parent_id, :data)",
-                lambda ctx: {"parent_id": n12.id, "data": "n121"},
-            ),
-            CompiledSQL(
-                "INSERT INTO nodes (parent_id, data) VALUES "
-                "(:parent_id, :data)",
-                lambda ctx: {"parent_id": n12.id, "data": "n122"},
-            ),
-            CompiledSQL(
-                "INSERT INTO nodes (parent_id, data) VALUES "
-                "(:parent_id, :data)",
-                lambda ctx: {"parent_id": n12.id, "data": "n123"},
+            Conditional(
+                testing.db.dialect.insert_executemany_returning,
+                [
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: [
+                            {"parent_id": n1.id, "data": "n11"},
+                            {"parent_id": n1.id, "data": "n12"},
+                            {"parent_id": n1.id, "data": "n13"},
+                        ],
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: [
+                            {"parent_id": n12.id, "data": "n121"},
+                            {"parent_id": n12.id, "data": "n122"},
+                            {"parent_id": n12.id, "data": "n123"},
+                        ],
+                    ),
+                ],
+                [
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: {"parent_id": n1.id, "data": "n11"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: {"parent_id": n1.id, "data": "n12"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: {"parent_id": n1.id, "data": "n13"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: {"parent_id": n12.id, "data": "n121"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: {"parent_id": n12.id, "data": "n122"},
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO nodes (parent_id, data) VALUES "
+                        "(:parent_id, :data)",
+                        lambda ctx: {"parent_id": n12.id, "data": "n123"},
+                    ),
+                ],
             ),
         )
 
@@ -1907,8 +2095,23 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
         self.assert_sql_execution(
             testing.db,
             sess.flush,
-            CompiledSQL("INSERT INTO t (data) VALUES (:data)", {"data": "t1"}),
-            CompiledSQL("INSERT INTO t (data) VALUES (:data)", {"data": "t2"}),
+            Conditional(
+                testing.db.dialect.insert_executemany_returning,
+                [
+                    CompiledSQL(
+                        "INSERT INTO t (data) VALUES (:data)",
+                        [{"data": "t1"}, {"data": "t2"}],
+                    )
+                ],
+                [
+                    CompiledSQL(
+                        "INSERT INTO t (data) VALUES (:data)", {"data": "t1"}
+                    ),
+                    CompiledSQL(
+                        "INSERT INTO t (data) VALUES (:data)", {"data": "t2"}
+                    ),
+                ],
+            ),
             CompiledSQL(
                 "INSERT INTO t (id, data) VALUES (:id, :data)",
                 [
@@ -1938,6 +2141,172 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
             ),
         )
 
+    def test_batch_update_interaction(self):
+        """test that UPDATE statements with the same set of parameters
+        are batched together even when not consecutive in primary
+        key order.
+
+        """
+
+        t = self.tables.t
+
+        class T(fixtures.ComparableEntity):
+            pass
+
+        mapper(T, t)
+        sess = Session()
+        sess.add_all([T(id=i, data="t%d" % i) for i in range(1, 7)])
+        sess.flush()
+
+        t1, t2, t3, t4, t5, t6 = [sess.query(T).get(i) for i in range(1, 7)]
+        t1.data = "t1new"
+        t2.def_ = "def2"
+        t3.data = "t3new"
+        t4.data = "t4new"
+        t4.def_ = "def4"
+        t5.data = func.lower("T5NEW")
+        t6.data = "t6new"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                [
+                    {"data": "t1new", "t_id": 1},
+                    {"data": "t3new", "t_id": 3},
+                    {"data": "t6new", "t_id": 6},
+                ],
+            ),
+            CompiledSQL(
+                "UPDATE t SET def_=:def_ WHERE t.id = :t_id",
+                [{"def_": "def2", "t_id": 2}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET data=:data, def_=:def_ WHERE t.id = :t_id",
+                [{"data": "t4new", "def_": "def4", "t_id": 4}],
+            ),
+            CompiledSQL(
+                "UPDATE t SET data=lower(:lower_1) WHERE t.id = :t_id",
+                [{"lower_1": "T5NEW", "t_id": 5}],
+            ),
+        )
+        eq_(
+            sess.query(T.id, T.data).order_by(T.id).all(),
+            [
+                (1, "t1new"),
+                (2, "t2"),
+                (3, "t3new"),
+                (4, "t4new"),
+                (5, "t5new"),
+                (6, "t6new"),
+            ],
+        )
+
+
+class DeleteChunksTest(fixtures.MappedTest, testing.AssertsExecutionResults):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        Table(
+            "ct",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50), primary_key=True),
+            Column("data", String(50)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Basic):
+            pass
+
+        class CT(cls.Basic):
+            pass
+
+    def test_delete_chunks(self):
+        T, t = self.classes.T, self.tables.t
+
+        mapper(T, t, delete_chunksize=2)
+        sess = Session()
+        objs = [T(id=i, data="t%d" % i) for i in range(1, 6)]
+        sess.add_all(objs)
+        sess.flush()
+
+        for obj in objs:
+            sess.delete(obj)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM t WHERE t.id IN ([EXPANDING_pk_values])",
+                [{"pk_values": [1, 2]}],
+            ),
+            CompiledSQL(
+                "DELETE FROM t WHERE t.id IN ([EXPANDING_pk_values])",
+                [{"pk_values": [3, 4]}],
+            ),
+            CompiledSQL(
+                "DELETE FROM t WHERE t.id IN ([EXPANDING_pk_values])",
+                [{"pk_values": [5]}],
+            ),
+        )
+        eq_(sess.query(T).count(), 0)
+
+    @testing.requires.tuple_in
+    def test_delete_chunks_composite(self):
+        CT, ct = self.classes.CT, self.tables.ct
+
+        mapper(CT, ct, delete_chunksize=10)
+        sess = Session()
+        objs = [CT(id=i, name="n%d" % i) for i in range(1, 4)]
+        sess.add_all(objs)
+        sess.add(CT(id=1, name="n2"))
+        sess.flush()
+
+        for obj in objs:
+            sess.delete(obj)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM ct WHERE (ct.id, ct.name) "
+                "IN ([EXPANDING_pk_values])",
+                [{"pk_values": [(1, "n1"), (2, "n2"), (3, "n3")]}],
+            ),
+        )
+        eq_(sess.query(CT.id, CT.name).all(), [(1, "n2")])
+
+    @testing.requires.sane_rowcount
+    def test_delete_chunks_missing_warning(self):
+        T, t = self.classes.T, self.tables.t
+
+        mapper(T, t, delete_chunksize=2)
+        sess = Session()
+        objs = [T(id=i, data="t%d" % i) for i in range(1, 4)]
+        sess.add_all(objs)
+        sess.flush()
+
+        sess.execute(t.delete().where(t.c.id == 2))
+        for obj in objs:
+            sess.delete(obj)
+
+        assert_raises_message(
+            exc.SAWarning,
+            r"DELETE statement on table 't' expected to "
+            r"delete 3 row\(s\); 2 were matched.",
+            sess.flush,
+        )
+
 
 class LoadersUsingCommittedTest(UOWTest):
 
@@ -2323,12 +2692,6 @@ class EagerDefaultsTest(fixtures.MappedTest):
                     [{"foo": 5, "test2_id": 1}],
                     dialect="postgresql",
                 ),
-                CompiledSQL(
-                    "UPDATE test2 SET foo=%(foo)s, bar=%(bar)s "
-                    "WHERE test2.id = %(test2_id)s",
-                    [{"foo": 6, "bar": 10, "test2_id": 2}],
-                    dialect="postgresql",
-                ),
                 CompiledSQL(
                     "UPDATE test2 SET foo=%(foo)s "
                     "WHERE test2.id = %(test2_id)s "
@@ -2339,7 +2702,10 @@ class EagerDefaultsTest(fixtures.MappedTest):
                 CompiledSQL(
                     "UPDATE test2 SET foo=%(foo)s, bar=%(bar)s "
                     "WHERE test2.id = %(test2_id)s",
-                    [{"foo": 8, "bar": 12, "test2_id": 4}],
+                    [
+                        {"foo": 6, "bar": 10, "test2_id": 2},
+                        {"foo": 8, "bar": 12, "test2_id": 4},
+                    ],
                     dialect="postgresql",
                 ),
             )
@@ -2351,11 +2717,6 @@ class EagerDefaultsTest(fixtures.MappedTest):
                     "UPDATE test2 SET foo=:foo WHERE test2.id = :test2_id",
                     [{"foo": 5, "test2_id": 1}],
                 ),
-                CompiledSQL(
-                    "UPDATE test2 SET foo=:foo, bar=:bar "
-                    "WHERE test2.id = :test2_id",
-                    [{"foo": 6, "bar": 10, "test2_id": 2}],
-                ),
                 CompiledSQL(
                     "UPDATE test2 SET foo=:foo WHERE test2.id = :test2_id",
                     [{"foo": 7, "test2_id": 3}],
@@ -2363,7 +2724,10 @@ class EagerDefaultsTest(fixtures.MappedTest):
                 CompiledSQL(
                     "UPDATE test2 SET foo=:foo, bar=:bar "
                     "WHERE test2.id = :test2_id",
-                    [{"foo": 8, "bar": 12, "test2_id": 4}],
+                    [
+                        {"foo": 6, "bar": 10, "test2_id": 2},
+                        {"foo": 8, "bar": 12, "test2_id": 4},
+                    ],
                 ),
                 CompiledSQL(
                     "SELECT test2.bar AS test2_bar FROM test2 "
@@ -2418,6 +2782,12 @@ class EagerDefaultsTest(fixtures.MappedTest):
                     [{"foo": 5, "test2_id": 1}],
                     dialect="postgresql",
                 ),
+                CompiledSQL(
+                    "UPDATE test2 SET foo=%(foo)s, bar=5 + 7 "
+                    "WHERE test2.id = %(test2_id)s RETURNING test2.bar",
+                    [{"foo": 8, "test2_id": 4}],
+                    dialect="postgresql",
+                ),
                 CompiledSQL(
                     "UPDATE test2 SET foo=%(foo)s, bar=%(bar)s "
                     "WHERE test2.id = %(test2_id)s",
@@ -2431,12 +2801,6 @@ class EagerDefaultsTest(fixtures.MappedTest):
                     [{"foo": 7, "test2_id": 3}],
                     dialect="postgresql",
                 ),
-                CompiledSQL(
-                    "UPDATE test2 SET foo=%(foo)s, bar=5 + 7 "
-                    "WHERE test2.id = %(test2_id)s RETURNING test2.bar",
-                    [{"foo": 8, "test2_id": 4}],
-                    dialect="postgresql",
-                ),
             )
         else:
             self.assert_sql_execution(
@@ -2447,6 +2811,11 @@ class EagerDefaultsTest(fixtures.MappedTest):
                     "WHERE test2.id = :test2_id",
                     [{"foo": 5, "test2_id": 1}],
                 ),
+                CompiledSQL(
+                    "UPDATE test2 SET foo=:foo, bar=5 + 7 "
+                    "WHERE test2.id = :test2_id",
+                    [{"foo": 8, "test2_id": 4}],
+                ),
                 CompiledSQL(
                     "UPDATE test2 SET foo=:foo, bar=:bar "
                     "WHERE test2.id = :test2_id",
@@ -2456,11 +2825,6 @@ class EagerDefaultsTest(fixtures.MappedTest):
                     "UPDATE test2 SET foo=:foo WHERE test2.id = :test2_id",
                     [{"foo": 7, "test2_id": 3}],
                 ),
-                CompiledSQL(
-                    "UPDATE test2 SET foo=:foo, bar=5 + 7 "
-                    "WHERE test2.id = :test2_id",
-                    [{"foo": 8, "test2_id": 4}],
-                ),
                 CompiledSQL(
                     "SELECT test2.bar AS test2_bar FROM test2 "
                     "WHERE test2.id = :param_1",
@@ -2526,17 +2890,17 @@ class EagerDefaultsTest(fixtures.MappedTest):
             lambda: s.bulk_update_mappings(Thing2, mappings),
             CompiledSQL(
                 "UPDATE test2 SET foo=:foo WHERE test2.id = :test2_id",
-                [{"foo": 5, "test2_id": 1}],
+                [
+                    {"foo": 5, "test2_id": 1},
+                    {"foo": 7, "test2_id": 3},
+                    {"foo": 8, "test2_id": 4},
+                ],
             ),
             CompiledSQL(
                 "UPDATE test2 SET foo=:foo, bar=:bar "
                 "WHERE test2.id = :test2_id",
                 [{"foo": 6, "bar": 10, "test2_id": 2}],
             ),
-            CompiledSQL(
-                "UPDATE test2 SET foo=:foo WHERE test2.id = :test2_id",
-                [{"foo": 7, "test2_id": 3}, {"foo": 8, "test2_id": 4}],
-            ),
         )
 
     def test_update_defaults_present(self):
@@ -233,6 +233,110 @@ class VersioningTest(fixtures.MappedTest):
             [(f1.id, "f1rev2", 2), (f2.id, "f2rev2", 2)],
         )
 
+    @testing.emits_warning(r".*versioning cannot be verified")
+    @testing.requires.sane_multi_rowcount
+    def test_multiple_updates_executemany(self):
+        Foo = self.classes.Foo
+
+        s1 = self._fixture()
+        f1 = Foo(value="f1")
+        f2 = Foo(value="f2")
+        s1.add_all((f1, f2))
+        s1.commit()
+
+        f1.value = "f1rev2"
+        f2.value = "f2rev2"
+
+        self.assert_sql_execution(
+            testing.db,
+            s1.flush,
+            CompiledSQL(
+                "UPDATE version_table SET version_id=:version_id, "
+                "value=:value WHERE version_table.id = :version_table_id "
+                "AND version_table.version_id = "
+                ":version_table_version_id",
+                [
+                    {
+                        "version_id": 2,
+                        "value": "f1rev2",
+                        "version_table_id": f1.id,
+                        "version_table_version_id": 1,
+                    },
+                    {
+                        "version_id": 2,
+                        "value": "f2rev2",
+                        "version_table_id": f2.id,
+                        "version_table_version_id": 1,
+                    },
+                ],
+            ),
+        )
+        eq_(f1.version_id, 2)
+        eq_(f2.version_id, 2)
+
+    @testing.emits_warning(r".*versioning cannot be verified")
+    @testing.requires.sane_multi_rowcount
+    def test_multiple_updates_executemany_stale(self):
+        Foo = self.classes.Foo
+
+        s1 = self._fixture()
+        f1 = Foo(value="f1")
+        f2 = Foo(value="f2")
+        s1.add_all((f1, f2))
+        s1.commit()
+
+        s2 = create_session(autocommit=False)
+        f1_s = s2.query(Foo).get(f1.id)
+        f1_s.value = "f1rev2theirs"
+        s2.commit()
+
+        f1.value = "f1rev2"
+        f2.value = "f2rev2"
+        assert_raises_message(
+            sa.orm.exc.StaleDataError,
+            r"UPDATE statement on table 'version_table' expected "
+            r"to update 2 row\(s\); 1 were matched.",
+            s1.flush,
+        )
+        s1.rollback()
+
+    @testing.requires.sane_rowcount
+    @testing.requires.tuple_in
+    def test_delete_chunks_versioncheck(self):
+        Foo, version_table = self.classes.Foo, self.tables.version_table
+
+        mapper(
+            Foo,
+            version_table,
+            version_id_col=version_table.c.version_id,
+            delete_chunksize=5,
+        )
+        s1 = Session()
+        f1 = Foo(value="f1")
+        f2 = Foo(value="f2")
+        s1.add_all((f1, f2))
+        s1.commit()
+
+        s2 = create_session(autocommit=False)
+        f1_s = s2.query(Foo).get(f1.id)
+        f1_s.value = "f1rev2"
+        s2.commit()
+
+        s1.delete(f1)
+        s1.delete(f2)
+        assert_raises_message(
+            sa.orm.exc.StaleDataError,
+            r"DELETE statement on table 'version_table' expected "
+            r"to delete 2 row\(s\); 1 were matched.",
+            s1.commit,
+        )
+        s1.rollback()
+
+        s1.delete(f1)
+        s1.delete(f2)
+        s1.commit()
+        eq_(s1.query(Foo).count(), 0)
+
     @testing.emits_warning(r".*versioning cannot be verified")
     def test_bulk_insert(self):
         Foo = self.classes.Foo
@@ -381,6 +381,14 @@ class DefaultRequirements(SuiteRequirements):
             'outer-joined to a subquery"',
         )
 
+    @property
+    def select_for_update(self):
+        """Target must support the SELECT..FOR UPDATE syntax."""
+
+        return skip_if(
+            ["sqlite", "mssql"], "Backend does not support SELECT..FOR UPDATE"
+        )
+
     @property
     def update_from(self):
         """Target must support UPDATE..FROM syntax"""
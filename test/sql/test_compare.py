@@ -12,6 +12,7 @@ from sqlalchemy import exists
 from sqlalchemy import extract
 from sqlalchemy import Float
 from sqlalchemy import Integer
+from sqlalchemy import literal_column
 from sqlalchemy import MetaData
 from sqlalchemy import or_
 from sqlalchemy import select
@@ -435,6 +436,57 @@ class CompareAndCopyTest(fixtures.TestBase):
                 eq_(a_params["bindparams"], assert_a_params)
                 eq_(b_params["bindparams"], assert_b_params)
 
+    def test_generate_cache_key(self):
+        for fixture in self.fixtures:
+            case_a = fixture()
+            case_b = fixture()
+
+            for a, b in itertools.combinations_with_replacement(
+                range(len(case_a)), 2
+            ):
+                a_key = case_a[a]._generate_cache_key()
+                b_key = case_b[b]._generate_cache_key()
+
+                if a == b:
+                    eq_(a_key.key, b_key.key)
+                    eq_(len(a_key.bindparams), len(b_key.bindparams))
+                elif a_key.key == b_key.key:
+                    for a_param, b_param in zip(
+                        a_key.bindparams, b_key.bindparams
+                    ):
+                        if not a_param.compare(b_param):
+                            break
+                    else:
+                        assert False, "Bound parameters are all the same"
+
+    def test_generate_cache_key_anon_names(self):
+        def fixture():
+            subq = select([table_a.c.a, func.count().label(None)]).alias()
+            return select([subq.c.a, literal_column("q").label(None)]).where(
+                subq.c.a == bindparam(None, 5)
+            )
+
+        s1, s2 = fixture(), fixture()
+
+        # the anonymous names differ between the two statements, however
+        # render the same SQL; the keys are the same as well
+        ne_(s1._cache_key(bindparams=[]), s2._cache_key(bindparams=[]))
+        eq_(str(s1), str(s2))
+
+        k1, k2 = s1._generate_cache_key(), s2._generate_cache_key()
+        eq_(k1.key, k2.key)
+        eq_(len(k1.bindparams), 1)
+        eq_(k1.bindparams[0].value, 5)
+
+    def test_generate_cache_key_uncacheable(self):
+        eq_(table_a.insert().values(a=5)._generate_cache_key(), None)
+        multi_values = table_a.insert().values([{"a": 5}, {"a": 6}])
+        eq_(multi_values._generate_cache_key(), None)
+
+        k1 = table_a.insert().values(a=bindparam("q"))._generate_cache_key()
+        k2 = table_a.insert().values(a=bindparam("q"))._generate_cache_key()
+        eq_(k1.key, k2.key)
+
     def test_compare_col_identity(self):
         stmt1 = (
             select([table_a.c.a, table_b.c.b])
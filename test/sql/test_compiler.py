@@ -2526,6 +2526,84 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
             _group_number=2,
         )
 
+    def _bind_assembler_fixture(self):
+        class MyType(types.TypeDecorator):
+            impl = Integer
+
+            def process_bind_param(self, value, dialect):
+                return value * 10
+
+        return select([table1]).where(
+            and_(
+                table1.c.myid == bindparam("x", type_=MyType()),
+                table1.c.name == bindparam("y", "default"),
+                table1.c.description == bindparam("z", callable_=lambda: 5),
+                table1.c.myid != bindparam("x", type_=MyType()),
+            )
+        )
+
+    def test_bind_assembler_positional(self):
+        c = self._bind_assembler_fixture().compile(dialect=sqlite.dialect())
+        eq_(
+            [(name, position) for name, proc, position in c._bind_assembly],
+            [("x", 0), ("y", 1), ("z", 2), ("x", 3)],
+        )
+        eq_(c._bind_assembler({"x": 3}, None), (30, "default", 5, 30))
+        eq_(
+            c._bind_assembler({"x": 3, "y": "q", "z": 8}, None),
+            (30, "q", 8, 30),
+        )
+
+    def test_bind_assembler_named(self):
+        c = self._bind_assembler_fixture().compile(
+            dialect=default.DefaultDialect()
+        )
+        eq_(
+            [(name, position) for name, proc, position in c._bind_assembly],
+            [("x", "x"), ("y", "y"), ("z", "z")],
+        )
+        eq_(
+            c._bind_assembler({"x": 3}, None),
+            {"x": 30, "y": "default", "z": 5},
+        )
+
+    def test_bind_assembler_matches_construct_params(self):
+        stmt = table1.insert().values(myid=bindparam("id"), name="n")
+        for dialect in (sqlite.dialect(), default.DefaultDialect()):
+            c = stmt.compile(dialect=dialect, column_keys=["description"])
+            for params in [
+                {"id": 1, "description": "d"},
+                {"id": 2, "description": "d", "name": "x"},
+            ]:
+                pd = c.construct_params(params)
+                if c.positional:
+                    expected = tuple(pd[key] for key in c.positiontup)
+                else:
+                    expected = pd
+                eq_(c._bind_assembler(params, None), expected)
+
+    def test_bind_assembler_missing(self):
+        c = (
+            select([table1])
+            .where(table1.c.myid == bindparam("x", required=True))
+            .compile()
+        )
+        assert_raises_message(
+            exc.InvalidRequestError,
+            r"A value is required for bind parameter 'x' \(",
+            c._bind_assembler,
+            {},
+            None,
+        )
+        assert_raises_message(
+            exc.InvalidRequestError,
+            r"A value is required for bind parameter 'x', "
+            "in parameter group 2",
+            c._bind_assembler,
+            {"y": 5},
+            2,
+        )
+
     def test_tuple(self):
         self.assert_compile(
             tuple_(table1.c.myid, table1.c.name).in_([(1, "foo"), (5, "bar")]),
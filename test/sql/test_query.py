@@ -752,6 +752,40 @@ class QueryTest(fixtures.TestBase):
                 [(7, "jack"), (8, "fred")],
             )
 
+    @testing.requires.tuple_in
+    def test_expanding_in_composite_bind_processors(self):
+        class MyInteger(TypeDecorator):
+            impl = Integer
+
+            def process_bind_param(self, value, dialect):
+                return int(value[4:])
+
+        testing.db.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+            ],
+        )
+
+        with testing.db.connect() as conn:
+            stmt = (
+                select([users])
+                .where(
+                    tuple_(
+                        cast(users.c.user_id, MyInteger), users.c.user_name
+                    ).in_(bindparam("uname", expanding=True))
+                )
+                .order_by(users.c.user_id)
+            )
+
+            eq_(
+                conn.execute(
+                    stmt, {"uname": [("INT_7", "jack"), ("INT_8", "fred")]}
+                ).fetchall(),
+                [(7, "jack"), (8, "fred")],
+            )
+
     @testing.fails_on("firebird", "uses sql-92 rules")
     @testing.fails_on("sybase", "uses sql-92 rules")
     @testing.skip_if(["mssql"])
@@ -1,3 +1,4 @@
+import array
 from contextlib import contextmanager
 import operator
 
@@ -12,6 +13,7 @@ from sqlalchemy import Integer
 from sqlalchemy import literal
 from sqlalchemy import literal_column
 from sqlalchemy import MetaData
+from sqlalchemy import null
 from sqlalchemy import select
 from sqlalchemy import sql
 from sqlalchemy import String
@@ -301,6 +303,192 @@ class ResultProxyTest(fixtures.TablesTest):
             rows.append(row)
         eq_(len(rows), 2)
 
+    def test_fetch_columns(self):
+        users = self.tables.users
+
+        users.insert().execute(
+            [
+                {"user_id": 7, "user_name": "jack"},
+                {"user_id": 8, "user_name": "ed"},
+                {"user_id": 9, "user_name": None},
+            ]
+        )
+        r = (
+            select([users.c.user_name, users.c.user_id])
+            .order_by(users.c.user_id)
+            .execute()
+        )
+        eq_(r.fetch_columns(2), [["jack", "ed"], [7, 8]])
+        eq_(r.fetch_columns(2), [[None], [9]])
+        eq_(r.fetch_columns(2), [[], []])
+        eq_(r.fetch_columns(), [[], []])
+
+    def test_fetch_columns_processors(self):
+        users = self.tables.users
+
+        class MyType(TypeDecorator):
+            impl = String()
+
+            def process_result_value(self, value, dialect):
+                return "HI " + value
+
+        users.insert().execute(
+            [
+                {"user_id": 7, "user_name": "jack"},
+                {"user_id": 8, "user_name": "ed"},
+            ]
+        )
+        r = (
+            select([type_coerce(users.c.user_name, MyType()), users.c.user_id])
+            .order_by(users.c.user_id)
+            .execute()
+        )
+        eq_(r.fetch_columns(), [["HI jack", "HI ed"], [7, 8]])
+        assert r._soft_closed
+
+    def test_processors_applied_on_fetch(self):
+        users = self.tables.users
+        canary = []
+
+        class MyType(TypeDecorator):
+            impl = String()
+
+            def process_result_value(self, value, dialect):
+                canary.append(value)
+                return "HI " + value
+
+        users.insert().execute(
+            [
+                {"user_id": 7, "user_name": "jack"},
+                {"user_id": 8, "user_name": "ed"},
+            ]
+        )
+        r = (
+            select([type_coerce(users.c.user_name, MyType()), users.c.user_id])
+            .order_by(users.c.user_id)
+            .execute()
+        )
+        rows = r.fetchall()
+        eq_(canary, ["jack", "ed"])
+
+        eq_(rows[0][0], "HI jack")
+        eq_(rows[0]["user_id"], 7)
+        eq_(list(rows[1]), ["HI ed", 8])
+        eq_(rows[1][0:1], ("HI ed",))
+        eq_(canary, ["jack", "ed"])
+
+    def test_freeze(self):
+        users = self.tables.users
+
+        class MyType(TypeDecorator):
+            impl = String()
+
+            def process_result_value(self, value, dialect):
+                return "HI " + value
+
+        users.insert().execute(
+            [
+                {"user_id": 7, "user_name": "jack"},
+                {"user_id": 8, "user_name": "ed"},
+                {"user_id": 9, "user_name": "fred"},
+            ]
+        )
+        name = type_coerce(users.c.user_name, MyType())
+        r = select([users.c.user_id, name]).order_by(users.c.user_id).execute()
+        frozen = r.freeze()
+        assert r._soft_closed
+        eq_(r.fetchall(), [])
+
+        # raw rows are stored; processing occurs on each delivery
+        eq_(frozen.rows, [(7, "jack"), (8, "ed"), (9, "fred")])
+
+        for i in range(2):
+            r2 = frozen()
+            row = r2.fetchone()
+            eq_(row[users.c.user_id], 7)
+            eq_(row[1], "HI jack")
+            eq_(r2.fetchmany(1), [(8, "HI ed")])
+            eq_(r2.fetchall(), [(9, "HI fred")])
+            eq_(r2.fetchone(), None)
+            assert r2._soft_closed
+
+    def test_freeze_adapt_to_statement(self):
+        users = self.tables.users
+
+        users.insert().execute({"user_id": 7, "user_name": "jack"})
+
+        def stmt():
+            ua = users.alias()
+            return select([ua.c.user_id, ua.c.user_name.label(None)]), ua
+
+        s1, ua1 = stmt()
+        frozen = testing.db.execute(s1).freeze()
+
+        s2, ua2 = stmt()
+        row = frozen(s2).fetchone()
+        eq_(row[ua2.c.user_id], 7)
+        eq_(row[s2.selected_columns[1]], "jack")
+        eq_(row[ua1.c.user_id], 7)
+
+    def test_fetch_columns_arrays(self):
+        users = self.tables.users
+
+        users.insert().execute(
+            [
+                {"user_id": 7, "user_name": "jack"},
+                {"user_id": 8, "user_name": "ed"},
+            ]
+        )
+        r = (
+            select(
+                [
+                    users.c.user_id,
+                    users.c.user_name,
+                    literal_column("2.5"),
+                    null(),
+                ]
+            )
+            .order_by(users.c.user_id)
+            .execute()
+        )
+        user_id, user_name, num, nulls = r.fetch_columns(arrays=True)
+
+        is_(type(user_id), array.array)
+        eq_(list(user_id), [7, 8])
+        is_(type(num), array.array)
+        eq_(num.typecode, "d")
+        eq_(list(num), [2.5, 2.5])
+        eq_(user_name, ["jack", "ed"])
+        eq_(nulls, [None, None])
+
+    def test_column_array_uniform_types(self):
+        int_typecode = _result._array_int_typecode
+        for values, typecode in [
+            ([1, 2, 3], int_typecode),
+            ([1.5, 2.5], "d"),
+            ([1.5, 2], None),
+            ([1, 2.5], None),
+            ([1, True], None),
+            ([True, False], None),
+            ([1, None], None),
+            ([1, 2 ** 70], None),
+        ]:
+            col = _result._column_array(values)
+            if typecode is None:
+                is_(col, values)
+            else:
+                is_(type(col), array.array)
+                eq_(col.typecode, typecode)
+                eq_(list(col), values)
+
+    @testing.only_on("sqlite")
+    def test_fetch_columns_arrays_mixed_types(self):
+        # SQLite returns the value's own type for each row
+        r = testing.db.execute(text("SELECT 1.5 AS x UNION ALL SELECT 2 AS x"))
+        (x,) = r.fetch_columns(arrays=True)
+        eq_(x, [1.5, 2])
+        eq_([type(v) for v in x], [float, int])
+
     def test_column_slices(self):
         users = self.tables.users
         addresses = self.tables.addresses
@@ -1722,6 +1910,17 @@ class AlternateResultProxyTest(fixtures.TablesTest):
             eq_(r.scalar(), 1)
             self._assert_result_closed(r)
 
+            r = self.engine.execute(select([self.table]))
+            eq_(r.fetch_columns(3), [[1, 2, 3], ["t_1", "t_2", "t_3"]])
+            eq_(r.fetchone(), (4, "t_4"))
+            eq_(
+                r.fetch_columns(),
+                [list(range(5, 12)), ["t_%d" % i for i in range(5, 12)]],
+            )
+            eq_(r.fetch_columns(2), [[], []])
+            r.close()
+            self._assert_result_closed(r)
+
     def _assert_result_closed(self, r):
         assert_raises_message(
             sa_exc.ResourceClosedError, "object is closed", r.fetchone
@@ -1735,6 +1934,10 @@ class AlternateResultProxyTest(fixtures.TablesTest):
             sa_exc.ResourceClosedError, "object is closed", r.fetchall
         )
 
+        assert_raises_message(
+            sa_exc.ResourceClosedError, "object is closed", r.fetch_columns
+        )
+
     def test_basic_plain(self):
         self._test_proxy(_result.ResultProxy)
 
@@ -1789,6 +1992,10 @@ class AlternateResultProxyTest(fixtures.TablesTest):
                     r = conn.execute(stmt)
                     eq_(r.scalar(), "HI THERE")
 
+                for i in range(2):
+                    r = conn.execute(stmt)
+                    eq_(r.fetch_columns(), [["HI THERE"]])
+
     def test_buffered_row_growth(self):
         with self._proxy_fixture(_result.BufferedRowResultProxy):
             with self.engine.connect() as conn:
@@ -1803,6 +2010,52 @@ class AlternateResultProxyTest(fixtures.TablesTest):
                         eq_(result._bufsize, checks[idx])
                     le_(len(result._BufferedRowResultProxy__rowbuffer), 1000)
 
+    def test_buffered_row_fetchmany_past_buffer(self):
+        with self._proxy_fixture(_result.BufferedRowResultProxy):
+            with self.engine.connect() as conn:
+                conn.execute(
+                    self.table.insert(),
+                    [{"x": i, "y": "t_%d" % i} for i in range(15, 1200)],
+                )
+                result = conn.execute(
+                    self.table.select().order_by(self.table.c.x)
+                )
+                eq_(result.fetchone(), (1, "t_1"))
+                eq_(result._bufsize, 5)
+
+                rows = result.fetchmany(500)
+                eq_(
+                    [row[0] for row in rows],
+                    list(range(2, 12)) + list(range(15, 505)),
+                )
+                eq_(len(result._BufferedRowResultProxy__rowbuffer), 0)
+                eq_(result._bufsize, 5)
+
+                eq_(result.fetchone(), (505, "t_505"))
+                eq_(len(result._BufferedRowResultProxy__rowbuffer), 4)
+                eq_([row[0] for row in result.fetchmany(2)], [506, 507])
+                eq_(len(result._BufferedRowResultProxy__rowbuffer), 2)
+
+                rows = result.fetchmany(1000)
+                eq_([row[0] for row in rows], list(range(508, 1200)))
+                eq_(result.fetchmany(5), [])
+
+    def test_stream_results_sqlite(self):
+        table = self.tables.test
+        with self.engine.connect() as conn:
+            result = conn.execute(table.select())
+            assert not isinstance(result, _result.BufferedRowResultProxy)
+
+            result = conn.execution_options(
+                stream_results=True, max_row_buffer=3
+            ).execute(table.select().order_by(table.c.x))
+            assert isinstance(result, _result.BufferedRowResultProxy)
+            rows = []
+            for row in result:
+                rows.append(row)
+                le_(len(result._BufferedRowResultProxy__rowbuffer), 3)
+            eq_(rows, [(i, "t_%d" % i) for i in range(1, 12)])
+
     def test_max_row_buffer_option(self):
         with self._proxy_fixture(_result.BufferedRowResultProxy):
             with self.engine.connect() as conn:
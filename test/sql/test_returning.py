@@ -1,6 +1,8 @@
+import contextlib
 import itertools
 
 from sqlalchemy import Boolean
+from sqlalchemy import event
 from sqlalchemy import exc as sa_exc
 from sqlalchemy import func
 from sqlalchemy import Integer
@@ -14,6 +16,7 @@ from sqlalchemy.testing import AssertsExecutionResults
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.types import TypeDecorator
@@ -427,6 +430,132 @@ class ReturnDefaultsTest(fixtures.TablesTest):
         eq_(dict(result.returned_defaults), {"upddef": 1})
 
 
+class InsertManyReturningTest(fixtures.TablesTest):
+    __requires__ = ("insert_executemany_returning",)
+    run_define_tables = "each"
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t1",
+            metadata,
+            Column(
+                "id", Integer, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column("data", String(50)),
+            Column("insdef", Integer, default=5),
+            Column("srvdef", String(20), server_default="srv"),
+        )
+
+    @contextlib.contextmanager
+    def _batch_fixture(self, page_size=1000, max_parameters=32700):
+        statements = []
+
+        def do_execute(cursor, statement, parameters, context):
+            statements.append((statement, parameters))
+
+        dialect = testing.db.dialect
+        event.listen(dialect, "do_execute", do_execute)
+        try:
+            with mock.patch.object(
+                dialect, "insertmanyvalues_page_size", page_size
+            ), mock.patch.object(
+                dialect, "insertmanyvalues_max_parameters", max_parameters
+            ):
+                yield statements
+        finally:
+            event.remove(dialect, "do_execute", do_execute)
+
+    def test_insert_executemany_pks(self):
+        t1 = self.tables.t1
+        result = testing.db.execute(
+            t1.insert().return_defaults(),
+            [{"data": "d%d" % i} for i in range(1, 6)],
+        )
+        eq_(result.inserted_primary_key_rows, [[i] for i in range(1, 6)])
+        eq_(result.rowcount, 5)
+        eq_(
+            testing.db.execute(select([t1.c.id, t1.c.data])).fetchall(),
+            [(i, "d%d" % i) for i in range(1, 6)],
+        )
+
+    def test_insert_executemany_return_defaults(self):
+        t1 = self.tables.t1
+        result = testing.db.execute(
+            t1.insert().return_defaults(t1.c.srvdef),
+            [{"data": "d1"}, {"data": "d2"}],
+        )
+        eq_(
+            [
+                [row[col] for col in (t1.c.id, t1.c.srvdef)]
+                for row in result.returned_defaults_rows
+            ],
+            [[1, "srv"], [2, "srv"]],
+        )
+        eq_(result.returned_defaults, None)
+
+    def test_insert_executemany_returning(self):
+        t1 = self.tables.t1
+        result = testing.db.execute(
+            t1.insert().returning(t1.c.id, t1.c.data),
+            [{"data": "d%d" % i} for i in range(1, 4)],
+        )
+        eq_(result.fetchall(), [(1, "d1"), (2, "d2"), (3, "d3")])
+
+    def test_no_return_defaults(self):
+        t1 = self.tables.t1
+        result = testing.db.execute(
+            t1.insert(), [{"data": "d1"}, {"data": "d2"}]
+        )
+        eq_(result.inserted_primary_key_rows, None)
+        eq_(result.returned_defaults_rows, None)
+
+    @testing.only_on("sqlite")
+    def test_named_paramstyle(self):
+        t1 = self.tables.t1
+        e = engines.testing_engine(options={"paramstyle": "named"})
+
+        with e.connect() as conn:
+            t1.create(conn, checkfirst=True)
+            result = conn.execute(
+                t1.insert().return_defaults(),
+                [{"data": "d%d" % i, "insdef": i * 10} for i in range(1, 12)],
+            )
+            eq_(result.inserted_primary_key_rows, [[i] for i in range(1, 12)])
+            eq_(
+                conn.execute(
+                    select([t1.c.id, t1.c.data, t1.c.insdef]).order_by(t1.c.id)
+                ).fetchall(),
+                [(i, "d%d" % i, i * 10) for i in range(1, 12)],
+            )
+
+    def test_page_size(self):
+        t1 = self.tables.t1
+
+        with self._batch_fixture(page_size=2) as statements:
+            result = testing.db.execute(
+                t1.insert().return_defaults(),
+                [{"data": "d%d" % i} for i in range(1, 6)],
+            )
+        eq_(result.inserted_primary_key_rows, [[i] for i in range(1, 6)])
+
+        # two parameters per row, "data" and "insdef"
+        eq_([len(params) for stmt, params in statements], [4, 4, 2])
+
+    def test_max_parameters(self):
+        t1 = self.tables.t1
+
+        with self._batch_fixture(max_parameters=7) as statements:
+            result = testing.db.execute(
+                t1.insert().return_defaults(),
+                [{"data": "d%d" % i} for i in range(1, 6)],
+            )
+        eq_(result.inserted_primary_key_rows, [[i] for i in range(1, 6)])
+
+        eq_([len(params) for stmt, params in statements], [6, 4])
+
+
 class ImplicitReturningFlag(fixtures.TestBase):
     __backend__ = True
 